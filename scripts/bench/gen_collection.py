@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Synthetic Collection Generator for Music Collection MCP Server Benchmarks
+
+Generates a realistic music library of any size (presets: small = 1,000,
+medium = 10,000 and large = 50,000 bands) for benchmarks. The same seed
+always produces the same library.
+
+Bands vary in album count and folder structure: flat "YYYY - Album" folders
+(default), type folders such as Album/, Live/ and Demo/ (enhanced), albums
+without years (legacy) and mixes of those. Albums carry editions such as
+"(Deluxe Edition)", have cover images and scan galleries, and bands have
+photos. Part of the bands get a .band_metadata.json with genres, members,
+missing albums and an analysis (reviews, ratings and similar bands), like a
+collection whose metadata was partly fetched already. Track files are empty.
+
+A manifest with the parameters and counts is written to
+.bench_collection.json in the library root.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Allow running from the repository root without installation
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.models import Album, AlbumAnalysis, BandAnalysis, BandMetadata
+
+SIZE_PRESETS = {'small': 1000, 'medium': 10000, 'large': 50000}
+
+MANIFEST_FILE = ".bench_collection.json"
+
+_ADJECTIVES = ["Iron", "Black", "Silent", "Electric", "Crimson", "Frozen", "Burning", "Hollow", "Golden",
+               "Savage", "Midnight", "Velvet", "Broken", "Eternal", "Wild", "Lunar", "Static", "Holy",
+               "Rusty", "Neon", "Northern", "Pale", "Sonic", "Wicked", "Blue", "Dead", "Violent", "Astral"]
+_NOUNS = ["Maiden", "Sabbath", "Wolves", "Tide", "Serpent", "Empire", "Circus", "Horizon", "Garden",
+          "Machine", "Prophets", "Ravens", "Mountain", "Orchestra", "Riders", "Temple", "Storm",
+          "Harvest", "Engine", "Choir", "Pilots", "Shadows", "Kingdom", "Lantern", "Saints", "Echoes"]
+_ALBUM_WORDS = ["Night", "Fire", "Dreams", "Steel", "Ocean", "Requiem", "Dawn", "Ashes", "Glory", "Rain",
+                "Thunder", "Machine", "Heart", "Chaos", "Silence", "Light", "Blood", "Road", "Stars",
+                "Winter", "Echo", "Paradise", "Ritual", "Voyage", "Empire", "Gravity", "Mirror"]
+_GENRES = ["Heavy Metal", "Thrash Metal", "Progressive Rock", "Hard Rock", "Doom Metal", "Black Metal",
+           "Death Metal", "Power Metal", "Punk Rock", "Alternative Rock", "Post-Rock", "Jazz Fusion",
+           "Blues Rock", "Grunge", "Shoegaze", "Stoner Rock", "Folk Metal", "Synthpop"]
+_COUNTRIES = ["United Kingdom", "United States", "Sweden", "Germany", "Norway", "Finland", "Brazil",
+              "Canada", "Japan", "Australia", "Italy", "Netherlands", "Spain", "Poland"]
+_EDITIONS = ["Deluxe Edition", "Remastered", "Limited Edition", "Anniversary Edition", "Expanded Edition"]
+
+# Album types with their share of non-album releases and their type folder names
+_RELEASE_TYPES = [("Live", 0.35), ("Compilation", 0.2), ("EP", 0.2), ("Demo", 0.15), ("Single", 0.1)]
+
+# Structure of band folders: default, enhanced (type folders), legacy (no years), mixed
+_STRUCTURES = [("default", 0.55), ("enhanced", 0.25), ("legacy", 0.1), ("mixed", 0.1)]
+
+_TRACK_EXTENSIONS = [".mp3", ".flac", ".m4a"]
+
+# Band names of each structure listed in the manifest, for benchmarks of single bands
+_SAMPLES_PER_STRUCTURE = 5
+
+
+def _weighted(rng: random.Random, choices: List[tuple]) -> str:
+    return rng.choices([choice for choice, _ in choices], weights=[weight for _, weight in choices])[0]
+
+
+def _band_names(rng: random.Random, count: int) -> List[str]:
+    """Unique band names, numbered once the word combinations run out."""
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)}"
+        if rng.random() < 0.2:
+            name = f"The {name}"
+        if name in seen:
+            name = f"{name} {len(names) + 1}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def _album_title(rng: random.Random) -> str:
+    words = rng.sample(_ALBUM_WORDS, rng.choice([1, 2, 2, 3]))
+    return " of ".join(words) if len(words) == 2 and rng.random() < 0.3 else " ".join(words)
+
+
+def _generate_band(rng: random.Random, root: Path, band_name: str, options: Dict[str, Any]) -> Tuple[str, Dict[str, int]]:
+    """Create one band folder (and maybe its metadata); return its structure and what was created."""
+    counts = {'albums': 0, 'tracks': 0, 'images': 0, 'metadata_files': 0, 'missing_albums': 0}
+    band_folder = root / band_name
+    band_folder.mkdir(parents=True)
+    structure = _weighted(rng, _STRUCTURES)
+
+    # Album counts are skewed: most bands have a few albums, some have dozens
+    album_count = max(1, min(options['max_albums'], int(rng.paretovariate(1.6) * 2)))
+    formed = rng.randint(1965, 2015)
+    band_genres = rng.sample(_GENRES, rng.randint(1, 3))
+    albums: List[Album] = []
+    used_titles = set()
+
+    for _ in range(album_count):
+        title = _album_title(rng)
+        while title in used_titles:
+            title = f"{title} II"
+        used_titles.add(title)
+        year = str(min(2025, formed + rng.randint(0, 35)))
+        album_type = "Album" if rng.random() < 0.7 else _weighted(rng, _RELEASE_TYPES)
+        edition = rng.choice(_EDITIONS) if rng.random() < 0.15 else ""
+        folder_name = f"{title} ({edition})" if edition else title
+
+        with_year = structure != "legacy" and not (structure == "mixed" and rng.random() < 0.4)
+        if with_year:
+            folder_name = f"{year} - {folder_name}"
+        in_type_folder = structure == "enhanced" or (structure == "mixed" and rng.random() < 0.5)
+        folder_path = f"{album_type}/{folder_name}" if in_type_folder else folder_name
+
+        album_folder = band_folder / folder_path
+        album_folder.mkdir(parents=True)
+        track_count = rng.randint(3, 14) if album_type != "Single" else rng.randint(1, 3)
+        extension = rng.choice(_TRACK_EXTENSIONS)
+        for track in range(1, min(track_count, options['max_track_files']) + 1):
+            (album_folder / f"{track:02d} - Track {track}{extension}").touch()
+        counts['tracks'] += min(track_count, options['max_track_files'])
+
+        gallery = []
+        if rng.random() < 0.6:
+            (album_folder / "cover.jpg").touch()
+            gallery.append("cover.jpg")
+        if rng.random() < 0.1:
+            (album_folder / "Scans").mkdir()
+            for page in range(1, rng.randint(2, 6)):
+                (album_folder / "Scans" / f"booklet-{page:02d}.jpg").touch()
+                gallery.append(f"Scans/booklet-{page:02d}.jpg")
+        counts['images'] += len(gallery)
+        counts['albums'] += 1
+
+        albums.append(Album(album_name=title, year=year if with_year else "", type=album_type,
+                            edition=edition, track_count=track_count, genres=band_genres[:1],
+                            folder_path=folder_path, gallery=gallery))
+
+    band_gallery = []
+    if rng.random() < 0.4:
+        for image in rng.sample(["band.jpg", "logo.png", "live-photo.jpg"], rng.randint(1, 3)):
+            (band_folder / image).touch()
+            band_gallery.append(image)
+    counts['images'] += len(band_gallery)
+
+    if rng.random() < options['metadata_fraction']:
+        missing = []
+        for _ in range(rng.choice([0, 0, 1, 1, 2, 3])):
+            title = _album_title(rng)
+            if title not in used_titles:
+                used_titles.add(title)
+                missing.append(Album(album_name=title, year=str(min(2025, formed + rng.randint(0, 35))),
+                                     track_count=rng.randint(6, 12), not_found=True))
+        analyze = None
+        if rng.random() < options['analysis_fraction']:
+            analyze = BandAnalysis(
+                review=f"{band_name} play {band_genres[0].lower()} with conviction.",
+                rate=rng.randint(3, 10),
+                albums=[AlbumAnalysis(album_name=album.album_name, review="Solid release.",
+                                      rate=rng.randint(1, 10)) for album in albums if rng.random() < 0.7],
+                similar_bands=[],
+                similar_bands_missing=[f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)}"]
+            )
+        metadata = BandMetadata(
+            band_name=band_name, formed=str(formed), genres=band_genres, origin=rng.choice(_COUNTRIES),
+            members=[f"Member {i}" for i in range(1, rng.randint(3, 6))],
+            albums_count=len(albums) + len(missing), description=f"{band_name} formed in {formed}.",
+            albums=albums, albums_missing=missing, analyze=analyze, gallery=band_gallery,
+            last_updated=f"{rng.randint(2020, 2025)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00"
+        )
+        (band_folder / ".band_metadata.json").write_text(
+            json.dumps(metadata.model_dump(mode='json'), indent=2), encoding='utf-8')
+        counts['metadata_files'] += 1
+        counts['missing_albums'] += len(missing)
+    return structure, counts
+
+
+def generate_collection(root: Path, bands: int, seed: int = 42, metadata_fraction: float = 0.6,
+                        analysis_fraction: float = 0.5, max_albums: int = 40,
+                        max_track_files: int = 14, similar_bands: bool = True) -> Dict[str, Any]:
+    """
+    Generate a synthetic music library.
+
+    Args:
+        root: Library root (created; must be empty or missing)
+        bands: Number of bands
+        seed: Random seed; the same seed generates the same library
+        metadata_fraction: Share of bands with a .band_metadata.json
+        analysis_fraction: Share of bands with metadata that also have an analysis
+        max_albums: Most albums of one band
+        max_track_files: Most track files created per album (track counts in
+            metadata are not capped)
+        similar_bands: Whether analyses name similar bands of the library
+
+    Returns:
+        Manifest with the parameters, the counts of what was generated and
+        sample band names of each folder structure
+
+    Raises:
+        ValueError: If root is not empty
+    """
+    root = Path(root)
+    if root.exists() and any(root.iterdir()):
+        raise ValueError(f"{root} is not empty")
+    root.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    names = _band_names(rng, bands)
+    options = {'metadata_fraction': metadata_fraction, 'analysis_fraction': analysis_fraction,
+               'max_albums': max_albums, 'max_track_files': max_track_files}
+    totals = {'bands': bands, 'albums': 0, 'tracks': 0, 'images': 0, 'metadata_files': 0, 'missing_albums': 0}
+    samples: Dict[str, List[str]] = {structure: [] for structure, _ in _STRUCTURES}
+    for name in names:
+        structure, counts = _generate_band(rng, root, name, options)
+        for key, value in counts.items():
+            totals[key] += value
+        if len(samples[structure]) < _SAMPLES_PER_STRUCTURE:
+            samples[structure].append(name)
+
+    if similar_bands and totals['metadata_files']:
+        _link_similar_bands(rng, root, names)
+
+    manifest = {
+        'seed': seed,
+        'parameters': {**options, 'similar_bands': similar_bands},
+        'counts': totals,
+        'samples': samples,
+        'genres': _GENRES,
+        'generation_seconds': round(time.perf_counter() - started, 2)
+    }
+    (root / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    return manifest
+
+
+def _link_similar_bands(rng: random.Random, root: Path, names: List[str]) -> None:
+    """Name bands of the library as similar bands in the analyses."""
+    for name in names:
+        metadata_file = root / name / ".band_metadata.json"
+        if not metadata_file.exists():
+            continue
+        data = json.loads(metadata_file.read_text(encoding='utf-8'))
+        if not data.get('analyze'):
+            continue
+        missing = {band.lower() for band in data['analyze']['similar_bands_missing']}
+        data['analyze']['similar_bands'] = [band for band in rng.sample(names, min(3, len(names)))
+                                            if band != name and band.lower() not in missing]
+        metadata_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+
+def load_manifest(root: Path) -> Optional[Dict[str, Any]]:
+    """Read the manifest of a generated library, None if there is none."""
+    try:
+        return json.loads((Path(root) / MANIFEST_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main generator interface."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic music library for benchmarks")
+    parser.add_argument('output', help="Library root to create (must be empty)")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--size', choices=sorted(SIZE_PRESETS), default='small',
+                      help="Preset: small (1k), medium (10k) or large (50k bands)")
+    size.add_argument('--bands', type=int, help="Number of bands")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument('--metadata-fraction', type=float, default=0.6,
+                        help="Share of bands with metadata (default: 0.6)")
+    parser.add_argument('--analysis-fraction', type=float, default=0.5,
+                        help="Share of bands with metadata that have an analysis (default: 0.5)")
+    parser.add_argument('--max-track-files', type=int, default=14,
+                        help="Most track files per album, lower for faster generation (default: 14)")
+    args = parser.parse_args(argv)
+
+    bands = args.bands or SIZE_PRESETS[args.size]
+    print(f"🎵 Generating {bands} bands (seed {args.seed}) in {args.output}")
+    try:
+        manifest = generate_collection(Path(args.output), bands, seed=args.seed,
+                                       metadata_fraction=args.metadata_fraction,
+                                       analysis_fraction=args.analysis_fraction,
+                                       max_track_files=args.max_track_files)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    counts = manifest['counts']
+    print(f"✅ {counts['bands']} bands, {counts['albums']} albums, {counts['tracks']} tracks, "
+          f"{counts['images']} images, {counts['metadata_files']} metadata files "
+          f"in {manifest['generation_seconds']} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
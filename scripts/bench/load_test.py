@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Load Test for Music Collection MCP Server
+
+Drives the server with N concurrent simulated clients issuing a weighted mix
+of requests against a synthetic library from gen_collection.py:
+
+- band_list: get_band_list_tool with search, filters, sorting and pages
+- advanced_search: advanced_search_albums_tool by years, types and ratings
+- band_info: the band://info resource
+- save_metadata: save_band_metadata_tool updating a band's details
+- scan_band: scan_music_folders of one band
+- scan_full: scan_music_folders of the whole library
+
+With --transport inprocess (the default) every client has its own MCP
+session with the server in this process. With --transport stdio the server
+runs as a child process (main.py) and the clients send concurrent requests
+over its stdio session, the way a desktop client does.
+
+Each client sends requests back to back (after --think-ms) until --duration
+seconds have passed or it sent --requests. The results give throughput,
+latency percentiles and error rates per operation and in total, as JSON.
+With --baseline they are compared with a stored run: an operation regressed
+when its p95 latency is more than --threshold (and --min-delta-ms) higher,
+its throughput more than --threshold lower, or its error rate higher.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Allow running from the repository root without installation
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from gen_collection import SIZE_PRESETS, generate_collection, load_manifest
+from run_benchmarks import (
+    DEFAULT_MIN_DELTA_MS,
+    DEFAULT_THRESHOLD,
+    Benchmark,
+    BenchmarkContext,
+    environment_info,
+    make_call,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "load_baseline.json"
+
+DEFAULT_MIX = {'band_list': 40, 'advanced_search': 20, 'band_info': 25, 'save_metadata': 10,
+               'scan_band': 4, 'scan_full': 1}
+
+TRANSPORTS = ('inprocess', 'stdio')
+
+RESULTS_VERSION = 1
+
+# Distinct error messages kept per operation
+_SAMPLE_ERRORS = 3
+
+# Error rates differing by less than this are noise
+_ERROR_RATE_TOLERANCE = 0.01
+
+
+class Workload:
+    """Draws the requests of the simulated clients."""
+
+    def __init__(self, library: Path, mix: Dict[str, float], genres: Optional[List[str]] = None):
+        """
+        Initialize workload.
+
+        Args:
+            library: Library the server serves (band names are read from it)
+            mix: Relative weight of each operation (see DEFAULT_MIX)
+            genres: Genres used in filters
+
+        Raises:
+            ValueError: If an operation is unknown, no weight is positive or
+                the library has no bands
+        """
+        unknown = set(mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+        self.operations = [operation for operation, weight in mix.items() if weight > 0]
+        if not self.operations:
+            raise ValueError("The mix needs an operation with a positive weight")
+        self.weights = [mix[operation] for operation in self.operations]
+        with os.scandir(library) as entries:
+            self.bands = sorted(entry.name for entry in entries if entry.is_dir() and not entry.name.startswith('.'))
+        if not self.bands:
+            raise ValueError(f"No bands in {library}")
+        self.genres = genres or ["Heavy Metal"]
+        self._saves = 0
+
+    def next_request(self, rng: random.Random) -> Tuple[str, Benchmark]:
+        """Draw the next request of a client."""
+        operation = rng.choices(self.operations, weights=self.weights)[0]
+        band = rng.choice(self.bands)
+        if operation == 'band_list':
+            arguments = rng.choice([
+                {},
+                {'search_query': rng.choice(["Iron", "Black", "The", "Storm"])},
+                {'filter_genre': rng.choice(self.genres), 'filter_has_metadata': True},
+                {'sort_by': 'albums_count', 'sort_order': 'desc', 'page': rng.randint(1, 5)},
+                {'include_albums': True, 'page_size': 20, 'page': rng.randint(1, 3)},
+            ])
+            return operation, Benchmark(operation, 'tool', 'get_band_list_tool', arguments)
+        if operation == 'advanced_search':
+            year = rng.randrange(1970, 2020, 10)
+            arguments = rng.choice([
+                {'year_min': year, 'year_max': year + 9},
+                {'album_types': rng.choice(["Live", "EP", "Demo,Live"])},
+                {'min_rating': rng.randint(5, 9)},
+            ])
+            return operation, Benchmark(operation, 'tool', 'advanced_search_albums_tool', arguments)
+        if operation == 'band_info':
+            return operation, Benchmark(operation, 'resource', f"band://info/{band}")
+        if operation == 'save_metadata':
+            self._saves += 1
+            # Without albums, the band's albums are kept
+            metadata = {'band_name': band, 'formed': str(rng.randint(1965, 2015)),
+                        'genres': rng.sample(self.genres, min(2, len(self.genres))),
+                        'origin': "Load Test", 'members': [f"Member {i}" for i in range(1, 4)],
+                        'description': f"Updated by load test request {self._saves}."}
+            return operation, Benchmark(operation, 'tool', 'save_band_metadata_tool',
+                                        {'band_name': band, 'metadata': metadata})
+        if operation == 'scan_band':
+            return operation, Benchmark(operation, 'tool', 'scan_music_folders', {'band_names': [band]})
+        return operation, Benchmark(operation, 'tool', 'scan_music_folders')
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))]
+
+
+def summarize_requests(records: List[Tuple[float, Optional[str]]], elapsed: float) -> Dict[str, Any]:
+    """
+    Summarize the requests of one operation (or of all).
+
+    Args:
+        records: (latency seconds, error or None) per request
+        elapsed: Length of the load test in seconds
+
+    Returns:
+        Dict with requests, errors, error_rate, throughput_rps, latency
+        (mean, p50, p95, p99 and max seconds) and sample_errors
+    """
+    latencies = sorted(seconds for seconds, _ in records)
+    errors = [error for _, error in records if error]
+    summary = {
+        'requests': len(records),
+        'errors': len(errors),
+        'error_rate': round(len(errors) / len(records), 4) if records else 0.0,
+        'throughput_rps': round(len(records) / elapsed, 2) if elapsed > 0 else 0.0,
+        'latency': {},
+        'sample_errors': list(dict.fromkeys(errors))[:_SAMPLE_ERRORS]
+    }
+    if latencies:
+        summary['latency'] = {
+            'mean': round(sum(latencies) / len(latencies), 6),
+            'p50': round(_percentile(latencies, 50), 6),
+            'p95': round(_percentile(latencies, 95), 6),
+            'p99': round(_percentile(latencies, 99), 6),
+            'max': round(latencies[-1], 6)
+        }
+    return summary
+
+
+async def _client_loop(client: Any, workload: Workload, rng: random.Random, deadline: float,
+                       max_requests: int, think_seconds: float,
+                       records: List[Tuple[str, float, Optional[str]]]) -> None:
+    sent = 0
+    while time.perf_counter() < deadline and (not max_requests or sent < max_requests):
+        operation, request = workload.next_request(rng)
+        started = time.perf_counter()
+        try:
+            error = await make_call(client, request)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        records.append((operation, time.perf_counter() - started, error))
+        sent += 1
+        if think_seconds:
+            await asyncio.sleep(think_seconds)
+
+
+async def _run_load(library: Path, workload: Workload, transport: str, clients: int, duration: float,
+                    max_requests: int, think_seconds: float, seed: int,
+                    env: Dict[str, str]) -> Tuple[List[Tuple[str, float, Optional[str]]], float]:
+    from fastmcp import Client
+
+    async with AsyncExitStack() as stack:
+        if transport == 'stdio':
+            from fastmcp.client.transports import PythonStdioTransport
+            server = PythonStdioTransport(REPO_ROOT / "main.py", env={**os.environ, **env}, cwd=str(REPO_ROOT),
+                                          python_cmd=sys.executable, log_file=library.parent / "server.log")
+            # One server process; the clients share its session, each with requests in flight
+            session = await stack.enter_async_context(Client(server))
+            sessions = [session] * clients
+        else:
+            from src.mcp_server import mcp
+            sessions = [await stack.enter_async_context(Client(mcp)) for _ in range(clients)]
+
+        # The library is scanned before the load starts
+        error = await make_call(sessions[0], Benchmark('scan_full', 'tool', 'scan_music_folders'))
+        if error:
+            raise RuntimeError(f"Initial scan failed: {error}")
+
+        records: List[Tuple[str, float, Optional[str]]] = []
+        started = time.perf_counter()
+        deadline = started + duration if duration > 0 else math.inf
+        await asyncio.gather(*(
+            _client_loop(session, workload, random.Random(seed * 1000 + index), deadline, max_requests,
+                         think_seconds, records)
+            for index, session in enumerate(sessions)))
+        return records, time.perf_counter() - started
+
+
+def run_load_test(source: Path, clients: int = 8, duration: float = 30.0, max_requests: int = 0,
+                  think_ms: float = 0.0, mix: Optional[Dict[str, float]] = None, transport: str = 'inprocess',
+                  seed: int = 42, work_dir: Optional[Path] = None, fs_latency_ms: float = 0.0,
+                  fs_jitter_ms: float = 0.0, config_options: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Run a load test against a copy of a library.
+
+    Args:
+        source: Library generated by gen_collection.py (not modified)
+        clients: Concurrent simulated clients
+        duration: Seconds the clients send requests (0 for no limit)
+        max_requests: Requests per client (0 for no limit; duration or
+            max_requests must be set)
+        think_ms: Pause of a client after each response
+        mix: Relative weight of each operation (DEFAULT_MIX by default)
+        transport: 'inprocess' or 'stdio'
+        seed: Seed of the clients' request sequences
+        work_dir: Directory for the library copy (a temporary one by default)
+        fs_latency_ms: Simulated file system round trip (in-process only)
+        fs_jitter_ms: Random variation of the simulated round trips
+        config_options: Server configuration options (values as in the environment)
+
+    Returns:
+        Results with settings, environment, totals and per-operation statistics
+
+    Raises:
+        ValueError: If the settings are invalid
+    """
+    from src.config import Config
+    from src.core.tools.filesystem import LatencyFileSystem, configure_filesystem
+    from src.di import override_dependency
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of: {', '.join(TRANSPORTS)}")
+    if clients < 1 or (duration <= 0 and max_requests <= 0):
+        raise ValueError("Set at least one client, and a duration or a number of requests")
+    simulated = fs_latency_ms > 0 or fs_jitter_ms > 0
+    if simulated and transport == 'stdio':
+        raise ValueError("File system latency can only be simulated in-process")
+
+    mix = dict(mix or DEFAULT_MIX)
+    manifest = load_manifest(source) or {}
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = work_dir = Path(tempfile.mkdtemp(prefix="music-mcp-load-"))
+    context = BenchmarkContext(Path(source), Path(work_dir))
+    context.restore_library()
+    workload = Workload(context.library, mix, manifest.get('genres'))
+    env = {**(config_options or {}), 'MUSIC_ROOT_PATH': str(context.library)}
+    try:
+        if simulated:
+            configure_filesystem(LatencyFileSystem(latency_ms=fs_latency_ms, jitter_ms=fs_jitter_ms, seed=seed))
+        with override_dependency(Config, Config(**env)):
+            records, elapsed = asyncio.run(_run_load(context.library, workload, transport, clients, duration,
+                                                     max_requests, think_ms / 1000, seed, env))
+    finally:
+        if simulated:
+            configure_filesystem()
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    by_operation: Dict[str, List[Tuple[float, Optional[str]]]] = {}
+    for operation, seconds, error in records:
+        by_operation.setdefault(operation, []).append((seconds, error))
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(),
+        'collection': {key: manifest.get(key) for key in ('seed', 'counts', 'parameters')},
+        'environment': environment_info(),
+        'settings': {'transport': transport, 'clients': clients, 'duration_seconds': duration,
+                     'requests_per_client': max_requests, 'think_ms': think_ms, 'mix': mix, 'seed': seed,
+                     'config': dict(config_options or {}),
+                     'filesystem': {'latency_ms': fs_latency_ms, 'jitter_ms': fs_jitter_ms}},
+        'elapsed_seconds': round(elapsed, 3),
+        'totals': summarize_requests([(seconds, error) for _, seconds, error in records], elapsed),
+        'operations': {operation: summarize_requests(by_operation[operation], elapsed)
+                       for operation in sorted(by_operation)}
+    }
+
+
+def compare_load_results(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+                         min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> Dict[str, Any]:
+    """
+    Compare a load test with a baseline.
+
+    An operation regressed when its p95 latency is more than threshold and
+    min_delta_ms higher, its throughput more than threshold lower, or its
+    error rate more than one percentage point higher than in the baseline.
+
+    Args:
+        results: Result of run_load_test()
+        baseline: Stored result of an earlier run
+        threshold: Allowed change, e.g. 0.25 for 25%
+        min_delta_ms: Latency increases smaller than this are noise
+
+    Returns:
+        Dict with per-operation comparisons, the regressed operation names,
+        and settings_match (False when the library or the load differs)
+    """
+    comparisons = {}
+    regressions = []
+    for operation, current in results.get('operations', {}).items():
+        base = baseline.get('operations', {}).get(operation)
+        if not base or not base.get('latency') or not current.get('latency'):
+            comparisons[operation] = {'status': 'new'}
+            continue
+        p95, base_p95 = current['latency']['p95'], base['latency']['p95']
+        throughput, base_throughput = current['throughput_rps'], base['throughput_rps']
+        reasons = []
+        if p95 > base_p95 * (1 + threshold) and (p95 - base_p95) * 1000 >= min_delta_ms:
+            reasons.append('p95 latency')
+        if base_throughput > 0 and throughput < base_throughput / (1 + threshold):
+            reasons.append('throughput')
+        if current['error_rate'] > base['error_rate'] + _ERROR_RATE_TOLERANCE:
+            reasons.append('error rate')
+        if reasons:
+            regressions.append(operation)
+        comparisons[operation] = {
+            'status': 'regressed' if reasons else 'ok',
+            'reasons': reasons,
+            'p95_ratio': round(p95 / base_p95, 3) if base_p95 > 0 else 1.0,
+            'throughput_ratio': round(throughput / base_throughput, 3) if base_throughput > 0 else 1.0,
+            'error_rate': current['error_rate'],
+            'baseline_error_rate': base['error_rate']
+        }
+    compared_settings = ('transport', 'clients', 'duration_seconds', 'requests_per_client', 'think_ms', 'mix',
+                         'config', 'filesystem')
+    return {
+        'settings_match': (results.get('collection') == baseline.get('collection')
+                           and all(results.get('settings', {}).get(key) == baseline.get('settings', {}).get(key)
+                                   for key in compared_settings)),
+        'regressions': regressions,
+        'operations': comparisons
+    }
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    print(f"\n{'operation':<16} {'requests':>8} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = list(results['operations'].items()) + [('total', results['totals'])]
+    for operation, stats in rows:
+        latency = stats['latency'] or {'p50': 0, 'p95': 0, 'p99': 0}
+        print(f"{operation:<16} {stats['requests']:>8} {stats['errors']:>7} {stats['throughput_rps']:>8.1f} "
+              f"{latency['p50'] * 1000:>9.1f} {latency['p95'] * 1000:>9.1f} {latency['p99'] * 1000:>9.1f}")
+    for operation, stats in results['operations'].items():
+        for error in stats['sample_errors']:
+            print(f"  ❌ {operation}: {error}")
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(','):
+        operation, separator, weight = part.partition('=')
+        if not separator:
+            raise ValueError(f"Expected OPERATION=WEIGHT, got {part!r}")
+        mix[operation.strip()] = float(weight)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main load test interface."""
+    parser = argparse.ArgumentParser(description="Load test the Music Collection MCP Server")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--collection', help="Library generated by gen_collection.py (not modified)")
+    source.add_argument('--size', choices=sorted(SIZE_PRESETS), default='small',
+                        help="Generate a library of this preset size (default: small)")
+    source.add_argument('--bands', type=int, help="Generate a library with this many bands")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of the library and requests (default: 42)")
+    parser.add_argument('--transport', choices=TRANSPORTS, default='inprocess',
+                        help="Serve in this process or over stdio from a child process (default: inprocess)")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent clients (default: 8)")
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds of load (default: 30)")
+    parser.add_argument('--requests', type=int, default=0, help="Requests per client (default: until --duration)")
+    parser.add_argument('--think-ms', type=float, default=0.0, help="Pause of a client between requests")
+    parser.add_argument('--mix', help="Operation weights, e.g. band_list=50,band_info=50 (default: "
+                                      + ','.join(f"{op}={weight}" for op, weight in DEFAULT_MIX.items()) + ")")
+    parser.add_argument('--work-dir', help="Directory for the library copy (default: a temporary directory)")
+    parser.add_argument('--output', help="Write the JSON results to this file")
+    parser.add_argument('--baseline', help=f"Compare with this result file (default: {DEFAULT_BASELINE.name} "
+                                           "next to this script, when it exists)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed change of p95 latency and throughput, as a fraction (default: 0.25)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore p95 latency increases smaller than this (default: 5)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store the results as the baseline")
+    parser.add_argument('--fs-latency-ms', type=float, default=0.0,
+                        help="Simulated round trip of every file system operation (in-process only)")
+    parser.add_argument('--fs-jitter-ms', type=float, default=0.0, help="Random variation of the round trips")
+    parser.add_argument('--config', action='append', default=[], metavar='KEY=VALUE',
+                        help="Server configuration option, e.g. HANDLER_THREAD_POOL_SIZE=16 (repeatable)")
+    args = parser.parse_args(argv)
+
+    config_options = {}
+    for option in args.config:
+        key, separator, value = option.partition('=')
+        if not separator or not key.strip():
+            parser.error(f"--config expects KEY=VALUE, got {option!r}")
+        config_options[key.strip()] = value
+    try:
+        mix = _parse_mix(args.mix) if args.mix else None
+    except ValueError as e:
+        parser.error(f"--mix: {e}")
+    logging.basicConfig(level=logging.WARNING)
+
+    generated_dir = None
+    if args.collection:
+        source_dir = Path(args.collection)
+        if not source_dir.is_dir():
+            print(f"❌ Library not found: {source_dir}")
+            return 1
+    else:
+        generated_dir = Path(tempfile.mkdtemp(prefix="music-mcp-collection-"))
+        source_dir = generated_dir / "library"
+        bands = args.bands or SIZE_PRESETS[args.size]
+        print(f"🎵 Generating {bands} bands (seed {args.seed})")
+        generate_collection(source_dir, bands, seed=args.seed)
+
+    try:
+        limit = f"{args.requests} requests each" if args.requests else f"{args.duration:g} s"
+        print(f"🔥 {args.clients} clients over {args.transport}, {limit}")
+        results = run_load_test(source_dir, clients=args.clients, duration=args.duration,
+                                max_requests=args.requests, think_ms=args.think_ms, mix=mix,
+                                transport=args.transport, seed=args.seed,
+                                work_dir=Path(args.work_dir) if args.work_dir else None,
+                                fs_latency_ms=args.fs_latency_ms, fs_jitter_ms=args.fs_jitter_ms,
+                                config_options=config_options)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        if generated_dir is not None:
+            shutil.rmtree(generated_dir, ignore_errors=True)
+
+    _print_results(results)
+    baseline_path = Path(args.baseline) if args.baseline else DEFAULT_BASELINE
+    status = 0
+    if baseline_path.exists() and not args.save_baseline:
+        comparison = compare_load_results(results, json.loads(baseline_path.read_text(encoding='utf-8')),
+                                          args.threshold, args.min_delta_ms)
+        results['comparison'] = comparison
+        if not comparison['settings_match']:
+            print("\n⚠️  The baseline was measured with another library or load; results are not comparable")
+        for operation, row in comparison['operations'].items():
+            if row['status'] == 'regressed':
+                print(f"🐢 {operation}: {', '.join(row['reasons'])} (p95 x{row['p95_ratio']:.2f}, "
+                      f"throughput x{row['throughput_ratio']:.2f})")
+        if comparison['regressions']:
+            status = 1
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + '\n', encoding='utf-8')
+        print(f"💾 Results written to {args.output}")
+    if args.save_baseline:
+        baseline_path.write_text(text + '\n', encoding='utf-8')
+        print(f"💾 Baseline saved to {baseline_path}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
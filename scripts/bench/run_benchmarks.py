@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Music Collection MCP Server
+
+Runs the server's tools and resources against a synthetic library from
+gen_collection.py, through an in-memory MCP client, so the timings include
+what a client sees (parameter validation, the handler pool, serialization):
+
+- scan_full / scan_noop: first scan of the library, and a scan without changes
+- scan_scoped: rescan of one band (incremental mode)
+- band_list_*: get_band_list_tool with search, filters, sorting and albums
+- advanced_search_*: advanced_search_albums_tool by year, type and rating
+- analytics_insights: analyze_collection_insights_tool
+- resource_*: collection://summary, collection://analytics and band://info
+- migrate_dry_run: migrate_band_structure with dry_run=true
+
+Each benchmark runs --warmup times untimed and --repeat times timed. The
+results (min, median, mean, p95 and max per benchmark, with the library
+manifest and the environment) are written as JSON. With --baseline, the
+medians are compared with a stored result file: a benchmark regressed when
+its median is more than --threshold slower (a baseline may set thresholds
+per benchmark) and at least --min-delta-ms slower, and the runner then
+exits with status 1.
+
+The library is copied to a work directory first; the source is never
+modified. Timings are only comparable on the same machine with the same
+library (size and seed), so save a baseline per machine with --save-baseline.
+
+--fs-latency-ms simulates network storage: the scanner and storage then
+reach the library through a LatencyFileSystem, which delays every scandir,
+stat, open, rename and flock (by --fs-jitter-ms more or less) and can fail
+a fraction of them (--fs-failure-rate). The results then also show how many
+of each operation a run of every benchmark made. --config sets server
+options, e.g. --config METADATA_STORAGE_FORMAT=gzip, to compare settings.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Allow running from the repository root without installation
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from gen_collection import SIZE_PRESETS, generate_collection, load_manifest
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+
+RESULTS_VERSION = 1
+
+
+class Benchmark:
+    """One timed MCP call."""
+
+    def __init__(self, name: str, kind: str, target: str, arguments: Optional[Dict[str, Any]] = None,
+                 setup: Optional[Callable[['BenchmarkContext'], None]] = None):
+        """
+        Initialize benchmark.
+
+        Args:
+            name: Benchmark name (the key in results and baselines)
+            kind: 'tool' or 'resource'
+            target: Tool name or resource URI
+            arguments: Tool arguments
+            setup: Called untimed before every run, e.g. to restore the library
+        """
+        self.name = name
+        self.kind = kind
+        self.target = target
+        self.arguments = arguments or {}
+        self.setup = setup
+
+
+class BenchmarkContext:
+    """Library copies used by a benchmark run."""
+
+    def __init__(self, source: Path, work_dir: Path):
+        self.source = source
+        self.library = work_dir / "library"
+
+    def restore_library(self) -> None:
+        """Replace the work library with a fresh copy of the source."""
+        if self.library.exists():
+            shutil.rmtree(self.library)
+        shutil.copytree(self.source, self.library)
+
+
+def build_benchmarks(manifest: Dict[str, Any]) -> List[Benchmark]:
+    """
+    Get the benchmarks for a library, in the order they run.
+
+    Args:
+        manifest: Manifest of the library (names sample bands)
+
+    Returns:
+        Benchmarks; scan_full runs first, as the others need a scanned library
+    """
+    samples = manifest.get('samples', {})
+    band = next((names[0] for names in samples.values() if names), None)
+    genre = manifest.get('genres', ["Heavy Metal"])[0]
+    benchmarks = [
+        Benchmark('scan_full', 'tool', 'scan_music_folders', setup=BenchmarkContext.restore_library),
+        Benchmark('scan_noop', 'tool', 'scan_music_folders'),
+        Benchmark('band_list_default', 'tool', 'get_band_list_tool'),
+        Benchmark('band_list_search', 'tool', 'get_band_list_tool', {'search_query': "Iron"}),
+        Benchmark('band_list_filtered', 'tool', 'get_band_list_tool',
+                  {'filter_genre': genre, 'filter_has_metadata': True}),
+        Benchmark('band_list_sorted_page', 'tool', 'get_band_list_tool',
+                  {'sort_by': 'albums_count', 'sort_order': 'desc', 'page': 3}),
+        Benchmark('band_list_with_albums', 'tool', 'get_band_list_tool',
+                  {'include_albums': True, 'page_size': 20}),
+        Benchmark('advanced_search_years', 'tool', 'advanced_search_albums_tool',
+                  {'year_min': 1990, 'year_max': 1999}),
+        Benchmark('advanced_search_types', 'tool', 'advanced_search_albums_tool',
+                  {'album_types': "Live,EP", 'editions': "Deluxe Edition"}),
+        Benchmark('advanced_search_rating', 'tool', 'advanced_search_albums_tool', {'min_rating': 7}),
+        Benchmark('analytics_insights', 'tool', 'analyze_collection_insights_tool'),
+        Benchmark('resource_collection_summary', 'resource', 'collection://summary'),
+        Benchmark('resource_analytics', 'resource', 'collection://analytics'),
+    ]
+    if band:
+        benchmarks.insert(2, Benchmark('scan_scoped', 'tool', 'scan_music_folders', {'band_names': [band]}))
+        benchmarks.append(Benchmark('resource_band_info', 'resource', f"band://info/{band}"))
+    migration_band = next(iter(samples.get('default', [])), None)
+    if migration_band:
+        benchmarks.append(Benchmark('migrate_dry_run', 'tool', 'migrate_band_structure',
+                                    {'band_name': migration_band, 'migration_type': 'default_to_enhanced',
+                                     'dry_run': True}))
+    return benchmarks
+
+
+def summarize(seconds: List[float]) -> Dict[str, Any]:
+    """Statistics of the timed runs of a benchmark, in seconds."""
+    ordered = sorted(seconds)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        'runs': len(ordered),
+        'min': round(ordered[0], 6),
+        'median': round(statistics.median(ordered), 6),
+        'mean': round(statistics.fmean(ordered), 6),
+        'p95': round(ordered[p95_index], 6),
+        'max': round(ordered[-1], 6)
+    }
+
+
+async def make_call(client: Any, benchmark: Benchmark) -> Optional[str]:
+    """Make the benchmark's call; return its error, None if it succeeded."""
+    if benchmark.kind == 'resource':
+        contents = await client.read_resource(benchmark.target)
+        if not contents:
+            return "empty resource"
+        # Resources render failures as Markdown with an error heading near the top
+        text = getattr(contents[0], 'text', "") or ""
+        return next((line.lstrip('# ') for line in text.splitlines()[:5]
+                     if line.startswith('#') and 'Error' in line), None)
+    result = await client.call_tool(benchmark.target, benchmark.arguments, raise_on_error=False)
+    if result.is_error:
+        return str(result.content[0].text if result.content else "tool error")
+    data = result.data if isinstance(result.data, dict) else {}
+    if data.get('status') == 'error':
+        error = data.get('error') or data.get('message')
+        return str(error.get('message', error) if isinstance(error, dict) else error)
+    return None
+
+
+async def _run_suite(context: BenchmarkContext, benchmarks: List[Benchmark], repeat: int,
+                     warmup: int) -> Dict[str, Any]:
+    from fastmcp import Client
+    from src.core.tools.filesystem import get_filesystem
+    from src.mcp_server import mcp
+
+    filesystem = get_filesystem()
+    results = {}
+    async with Client(mcp) as client:
+        for benchmark in benchmarks:
+            seconds = []
+            error = None
+            calls_before = None
+            for run in range(warmup + repeat):
+                if run == warmup and hasattr(filesystem, 'get_stats'):
+                    calls_before = filesystem.get_stats()['calls']
+                if benchmark.setup:
+                    benchmark.setup(context)
+                started = time.perf_counter()
+                error = await make_call(client, benchmark)
+                elapsed = time.perf_counter() - started
+                if error:
+                    break
+                if run >= warmup:
+                    seconds.append(elapsed)
+            if error:
+                print(f"  ❌ {benchmark.name}: {error}")
+                results[benchmark.name] = {'error': error}
+                continue
+            if seconds:
+                results[benchmark.name] = summarize(seconds)
+                if calls_before is not None:
+                    calls_after = filesystem.get_stats()['calls']
+                    results[benchmark.name]['filesystem_calls'] = {
+                        operation: round((calls_after[operation] - calls_before[operation]) / len(seconds), 1)
+                        for operation in calls_after}
+                print(f"  ✅ {benchmark.name:<28} median {results[benchmark.name]['median'] * 1000:10.1f} ms")
+    return results
+
+
+def run_benchmarks(source: Path, repeat: int = 5, warmup: int = 1, only: Optional[List[str]] = None,
+                   work_dir: Optional[Path] = None, fs_latency_ms: float = 0.0, fs_jitter_ms: float = 0.0,
+                   fs_failure_rate: float = 0.0, fs_seed: Optional[int] = None,
+                   config_options: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Run the benchmark suite against a copy of a library.
+
+    Args:
+        source: Library generated by gen_collection.py (not modified)
+        repeat: Timed runs per benchmark
+        warmup: Untimed runs per benchmark before the timed ones
+        only: Names of the benchmarks to run (scan_full always runs, once
+            untimed if it is not selected, to scan the library)
+        work_dir: Directory for the library copy (a temporary one by default)
+        fs_latency_ms: Simulated round trip of every file system operation
+        fs_jitter_ms: Random variation of the simulated round trips
+        fs_failure_rate: Fraction of file system operations failing
+        fs_seed: Seed of the jitter and failures
+        config_options: Server configuration options (values as in the environment)
+
+    Returns:
+        Results with the manifest, settings, environment and per-benchmark statistics
+    """
+    from src.config import Config
+    from src.core.tools.filesystem import LatencyFileSystem, configure_filesystem
+    from src.di import override_dependency
+
+    manifest = load_manifest(source) or {}
+    benchmarks = build_benchmarks(manifest)
+    if only:
+        benchmarks = [b for b in benchmarks if b.name in only or b.name == 'scan_full']
+
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = work_dir = Path(tempfile.mkdtemp(prefix="music-mcp-bench-"))
+    context = BenchmarkContext(Path(source), Path(work_dir))
+    context.restore_library()
+    filesystem_settings = {'latency_ms': fs_latency_ms, 'jitter_ms': fs_jitter_ms,
+                           'failure_rate': fs_failure_rate, 'seed': fs_seed}
+    simulated = fs_latency_ms > 0 or fs_jitter_ms > 0 or fs_failure_rate > 0
+    config = Config(**{**(config_options or {}), 'MUSIC_ROOT_PATH': str(context.library)})
+    try:
+        if simulated:
+            configure_filesystem(LatencyFileSystem(latency_ms=fs_latency_ms, jitter_ms=fs_jitter_ms,
+                                                   failure_rate=fs_failure_rate, seed=fs_seed))
+        with override_dependency(Config, config):
+            results = {}
+            if only and 'scan_full' not in only:
+                # The other benchmarks need a scanned library; only a failed scan is reported
+                results = asyncio.run(_run_suite(context, benchmarks[:1], repeat=0, warmup=1))
+                benchmarks = benchmarks[1:]
+            results.update(asyncio.run(_run_suite(context, benchmarks, repeat, warmup)))
+    finally:
+        if simulated:
+            configure_filesystem()
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(),
+        'collection': {key: manifest.get(key) for key in ('seed', 'counts', 'parameters')},
+        'environment': environment_info(),
+        'settings': {'repeat': repeat, 'warmup': warmup, 'config': dict(config_options or {}),
+                     'filesystem': filesystem_settings if simulated else {'latency_ms': 0.0}},
+        'benchmarks': results
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine and code version the results were measured with."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'commit': commit
+    }
+
+
+def compare_results(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+                    min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> Dict[str, Any]:
+    """
+    Compare benchmark medians with a baseline.
+
+    A benchmark regressed when its median is more than threshold (a fraction;
+    the baseline's 'thresholds' can set one per benchmark) and min_delta_ms
+    slower than the baseline median. Benchmarks that failed count as regressed.
+
+    Args:
+        results: Result of run_benchmarks()
+        baseline: Stored result of an earlier run
+        threshold: Allowed slowdown, e.g. 0.25 for 25%
+        min_delta_ms: Slowdowns smaller than this are noise
+
+    Returns:
+        Dict with per-benchmark comparisons, the regressed benchmark names,
+        collection_matches (False when the libraries differ, which makes
+        the comparison meaningless) and settings_match (False when the
+        simulated file systems or server options differ)
+    """
+    thresholds = baseline.get('thresholds', {})
+    comparisons = {}
+    regressions = []
+    for name, current in results.get('benchmarks', {}).items():
+        base = baseline.get('benchmarks', {}).get(name)
+        if 'error' in current:
+            comparisons[name] = {'status': 'failed', 'error': current['error']}
+            regressions.append(name)
+            continue
+        if not base or 'median' not in base:
+            comparisons[name] = {'status': 'new', 'median': current['median']}
+            continue
+        allowed = thresholds.get(name, threshold)
+        ratio = current['median'] / base['median'] if base['median'] > 0 else 1.0
+        delta_ms = (current['median'] - base['median']) * 1000
+        if ratio > 1 + allowed and delta_ms >= min_delta_ms:
+            status = 'regressed'
+            regressions.append(name)
+        elif ratio < 1 / (1 + allowed) and -delta_ms >= min_delta_ms:
+            status = 'improved'
+        else:
+            status = 'ok'
+        comparisons[name] = {'status': status, 'baseline_median': base['median'], 'median': current['median'],
+                             'ratio': round(ratio, 3), 'threshold': allowed}
+    return {
+        'collection_matches': results.get('collection') == baseline.get('collection'),
+        'settings_match': all(results.get('settings', {}).get(key) == baseline.get('settings', {}).get(key)
+                              for key in ('filesystem', 'config')),
+        'regressions': regressions,
+        'benchmarks': comparisons
+    }
+
+
+def _print_comparison(comparison: Dict[str, Any]) -> None:
+    icons = {'ok': '✅', 'improved': '🚀', 'regressed': '🐢', 'failed': '❌', 'new': '🆕'}
+    print("\n📊 Comparison with baseline")
+    if not comparison['collection_matches']:
+        print("⚠️  The baseline was measured on a different library; timings are not comparable")
+    if not comparison['settings_match']:
+        print("⚠️  The baseline was measured with other file system or server settings")
+    for name, row in comparison['benchmarks'].items():
+        if 'ratio' in row:
+            print(f"  {icons[row['status']]} {name:<28} {row['baseline_median'] * 1000:10.1f} ms -> "
+                  f"{row['median'] * 1000:10.1f} ms  x{row['ratio']:.2f}")
+        else:
+            print(f"  {icons[row['status']]} {name:<28} {row['status']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main benchmark interface."""
+    parser = argparse.ArgumentParser(description="Benchmark the Music Collection MCP Server")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--collection', help="Library generated by gen_collection.py (not modified)")
+    source.add_argument('--size', choices=sorted(SIZE_PRESETS), default='small',
+                        help="Generate a library of this preset size (default: small)")
+    source.add_argument('--bands', type=int, help="Generate a library with this many bands")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of a generated library (default: 42)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument('--warmup', type=int, default=1, help="Untimed runs per benchmark (default: 1)")
+    parser.add_argument('--only', help="Comma-separated benchmark names to run")
+    parser.add_argument('--work-dir', help="Directory for the library copy (default: a temporary directory)")
+    parser.add_argument('--output', help="Write the JSON results to this file (default: print them)")
+    parser.add_argument('--baseline', help=f"Compare with this result file (default: {DEFAULT_BASELINE.name} "
+                                           "next to this script, when it exists)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of a median, as a fraction (default: 0.25)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore slowdowns smaller than this (default: 5)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store the results as the baseline")
+    parser.add_argument('--fs-latency-ms', type=float, default=0.0,
+                        help="Simulated round trip of every file system operation, e.g. 2-20 for a NAS")
+    parser.add_argument('--fs-jitter-ms', type=float, default=0.0, help="Random variation of the round trips")
+    parser.add_argument('--fs-failure-rate', type=float, default=0.0,
+                        help="Fraction of file system operations failing with EIO")
+    parser.add_argument('--fs-seed', type=int, help="Seed of the simulated jitter and failures")
+    parser.add_argument('--config', action='append', default=[], metavar='KEY=VALUE',
+                        help="Server configuration option, e.g. METADATA_STORAGE_FORMAT=gzip (repeatable)")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be at least 1 and --warmup at least 0")
+    if min(args.fs_latency_ms, args.fs_jitter_ms, args.fs_failure_rate) < 0 or args.fs_failure_rate > 1:
+        parser.error("--fs-* values must not be negative, and --fs-failure-rate at most 1")
+    config_options = {}
+    for option in args.config:
+        key, separator, value = option.partition('=')
+        if not separator or not key.strip():
+            parser.error(f"--config expects KEY=VALUE, got {option!r}")
+        config_options[key.strip()] = value
+    logging.basicConfig(level=logging.WARNING)
+
+    generated_dir = None
+    if args.collection:
+        source_dir = Path(args.collection)
+        if not source_dir.is_dir():
+            print(f"❌ Library not found: {source_dir}")
+            return 1
+    else:
+        generated_dir = Path(tempfile.mkdtemp(prefix="music-mcp-collection-"))
+        source_dir = generated_dir / "library"
+        bands = args.bands or SIZE_PRESETS[args.size]
+        print(f"🎵 Generating {bands} bands (seed {args.seed})")
+        generate_collection(source_dir, bands, seed=args.seed)
+
+    try:
+        print(f"⏱️  Running benchmarks on {source_dir}")
+        only = [name.strip() for name in args.only.split(',')] if args.only else None
+        results = run_benchmarks(source_dir, repeat=args.repeat, warmup=args.warmup, only=only,
+                                 work_dir=Path(args.work_dir) if args.work_dir else None,
+                                 fs_latency_ms=args.fs_latency_ms, fs_jitter_ms=args.fs_jitter_ms,
+                                 fs_failure_rate=args.fs_failure_rate, fs_seed=args.fs_seed,
+                                 config_options=config_options)
+    finally:
+        if generated_dir is not None:
+            shutil.rmtree(generated_dir, ignore_errors=True)
+
+    baseline_path = Path(args.baseline) if args.baseline else DEFAULT_BASELINE
+    status = 0
+    if baseline_path.exists() and not args.save_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        comparison = compare_results(results, baseline, args.threshold, args.min_delta_ms)
+        results['comparison'] = comparison
+        _print_comparison(comparison)
+        if comparison['regressions']:
+            print(f"\n🐢 Regressed: {', '.join(comparison['regressions'])}")
+            status = 1
+    elif any('error' in result for result in results['benchmarks'].values()):
+        status = 1
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + '\n', encoding='utf-8')
+        print(f"💾 Results written to {args.output}")
+    elif not args.save_baseline:
+        print(text)
+    if args.save_baseline:
+        baseline_path.write_text(text + '\n', encoding='utf-8')
+        print(f"💾 Baseline saved to {baseline_path}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
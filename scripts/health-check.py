@@ -8,6 +8,10 @@ This script provides comprehensive health monitoring for:
 - File system consistency
 - Performance monitoring
 - Configuration validation
+
+Metadata is read from METADATA_STORE_PATH (or --store) when an out-of-tree
+metadata store is used; reports are then written there too, so the music
+root is only read.
 """
 
 import os
@@ -20,24 +24,34 @@ from typing import Dict, List, Any, Optional, Tuple
 import hashlib
 from collections import defaultdict, Counter
 
+# Allow running from the repository root without installation
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.tools.json_codec import read_json_file
+from src.core.tools.metadata_store import MetadataStore
+
 
 class MusicCollectionHealthCheck:
     """Comprehensive health check system for Music Collection MCP Server."""
     
-    def __init__(self, music_root: str):
+    def __init__(self, music_root: str, store_path: Optional[str] = None):
         """
         Initialize health check system.
         
         Args:
             music_root: Root path of music collection
+            store_path: Out-of-tree metadata store (defaults to METADATA_STORE_PATH)
         """
         self.music_root = Path(music_root)
+        self.metadata_store = MetadataStore(music_root, store_path or os.getenv('METADATA_STORE_PATH'))
+        self.metadata_root = self.metadata_store.metadata_root
         self.start_time = time.time()
         
         # Health check results
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'music_root': str(self.music_root),
+            'metadata_root': str(self.metadata_root),
             'overall_health': 'unknown',
             'checks': {},
             'issues': [],
@@ -99,7 +113,7 @@ class MusicCollectionHealthCheck:
             
             # Check write permissions for metadata
             try:
-                test_file = self.music_root / ".health_check_test"
+                test_file = self.metadata_root / ".health_check_test"
                 test_file.touch()
                 test_file.unlink()
                 check_result['details']['write_access'] = True
@@ -142,7 +156,7 @@ class MusicCollectionHealthCheck:
             'issues': []
         }
         
-        collection_index_file = self.music_root / ".collection_index.json"
+        collection_index_file = self.metadata_store.collection_index_file()
         
         if not collection_index_file.exists():
             check_result['status'] = 'warning'
@@ -150,8 +164,7 @@ class MusicCollectionHealthCheck:
             self.results['warnings'].append("Collection index missing - run scan_music_folders")
         else:
             try:
-                with open(collection_index_file) as f:
-                    collection_index = json.load(f)
+                collection_index = read_json_file(collection_index_file)
                 
                 # Validate index structure
                 required_fields = ['bands', 'collection_stats', 'last_updated']
@@ -192,7 +205,7 @@ class MusicCollectionHealthCheck:
                         check_result['issues'].append("Album count mismatch in statistics")
                         self.results['warnings'].append("Collection statistics may be inconsistent")
                 
-            except json.JSONDecodeError:
+            except ValueError:
                 check_result['status'] = 'fail'
                 check_result['issues'].append("Collection index is corrupted (invalid JSON)")
                 self.results['issues'].append("Collection index file is corrupted")
@@ -219,7 +232,7 @@ class MusicCollectionHealthCheck:
         total_size = 0
         
         # Find all metadata files
-        for root, dirs, files in os.walk(self.music_root):
+        for root, dirs, files in os.walk(self.metadata_root):
             for file in files:
                 if file == ".band_metadata.json":
                     metadata_files.append(Path(root) / file)
@@ -229,8 +242,7 @@ class MusicCollectionHealthCheck:
         # Check each metadata file
         for metadata_file in metadata_files:
             try:
-                with open(metadata_file) as f:
-                    metadata = json.load(f)
+                metadata = read_json_file(metadata_file)
                 
                 # Basic structure validation
                 if not isinstance(metadata, dict):
@@ -244,7 +256,7 @@ class MusicCollectionHealthCheck:
                 
                 total_size += metadata_file.stat().st_size
                 
-            except json.JSONDecodeError:
+            except ValueError:
                 corrupted_files.append(str(metadata_file))
             except Exception:
                 corrupted_files.append(str(metadata_file))
@@ -308,11 +320,10 @@ class MusicCollectionHealthCheck:
         check_result['details']['actual_albums'] = sum(band['albums_count'] for band in actual_bands.values())
         
         # Compare with collection index
-        collection_index_file = self.music_root / ".collection_index.json"
+        collection_index_file = self.metadata_store.collection_index_file()
         if collection_index_file.exists():
             try:
-                with open(collection_index_file) as f:
-                    collection_index = json.load(f)
+                collection_index = read_json_file(collection_index_file)
                 
                 indexed_bands = collection_index.get('bands', {})
                 check_result['details']['indexed_bands'] = len(indexed_bands)
@@ -348,7 +359,7 @@ class MusicCollectionHealthCheck:
                     check_result['details']['album_count_mismatches'] = album_count_mismatches
                     self.results['warnings'].append("Album counts may be outdated")
                 
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 check_result['status'] = 'fail'
                 check_result['issues'].append("Cannot compare with collection index")
         else:
@@ -635,6 +646,8 @@ class MusicCollectionHealthCheck:
         print(f"\n{health_icons[results['overall_health']]} OVERALL HEALTH: {results['overall_health'].upper()}")
         print(f"📅 Check Date: {results['timestamp']}")
         print(f"📁 Music Root: {results['music_root']}")
+        if results.get('metadata_root') != results['music_root']:
+            print(f"🗂️  Metadata Store: {results['metadata_root']}")
         print(f"⏱️  Check Duration: {results['metrics'].get('check_duration', 0):.2f}s")
         
         # Check summary
@@ -683,7 +696,7 @@ class MusicCollectionHealthCheck:
         
         if output_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.music_root / f"health_check_{timestamp}.json"
+            output_file = self.metadata_root / f"health_check_{timestamp}.json"
         
         output_path = Path(output_file)
         
@@ -703,13 +716,26 @@ Quick Health Check for Music Collection MCP Server
 
 import sys
 import json
+import gzip
+import zlib
 from pathlib import Path
 from datetime import datetime
 
-def quick_health_check(music_path):
+def load_json(path):
+    """Load a metadata file written in any METADATA_STORAGE_FORMAT."""
+    raw = path.read_bytes()
+    if raw[:2] == b"\\x1f\\x8b":
+        raw = gzip.decompress(raw)
+    elif len(raw) > 1 and raw[0] == 0x78 and (raw[0] * 256 + raw[1]) % 31 == 0:
+        raw = zlib.decompress(raw)
+    return json.loads(raw)
+
+def quick_health_check(music_path, store_path=None):
     """Run a quick health check."""
     
     music_root = Path(music_path)
+    # Metadata lives in the out-of-tree store when one is used
+    metadata_root = Path(store_path) if store_path else music_root
     print("🏥 Quick Health Check")
     print("=" * 30)
     
@@ -721,14 +747,13 @@ def quick_health_check(music_path):
         return False
     
     # Check collection index
-    index_file = music_root / ".collection_index.json"
+    index_file = metadata_root / ".collection_index.json"
     if not index_file.exists():
         print("⚠️  Collection index missing - run scan")
         issues += 1
     else:
         try:
-            with open(index_file) as f:
-                index = json.load(f)
+            index = load_json(index_file)
             
             bands = len(index.get('bands', {}))
             print(f"✅ Collection index: {bands} bands")
@@ -741,7 +766,7 @@ def quick_health_check(music_path):
                 if days_old > 30:
                     print(f"⚠️  Index is {days_old} days old")
                     issues += 1
-        except (json.JSONDecodeError, KeyError):
+        except (ValueError, KeyError, OSError, zlib.error):
             print("❌ Collection index corrupted")
             issues += 1
     
@@ -750,7 +775,7 @@ def quick_health_check(music_path):
     print(f"📁 Filesystem: {actual_bands} band folders")
     
     # Check metadata files
-    metadata_files = list(music_root.rglob(".band_metadata.json"))
+    metadata_files = list(metadata_root.rglob(".band_metadata.json"))
     print(f"📄 Metadata files: {len(metadata_files)}")
     
     if issues == 0:
@@ -761,11 +786,11 @@ def quick_health_check(music_path):
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_health_check.py <music_path>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python quick_health_check.py <music_path> [<metadata_store_path>]")
         sys.exit(1)
     
-    success = quick_health_check(sys.argv[1])
+    success = quick_health_check(*sys.argv[1:])
     sys.exit(0 if success else 1)
 '''
     
@@ -777,7 +802,7 @@ def main():
     
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  python health-check.py <music_path> [--save-report] [--output <file>]")
+        print("  python health-check.py <music_path> [--store <metadata_store>] [--save-report] [--output <file>]")
         print("\nExamples:")
         print("  python health-check.py /home/user/Music")
         print("  python health-check.py C:\\Users\\User\\Music --save-report")
@@ -795,6 +820,14 @@ def main():
             print("Error: --output requires a filename")
             sys.exit(1)
     
+    store_path = None
+    if '--store' in sys.argv:
+        try:
+            store_path = os.path.abspath(os.path.expanduser(sys.argv[sys.argv.index('--store') + 1]))
+        except IndexError:
+            print("Error: --store requires a directory")
+            sys.exit(1)
+    
     # Expand user path and make absolute
     music_path = os.path.abspath(os.path.expanduser(music_path))
     
@@ -803,7 +836,7 @@ def main():
         sys.exit(1)
     
     # Run health check
-    health_checker = MusicCollectionHealthCheck(music_path)
+    health_checker = MusicCollectionHealthCheck(music_path, store_path)
     results = health_checker.run_full_health_check()
     
     # Print report
@@ -816,7 +849,7 @@ def main():
     
     # Create quick health check script
     quick_script_content = create_health_check_script()
-    quick_script_path = Path(music_path) / "quick_health_check.py"
+    quick_script_path = health_checker.metadata_root / "quick_health_check.py"
     try:
         with open(quick_script_path, 'w') as f:
             f.write(quick_script_content)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Metadata Store Importer for Music Collection MCP Server
+
+One-shot import of existing in-tree metadata (.band_metadata.json per band
+and .collection_index.json) into an out-of-tree metadata store. The music
+root is only read; after the import, set METADATA_STORE_PATH so the server
+never writes into the music tree again.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Allow running from the repository root without installation
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.tools.metadata_store import MetadataStore
+
+
+def main():
+    """Main import interface."""
+    args = [arg for arg in sys.argv[1:] if arg != "--overwrite"]
+    overwrite = "--overwrite" in sys.argv[1:]
+
+    if len(args) != 2:
+        print("Usage: python import-metadata-store.py <music_path> <store_path> [--overwrite]")
+        print("\nExample:")
+        print("  python import-metadata-store.py /mnt/nas/music /var/lib/music-mcp")
+        sys.exit(1)
+
+    music_path = os.path.abspath(os.path.expanduser(args[0]))
+    store_path = os.path.abspath(os.path.expanduser(args[1]))
+
+    print("🎵 Music Collection Metadata Store Import")
+    print(f"📁 Music root: {music_path}")
+    print(f"🗄️  Metadata store: {store_path}")
+
+    try:
+        result = MetadataStore(music_path, store_path).import_in_tree_metadata(overwrite=overwrite)
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
+
+    print(f"\n✅ Imported {result['bands_imported']} band metadata files "
+          f"({result['bands_skipped']} already in store)")
+    print(f"   Collection index imported: {result['collection_index_imported']}")
+    for error in result['errors']:
+        print(f"⚠️  {error}")
+    print(f"\nSet METADATA_STORE_PATH={store_path} to use the store.")
+
+    sys.exit(0 if result['status'] == 'success' else 2)
+
+
+if __name__ == "__main__":
+    main()
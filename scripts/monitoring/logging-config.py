@@ -4,16 +4,110 @@ Logging Configuration for Music Collection MCP Server
 
 This module provides comprehensive logging configuration for monitoring,
 debugging, and maintaining the MCP server in different environments.
+
+Logging never blocks the code that logs: loggers put records on a bounded
+queue (QueueHandler) and a listener thread per logger formats and writes
+them (QueueListener). When the queue is full, records are dropped and
+counted instead of waiting for the disk. Records below ERROR are
+rate-limited per call site, so a debug line logged for every band or album
+keeps only a sample of its records on large collections. PerformanceLogger
+and MCPRequestLogger write their structured records in batches.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 import os
 import json
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Rate-limit and sample records per call site.
+
+    Each call site (logger, file and line) may log up to burst records at
+    once, refilled at per_second. Beyond that, one in sample_every records is
+    kept. The next record kept from a site says how many were suppressed.
+    Records at or above exempt_level always pass.
+    """
+
+    def __init__(self, per_second: float = 10.0, burst: int = 50, sample_every: int = 100,
+                 exempt_level: int = logging.ERROR):
+        """
+        Initialize rate limit filter.
+
+        Args:
+            per_second: Records per second a call site may log after its burst
+            burst: Records a call site may log at once
+            sample_every: Keep one in this many records over the limit (0 drops them all)
+            exempt_level: Records at this level or above are never limited
+        """
+        super().__init__()
+        self.per_second = per_second
+        self.burst = burst
+        self.sample_every = sample_every
+        self.exempt_level = exempt_level
+        self.suppressed_total = 0
+        self._lock = threading.Lock()
+        # Call site -> [tokens, last refill, records over the limit, suppressed since last kept]
+        self._sites: Dict[Tuple[str, str, int], List[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        site_key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(site_key)
+            if site is None:
+                site = self._sites[site_key] = [float(self.burst), now, 0, 0]
+            site[0] = min(float(self.burst), site[0] + (now - site[1]) * self.per_second)
+            site[1] = now
+            if site[0] >= 1:
+                site[0] -= 1
+                keep = True
+            else:
+                site[2] += 1
+                keep = self.sample_every > 0 and site[2] % self.sample_every == 0
+            if not keep:
+                site[3] += 1
+                self.suppressed_total += 1
+                return False
+            suppressed, site[3] = site[3], 0
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar records suppressed]"
+            record.args = None
+            record.suppressed_records = suppressed
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops (and counts) records when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the arguments here; the listener thread formats the record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 class MCPLoggingConfig:
@@ -36,20 +130,30 @@ class MCPLoggingConfig:
         'production': '[%(asctime)s] %(levelname)s - %(message)s'
     }
     
-    def __init__(self, log_dir: Optional[str] = None, environment: str = "production"):
+    def __init__(self, log_dir: Optional[str] = None, environment: str = "production",
+                 capture_root: bool = False):
         """
         Initialize logging configuration.
         
         Args:
             log_dir: Directory for log files (if None, uses temp directory)
             environment: Deployment environment (development, testing, production)
+            capture_root: Also send records of the root logger (which the
+                server's modules log through) to the configured handlers
         """
         self.environment = environment
         self.log_dir = Path(log_dir) if log_dir else Path.cwd() / "logs"
         self.log_dir.mkdir(exist_ok=True)
+        self.capture_root = capture_root
         
         # Configure based on environment
         self.config = self._get_environment_config()
+        self.rate_limit_filter = RateLimitFilter(**self.config['rate_limit'])
+        # Queue handlers created by this config, with the loggers they are attached to
+        self._queue_handlers: List[Tuple[logging.Logger, NonBlockingQueueHandler]] = []
+        self._listeners: List[logging.handlers.QueueListener] = []
+        self._dropped = 0
+        self._atexit_registered = False
         
     def _get_environment_config(self) -> Dict[str, Any]:
         """Get logging configuration based on environment."""
@@ -62,7 +166,9 @@ class MCPLoggingConfig:
                 'log_mcp_requests': True,
                 'log_performance': True,
                 'max_file_size': 10 * 1024 * 1024,  # 10MB
-                'backup_count': 5
+                'backup_count': 5,
+                'queue_size': 50000,
+                'rate_limit': {'per_second': 50.0, 'burst': 500, 'sample_every': 20}
             },
             'testing': {
                 'level': 'INFO',
@@ -71,7 +177,9 @@ class MCPLoggingConfig:
                 'log_mcp_requests': False,
                 'log_performance': False,
                 'max_file_size': 5 * 1024 * 1024,  # 5MB
-                'backup_count': 3
+                'backup_count': 3,
+                'queue_size': 10000,
+                'rate_limit': {'per_second': 10.0, 'burst': 100, 'sample_every': 100}
             },
             'production': {
                 'level': 'ERROR',
@@ -80,7 +188,9 @@ class MCPLoggingConfig:
                 'log_mcp_requests': False,
                 'log_performance': False,
                 'max_file_size': 50 * 1024 * 1024,  # 50MB
-                'backup_count': 10
+                'backup_count': 10,
+                'queue_size': 10000,
+                'rate_limit': {'per_second': 5.0, 'burst': 50, 'sample_every': 100}
             }
         }
         
@@ -93,17 +203,26 @@ class MCPLoggingConfig:
         logger = logging.getLogger('music_mcp')
         logger.setLevel(self.LOG_LEVELS[self.config['level']])
         
-        # Clear existing handlers
+        # Clear existing handlers (and the queue handlers of an earlier setup)
+        self.shutdown()
         logger.handlers.clear()
         
-        # Add configured handlers
-        for handler_type in self.config['handlers']:
-            handler = self._create_handler(handler_type)
-            if handler:
-                logger.addHandler(handler)
+        # Add configured handlers behind a queue; with capture_root they serve
+        # the root logger, which music_mcp records propagate to. Handlers the
+        # application installed on the root logger are kept.
+        handlers = [handler for handler in map(self._create_handler, self.config['handlers']) if handler]
+        if self.capture_root:
+            root = logging.getLogger()
+            root.setLevel(self.LOG_LEVELS[self.config['level']])
+            self._attach_async(root, handlers)
+        else:
+            self._attach_async(logger, handlers)
         
         # Setup specialized loggers
         self._setup_specialized_loggers()
+        if not self._atexit_registered:
+            atexit.register(self.shutdown)
+            self._atexit_registered = True
         
         # Log initial configuration
         logger.info(f"Logging configured for {self.environment} environment")
@@ -168,7 +287,7 @@ class MCPLoggingConfig:
             mcp_logger = logging.getLogger('music_mcp.requests')
             mcp_handler = logging.FileHandler(self.log_dir / "mcp_requests.log")
             mcp_handler.setFormatter(JSONFormatter())
-            mcp_logger.addHandler(mcp_handler)
+            self._attach_async(mcp_logger, [mcp_handler], rate_limit=False)
             mcp_logger.setLevel(logging.INFO)
         
         # Performance Logger
@@ -176,7 +295,7 @@ class MCPLoggingConfig:
             perf_logger = logging.getLogger('music_mcp.performance')
             perf_handler = logging.FileHandler(self.log_dir / "performance.log")
             perf_handler.setFormatter(JSONFormatter())
-            perf_logger.addHandler(perf_handler)
+            self._attach_async(perf_logger, [perf_handler], rate_limit=False)
             perf_logger.setLevel(logging.INFO)
         
         # Error Logger (always enabled)
@@ -184,7 +303,48 @@ class MCPLoggingConfig:
         error_handler = logging.FileHandler(self.log_dir / "errors.log")
         error_handler.setFormatter(self._get_formatter())
         error_handler.setLevel(logging.ERROR)
-        error_logger.addHandler(error_handler)
+        self._attach_async(error_logger, [error_handler], rate_limit=False)
+    
+    def _attach_async(self, logger: logging.Logger, handlers: List[logging.Handler],
+                      rate_limit: bool = True) -> NonBlockingQueueHandler:
+        """
+        Send a logger's records to handlers through a queue and a listener thread.
+        
+        Args:
+            logger: Logger to attach the queue handler to
+            handlers: Handlers writing the records in the listener thread
+            rate_limit: Rate-limit and sample the records per call site
+                (structured request and performance records are already batched)
+        """
+        queue_handler = NonBlockingQueueHandler(queue.Queue(self.config['queue_size']))
+        if rate_limit:
+            queue_handler.addFilter(self.rate_limit_filter)
+        listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+        logger.addHandler(queue_handler)
+        self._queue_handlers.append((logger, queue_handler))
+        self._listeners.append(listener)
+        return queue_handler
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get the records waiting in the queues, dropped because a queue was full, and suppressed."""
+        return {
+            'queued': sum(handler.queue.qsize() for _, handler in self._queue_handlers),
+            'dropped': self._dropped + sum(handler.dropped for _, handler in self._queue_handlers),
+            'suppressed': self.rate_limit_filter.suppressed_total
+        }
+    
+    def shutdown(self) -> None:
+        """Write the queued records, stop the listener threads and detach the queue handlers."""
+        for logger, queue_handler in self._queue_handlers:
+            logger.removeHandler(queue_handler)
+            self._dropped += queue_handler.dropped
+        self._queue_handlers.clear()
+        for listener in self._listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        self._listeners.clear()
     
     def get_logger(self, name: str) -> logging.Logger:
         """Get logger for specific component."""
@@ -218,11 +378,78 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
-class PerformanceLogger:
+class _BatchingLogger:
+    """
+    Writes structured records in batches.
+    
+    Records are buffered and written as one log record holding a list of
+    them when batch_size records are buffered or flush_interval seconds after
+    the first one; flush() writes the buffer at once.
+    """
+    
+    def __init__(self, logger_name: str, message: str, batch_size: int = 50, flush_interval: float = 5.0):
+        self.logger = logging.getLogger(logger_name)
+        self.message = message
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def _emit(self, log_data: Dict[str, Any]) -> None:
+        """Buffer one structured record."""
+        with self._lock:
+            self._buffer.append(log_data)
+            if len(self._buffer) < self.batch_size:
+                if self._timer is None and self.flush_interval > 0:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            batch = self._take_batch()
+        self._write(batch)
+    
+    def flush(self) -> None:
+        """Write the buffered records."""
+        with self._lock:
+            batch = self._take_batch()
+        if batch:
+            self._write(batch)
+    
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        batch, self._buffer = self._buffer, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        record = logging.LogRecord(
+            name=self.logger.name,
+            level=logging.INFO,
+            pathname='',
+            lineno=0,
+            msg=self.message,
+            args=(),
+            exc_info=None
+        )
+        record.extra_fields = batch[0] if len(batch) == 1 else {'batch_size': len(batch), 'records': batch}
+        
+        self.logger.handle(record)
+
+
+class PerformanceLogger(_BatchingLogger):
     """Specialized logger for performance monitoring."""
     
-    def __init__(self):
-        self.logger = logging.getLogger('music_mcp.performance')
+    def __init__(self, batch_size: int = 50, flush_interval: float = 5.0):
+        """
+        Initialize performance logger.
+        
+        Args:
+            batch_size: Records written together (1 writes each at once)
+            flush_interval: Longest time a record waits for its batch, in seconds
+        """
+        super().__init__('music_mcp.performance', 'Performance metrics', batch_size, flush_interval)
         
     def log_operation(self, operation: str, duration: float, 
                      details: Optional[Dict[str, Any]] = None) -> None:
@@ -237,26 +464,21 @@ class PerformanceLogger:
         if details:
             log_data.update(details)
         
-        # Create log record with extra fields
-        record = logging.LogRecord(
-            name=self.logger.name,
-            level=logging.INFO,
-            pathname='',
-            lineno=0,
-            msg='Performance metric',
-            args=(),
-            exc_info=None
-        )
-        record.extra_fields = log_data
-        
-        self.logger.handle(record)
+        self._emit(log_data)
 
 
-class MCPRequestLogger:
+class MCPRequestLogger(_BatchingLogger):
     """Specialized logger for MCP request/response monitoring."""
     
-    def __init__(self):
-        self.logger = logging.getLogger('music_mcp.requests')
+    def __init__(self, batch_size: int = 50, flush_interval: float = 5.0):
+        """
+        Initialize request logger.
+        
+        Args:
+            batch_size: Records written together (1 writes each at once)
+            flush_interval: Longest time a record waits for its batch, in seconds
+        """
+        super().__init__('music_mcp.requests', 'MCP operations', batch_size, flush_interval)
         
     def log_request(self, method: str, params: Dict[str, Any],
                    request_id: Optional[str] = None) -> None:
@@ -305,43 +527,47 @@ class MCPRequestLogger:
     def _log_mcp_data(self, log_data: Dict[str, Any]) -> None:
         """Log MCP data with JSON formatting."""
         
-        record = logging.LogRecord(
-            name=self.logger.name,
-            level=logging.INFO,
-            pathname='',
-            lineno=0,
-            msg='MCP operation',
-            args=(),
-            exc_info=None
-        )
-        record.extra_fields = log_data
-        
-        self.logger.handle(record)
+        self._emit(log_data)
 
 
 def setup_monitoring(environment: str = "production", 
-                    log_dir: Optional[str] = None) -> Dict[str, Any]:
+                    log_dir: Optional[str] = None, capture_root: bool = False) -> Dict[str, Any]:
     """
     Setup complete monitoring configuration.
     
+    Args:
+        environment: Deployment environment (development, testing, production)
+        log_dir: Directory for log files
+        capture_root: Also log the server modules' records (root logger)
+    
     Returns:
-        Dictionary containing configured loggers and utilities
+        Dictionary containing configured loggers and utilities; call
+        'shutdown' to write everything buffered before exiting
     """
     
     # Setup main logging
-    logging_config = MCPLoggingConfig(log_dir=log_dir, environment=environment)
+    logging_config = MCPLoggingConfig(log_dir=log_dir, environment=environment, capture_root=capture_root)
     main_logger = logging_config.setup_logging()
     
     # Create specialized loggers
     performance_logger = PerformanceLogger()
     request_logger = MCPRequestLogger()
     
+    def shutdown() -> None:
+        performance_logger.flush()
+        request_logger.flush()
+        logging_config.shutdown()
+    
+    atexit.register(shutdown)
+    
     # Create monitoring utilities
     monitoring_utils = {
         'main_logger': main_logger,
         'performance_logger': performance_logger,
         'request_logger': request_logger,
         'get_logger': logging_config.get_logger,
+        'get_stats': logging_config.get_stats,
+        'shutdown': shutdown,
         'log_dir': logging_config.log_dir
     }
     
@@ -391,7 +617,7 @@ def analyze_logs(log_dir):
             for line in f:
                 try:
                     data = json.loads(line)
-                    operations.append(data)
+                    operations.extend(data.get('records', [data]))
                 except json.JSONDecodeError:
                     continue
         
@@ -411,7 +637,7 @@ def analyze_logs(log_dir):
             for line in f:
                 try:
                     data = json.loads(line)
-                    requests.append(data)
+                    requests.extend(data.get('records', [data]))
                 except json.JSONDecodeError:
                     continue
         
@@ -457,6 +683,7 @@ if __name__ == "__main__":
     # Test request logging
     req_logger.log_request("scan_music_folders", {"path": "/music"}, "req-123")
     req_logger.log_response("scan_music_folders", {"bands": 10}, 0.5, "req-123")
+    monitoring['shutdown']()
     
     print(f"Logs written to: {monitoring['log_dir']}")
     
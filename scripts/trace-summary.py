@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Trace Summary for Music Collection MCP Server
+
+Reads the span file written when TRACE_SAMPLE_RATE is set (logs/traces.jsonl
+and its rotated files by default) and prints a flame-style summary for each
+traced request: the tree of operations it ran, with sibling spans of the same
+name merged, their call counts, total and self time and share of the request.
+
+With --folded it prints folded stacks instead ("root;child;grandchild self_us"
+per line), the input format of flamegraph.pl and speedscope.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def span_files(path: Path) -> List[Path]:
+    """Get a span file and its rotated files, oldest first."""
+    rotated = sorted(path.parent.glob(f"{path.name}.*"),
+                     key=lambda p: int(p.suffix[1:]) if p.suffix[1:].isdigit() else 0, reverse=True)
+    return [p for p in rotated if p.suffix[1:].isdigit()] + ([path] if path.exists() else [])
+
+
+def load_spans(paths: Iterable[Path]) -> List[Dict[str, Any]]:
+    """Read spans from JSONL files, skipping lines that are not valid JSON."""
+    spans = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    spans.append(json.loads(line))
+                except ValueError:
+                    continue
+    return spans
+
+
+class Node:
+    """Spans of the same name at the same position in a request's tree."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.child_ns = 0
+        self.errors = 0
+        self.children: Dict[str, 'Node'] = {}
+
+    @property
+    def self_ns(self) -> int:
+        return max(0, self.total_ns - self.child_ns)
+
+
+def build_trees(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge the spans of each trace into a tree per root span.
+
+    Returns:
+        List of traces (trace ID, root span, merged tree), in start order
+    """
+    by_id = {span['spanId']: span for span in spans}
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    roots = []
+    for span in spans:
+        parent = span.get('parentSpanId')
+        if parent and parent in by_id:
+            children.setdefault(parent, []).append(span)
+        else:
+            # Root spans, and spans whose parent was not recorded (e.g. rotated away)
+            roots.append(span)
+
+    def duration(span: Dict[str, Any]) -> int:
+        return int(span['endTimeUnixNano']) - int(span['startTimeUnixNano'])
+
+    def add(node: Node, span: Dict[str, Any]) -> None:
+        node.count += 1
+        node.total_ns += duration(span)
+        if span.get('status', {}).get('code') == 'STATUS_CODE_ERROR':
+            node.errors += 1
+        for child in children.get(span['spanId'], []):
+            node.child_ns += duration(child)
+            child_node = node.children.get(child['name'])
+            if child_node is None:
+                child_node = node.children[child['name']] = Node(child['name'])
+            add(child_node, child)
+
+    traces = []
+    for root in sorted(roots, key=lambda span: int(span['startTimeUnixNano'])):
+        tree = Node(root['name'])
+        add(tree, root)
+        traces.append({'trace_id': root['traceId'], 'root': root, 'tree': tree})
+    return traces
+
+
+def format_tree(tree: Node, min_percent: float = 1.0) -> List[str]:
+    """Render a merged tree, heaviest operations first."""
+    lines = []
+    request_ns = tree.total_ns or 1
+
+    def render(node: Node, depth: int) -> None:
+        percent = 100.0 * node.total_ns / request_ns
+        if depth and percent < min_percent:
+            return
+        calls = f" x{node.count}" if node.count > 1 else ""
+        errors = f" ({node.errors} failed)" if node.errors else ""
+        lines.append(f"{node.total_ns / 1e6:10.1f} ms {percent:5.1f}%  self {node.self_ns / 1e6:8.1f} ms  "
+                     f"{'  ' * depth}{node.name}{calls}{errors}")
+        for child in sorted(node.children.values(), key=lambda n: n.total_ns, reverse=True):
+            render(child, depth + 1)
+
+    render(tree, 0)
+    return lines
+
+
+def folded_stacks(tree: Node, prefix: str = "") -> List[str]:
+    """Render a merged tree as folded stacks with self time in microseconds."""
+    stack = f"{prefix};{tree.name}" if prefix else tree.name
+    lines = [f"{stack} {tree.self_ns // 1000}"] if tree.self_ns >= 1000 else []
+    for child in tree.children.values():
+        lines.extend(folded_stacks(child, stack))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main summary interface."""
+    parser = argparse.ArgumentParser(description="Summarize traced requests of the Music Collection MCP Server")
+    parser.add_argument('trace_file', nargs='?', default='logs/traces.jsonl',
+                        help="Span file (its rotated files are read too)")
+    parser.add_argument('--trace', help="Only the trace with this ID")
+    parser.add_argument('--name', help="Only requests whose root span name contains this text")
+    parser.add_argument('--slowest', type=int, default=0, help="Only the N slowest requests")
+    parser.add_argument('--min-percent', type=float, default=1.0,
+                        help="Hide operations below this share of the request (default: 1)")
+    parser.add_argument('--folded', action='store_true', help="Print folded stacks for flame graph tools")
+    args = parser.parse_args(argv)
+
+    files = span_files(Path(args.trace_file))
+    if not files:
+        print(f"No span file found at {args.trace_file}", file=sys.stderr)
+        return 1
+
+    traces = build_trees(load_spans(files))
+    if args.trace:
+        traces = [trace for trace in traces if trace['trace_id'] == args.trace]
+    if args.name:
+        traces = [trace for trace in traces if args.name in trace['root']['name']]
+    if args.slowest:
+        traces = sorted(traces, key=lambda trace: trace['tree'].total_ns, reverse=True)[:args.slowest]
+
+    for trace in traces:
+        if args.folded:
+            print('\n'.join(folded_stacks(trace['tree'])))
+            continue
+        print(f"trace {trace['trace_id']}  {trace['root']['name']}  {trace['tree'].total_ns / 1e6:.1f} ms")
+        print('\n'.join(format_tree(trace['tree'], args.min_percent)))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
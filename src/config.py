@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import Field, ValidationError
 from pydantic_settings import BaseSettings
 
@@ -24,6 +24,93 @@ class Config(BaseSettings):
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR)."
     )
+    BACKUP_RETENTION_COUNT: int = Field(
+        default=5,
+        ge=1,
+        description="Number of backups kept per metadata/index file (default: 5)."
+    )
+    METADATA_STORE_PATH: Optional[str] = Field(
+        default=None,
+        description="Optional local directory for metadata, index, backup and lock files. "
+                    "When set, the music root is only read."
+    )
+    METADATA_STORAGE_FORMAT: Literal["pretty", "compact", "gzip", "zlib"] = Field(
+        default="pretty",
+        description="On-disk encoding of metadata and index files: pretty (indented JSON), "
+                    "compact (no indentation), gzip or zlib (compact and compressed)."
+    )
+    WATCH_MODE_ENABLED: bool = Field(
+        default=False,
+        description="Keep the collection index live by watching the music root with inotify (Linux)."
+    )
+    WATCH_DEBOUNCE_SECONDS: float = Field(
+        default=2.0,
+        ge=0,
+        description="Quiet time before a changed band is re-scanned in watch mode (default: 2.0)."
+    )
+    WATCH_BACKEND: Literal["auto", "inotify", "poll"] = Field(
+        default="auto",
+        description="Watch mode backend: inotify, poll (for NFS/SMB mounts) or auto (poll on network mounts)."
+    )
+    WATCH_POLL_MIN_INTERVAL: float = Field(
+        default=10.0,
+        ge=0,
+        description="Shortest time between poll cycles in seconds (default: 10)."
+    )
+    WATCH_POLL_MAX_INTERVAL: float = Field(
+        default=300.0,
+        ge=0,
+        description="Longest time between poll cycles while the collection is idle (default: 300)."
+    )
+    WATCH_POLL_MAX_STATS_PER_SECOND: float = Field(
+        default=100.0,
+        ge=0,
+        description="I/O budget for polling in stat calls per second; 0 disables the limit (default: 100)."
+    )
+    SCAN_CHECKPOINT_INTERVAL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Time between scan checkpoints that let an interrupted scan resume; 0 disables (default: 30)."
+    )
+    JOB_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Worker threads for background jobs started with async_mode=True (default: 2)."
+    )
+    HANDLER_THREAD_POOL_SIZE: int = Field(
+        default=8,
+        ge=1,
+        description="Threads running tool and resource handlers off the event loop (default: 8)."
+    )
+    TRACE_SAMPLE_RATE: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Fraction of requests recorded as trace spans; 0 disables tracing (default: 0)."
+    )
+    TRACE_FILE: str = Field(
+        default="logs/traces.jsonl",
+        description="JSONL file trace spans are written to, rotated at 10 MB (default: logs/traces.jsonl)."
+    )
+    PROFILE_SAMPLE_RATE: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Fraction of tool calls run under cProfile; 0 profiles only calls with profile=true (default: 0)."
+    )
+    PROFILE_DIR: str = Field(
+        default="logs/profiles",
+        description="Directory for .pstats files and profile summaries (default: logs/profiles)."
+    )
+    PROFILE_TRACEMALLOC: bool = Field(
+        default=False,
+        description="Also trace memory allocations of profiled calls with tracemalloc (default: false)."
+    )
+    PERFORMANCE_TRACEMALLOC: bool = Field(
+        default=False,
+        description="Trace memory allocations of tracked operations (scans, index loads, analytics) with "
+                    "tracemalloc; slows them down (default: false)."
+    )
 
     # Only read from environment variables, no .env file support
     model_config = {
@@ -35,7 +122,11 @@ class Config(BaseSettings):
         return (
             f"Config(MUSIC_ROOT_PATH='{self.MUSIC_ROOT_PATH}', "
             f"CACHE_DURATION_DAYS={self.CACHE_DURATION_DAYS}, "
-            f"LOG_LEVEL='{self.LOG_LEVEL}')"
+            f"LOG_LEVEL='{self.LOG_LEVEL}', "
+            f"METADATA_STORE_PATH={self.METADATA_STORE_PATH!r}, "
+            f"METADATA_STORAGE_FORMAT='{self.METADATA_STORAGE_FORMAT}', "
+            f"WATCH_MODE_ENABLED={self.WATCH_MODE_ENABLED}, "
+            f"WATCH_BACKEND='{self.WATCH_BACKEND}')"
         )
 
 
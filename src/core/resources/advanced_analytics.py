@@ -11,6 +11,7 @@ from typing import Any, Dict, List
 
 # Local imports
 from src.models.analytics import AdvancedCollectionInsights, CollectionAnalyzer
+from src.core.tools.performance import track_operation
 from src.core.tools.storage import StorageError, load_band_metadata, load_collection_index
 
 logger = logging.getLogger(__name__)
@@ -54,7 +55,9 @@ def get_advanced_analytics_markdown() -> str:
             return _generate_no_metadata_message()
         
         # Perform comprehensive analysis
-        insights = CollectionAnalyzer.analyze_collection(collection_index, band_metadata)
+        with track_operation("analyze_collection", bands=len(band_metadata)) as metrics:
+            insights = CollectionAnalyzer.analyze_collection(collection_index, band_metadata)
+            metrics.items_processed = len(band_metadata)
         
         # Generate comprehensive markdown
         return _generate_analytics_markdown(insights, collection_index, band_metadata)
@@ -126,8 +129,8 @@ def _generate_header_section(insights: AdvancedCollectionInsights) -> str:
         "Expert": "🎓",
         "Master": "👑"
     }
-    maturity_icon = maturity_icons.get(insights.collection_maturity.value, "📊")
-    badges.append(f"{maturity_icon} **{insights.collection_maturity.value} Collection**")
+    maturity_icon = maturity_icons.get(insights.collection_maturity, "📊")
+    badges.append(f"{maturity_icon} **{insights.collection_maturity} Collection**")
     
     # Health badge
     health_level = insights.health_metrics.get_health_level()
@@ -182,9 +185,9 @@ def _generate_maturity_health_overview(insights: AdvancedCollectionInsights) ->
     
     # Maturity description
     section.append("")
-    section.append(f"### 🏆 Collection Maturity: **{insights.collection_maturity.value}**")
+    section.append(f"### 🏆 Collection Maturity: **{insights.collection_maturity}**")
     section.append("")
-    section.append(_get_maturity_description(insights.collection_maturity.value))
+    section.append(_get_maturity_description(insights.collection_maturity))
     
     return "\n".join(section)
 
@@ -358,13 +361,13 @@ def _generate_recommendations_section(insights: AdvancedCollectionInsights) -> s
         if high_priority:
             section.append("#### 🔥 High Priority")
             for rec in high_priority[:5]:
-                section.append(f"- **{rec.band_name}**: Add {rec.album_type.value} ({rec.reason})")
+                section.append(f"- **{rec.band_name}**: Add {rec.album_type} ({rec.reason})")
         
         if medium_priority:
             section.append("")
             section.append("#### 🟡 Medium Priority")
             for rec in medium_priority[:5]:
-                section.append(f"- **{rec.band_name}**: Consider {rec.album_type.value} ({rec.reason})")
+                section.append(f"- **{rec.band_name}**: Consider {rec.album_type} ({rec.reason})")
     
     # Edition upgrades
     if insights.edition_upgrades:
@@ -517,7 +520,7 @@ def _generate_analytics_metadata_section(insights: AdvancedCollectionInsights, b
         "|-------------|-------|",
         f"| **Analysis Date** | {insights.generated_at[:19].replace('T', ' ')} |",
         f"| **Bands Analyzed** | {bands_analyzed} |",
-        f"| **Collection Maturity** | {insights.collection_maturity.value} |",
+        f"| **Collection Maturity** | {insights.collection_maturity} |",
         f"| **Analytics Version** | Advanced Analytics v1.0.0 |",
         f"| **Analysis Features** | Type Distribution, Health Metrics, Recommendations |"
     ]
@@ -169,7 +169,7 @@ def _generate_albums_section(metadata: BandMetadata) -> str:
     # Add folder structure information if available
     if metadata.folder_structure:
         structure_info = []
-        structure_info.append(f"**Organization:** {metadata.folder_structure.structure_type.value.title()}")
+        structure_info.append(f"**Organization:** {metadata.folder_structure.structure_type.title()}")
         structure_info.append(f"**Health:** {metadata.folder_structure.get_organization_health().title()}")
         structure_info.append(f"**Score:** {metadata.folder_structure.structure_score}/100")
         
@@ -355,8 +355,8 @@ def _generate_statistics_section(metadata: BandMetadata) -> str:
         structure_table = [
             "| Aspect | Status |",
             "|--------|--------|",
-            f"| Structure Type | {metadata.folder_structure.structure_type.value.title()} |",
-            f"| Consistency | {metadata.folder_structure.consistency.value.title()} |",
+            f"| Structure Type | {metadata.folder_structure.structure_type.title()} |",
+            f"| Consistency | {metadata.folder_structure.consistency.title()} |",
             f"| Organization Score | {metadata.folder_structure.structure_score}/100 |",
             f"| Health Assessment | {metadata.folder_structure.get_organization_health().title()} |",
             f"| Migration Needed | {'Yes ⚠️' if metadata.folder_structure.is_migration_recommended() else 'No ✅'} |"
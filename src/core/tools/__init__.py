@@ -4,17 +4,25 @@ Tools module for Music Collection MCP Server.
 This module provides tools for scanning, storage, metadata management, and cache management.
 """
 
-from .scanner import scan_music_folders
+from .scanner import scan_music_folders, get_scan_report, rescan_bands
 from .storage import (
     save_band_metadata,
     save_band_analyze, 
     save_collection_insight,
     get_band_list,
     load_band_metadata,
+    load_band_metadata_summary,
     load_collection_index,
     update_collection_index,
-    cleanup_backups
+    cleanup_backups,
+    list_backups
 )
+from .backup_catalog import BackupCatalog
+from .filesystem import LatencyFileSystem, LocalFileSystem
+from .json_codec import STORAGE_FORMATS, read_json_file
+from .metadata_store import MetadataStore
+from .watcher import CollectionWatcher, get_watch_status
+from .poll_watcher import PollingChangeDetector
 from .cache import (
     CacheManager,
     CacheStatus,
@@ -26,6 +34,7 @@ from .cache import (
     get_collection_cache_stats
 )
 from .performance import (
+    LatencyHistogram,
     PerformanceMetrics,
     PerformanceTracker,
     BatchFileOperations,
@@ -33,12 +42,15 @@ from .performance import (
     performance_monitor,
     track_operation,
     get_performance_summary,
-    clear_performance_metrics
+    clear_performance_metrics,
+    configure_allocation_tracing
 )
 
 __all__ = [
     # Scanner functions
     'scan_music_folders',
+    'get_scan_report',
+    'rescan_bands',
     
     # Storage functions
     'save_band_metadata',
@@ -46,9 +58,20 @@ __all__ = [
     'save_collection_insight', 
     'get_band_list',
     'load_band_metadata',
+    'load_band_metadata_summary',
     'load_collection_index',
     'update_collection_index',
     'cleanup_backups',
+    'list_backups',
+    'BackupCatalog',
+    'LocalFileSystem',
+    'LatencyFileSystem',
+    'STORAGE_FORMATS',
+    'read_json_file',
+    'MetadataStore',
+    'CollectionWatcher',
+    'PollingChangeDetector',
+    'get_watch_status',
     
     # Metadata functions
     'metadata_save_band_metadata',
@@ -66,6 +89,7 @@ __all__ = [
     'get_collection_cache_stats',
     
     # Performance monitoring
+    'LatencyHistogram',
     'PerformanceMetrics',
     'PerformanceTracker',
     'BatchFileOperations', 
@@ -73,5 +97,6 @@ __all__ = [
     'performance_monitor',
     'track_operation',
     'get_performance_summary',
-    'clear_performance_metrics'
+    'clear_performance_metrics',
+    'configure_allocation_tracing'
 ] 
\ No newline at end of file
@@ -0,0 +1,340 @@
+"""
+Backup Catalog for Music Collection MCP Server.
+
+Every backup created by the storage layer is recorded in an append-only
+JSON Lines catalog at the metadata root. Listing, retention and cleanup work
+from the catalog, so they never have to walk the music tree (which is very
+slow on network storage).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.core.tools.filesystem import get_filesystem
+
+logger = logging.getLogger(__name__)
+
+# Deliberately does not match the "*.backup*" pattern used for legacy discovery
+BACKUP_CATALOG_FILENAME = ".metadata_backups.jsonl"
+
+# Default number of backups kept per original file
+DEFAULT_MAX_BACKUPS = 5
+
+# Compact the catalog once this many superseded lines have accumulated
+_MIN_COMPACTION_LINES = 100
+
+
+def retention_count_from_config(config: Any) -> int:
+    """
+    Get the number of backups to keep per file from a configuration object.
+
+    Args:
+        config: Configuration instance (BACKUP_RETENTION_COUNT is optional)
+
+    Returns:
+        Positive retention count
+    """
+    value = getattr(config, 'BACKUP_RETENTION_COUNT', None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return DEFAULT_MAX_BACKUPS
+
+
+class BackupCatalog:
+    """
+    Thread-safe, append-only catalog of backup files below a metadata root.
+
+    Paths are stored relative to the root. Each line is either an ``add``
+    record (backup created), a ``remove`` record (backup deleted) or the
+    ``imported`` marker written once backups that predate the catalog have
+    been imported; the catalog is compacted when superseded lines outnumber
+    live entries.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Initialize backup catalog.
+
+        Args:
+            root: Metadata root directory that contains the catalog file
+        """
+        self.root = Path(root)
+        self.catalog_file = self.root / BACKUP_CATALOG_FILENAME
+        self._lock = threading.RLock()
+        # original (relative) -> backup (relative) -> entry
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._stale_lines = 0
+        self._known_size: Optional[int] = None
+        self._legacy_imported = False
+
+    def legacy_imported(self) -> bool:
+        """True once backups that predate the catalog have been imported (see import_untracked)."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._legacy_imported
+
+    def _relative(self, path: Union[str, Path]) -> str:
+        """Convert a path to a root-relative POSIX string."""
+        return Path(os.path.relpath(os.path.abspath(path), os.path.abspath(self.root))).as_posix()
+
+    def _ensure_loaded(self) -> None:
+        """(Re)load the catalog if it changed on disk since it was last read or written."""
+        try:
+            size = self.catalog_file.stat().st_size
+        except FileNotFoundError:
+            size = None
+        if self._known_size is not None and size == self._known_size:
+            return
+
+        self._entries = {}
+        self._stale_lines = 0
+        self._legacy_imported = False
+        if size is not None:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn trailing line from an interrupted append
+                        self._stale_lines += 1
+                        continue
+                    self._apply_record(record)
+        self._known_size = size if size is not None else 0
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a single catalog record to the in-memory state."""
+        backup = record.get('backup')
+        if record.get('op') == 'imported':
+            self._legacy_imported = True
+            return
+        if record.get('op') == 'remove':
+            for backups in self._entries.values():
+                if backups.pop(backup, None) is not None:
+                    break
+            self._stale_lines += 2  # the remove line and the add line it cancels
+            return
+        original = record.get('original', '')
+        backups = self._entries.setdefault(original, {})
+        if backup in backups:
+            self._stale_lines += 1
+        backups[backup] = {
+            'backup': backup,
+            'original': original,
+            'created': record.get('created', 0.0),
+            'size': record.get('size', 0)
+        }
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the catalog file and keep the cached size in sync."""
+        if not records:
+            return
+        payload = ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.catalog_file, 'a', encoding='utf-8') as f:
+            f.write(payload)
+        self._known_size = (self._known_size or 0) + len(payload.encode('utf-8'))
+
+    def _live_count(self) -> int:
+        return sum(len(backups) for backups in self._entries.values())
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the catalog without superseded lines once they dominate it."""
+        if self._stale_lines < max(_MIN_COMPACTION_LINES, self._live_count()):
+            return
+        temp_file = self.catalog_file.with_name(self.catalog_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            if self._legacy_imported:
+                f.write(json.dumps({'op': 'imported'}) + '\n')
+            for backups in self._entries.values():
+                for entry in backups.values():
+                    f.write(json.dumps(dict(op='add', **entry), ensure_ascii=False) + '\n')
+        os.replace(temp_file, self.catalog_file)
+        self._known_size = self.catalog_file.stat().st_size
+        self._stale_lines = 0
+
+    def _prune(self, original: str, max_backups: int, stats: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Delete the oldest backups of one original beyond max_backups."""
+        backups = self._entries.get(original, {})
+        if len(backups) <= max_backups:
+            return []
+        ordered = sorted(backups.values(), key=lambda e: e['created'], reverse=True)
+        removals = []
+        for entry in ordered[max_backups:]:
+            try:
+                get_filesystem().remove(self.root / entry['backup'])
+                stats['files_removed'] += 1
+                stats['space_freed_bytes'] += entry['size']
+            except FileNotFoundError:
+                pass  # Already gone; just drop it from the catalog
+            except OSError as e:
+                logger.warning(f"Could not delete backup {entry['backup']}: {e}")
+                continue
+            backups.pop(entry['backup'], None)
+            self._stale_lines += 2
+            removals.append({'op': 'remove', 'backup': entry['backup']})
+        if not backups:
+            self._entries.pop(original, None)
+        return removals
+
+    def record(self, backup_path: Union[str, Path], original_path: Union[str, Path],
+               max_backups: int = DEFAULT_MAX_BACKUPS) -> Dict[str, int]:
+        """
+        Record a newly created backup and apply retention to its original file.
+
+        Args:
+            backup_path: Path of the backup file that was created
+            original_path: Path of the file that was backed up
+            max_backups: Number of backups to keep for the original file
+
+        Returns:
+            Dict with files_removed and space_freed_bytes from retention
+        """
+        backup_path = Path(backup_path)
+        try:
+            size = backup_path.stat().st_size
+        except OSError:
+            size = 0
+        record = {
+            'op': 'add',
+            'backup': self._relative(backup_path),
+            'original': self._relative(original_path),
+            'created': time.time(),
+            'size': size
+        }
+        stats = {'files_removed': 0, 'space_freed_bytes': 0}
+        with self._lock:
+            self._ensure_loaded()
+            self._apply_record(record)
+            removals = self._prune(record['original'], max_backups, stats)
+            self._append([record] + removals)
+            self._maybe_compact()
+        return stats
+
+    def import_untracked(self, backup_files: List[Path]) -> int:
+        """
+        Add backups that exist on disk but predate the catalog.
+
+        Files are grouped by the name before ``.backup``, matching how
+        backups were grouped before the catalog existed. The ``imported``
+        marker is written along with them, so the import runs once per
+        catalog even if backups were recorded before it.
+
+        Args:
+            backup_files: Backup files discovered on disk
+
+        Returns:
+            Number of backups added to the catalog
+        """
+        with self._lock:
+            self._ensure_loaded()
+            known = {b for backups in self._entries.values() for b in backups}
+            records = []
+            for backup_file in backup_files:
+                relative = self._relative(backup_file)
+                if relative in known:
+                    continue
+                try:
+                    stat = backup_file.stat()
+                except OSError:
+                    continue
+                original = backup_file.parent / backup_file.name.split('.backup')[0]
+                record = {
+                    'op': 'add',
+                    'backup': relative,
+                    'original': self._relative(original),
+                    'created': stat.st_mtime,
+                    'size': stat.st_size
+                }
+                self._apply_record(record)
+                records.append(record)
+            records.append({'op': 'imported'})
+            self._apply_record(records[-1])
+            self._append(records)
+            return len(records) - 1
+
+    def apply_retention(self, max_backups: int = DEFAULT_MAX_BACKUPS) -> Dict[str, int]:
+        """
+        Keep only the newest max_backups backups of every original file.
+
+        Args:
+            max_backups: Number of backups to keep per original file
+
+        Returns:
+            Dict with files_removed and space_freed_bytes
+        """
+        stats = {'files_removed': 0, 'space_freed_bytes': 0}
+        with self._lock:
+            self._ensure_loaded()
+            removals = []
+            for original in list(self._entries):
+                removals.extend(self._prune(original, max_backups, stats))
+            self._append(removals)
+            self._maybe_compact()
+        return stats
+
+    def list_backups(self, original_path: Optional[Union[str, Path]] = None) -> List[Dict[str, Any]]:
+        """
+        List cataloged backups, newest first.
+
+        Args:
+            original_path: Only list backups of this file (all files if None)
+
+        Returns:
+            List of dicts with backup, original, created and size
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if original_path is not None:
+                groups = [self._entries.get(self._relative(original_path), {})]
+            else:
+                groups = list(self._entries.values())
+            entries = [dict(entry) for backups in groups for entry in backups.values()]
+        return sorted(entries, key=lambda e: e['created'], reverse=True)
+
+
+_catalogs: Dict[str, BackupCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_backup_catalog(root: Union[str, Path]) -> BackupCatalog:
+    """
+    Get the shared catalog instance for a metadata root.
+
+    Args:
+        root: Metadata root directory
+
+    Returns:
+        BackupCatalog for the root
+    """
+    key = os.path.abspath(root)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = BackupCatalog(key)
+        return catalog
+
+
+def catalog_for_path(root: Union[str, Path], path: Union[str, Path]) -> Optional[BackupCatalog]:
+    """
+    Get the catalog responsible for a file, if the file lives below root.
+
+    Args:
+        root: Metadata root directory
+        path: File whose backups should be cataloged
+
+    Returns:
+        BackupCatalog for root, or None if path is outside of it
+    """
+    root_abs = os.path.abspath(root)
+    path_abs = os.path.abspath(path)
+    try:
+        if os.path.commonpath([root_abs, path_abs]) != root_abs:
+            return None
+    except ValueError:
+        return None  # Different drives on Windows
+    return get_backup_catalog(root_abs)
@@ -5,7 +5,6 @@ This module provides comprehensive cache management including expiration logic,
 validation functions, statistics tracking, cleanup utilities, and migration tools.
 """
 
-import json
 import os
 import shutil
 from datetime import datetime, timedelta
@@ -16,6 +15,13 @@ from enum import Enum
 
 from src.models import BandMetadata, CollectionIndex, BandIndexEntry
 from src.di import get_config
+from src.core.tools.json_codec import (
+    encode_json,
+    read_json_file,
+    storage_format_for_path,
+    storage_format_from_config,
+)
+from src.core.tools.metadata_store import MetadataStore
 
 
 class CacheStatus(Enum):
@@ -96,6 +102,8 @@ class CacheManager:
         """
         config = get_config()
         self.music_root = Path(music_root or config.MUSIC_ROOT_PATH)
+        self.metadata_store = MetadataStore.from_config(config, music_root=self.music_root)
+        self.storage_format = storage_format_from_config(config)
         self.cache_duration_days = cache_duration_days or config.CACHE_DURATION_DAYS
         self.cache_duration = timedelta(days=self.cache_duration_days)
         
@@ -127,10 +135,9 @@ class CacheManager:
             
             # Check if file is readable and contains valid JSON
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                read_json_file(file_path)
                 return True
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 return False
                 
         except Exception:
@@ -160,10 +167,9 @@ class CacheManager:
             
             # Check if file is readable and contains valid JSON
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                read_json_file(file_path)
                 return CacheStatus.VALID
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 return CacheStatus.CORRUPTED
                 
         except Exception:
@@ -179,8 +185,7 @@ class CacheManager:
         Returns:
             Dict with validation results and recommendations
         """
-        band_folder = self.music_root / band_name
-        metadata_file = band_folder / ".band_metadata.json"
+        metadata_file = self.metadata_store.band_metadata_file(band_name)
         
         self._access_count += 1
         
@@ -237,7 +242,7 @@ class CacheManager:
             if self.music_root.exists():
                 for band_folder in self.music_root.iterdir():
                     if band_folder.is_dir() and not band_folder.name.startswith('.'):
-                        metadata_file = band_folder / ".band_metadata.json"
+                        metadata_file = self.metadata_store.band_metadata_file(band_folder.name)
                         if metadata_file.exists():
                             try:
                                 stat = metadata_file.stat()
@@ -281,7 +286,7 @@ class CacheManager:
                     stats.cache_hit_rate = (self._hit_count / self._access_count) * 100
             
             # Check for collection index cache
-            collection_index_file = self.music_root / ".collection_index.json"
+            collection_index_file = self.metadata_store.collection_index_file()
             if collection_index_file.exists():
                 try:
                     stat = collection_index_file.stat()
@@ -327,7 +332,7 @@ class CacheManager:
             # Clean up expired band metadata files
             for band_folder in self.music_root.iterdir():
                 if band_folder.is_dir() and not band_folder.name.startswith('.'):
-                    metadata_file = band_folder / ".band_metadata.json"
+                    metadata_file = self.metadata_store.band_metadata_file(band_folder.name)
                     
                     if metadata_file.exists():
                         status = self.get_cache_status(metadata_file)
@@ -348,7 +353,7 @@ class CacheManager:
                                 result["errors"].append(f"Failed to delete {metadata_file}: {e}")
             
             # Clean up expired collection index if corrupted
-            collection_index_file = self.music_root / ".collection_index.json"
+            collection_index_file = self.metadata_store.collection_index_file()
             if collection_index_file.exists():
                 status = self.get_cache_status(collection_index_file)
                 
@@ -399,11 +404,10 @@ class CacheManager:
                 return result
             
             # Migrate collection index
-            collection_index_file = self.music_root / ".collection_index.json"
+            collection_index_file = self.metadata_store.collection_index_file()
             if collection_index_file.exists():
                 try:
-                    with open(collection_index_file, 'r', encoding='utf-8') as f:
-                        index_data = json.load(f)
+                    index_data = read_json_file(collection_index_file)
                     
                     current_version = index_data.get('metadata_version', '0.9')
                     
@@ -417,8 +421,8 @@ class CacheManager:
                         index_data['metadata_version'] = target_version
                         
                         # Save updated file
-                        with open(collection_index_file, 'w', encoding='utf-8') as f:
-                            json.dump(index_data, f, indent=2, ensure_ascii=False)
+                        collection_index_file.write_bytes(encode_json(
+                            index_data, storage_format_for_path(collection_index_file, self.storage_format)))
                         
                         result["migrated_files"].append({
                             "file": str(collection_index_file),
@@ -432,12 +436,11 @@ class CacheManager:
             # Migrate band metadata files
             for band_folder in self.music_root.iterdir():
                 if band_folder.is_dir() and not band_folder.name.startswith('.'):
-                    metadata_file = band_folder / ".band_metadata.json"
+                    metadata_file = self.metadata_store.band_metadata_file(band_folder.name)
                     
                     if metadata_file.exists():
                         try:
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
+                            metadata = read_json_file(metadata_file)
                             
                             # Check if migration is needed
                             needs_migration = False
@@ -469,8 +472,8 @@ class CacheManager:
                                 result["backup_files"].append(str(backup_file))
                                 
                                 # Save updated metadata
-                                with open(metadata_file, 'w', encoding='utf-8') as f:
-                                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                                metadata_file.write_bytes(encode_json(
+                                    metadata, storage_format_for_path(metadata_file, self.storage_format)))
                                 
                                 result["migrated_files"].append({
                                     "file": str(metadata_file),
@@ -503,8 +506,7 @@ def is_metadata_cache_valid(band_name: str, music_root: Optional[str] = None) ->
         True if cache is valid and not expired
     """
     cache_manager = CacheManager(music_root)
-    band_folder = cache_manager.music_root / band_name
-    metadata_file = band_folder / ".band_metadata.json"
+    metadata_file = cache_manager.metadata_store.band_metadata_file(band_name)
     return cache_manager.is_cache_valid(metadata_file)
 
 
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Collection generation counter for the Music Collection MCP Server.
+
+Every write of a metadata or index file by this process bumps the collection
+generation. Results computed from the collection are valid for the
+generation they were computed at, so the generation lets callers tell
+whether a cached or in-flight result can still be used.
+"""
+
+import threading
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def get_collection_generation() -> int:
+    """
+    Get the current collection generation.
+
+    Returns:
+        Number of collection writes made by this process so far
+    """
+    return _generation
+
+
+def bump_collection_generation() -> int:
+    """
+    Record a write to the collection's metadata or index files.
+
+    Returns:
+        The new collection generation
+    """
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        return _generation
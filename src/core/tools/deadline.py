@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Time budgets for collection operations.
+
+Operations that load the metadata of many bands accept a deadline_ms
+budget. Their loops check the Deadline between bands and, once it has
+expired, stop and return what they have so far, flagged complete=false.
+Where the work can be resumed, the response carries a continuation token
+that a follow-up call passes back to carry on where the previous one
+stopped.
+"""
+
+import base64
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+
+class Deadline:
+    """A point in time after which an operation should stop."""
+
+    def __init__(self, deadline_ms: Optional[int] = None):
+        """
+        Initialize deadline.
+
+        Args:
+            deadline_ms: Budget in milliseconds from now (None for no deadline)
+
+        Raises:
+            ValueError: If deadline_ms is not a positive integer
+        """
+        if deadline_ms is not None and (isinstance(deadline_ms, bool) or not isinstance(deadline_ms, int)
+                                        or deadline_ms <= 0):
+            raise ValueError("deadline_ms must be a positive integer (milliseconds)")
+        self.budget_ms = deadline_ms
+        self._expires_at = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+
+    def expired(self) -> bool:
+        """True once the budget is used up (never without a budget)."""
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Seconds left of the budget, None without a budget."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+
+def _fingerprint(params: Dict[str, Any]) -> str:
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def make_continuation_token(operation: str, offset: int, params: Dict[str, Any], index_version: str) -> str:
+    """
+    Encode where a partial operation stopped.
+
+    Args:
+        operation: Name of the operation
+        offset: Position in the band order to continue from
+        params: Parameters that define the operation's results
+        index_version: Version of the collection index the offset refers to
+
+    Returns:
+        Opaque continuation token
+    """
+    payload = {'op': operation, 'offset': offset, 'params': _fingerprint(params), 'index': index_version}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+def parse_continuation_token(token: str, operation: str, params: Dict[str, Any], index_version: str) -> int:
+    """
+    Decode a continuation token and check that it belongs to this call.
+
+    Args:
+        token: Token from a previous partial response
+        operation: Name of the operation
+        params: Parameters of this call (must match the original call)
+        index_version: Current version of the collection index
+
+    Returns:
+        Position in the band order to continue from
+
+    Raises:
+        ValueError: If the token is invalid, belongs to another call, or the
+            collection index has changed since it was issued
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        offset = int(payload['offset'])
+        matches = payload['op'] == operation and payload['params'] == _fingerprint(params)
+        current = payload['index'] == index_version
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("Invalid continuation token")
+    if not matches or offset < 0:
+        raise ValueError("Continuation token does not belong to this operation and parameters")
+    if not current:
+        raise ValueError("Collection index changed since the continuation token was issued; start again without it")
+    return offset
+
+
+def index_version(index: Any) -> str:
+    """
+    Describe the version of a collection index for continuation tokens.
+
+    Args:
+        index: CollectionIndex
+
+    Returns:
+        String that changes when the index is rewritten with other bands
+    """
+    return f"{index.last_scan}:{len(index.bands)}"
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Pluggable file system access for Music Collection MCP Server.
+
+The scanner, storage and BatchFileOperations reach the file system through
+get_filesystem() for the operations whose cost depends on where the
+collection is stored: listing directories (scandir), stat, open, rename,
+flock, and the link, copy and remove calls that create and prune backups.
+LocalFileSystem calls the os functions directly.
+
+LatencyFileSystem wraps another file system and delays each operation by a
+configurable latency and jitter, failing a configurable fraction of them,
+so benchmarks can measure scans, caches and parallelism against network
+storage round trips (2-20 ms on a NAS) on a local disk.
+
+LocalFileSystem reports its listings, stats and opens to the scan cost
+profile of a running scan (see scan_costs), so a scan can show which bands
+cost the most file system round trips.
+"""
+
+import errno
+import os
+import random
+import shutil
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from src.core.tools.scan_costs import record_scan_io
+
+# Operations a file system implementation can delay or fail
+OPERATIONS = ('scandir', 'stat', 'open', 'rename', 'flock', 'link', 'copy', 'remove')
+
+PathLike = Union[str, Path]
+
+
+class LocalFileSystem:
+    """File system access through the os functions."""
+
+    def scandir(self, path: PathLike) -> Any:
+        """
+        List a directory.
+
+        Returns:
+            Iterator of os.DirEntry, usable as a context manager like os.scandir()
+        """
+        record_scan_io('dirs_listed')
+        return os.scandir(path)
+
+    def stat(self, path: PathLike) -> os.stat_result:
+        """Get the status of a path, following symlinks."""
+        record_scan_io('paths_stated')
+        return os.stat(path)
+
+    def open(self, path: PathLike, mode: str = 'r', **kwargs) -> IO:
+        """Open a file, with the arguments of the open() built-in."""
+        record_scan_io('files_opened')
+        return open(path, mode, **kwargs)
+
+    def rename(self, source: PathLike, target: PathLike) -> None:
+        """Rename source to target, atomically replacing target if it exists."""
+        os.replace(source, target)
+
+    def flock(self, file: IO, operation: int) -> None:
+        """Apply an fcntl.flock() operation to an open file (no-op where fcntl is missing)."""
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), operation)
+
+    def link(self, source: PathLike, target: PathLike) -> None:
+        """Create target as a hard link to source."""
+        os.link(source, target)
+
+    def copy(self, source: PathLike, target: PathLike) -> None:
+        """Copy source to target with its metadata, like shutil.copy2()."""
+        shutil.copy2(source, target)
+
+    def remove(self, path: PathLike) -> None:
+        """Remove a file."""
+        os.remove(path)
+
+    def exists(self, path: PathLike) -> bool:
+        """Whether a path exists (one stat)."""
+        try:
+            self.stat(path)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def is_dir(self, path: PathLike) -> bool:
+        """Whether a path is a directory (one stat)."""
+        try:
+            return stat.S_ISDIR(self.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def is_file(self, path: PathLike) -> bool:
+        """Whether a path is a regular file (one stat)."""
+        try:
+            return stat.S_ISREG(self.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+
+class _LatentDirEntry:
+    """Directory entry whose stat() goes through a latency file system."""
+
+    __slots__ = ('_entry', '_filesystem')
+
+    def __init__(self, entry: os.DirEntry, filesystem: 'LatencyFileSystem'):
+        self._entry = entry
+        self._filesystem = filesystem
+
+    name = property(lambda self: self._entry.name)
+    path = property(lambda self: self._entry.path)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        # Types come with the listing (d_type); no round trip
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        return self._entry.is_symlink()
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        self._filesystem._delay('stat', self._entry.path)
+        record_scan_io('paths_stated')
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def __fspath__(self) -> str:
+        return self._entry.path
+
+
+class _LatentScandir:
+    """Directory listing of a latency file system."""
+
+    def __init__(self, entries: Any, filesystem: 'LatencyFileSystem'):
+        self._entries = entries
+        self._filesystem = filesystem
+
+    def __iter__(self) -> Iterator[_LatentDirEntry]:
+        for entry in self._entries:
+            yield _LatentDirEntry(entry, self._filesystem)
+
+    def __enter__(self) -> '_LatentScandir':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._entries.close()
+
+
+class LatencyFileSystem(LocalFileSystem):
+    """
+    File system adding latency, jitter and failures to another file system.
+
+    Each operation sleeps for its latency plus a uniform random jitter
+    (up to the jitter in either direction, never below zero) before it runs,
+    and fails with an injected EIO error at its failure rate. A directory
+    listing costs one round trip; entry types come with the listing, but
+    stat() of an entry costs a stat round trip.
+    """
+
+    def __init__(self, base: Optional[LocalFileSystem] = None,
+                 latency_ms: Union[float, Dict[str, float]] = 0.0,
+                 jitter_ms: Union[float, Dict[str, float]] = 0.0,
+                 failure_rate: Union[float, Dict[str, float]] = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize latency file system.
+
+        Args:
+            base: File system doing the work (LocalFileSystem by default)
+            latency_ms: Delay of every operation, or delays by operation name
+                (see OPERATIONS; missing operations are not delayed)
+            jitter_ms: Random variation of the delays, the same way
+            failure_rate: Fraction of operations failing, the same way
+            seed: Seed of the jitter and failures, for reproducible runs
+
+        Raises:
+            ValueError: If an operation name is unknown or a value is negative
+        """
+        self.base = base or LocalFileSystem()
+        self.latency = self._per_operation(latency_ms, 'latency_ms', scale=0.001)
+        self.jitter = self._per_operation(jitter_ms, 'jitter_ms', scale=0.001)
+        self.failure_rate = self._per_operation(failure_rate, 'failure_rate')
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls = dict.fromkeys(OPERATIONS, 0)
+        self._failures = dict.fromkeys(OPERATIONS, 0)
+        self._delay_seconds = dict.fromkeys(OPERATIONS, 0.0)
+
+    @staticmethod
+    def _per_operation(value: Union[float, Dict[str, float]], name: str, scale: float = 1.0) -> Dict[str, float]:
+        values = value if isinstance(value, dict) else dict.fromkeys(OPERATIONS, value)
+        unknown = set(values) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown file system operations in {name}: {', '.join(sorted(unknown))}")
+        if any(v < 0 for v in values.values()):
+            raise ValueError(f"{name} must not be negative")
+        return {operation: float(values.get(operation, 0.0)) * scale for operation in OPERATIONS}
+
+    def _delay(self, operation: str, path: Any) -> None:
+        """Sleep for one round trip of an operation, failing it at its failure rate."""
+        latency = self.latency[operation]
+        jitter = self.jitter[operation]
+        with self._lock:
+            if jitter:
+                latency = max(0.0, latency + self._random.uniform(-jitter, jitter))
+            failed = self.failure_rate[operation] > 0 and self._random.random() < self.failure_rate[operation]
+            self._calls[operation] += 1
+            self._failures[operation] += 1 if failed else 0
+            self._delay_seconds[operation] += latency
+        if latency:
+            time.sleep(latency)
+        if failed:
+            raise OSError(errno.EIO, f"Injected {operation} failure", str(path))
+
+    def scandir(self, path: PathLike) -> _LatentScandir:
+        self._delay('scandir', path)
+        return _LatentScandir(self.base.scandir(path), self)
+
+    def stat(self, path: PathLike) -> os.stat_result:
+        self._delay('stat', path)
+        return self.base.stat(path)
+
+    def open(self, path: PathLike, mode: str = 'r', **kwargs) -> IO:
+        self._delay('open', path)
+        return self.base.open(path, mode, **kwargs)
+
+    def rename(self, source: PathLike, target: PathLike) -> None:
+        self._delay('rename', source)
+        self.base.rename(source, target)
+
+    def flock(self, file: IO, operation: int) -> None:
+        self._delay('flock', getattr(file, 'name', file))
+        self.base.flock(file, operation)
+
+    def link(self, source: PathLike, target: PathLike) -> None:
+        self._delay('link', source)
+        self.base.link(source, target)
+
+    def copy(self, source: PathLike, target: PathLike) -> None:
+        self._delay('copy', source)
+        self.base.copy(source, target)
+
+    def remove(self, path: PathLike) -> None:
+        self._delay('remove', path)
+        self.base.remove(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the operations made so far.
+
+        Returns:
+            Dict with calls, injected failures and injected delay seconds by operation
+        """
+        with self._lock:
+            return {
+                'calls': dict(self._calls),
+                'failures': dict(self._failures),
+                'delay_seconds': {operation: round(seconds, 6) for operation, seconds in self._delay_seconds.items()}
+            }
+
+
+_filesystem: LocalFileSystem = LocalFileSystem()
+_filesystem_lock = threading.Lock()
+
+
+def get_filesystem() -> LocalFileSystem:
+    """
+    Get the file system used by the scanner and storage.
+
+    Returns:
+        LocalFileSystem unless another file system was configured
+    """
+    return _filesystem
+
+
+def configure_filesystem(filesystem: Optional[LocalFileSystem] = None) -> LocalFileSystem:
+    """
+    Replace the file system used by the scanner and storage.
+
+    Args:
+        filesystem: File system to use (None restores a LocalFileSystem)
+
+    Returns:
+        The file system now in use
+    """
+    global _filesystem
+    with _filesystem_lock:
+        _filesystem = filesystem if filesystem is not None else LocalFileSystem()
+    return _filesystem
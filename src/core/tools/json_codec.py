@@ -0,0 +1,165 @@
+"""
+JSON On-Disk Encoding for Music Collection MCP Server.
+
+Metadata and index files can be written pretty-printed (the default),
+compact (no indentation) or compact and compressed with gzip or zlib. The
+file names never change: readers detect compression from the first bytes of
+the file, so files written in different formats can be mixed freely and the
+format can be switched at any time.
+"""
+
+import gzip
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Union
+
+from src.core.tools.filesystem import get_filesystem
+from src.core.tools.scan_costs import record_scan_io, timed_scan_work
+
+STORAGE_FORMAT_PRETTY = "pretty"
+STORAGE_FORMAT_COMPACT = "compact"
+STORAGE_FORMAT_GZIP = "gzip"
+STORAGE_FORMAT_ZLIB = "zlib"
+
+STORAGE_FORMATS = (
+    STORAGE_FORMAT_PRETTY,
+    STORAGE_FORMAT_COMPACT,
+    STORAGE_FORMAT_GZIP,
+    STORAGE_FORMAT_ZLIB,
+)
+DEFAULT_STORAGE_FORMAT = STORAGE_FORMAT_PRETTY
+
+# Explicit suffixes always win over the configured format
+_SUFFIX_FORMATS = {
+    ".gz": STORAGE_FORMAT_GZIP,
+    ".zz": STORAGE_FORMAT_ZLIB,
+}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+# Middle compression level: most of the size win for a fraction of the CPU
+_COMPRESS_LEVEL = 6
+
+
+def storage_format_from_config(config: Any) -> str:
+    """
+    Get the on-disk JSON format from a configuration object.
+
+    Args:
+        config: Configuration instance (METADATA_STORAGE_FORMAT is optional)
+
+    Returns:
+        One of STORAGE_FORMATS
+    """
+    value = getattr(config, 'METADATA_STORAGE_FORMAT', None)
+    if isinstance(value, str) and value.lower() in STORAGE_FORMATS:
+        return value.lower()
+    return DEFAULT_STORAGE_FORMAT
+
+
+def storage_format_for_path(file_path: Union[str, Path], storage_format: str) -> str:
+    """
+    Resolve the format to write a file in, honouring compression suffixes.
+
+    Args:
+        file_path: Path of the file being written
+        storage_format: Configured storage format
+
+    Returns:
+        Format to use for this file
+    """
+    return _SUFFIX_FORMATS.get(Path(file_path).suffix.lower(), storage_format)
+
+
+def detect_encoding(raw: bytes) -> str:
+    """
+    Detect how a JSON file was encoded from its leading bytes.
+
+    A zlib stream starts with 0x78 and a header checksum; JSON text can never
+    start with 'x', so the check cannot misfire on plain files.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        "gzip", "zlib" or "json"
+    """
+    if raw[:2] == _GZIP_MAGIC:
+        return STORAGE_FORMAT_GZIP
+    if len(raw) >= 2 and raw[0] == 0x78 and (raw[0] * 256 + raw[1]) % 31 == 0:
+        return STORAGE_FORMAT_ZLIB
+    return "json"
+
+
+def encode_json(data: Any, storage_format: str = DEFAULT_STORAGE_FORMAT) -> bytes:
+    """
+    Serialize data to bytes in the given storage format.
+
+    Args:
+        data: JSON-serializable data
+        storage_format: One of STORAGE_FORMATS
+
+    Returns:
+        Encoded file contents
+
+    Raises:
+        ValueError: If the storage format is unknown
+    """
+    if storage_format not in STORAGE_FORMATS:
+        raise ValueError(f"Unknown metadata storage format: {storage_format}")
+
+    if storage_format == STORAGE_FORMAT_PRETTY:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if storage_format == STORAGE_FORMAT_GZIP:
+            # Fixed mtime keeps output deterministic for identical data
+            payload = gzip.compress(payload, compresslevel=_COMPRESS_LEVEL, mtime=0)
+        elif storage_format == STORAGE_FORMAT_ZLIB:
+            payload = zlib.compress(payload, _COMPRESS_LEVEL)
+    record_scan_io('metadata_bytes_written', len(payload))
+    return payload
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Deserialize file contents written in any storage format.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        ValueError: If the contents are not valid (possibly compressed) JSON
+    """
+    record_scan_io('metadata_bytes_read', len(raw))
+    with timed_scan_work('parse_seconds'):
+        encoding = detect_encoding(raw)
+        try:
+            if encoding == STORAGE_FORMAT_GZIP:
+                raw = gzip.decompress(raw)
+            elif encoding == STORAGE_FORMAT_ZLIB:
+                raw = zlib.decompress(raw)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"Corrupted {encoding} data: {e}") from e
+        return json.loads(raw)
+
+
+def read_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Read and decode a JSON file written in any storage format.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the contents are not valid JSON
+    """
+    with get_filesystem().open(file_path, 'rb') as f:
+        return decode_json(f.read())
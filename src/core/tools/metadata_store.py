@@ -0,0 +1,209 @@
+"""
+Metadata Store Path Resolution for Music Collection MCP Server.
+
+This module decides where metadata files live. By default band metadata,
+the collection index, their backups and lock files are stored inside the
+music tree. When METADATA_STORE_PATH is configured they are kept in a local
+directory instead, so the music root is only ever read (read-only mounts,
+slow network shares).
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+BAND_METADATA_FILENAME = ".band_metadata.json"
+COLLECTION_INDEX_FILENAME = ".collection_index.json"
+
+# Sub-directory of the store that mirrors band folders
+STORE_BANDS_DIRNAME = "bands"
+
+# Maximum length of the readable part of a mirrored band directory name
+_MAX_SAFE_NAME_LENGTH = 64
+_UNSAFE_CHARS = re.compile(r"[^\w\-. ]+", re.UNICODE)
+
+
+def _coerce_store_path(value: Any) -> Optional[Path]:
+    """Return a Path for a configured store value, ignoring empty/unset values."""
+    # Only real strings/paths count: mocked configs expose arbitrary attributes
+    if isinstance(value, (str, Path)) and str(value).strip():
+        return Path(value).expanduser()
+    return None
+
+
+def store_dirname_for_band(band_name: str) -> str:
+    """
+    Build the mirrored directory name for a band inside the store.
+
+    The name keeps a sanitized, human-readable prefix of the band name and
+    appends a short hash of the exact band name, so that names containing
+    path separators, reserved characters or differing only in case never
+    collide or escape the store directory.
+
+    Args:
+        band_name: Name of the band folder in the music root
+
+    Returns:
+        Directory name safe to use on any filesystem
+    """
+    safe_name = _UNSAFE_CHARS.sub("_", band_name).strip(" .")[:_MAX_SAFE_NAME_LENGTH]
+    digest = hashlib.sha1(band_name.encode("utf-8")).hexdigest()[:10]
+    return f"{safe_name or 'band'}-{digest}"
+
+
+class MetadataStore:
+    """
+    Resolves the on-disk location of metadata, index, backup and lock files.
+
+    Backup and lock files are always created next to the file they protect,
+    so resolving the metadata file location is enough to keep every write
+    out of the music tree when an external store is configured.
+    """
+
+    def __init__(self, music_root: Union[str, Path], store_root: Optional[Union[str, Path]] = None):
+        """
+        Initialize metadata store.
+
+        Args:
+            music_root: Path to the music collection root
+            store_root: Optional out-of-tree directory for metadata files
+        """
+        self.music_root = Path(music_root)
+        self.store_root = _coerce_store_path(store_root)
+
+    @classmethod
+    def from_config(cls, config: Any, music_root: Optional[Union[str, Path]] = None) -> 'MetadataStore':
+        """
+        Create a metadata store from a configuration object.
+
+        Args:
+            config: Configuration instance (METADATA_STORE_PATH is optional)
+            music_root: Override for the music root (defaults to config.MUSIC_ROOT_PATH)
+
+        Returns:
+            MetadataStore instance
+        """
+        root = music_root if music_root is not None else config.MUSIC_ROOT_PATH
+        return cls(root, getattr(config, 'METADATA_STORE_PATH', None))
+
+    @property
+    def is_external(self) -> bool:
+        """True if metadata is stored outside of the music tree."""
+        return self.store_root is not None
+
+    @property
+    def metadata_root(self) -> Path:
+        """Directory that contains all metadata files (store root or music root)."""
+        return self.store_root if self.store_root is not None else self.music_root
+
+    def band_metadata_dir(self, band_name: str) -> Path:
+        """
+        Get the directory holding the metadata file of a band.
+
+        Args:
+            band_name: Name of the band
+
+        Returns:
+            Band folder in the music tree, or its mirrored directory in the store
+        """
+        if self.store_root is None:
+            return self.music_root / band_name
+        return self.store_root / STORE_BANDS_DIRNAME / store_dirname_for_band(band_name)
+
+    def band_metadata_file(self, band_name: str) -> Path:
+        """
+        Get the path of a band's metadata file.
+
+        Args:
+            band_name: Name of the band
+
+        Returns:
+            Path to .band_metadata.json for the band
+        """
+        return self.band_metadata_dir(band_name) / BAND_METADATA_FILENAME
+
+    def collection_index_file(self) -> Path:
+        """
+        Get the path of the collection index file.
+
+        Returns:
+            Path to .collection_index.json
+        """
+        return self.metadata_root / COLLECTION_INDEX_FILENAME
+
+    def import_in_tree_metadata(self, overwrite: bool = False) -> Dict[str, Any]:
+        """
+        Copy existing in-tree metadata files into the external store.
+
+        The music tree is only read. Files already present in the store are
+        kept unless overwrite is True.
+
+        Args:
+            overwrite: Replace metadata that already exists in the store
+
+        Returns:
+            Dict with import statistics
+
+        Raises:
+            ValueError: If no external store is configured or the music root is missing
+        """
+        if self.store_root is None:
+            raise ValueError("METADATA_STORE_PATH is not configured; nothing to import into")
+        if not self.music_root.is_dir():
+            raise ValueError(f"Music root path does not exist: {self.music_root}")
+
+        result = {
+            "status": "success",
+            "store_path": str(self.store_root),
+            "bands_imported": 0,
+            "bands_skipped": 0,
+            "collection_index_imported": False,
+            "errors": []
+        }
+
+        with os.scandir(self.music_root) as entries:
+            band_names = sorted(
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith('.')
+            )
+
+        for band_name in band_names:
+            source = self.music_root / band_name / BAND_METADATA_FILENAME
+            if not source.is_file():
+                continue
+            target = self.band_metadata_file(band_name)
+            if target.exists() and not overwrite:
+                result["bands_skipped"] += 1
+                continue
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+                result["bands_imported"] += 1
+            except OSError as e:
+                logger.warning(f"Failed to import metadata for {band_name}: {e}")
+                result["errors"].append(f"{band_name}: {e}")
+
+        source_index = self.music_root / COLLECTION_INDEX_FILENAME
+        target_index = self.collection_index_file()
+        if source_index.is_file() and (overwrite or not target_index.exists()):
+            try:
+                target_index.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source_index, target_index)
+                result["collection_index_imported"] = True
+            except OSError as e:
+                logger.warning(f"Failed to import collection index: {e}")
+                result["errors"].append(f"{COLLECTION_INDEX_FILENAME}: {e}")
+
+        if result["errors"]:
+            result["status"] = "partial"
+        logger.info(
+            f"Imported {result['bands_imported']} band metadata files into {self.store_root} "
+            f"({result['bands_skipped']} skipped)"
+        )
+        return result
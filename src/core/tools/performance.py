@@ -3,17 +3,35 @@ Performance monitoring and optimization utilities for Music Collection MCP Serve
 
 This module provides tools for tracking file system operations, memory usage,
 and performance benchmarks to optimize large collection handling.
+
+The tracker keeps a bounded history: the most recent operations in a ring
+buffer and, per operation name, streaming aggregates (count, total, min,
+max and a log-bucketed latency histogram for percentiles), so its memory
+and the cost of a summary do not grow with the server's uptime.
+
+Operations can also trace their allocations with tracemalloc (opt-in with
+PERFORMANCE_TRACEMALLOC or trace_allocations=True): the peak traced memory
+during the operation and the allocation sites still holding memory at its
+end, which RSS deltas cannot attribute.
 """
 
 import functools
 import logging
+import math
+import os
 import time
+import tracemalloc
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional
 import threading
 
+from src.core.tools.filesystem import get_filesystem
+from src.core.tools.tracing import trace_span
+from src.di import get_config
+
 # Try to import psutil for memory monitoring
 try:
     import psutil
@@ -23,6 +41,69 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Finished operations kept in full by a tracker
+DEFAULT_MAX_RECENT_OPERATIONS = 1000
+
+# Latency histogram buckets grow by 2**(1/4) (about 19%) from one microsecond
+_HISTOGRAM_MIN_SECONDS = 1e-6
+_HISTOGRAM_BUCKETS_PER_DOUBLING = 4
+
+# Allocation sites kept per operation when tracing allocations
+DEFAULT_ALLOCATION_TOP_N = 10
+
+# Frames kept per allocation traceback; a site is the innermost frame in
+# this project, so allocations in json, pathlib or pydantic are attributed
+# to the code that called them
+_TRACEMALLOC_FRAMES = 5
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[3]) + os.sep
+
+# Allocations made by the tracing itself
+_IGNORED_ALLOCATION_FILES = {tracemalloc.__file__, __file__}
+
+_STATM_PATH = '/proc/self/statm'
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_process = None
+
+
+def _current_rss_mb() -> Optional[float]:
+    """
+    Get the resident set size of this process in MB.
+
+    Reads /proc/self/statm where available (one small read), otherwise asks
+    psutil through a process handle created once.
+
+    Returns:
+        RSS in MB, None if it cannot be measured
+    """
+    global _process
+    try:
+        with open(_STATM_PATH, 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if not HAS_PSUTIL:
+        return None
+    try:
+        if _process is None:
+            _process = psutil.Process()
+        return _process.memory_info().rss / 1024 / 1024
+    except Exception:
+        return None
+
+
+def trace_allocations_from_config(config: Any) -> bool:
+    """
+    Get whether tracked operations trace their allocations.
+
+    Args:
+        config: Configuration instance (PERFORMANCE_TRACEMALLOC is optional)
+
+    Returns:
+        True to run tracemalloc during tracked operations
+    """
+    return getattr(config, 'PERFORMANCE_TRACEMALLOC', False) is True
+
 
 @dataclass
 class PerformanceMetrics:
@@ -39,6 +120,11 @@ class PerformanceMetrics:
     directory_operations: int = 0
     errors: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    parent_operation: Optional[str] = None
+    traced_memory_peak: Optional[float] = None
+    allocation_sites: List[Dict[str, Any]] = field(default_factory=list)
+    _allocation_start: Any = field(default=None, repr=False, compare=False)
+    _allocation_peak: int = field(default=0, repr=False, compare=False)
     
     def finish(self) -> None:
         """Mark operation as finished and calculate duration."""
@@ -46,11 +132,12 @@ class PerformanceMetrics:
             self.end_time = time.time()
             self.duration = self.end_time - self.start_time
             
-            # Calculate memory delta if available
-            if HAS_PSUTIL and self.memory_start is not None:
-                current_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-                self.memory_end = current_memory
-                self.memory_delta = current_memory - self.memory_start
+            # Calculate memory delta if the start was sampled
+            if self.memory_start is not None:
+                current_memory = _current_rss_mb()
+                if current_memory is not None:
+                    self.memory_end = current_memory
+                    self.memory_delta = current_memory - self.memory_start
     
     @property
     def items_per_second(self) -> Optional[float]:
@@ -67,88 +154,386 @@ class PerformanceMetrics:
         return None
 
 
+_allocation_lock = threading.Lock()
+_allocation_operations: List[PerformanceMetrics] = []
+_tracemalloc_started = False
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(_PROJECT_ROOT):
+        return filename[len(_PROJECT_ROOT):]
+    marker = f"site-packages{os.sep}"
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    return filename
+
+
+def _record_allocation_peak() -> None:
+    """Fold the peak since the last reset into the operations tracing allocations."""
+    peak = tracemalloc.get_traced_memory()[1]
+    for metrics in _allocation_operations:
+        metrics._allocation_peak = max(metrics._allocation_peak, peak)
+
+
+def _start_allocation_trace(metrics: PerformanceMetrics) -> None:
+    """
+    Start tracing the allocations of an operation.
+
+    tracemalloc is process-wide: it runs while any operation traces
+    allocations (unless something else started it), and allocations of
+    concurrent operations count for all of them.
+    """
+    global _tracemalloc_started
+    with _allocation_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEMALLOC_FRAMES)
+            _tracemalloc_started = True
+        # Resetting the peak for this operation must not lose the others' peak
+        _record_allocation_peak()
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        metrics._allocation_start = (tracemalloc.take_snapshot(), current)
+        metrics._allocation_peak = current
+        _allocation_operations.append(metrics)
+
+
+def _finish_allocation_trace(metrics: PerformanceMetrics, top_n: int) -> None:
+    """Set the peak traced memory and top allocation sites of an operation."""
+    global _tracemalloc_started
+    snapshot = None
+    with _allocation_lock:
+        # Identity, not dataclass equality
+        index = next((i for i, running in enumerate(_allocation_operations) if running is metrics), None)
+        if index is None:
+            return
+        # Another tool (e.g. the profiler) may have stopped tracemalloc meanwhile
+        if tracemalloc.is_tracing():
+            _record_allocation_peak()
+            snapshot = tracemalloc.take_snapshot()
+        del _allocation_operations[index]
+        if not _allocation_operations and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+    start_snapshot, start_memory = metrics._allocation_start
+    metrics._allocation_start = None
+    if snapshot is None:
+        return
+
+    metrics.traced_memory_peak = (metrics._allocation_peak - start_memory) / 1024 / 1024
+    sites: Dict[str, Dict[str, Any]] = {}
+    for diff in snapshot.compare_to(start_snapshot, 'traceback'):
+        # Frames are ordered from the oldest to the most recent call
+        innermost = diff.traceback[-1]
+        # Snapshot.filter_traces() would cost more than the comparison
+        if diff.size_diff <= 0 or innermost.filename in _IGNORED_ALLOCATION_FILES:
+            continue
+        frame = next((frame for frame in reversed(diff.traceback) if frame.filename.startswith(_PROJECT_ROOT)),
+                     innermost)
+        site = f"{_short_path(frame.filename)}:{frame.lineno}"
+        entry = sites.setdefault(site, {'site': site, 'size_kb': 0.0, 'count': 0, 'allocated_in': {}})
+        entry['size_kb'] += diff.size_diff / 1024
+        entry['count'] += diff.count_diff
+        if frame is not innermost:
+            allocator = f"{_short_path(innermost.filename)}:{innermost.lineno}"
+            entry['allocated_in'][allocator] = entry['allocated_in'].get(allocator, 0) + diff.size_diff
+    top = sorted(sites.values(), key=lambda entry: entry['size_kb'], reverse=True)[:top_n]
+    for entry in top:
+        entry['size_kb'] = round(entry['size_kb'], 1)
+        allocated_in = entry.pop('allocated_in')
+        if allocated_in:
+            # Where most of the site's memory was allocated, e.g. json/decoder.py:353
+            entry['allocated_in'] = max(allocated_in, key=allocated_in.get)
+    metrics.allocation_sites = top
+
+
+class LatencyHistogram:
+    """
+    Streaming latency histogram with logarithmic buckets.
+
+    Buckets are kept sparsely, so memory depends on the spread of the
+    latencies rather than their number. Percentiles are estimated from the
+    bucket bounds, within about 10% of the true value.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, seconds: float) -> None:
+        """Add one latency in seconds."""
+        seconds = max(0.0, seconds)
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        bucket = self._bucket(seconds)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate a percentile of the recorded latencies.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # Geometric middle of the bucket, within the observed range
+                estimate = _HISTOGRAM_MIN_SECONDS * 2 ** ((bucket - 0.5) / _HISTOGRAM_BUCKETS_PER_DOUBLING)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the histogram (seconds)."""
+        return {
+            'count': self.count,
+            'total_seconds': self.total,
+            'avg_seconds': self.total / self.count if self.count else 0,
+            'min_seconds': self.min,
+            'max_seconds': self.max,
+            'p50_seconds': self.percentile(50),
+            'p95_seconds': self.percentile(95),
+            'p99_seconds': self.percentile(99)
+        }
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= _HISTOGRAM_MIN_SECONDS:
+            return 0
+        return math.ceil(math.log2(seconds / _HISTOGRAM_MIN_SECONDS) * _HISTOGRAM_BUCKETS_PER_DOUBLING)
+
+
+class _OperationStats:
+    """Streaming aggregates of the finished operations of one name."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.items_processed = 0
+        self.file_operations = 0
+        self.directory_operations = 0
+        self.errors = 0
+        self.memory_samples = 0
+        self.memory_delta_total = 0.0
+        self.memory_delta_max: Optional[float] = None
+        self.allocation_samples = 0
+        self.traced_peak_total = 0.0
+        self.traced_peak_max: Optional[float] = None
+        # Largest net allocation of each site in one operation
+        self.allocation_sites: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, metrics: PerformanceMetrics) -> None:
+        self.latency.record(metrics.duration or 0.0)
+        self.items_processed += metrics.items_processed
+        self.file_operations += metrics.file_operations
+        self.directory_operations += metrics.directory_operations
+        self.errors += metrics.errors
+        if metrics.memory_delta is not None:
+            self.memory_samples += 1
+            self.memory_delta_total += metrics.memory_delta
+            if self.memory_delta_max is None or metrics.memory_delta > self.memory_delta_max:
+                self.memory_delta_max = metrics.memory_delta
+        if metrics.traced_memory_peak is not None:
+            self.allocation_samples += 1
+            self.traced_peak_total += metrics.traced_memory_peak
+            if self.traced_peak_max is None or metrics.traced_memory_peak > self.traced_peak_max:
+                self.traced_peak_max = metrics.traced_memory_peak
+            for site in metrics.allocation_sites:
+                known = self.allocation_sites.get(site['site'])
+                if known is None or site['size_kb'] > known['size_kb']:
+                    self.allocation_sites[site['site']] = site
+
+    def top_allocation_sites(self, top_n: int) -> List[Dict[str, Any]]:
+        """Get the sites with the largest net allocations, dropping the others."""
+        sites = sorted(self.allocation_sites.values(), key=lambda site: site['size_kb'], reverse=True)[:top_n]
+        self.allocation_sites = {site['site']: site for site in sites}
+        return sites
+
+    def to_dict(self, allocation_top_n: int = DEFAULT_ALLOCATION_TOP_N) -> Dict[str, Any]:
+        summary = {
+            **self.latency.to_dict(),
+            'items_processed': self.items_processed,
+            'file_operations': self.file_operations,
+            'directory_operations': self.directory_operations,
+            'errors': self.errors
+        }
+        if self.allocation_samples:
+            summary.update({
+                'traced_operations': self.allocation_samples,
+                'max_traced_peak_mb': round(self.traced_peak_max, 3),
+                'avg_traced_peak_mb': round(self.traced_peak_total / self.allocation_samples, 3),
+                'top_allocation_sites': self.top_allocation_sites(allocation_top_n)
+            })
+        return summary
+
+
 class PerformanceTracker:
     """
     Thread-safe performance tracking for file system operations.
+
+    Each thread has its own stack of running operations, so nested and
+    concurrent operations are tracked independently.
     """
     
-    def __init__(self):
-        self._metrics: List[PerformanceMetrics] = []
+    def __init__(self, max_recent_operations: int = DEFAULT_MAX_RECENT_OPERATIONS, track_memory: bool = True,
+                 trace_allocations: Optional[bool] = None,
+                 allocation_top_n: int = DEFAULT_ALLOCATION_TOP_N):
+        """
+        Initialize performance tracker.
+
+        Args:
+            max_recent_operations: Finished operations kept in full (older
+                ones only count in the aggregates)
+            track_memory: Whether operations sample RSS unless they say otherwise
+            trace_allocations: Whether operations trace allocations with
+                tracemalloc unless they say otherwise (None reads
+                PERFORMANCE_TRACEMALLOC from the configuration on first use)
+            allocation_top_n: Allocation sites kept per operation
+        """
+        self.track_memory = track_memory
+        self.trace_allocations = trace_allocations
+        self.allocation_top_n = allocation_top_n
         self._lock = threading.Lock()
-        self._current_operation: Optional[PerformanceMetrics] = None
+        self._local = threading.local()
+        self._recent: Deque[PerformanceMetrics] = deque(maxlen=max(1, max_recent_operations))
+        self._operations: Dict[str, _OperationStats] = {}
+        self._totals = _OperationStats()
     
-    def start_operation(self, operation_name: str, **metadata) -> PerformanceMetrics:
-        """Start tracking a new operation."""
-        with self._lock:
-            metrics = PerformanceMetrics(
-                operation_name=operation_name,
-                start_time=time.time(),
-                metadata=metadata
-            )
-            
-            # Add memory tracking if available
-            if HAS_PSUTIL:
-                try:
-                    metrics.memory_start = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-                except Exception:
-                    pass  # Ignore memory tracking errors
-            
-            self._current_operation = metrics
-            return metrics
+    def start_operation(self, operation_name: str, track_memory: Optional[bool] = None,
+                        trace_allocations: Optional[bool] = None, **metadata) -> PerformanceMetrics:
+        """
+        Start tracking a new operation on the calling thread.
+
+        Args:
+            operation_name: Name of the operation
+            track_memory: Whether to sample RSS at start and finish (None for
+                the tracker's default)
+            trace_allocations: Whether to trace allocations with tracemalloc
+                (None for the tracker's default)
+            **metadata: Additional metadata to store with metrics
+
+        Returns:
+            Metrics object for the operation
+        """
+        stack = self._stack()
+        metrics = PerformanceMetrics(
+            operation_name=operation_name,
+            start_time=time.time(),
+            metadata=metadata,
+            parent_operation=stack[-1].operation_name if stack else None
+        )
+        if self.track_memory if track_memory is None else track_memory:
+            metrics.memory_start = _current_rss_mb()
+        if self._traces_allocations() if trace_allocations is None else trace_allocations:
+            _start_allocation_trace(metrics)
+        stack.append(metrics)
+        return metrics
     
     def finish_operation(self, metrics: PerformanceMetrics) -> None:
-        """Finish tracking an operation."""
+        """Finish tracking an operation and add it to the aggregates."""
+        metrics.finish()
+        if metrics._allocation_start is not None:
+            _finish_allocation_trace(metrics, self.allocation_top_n)
+        stack = self._stack()
+        # Usually the top of the stack, but tolerate operations finished out of order
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i] is metrics:
+                del stack[i]
+                break
         with self._lock:
-            metrics.finish()
-            self._metrics.append(metrics)
-            if self._current_operation is metrics:
-                self._current_operation = None
+            self._recent.append(metrics)
+            stats = self._operations.get(metrics.operation_name)
+            if stats is None:
+                stats = self._operations[metrics.operation_name] = _OperationStats()
+            stats.add(metrics)
+            self._totals.add(metrics)
     
     def get_current_operation(self) -> Optional[PerformanceMetrics]:
-        """Get the currently tracked operation."""
+        """Get the innermost operation running on the calling thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def get_recent_operations(self) -> List[PerformanceMetrics]:
+        """Get the most recently finished operations, oldest first."""
         with self._lock:
-            return self._current_operation
+            return list(self._recent)
     
     def get_metrics_summary(self) -> Dict[str, Any]:
-        """Get summary of all tracked operations."""
+        """
+        Get summary of all tracked operations.
+
+        The summary is built from the aggregates, so its cost depends on the
+        number of operation names, not on how many operations ran.
+
+        Returns:
+            Dict with totals, memory statistics and per-operation latency
+            percentiles
+        """
         with self._lock:
-            if not self._metrics:
+            totals = self._totals
+            if not totals.latency.count:
                 return {"total_operations": 0}
             
-            total_duration = sum(m.duration for m in self._metrics if m.duration)
-            total_items = sum(m.items_processed for m in self._metrics)
-            total_files = sum(m.file_operations for m in self._metrics)
-            total_dirs = sum(m.directory_operations for m in self._metrics)
-            total_errors = sum(m.errors for m in self._metrics)
+            total_duration = totals.latency.total
+            total_items = totals.items_processed
+            total_files = totals.file_operations
             
-            # Memory statistics if available
+            # Memory statistics if sampled
             memory_stats = {}
-            if HAS_PSUTIL:
-                memory_deltas = [m.memory_delta for m in self._metrics if m.memory_delta is not None]
-                if memory_deltas:
-                    memory_stats = {
-                        "max_memory_increase_mb": max(memory_deltas),
-                        "total_memory_delta_mb": sum(memory_deltas),
-                        "avg_memory_delta_mb": sum(memory_deltas) / len(memory_deltas)
-                    }
+            if totals.memory_samples:
+                memory_stats = {
+                    "max_memory_increase_mb": totals.memory_delta_max,
+                    "total_memory_delta_mb": totals.memory_delta_total,
+                    "avg_memory_delta_mb": totals.memory_delta_total / totals.memory_samples
+                }
+            if totals.allocation_samples:
+                memory_stats["max_traced_peak_mb"] = round(totals.traced_peak_max, 3)
             
             return {
-                "total_operations": len(self._metrics),
+                "total_operations": totals.latency.count,
                 "total_duration_seconds": total_duration,
                 "total_items_processed": total_items,
                 "total_file_operations": total_files,
-                "total_directory_operations": total_dirs,
-                "total_errors": total_errors,
+                "total_directory_operations": totals.directory_operations,
+                "total_errors": totals.errors,
                 "avg_items_per_second": total_items / total_duration if total_duration > 0 else 0,
                 "avg_files_per_second": total_files / total_duration if total_duration > 0 else 0,
-                **memory_stats
+                **memory_stats,
+                "recent_operations": len(self._recent),
+                "operations": {name: stats.to_dict(self.allocation_top_n)
+                               for name, stats in sorted(self._operations.items())}
             }
     
     def clear_metrics(self) -> None:
-        """Clear all tracked metrics."""
+        """Clear all tracked metrics (operations still running are kept)."""
         with self._lock:
-            self._metrics.clear()
-            self._current_operation = None
+            self._recent.clear()
+            self._operations.clear()
+            self._totals = _OperationStats()
+
+    def _traces_allocations(self) -> bool:
+        if self.trace_allocations is None:
+            try:
+                self.trace_allocations = trace_allocations_from_config(get_config())
+            except Exception:
+                self.trace_allocations = False
+        return self.trace_allocations
+
+    def _stack(self) -> List[PerformanceMetrics]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
 
 
 # Global performance tracker instance
@@ -156,22 +541,37 @@ _global_tracker = PerformanceTracker()
 
 
 @contextmanager
-def track_operation(operation_name: str, **metadata) -> Generator[PerformanceMetrics, None, None]:
+def track_operation(operation_name: str, track_memory: Optional[bool] = None,
+                    trace_allocations: Optional[bool] = None,
+                    **metadata) -> Generator[PerformanceMetrics, None, None]:
     """
     Context manager for tracking operation performance.
     
+    The operation is also a trace span, a child of the current span.
+    
     Args:
         operation_name: Name of the operation being tracked
+        track_memory: Whether to sample memory usage (None for the tracker's default)
+        trace_allocations: Whether to record the peak traced memory and top
+            allocation sites with tracemalloc (None for the tracker's
+            default, PERFORMANCE_TRACEMALLOC)
         **metadata: Additional metadata to store with metrics
         
     Yields:
         PerformanceMetrics: Metrics object for the operation
     """
-    metrics = _global_tracker.start_operation(operation_name, **metadata)
-    try:
-        yield metrics
-    finally:
-        _global_tracker.finish_operation(metrics)
+    with trace_span(operation_name, **metadata) as span:
+        metrics = _global_tracker.start_operation(operation_name, track_memory=track_memory,
+                                                  trace_allocations=trace_allocations, **metadata)
+        try:
+            yield metrics
+        finally:
+            _global_tracker.finish_operation(metrics)
+            if span.is_recording:
+                span.set_attributes(items_processed=metrics.items_processed,
+                                    file_operations=metrics.file_operations,
+                                    directory_operations=metrics.directory_operations,
+                                    errors=metrics.errors)
 
 
 def performance_monitor(operation_name: Optional[str] = None, track_memory: bool = True):
@@ -217,6 +617,20 @@ def clear_performance_metrics() -> None:
     _global_tracker.clear_metrics()
 
 
+def configure_allocation_tracing(enabled: Optional[bool] = True,
+                                 top_n: int = DEFAULT_ALLOCATION_TOP_N) -> None:
+    """
+    Turn allocation tracing of tracked operations on or off.
+
+    Args:
+        enabled: Whether operations trace allocations unless they say
+            otherwise (None reads PERFORMANCE_TRACEMALLOC again)
+        top_n: Allocation sites kept per operation
+    """
+    _global_tracker.trace_allocations = enabled
+    _global_tracker.allocation_top_n = top_n
+
+
 class BatchFileOperations:
     """
     Optimized batch file system operations.
@@ -226,7 +640,7 @@ class BatchFileOperations:
     def scan_directory_batch(directory: Path, pattern: str = "*", 
                            recursive: bool = False, exclude_hidden: bool = True) -> List[Path]:
         """
-        Efficiently scan directory using os.scandir for better performance.
+        Efficiently scan directory using scandir for better performance.
         
         Args:
             directory: Directory to scan
@@ -240,12 +654,11 @@ class BatchFileOperations:
         results = []
         
         try:
-            with track_operation("batch_directory_scan", 
+            with track_operation("batch_directory_scan", track_memory=False, trace_allocations=False,
                                directory=str(directory), recursive=recursive) as metrics:
                 
-                # Use os.scandir for better performance than pathlib
-                import os
-                with os.scandir(directory) as entries:
+                # Use scandir for better performance than pathlib
+                with get_filesystem().scandir(directory) as entries:
                     for entry in entries:
                         metrics.directory_operations += 1
                         
@@ -293,9 +706,10 @@ class BatchFileOperations:
         count = 0
         
         try:
-            with track_operation("count_files", directory=str(directory)) as metrics:
-                import os
-                with os.scandir(directory) as entries:
+            # Runs once per album; RSS samples and snapshots would cost more than the count
+            with track_operation("count_files", track_memory=False, trace_allocations=False,
+                                 directory=str(directory)) as metrics:
+                with get_filesystem().scandir(directory) as entries:
                     for entry in entries:
                         if entry.is_file():
                             metrics.file_operations += 1
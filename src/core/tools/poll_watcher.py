@@ -0,0 +1,315 @@
+"""
+Polling Change Detection for Music Collection MCP Server.
+
+inotify never sees changes on NFS/SMB mounts, so on network storage watch
+mode falls back to polling. Each poll cycle stats only the music root and
+the band folders and compares their modification times to a snapshot kept
+at the metadata root. Bands whose folder changed are re-scanned through the
+regular scanner path.
+
+Adding, removing or renaming an album or image changes the band folder's
+mtime and is picked up; edits to tracks inside an existing album folder are
+not, and still need a full scan.
+
+The poll interval adapts: it drops to the minimum while changes are being
+found, backs off towards the maximum while the collection is idle, and never
+goes below what the I/O budget (stat calls per second) and the observed
+cycle latency allow.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Snapshot of folder mtimes, kept at the metadata root between restarts
+POLL_SNAPSHOT_FILENAME = ".watch_snapshot.json"
+
+DEFAULT_POLL_MIN_INTERVAL = 10.0
+DEFAULT_POLL_MAX_INTERVAL = 300.0
+DEFAULT_POLL_MAX_STATS_PER_SECOND = 100.0
+
+# Interval multiplier for every cycle without changes
+_BACKOFF_FACTOR = 1.5
+
+# Poll at most this fraction of the time, however slow the storage is
+_MAX_DUTY_CYCLE = 0.1
+
+
+class PollingChangeDetector:
+    """
+    Detect collection changes by polling folder modification times.
+
+    A single background thread runs poll cycles and re-scans the bands that
+    changed. Cost and interval metrics are available from get_stats().
+    """
+
+    def __init__(self, music_root: Union[str, Path], snapshot_dir: Optional[Union[str, Path]] = None,
+                 min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+                 max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+                 max_stats_per_second: float = DEFAULT_POLL_MAX_STATS_PER_SECOND):
+        """
+        Initialize polling change detector.
+
+        Args:
+            music_root: Music collection root to poll
+            snapshot_dir: Directory for the mtime snapshot (music root if None)
+            min_interval: Shortest time between poll cycles in seconds
+            max_interval: Longest time between poll cycles while idle in seconds
+            max_stats_per_second: I/O budget; the interval never drops below
+                what keeps the average stat rate under it
+        """
+        self.music_root = Path(music_root)
+        self.snapshot_file = Path(snapshot_dir or music_root) / POLL_SNAPSHOT_FILENAME
+        self.min_interval = max(0.0, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.max_stats_per_second = max_stats_per_second if max_stats_per_second > 0 else None
+        self.interval = self.min_interval
+        self._root_mtime: Optional[int] = None
+        self._band_mtimes: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            'cycles': 0,
+            'changes_detected': 0,
+            'bands_rescanned': 0,
+            'bands_removed': 0,
+            'rescan_errors': 0,
+            'last_cycle_stats': 0,
+            'last_cycle_seconds': 0.0,
+            'max_cycle_seconds': 0.0,
+            'total_cycle_seconds': 0.0,
+            'total_stats': 0,
+            'last_lag_seconds': None,
+            'max_lag_seconds': 0.0,
+            'interval_reason': 'initial',
+            'last_update': None
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._stop.is_set()
+
+    def start(self) -> None:
+        """
+        Load (or take) the snapshot and start the polling thread.
+
+        Raises:
+            OSError: If the music root cannot be read
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        if not self._load_snapshot():
+            # No stored snapshot: assume the index is current as of now
+            self._take_snapshot()
+            self._save_snapshot()
+        else:
+            # Pick up changes made while the server was not running
+            self.interval = 0.0
+        self._thread = threading.Thread(target=self._poll_loop, name="collection-poll", daemon=True)
+        self._thread.start()
+        logger.info(f"Polling {len(self._band_mtimes)} band folders below {self.music_root}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _load_snapshot(self) -> bool:
+        """Load the stored snapshot; False if there is none for this root."""
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('music_root') != str(self.music_root):
+            return False
+        self._root_mtime = data.get('root_mtime_ns')
+        self._band_mtimes = dict(data.get('bands', {}))
+        return True
+
+    def _save_snapshot(self) -> None:
+        """Write the snapshot atomically."""
+        data = {
+            'music_root': str(self.music_root),
+            'root_mtime_ns': self._root_mtime,
+            'bands': self._band_mtimes
+        }
+        temp_file = self.snapshot_file.with_name(self.snapshot_file.name + '.tmp')
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_file, self.snapshot_file)
+        except OSError as e:
+            logger.warning(f"Could not save watch snapshot {self.snapshot_file}: {e}")
+
+    def _list_band_names(self) -> Set[str]:
+        """List candidate band folders in the music root."""
+        from src.core.tools.scanner import EXCLUDED_FOLDERS
+        with os.scandir(self.music_root) as entries:
+            return {entry.name for entry in entries
+                    if not entry.name.startswith('.') and entry.name.lower() not in EXCLUDED_FOLDERS
+                    and entry.is_dir()}
+
+    def _take_snapshot(self) -> None:
+        """Record the current mtimes of the root and every band folder."""
+        self._root_mtime = os.stat(self.music_root).st_mtime_ns
+        self._band_mtimes = {}
+        for name in self._list_band_names():
+            try:
+                self._band_mtimes[name] = os.stat(self.music_root / name).st_mtime_ns
+            except OSError:
+                continue
+
+    def poll_once(self) -> Dict[str, Any]:
+        """
+        Run one poll cycle: find changed bands, re-scan them and adapt the interval.
+
+        Returns:
+            Dict with the changed bands and the cost of the cycle
+        """
+        start = time.perf_counter()
+        stat_calls = 1
+        root_mtime = os.stat(self.music_root).st_mtime_ns
+
+        known = set(self._band_mtimes)
+        if root_mtime != self._root_mtime:
+            # Band folders were added, removed or renamed
+            current = self._list_band_names()
+            stat_calls += 1
+        else:
+            current = known
+
+        changed: Dict[str, Optional[int]] = {}
+        for name in current:
+            try:
+                mtime = os.stat(self.music_root / name).st_mtime_ns
+            except OSError:
+                mtime = None  # Vanished since the listing
+            stat_calls += 1
+            if mtime is None or self._band_mtimes.get(name) != mtime:
+                changed[name] = mtime
+        for name in known - current:
+            changed[name] = None
+        cycle_seconds = time.perf_counter() - start
+
+        rescanned = self._rescan(changed) if changed else set()
+        self._root_mtime = root_mtime
+        if rescanned:
+            # With in-tree metadata the rescan itself rewrites files in the
+            # band folders and the root, so record the mtimes it left behind
+            self._root_mtime = os.stat(self.music_root).st_mtime_ns
+            stat_calls += 1
+            for name in rescanned:
+                try:
+                    self._band_mtimes[name] = os.stat(self.music_root / name).st_mtime_ns
+                except OSError:
+                    self._band_mtimes.pop(name, None)
+                stat_calls += 1
+            self._save_snapshot()
+
+        self._record_cycle(stat_calls, cycle_seconds, changed)
+        self._adapt_interval(stat_calls, cycle_seconds, bool(changed))
+        return {
+            'changed_bands': sorted(changed),
+            'stat_calls': stat_calls,
+            'cycle_seconds': cycle_seconds,
+            'next_interval_seconds': self.interval
+        }
+
+    def _rescan(self, changed: Dict[str, Optional[int]]) -> Set[str]:
+        """Re-scan changed bands; returns the bands whose snapshot can be updated."""
+        from src.core.tools.scanner import rescan_bands
+
+        try:
+            result = rescan_bands(sorted(changed), self.music_root)
+        except Exception as e:
+            self._stats['rescan_errors'] += 1
+            logger.error(f"Polling watcher could not update bands {sorted(changed)}: {e}")
+            return set()
+        self._stats['bands_rescanned'] += result['bands_updated']
+        self._stats['bands_removed'] += result['bands_removed']
+        self._stats['rescan_errors'] += len(result['errors'])
+        self._stats['last_update'] = time.time()
+
+        now = time.time()
+        for mtime in changed.values():
+            if mtime is not None:
+                lag = max(0.0, now - mtime / 1e9)
+                self._stats['last_lag_seconds'] = round(lag, 3)
+                self._stats['max_lag_seconds'] = round(max(self._stats['max_lag_seconds'], lag), 3)
+        # Bands that failed to scan keep their old mtime and are retried next cycle
+        return set(changed) - set(result['failed_bands'])
+
+    def _record_cycle(self, stat_calls: int, cycle_seconds: float, changed: Dict[str, Any]) -> None:
+        self._stats['cycles'] += 1
+        self._stats['changes_detected'] += len(changed)
+        self._stats['last_cycle_stats'] = stat_calls
+        self._stats['total_stats'] += stat_calls
+        self._stats['last_cycle_seconds'] = round(cycle_seconds, 4)
+        self._stats['max_cycle_seconds'] = round(max(self._stats['max_cycle_seconds'], cycle_seconds), 4)
+        self._stats['total_cycle_seconds'] += cycle_seconds
+
+    def _adapt_interval(self, stat_calls: int, cycle_seconds: float, found_changes: bool) -> None:
+        """Choose the next interval from the change rate, I/O budget and latency."""
+        if found_changes:
+            interval, reason = self.min_interval, 'changes'
+        else:
+            interval = min(self.max_interval, max(self.interval, self.min_interval) * _BACKOFF_FACTOR)
+            reason = 'idle'
+
+        # Floors win over max_interval: staying under budget matters more
+        if self.max_stats_per_second:
+            budget_floor = stat_calls / self.max_stats_per_second
+            if budget_floor > interval:
+                interval, reason = budget_floor, 'io_budget'
+        latency_floor = cycle_seconds / _MAX_DUTY_CYCLE
+        if latency_floor > interval:
+            interval, reason = latency_floor, 'io_latency'
+
+        self.interval = interval
+        self._stats['interval_reason'] = reason
+
+    def _poll_loop(self) -> None:
+        """Polling thread: run cycles until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Polling watcher cycle failed: {e}")
+                self.interval = self.max_interval
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get polling metrics.
+
+        Returns:
+            Dict with running state, current interval, per-cycle cost (stat
+            calls and duration), average stat rate and rescan/lag counters
+        """
+        stats = dict(self._stats)
+        cycles = stats['cycles']
+        total_cycle_seconds = stats.pop('total_cycle_seconds')
+        stats.update({
+            'running': self.running,
+            'music_root': str(self.music_root),
+            'polled_folders': len(self._band_mtimes) + 1,
+            'interval_seconds': round(self.interval, 3),
+            'min_interval_seconds': self.min_interval,
+            'max_interval_seconds': self.max_interval,
+            'max_stats_per_second': self.max_stats_per_second,
+            'avg_cycle_seconds': round(total_cycle_seconds / cycles, 4) if cycles else None,
+            'stats_per_second': (round(stats['last_cycle_stats'] / self.interval, 2)
+                                 if self.interval > 0 else None),
+            'queue_depth': 0
+        })
+        return stats
@@ -0,0 +1,225 @@
+"""
+Scan Checkpoints for Music Collection MCP Server.
+
+A long scan periodically writes its progress to a scan-state file below the
+metadata root: the bands processed so far, their collection index entries
+(the partial index) and a fingerprint (folder modification time) of each
+processed band folder. The collection index itself is only saved when the
+scan completes, so when a scan is interrupted the next scan of the same scope
+finds the incomplete state and resumes from it: bands whose fingerprint is
+unchanged are taken from the checkpoint instead of being scanned again.
+
+The state file is removed once the scan that owns it completes. A scan of
+another scope leaves an incomplete state alone (and is not checkpointed
+itself), so a quick scoped scan never discards the progress of a full scan.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Scan-state file, kept at the metadata root while a scan is incomplete
+SCAN_STATE_FILENAME = ".scan_state.json"
+
+# Bump when the layout of the state file changes; older states are ignored
+SCAN_STATE_VERSION = 1
+
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 30.0
+
+
+def checkpoint_interval_from_config(config: Any) -> float:
+    """
+    Get the time between scan checkpoints from a configuration object.
+
+    Args:
+        config: Configuration instance (SCAN_CHECKPOINT_INTERVAL_SECONDS is optional)
+
+    Returns:
+        Interval in seconds; 0 means checkpoints are disabled
+    """
+    value = getattr(config, 'SCAN_CHECKPOINT_INTERVAL_SECONDS', None)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+        return float(value)
+    return DEFAULT_CHECKPOINT_INTERVAL_SECONDS
+
+
+def band_fingerprint(band_folder: Path) -> Optional[int]:
+    """
+    Get the fingerprint of a band folder.
+
+    Adding, removing or renaming an album or image changes it; edits to
+    tracks inside an existing album folder do not.
+
+    Args:
+        band_folder: Band folder path
+
+    Returns:
+        Folder modification time in nanoseconds, None if the folder is gone
+    """
+    try:
+        return os.stat(band_folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ScanCheckpoint:
+    """
+    Progress journal of one scan, keyed by music root and scan scope.
+
+    Processed bands are recorded in memory with record(); maybe_save() writes
+    the state file atomically once the checkpoint interval has passed.
+    """
+
+    def __init__(self, metadata_root: Union[str, Path], music_root: Union[str, Path],
+                 band_names: Optional[List[str]] = None, path_glob: Optional[str] = None,
+                 interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS):
+        """
+        Initialize scan checkpoint.
+
+        Args:
+            metadata_root: Directory that contains all metadata files
+            music_root: Music collection root being scanned
+            band_names: Band names of a scoped scan (None for all bands)
+            path_glob: Path glob of a scoped scan (None for all bands)
+            interval_seconds: Minimum time between checkpoints; 0 disables them
+        """
+        self.state_file = Path(metadata_root) / SCAN_STATE_FILENAME
+        self.music_root = str(music_root)
+        self.scope = {
+            'band_names': sorted(band_names) if band_names is not None else None,
+            'path_glob': path_glob
+        }
+        self.interval_seconds = interval_seconds
+        self.processed: Dict[str, Dict[str, Any]] = {}
+        self.resumed_from: Optional[str] = None
+        self.loaded_bands = 0
+        self.checkpoints_written = 0
+        self._elapsed_before = 0.0
+        self._started = time.monotonic()
+        self._last_save = self._started
+        self._owned = False
+        self._foreign_state = False
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Scan time spent on this scope, including interrupted earlier attempts."""
+        return self._elapsed_before + time.monotonic() - self._started
+
+    @property
+    def checkpointed_seconds(self) -> float:
+        """Scan time that earlier attempts had saved in the loaded checkpoint."""
+        return self._elapsed_before
+
+    def load(self) -> bool:
+        """
+        Load an incomplete state left behind by an interrupted scan of this scope.
+
+        Returns:
+            True if a matching state was loaded and the scan can resume
+        """
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scan state {self.state_file}: {e}")
+            return False
+
+        if state.get('version') != SCAN_STATE_VERSION or state.get('music_root') != self.music_root:
+            return False
+        if state.get('scope') != self.scope:
+            # Incomplete scan of another scope: keep its state for it
+            self._foreign_state = True
+            return False
+        self.processed = dict(state.get('processed_bands', {}))
+        self.loaded_bands = len(self.processed)
+        self._elapsed_before = float(state.get('elapsed_seconds', 0.0))
+        self.resumed_from = state.get('saved_at')
+        self._owned = True
+        return True
+
+    def record(self, band_name: str, fingerprint: Optional[int], albums_count: int,
+               total_tracks: int, index_entry: Dict[str, Any]) -> None:
+        """
+        Record a processed band.
+
+        Args:
+            band_name: Band name
+            fingerprint: Band folder fingerprint taken after the band was processed
+            albums_count: Albums found by the scan
+            total_tracks: Tracks found by the scan
+            index_entry: Collection index entry written for the band
+        """
+        self.processed[band_name] = {
+            'fingerprint': fingerprint,
+            'albums_count': albums_count,
+            'total_tracks': total_tracks,
+            'index_entry': index_entry
+        }
+
+    def forget(self, band_name: str) -> None:
+        """Drop a processed band, e.g. because its folder changed since it was recorded."""
+        self.processed.pop(band_name, None)
+
+    def maybe_save(self) -> bool:
+        """
+        Save a checkpoint if the checkpoint interval has passed.
+
+        Returns:
+            True if a checkpoint was written
+        """
+        if self.interval_seconds <= 0 or time.monotonic() - self._last_save < self.interval_seconds:
+            return False
+        return self.save()
+
+    def save(self) -> bool:
+        """
+        Write the state file atomically.
+
+        Returns:
+            True if the checkpoint was written
+        """
+        if self.interval_seconds <= 0 or self._foreign_state:
+            return False
+        state = {
+            'version': SCAN_STATE_VERSION,
+            'status': 'in_progress',
+            'music_root': self.music_root,
+            'scope': self.scope,
+            'saved_at': datetime.now().isoformat(),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'processed_bands': self.processed
+        }
+        temp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_file, self.state_file)
+        except OSError as e:
+            # A scan must not fail just because it cannot be checkpointed
+            logger.warning(f"Could not write scan checkpoint {self.state_file}: {e}")
+            return False
+        self._last_save = time.monotonic()
+        self._owned = True
+        self.checkpoints_written += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove the state file once the scan that owns it has completed."""
+        if not self._owned:
+            return
+        try:
+            self.state_file.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove scan state {self.state_file}: {e}")
+        self._owned = False
@@ -0,0 +1,242 @@
+"""
+Scan Cost Profiles for Music Collection MCP Server.
+
+While a scan runs, a ScanCostProfile is active on its thread. The file system
+layer and the JSON codec report their work to it: directories listed, paths
+stat'ed, files opened, metadata bytes read and written, and the time spent
+decoding (parsing) metadata. The scanner adds the time spent validating
+metadata models, and times its phases (discover, scan, sync, index, save).
+
+Work is charged to the band being scanned, or to the scan itself outside of
+bands. The scan result lists the phase breakdown, the totals and the slowest
+bands; every band's cost is also written to the scan report. Only the slowest
+bands are kept in memory, so a profile stays small on any collection size.
+
+With no active profile (watch mode re-scans, tool calls), reporting costs
+one context variable lookup.
+"""
+
+import contextvars
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Bands listed in the scan result, slowest first
+SLOWEST_BANDS_LISTED = 20
+
+# Scan phases in pipeline order
+SCAN_PHASES = ('discover', 'scan', 'sync', 'index', 'save')
+
+# Counters reported by the file system layer and the JSON codec
+IO_COUNTERS = ('dirs_listed', 'paths_stated', 'files_opened', 'metadata_bytes_read', 'metadata_bytes_written')
+
+_current_profile: contextvars.ContextVar = contextvars.ContextVar('music_mcp_scan_costs', default=None)
+
+
+class ScanCost:
+    """Work done for one band, or for a whole scan."""
+
+    __slots__ = IO_COUNTERS + ('parse_seconds', 'validate_seconds')
+
+    def __init__(self):
+        for counter in IO_COUNTERS:
+            setattr(self, counter, 0)
+        self.parse_seconds = 0.0
+        self.validate_seconds = 0.0
+
+    def add(self, other: 'ScanCost') -> None:
+        """Add the work of another cost to this one."""
+        for counter in ScanCost.__slots__:
+            setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary = {counter: getattr(self, counter) for counter in IO_COUNTERS}
+        summary['parse_seconds'] = round(self.parse_seconds, 6)
+        summary['validate_seconds'] = round(self.validate_seconds, 6)
+        return summary
+
+
+class BandCost(ScanCost):
+    """Work done and time spent scanning one band."""
+
+    __slots__ = ('band_name', 'seconds', 'phases', '_started')
+
+    def __init__(self, band_name: str):
+        super().__init__()
+        self.band_name = band_name
+        self.seconds = 0.0
+        self.phases: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'band_name': self.band_name,
+            'seconds': round(self.seconds, 6),
+            **super().to_dict(),
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.phases.items()}
+        }
+
+
+class ScanCostProfile:
+    """
+    Cost profile of one scan.
+
+    Use as a context manager on the scanning thread; the profile is active
+    (receives reported work) inside the block.
+    """
+
+    def __init__(self, slowest_bands: int = SLOWEST_BANDS_LISTED):
+        """
+        Initialize scan cost profile.
+
+        Args:
+            slowest_bands: Number of slowest bands kept
+        """
+        self.slowest_bands = max(0, slowest_bands)
+        self.phases: Dict[str, float] = dict.fromkeys(SCAN_PHASES, 0.0)
+        self.totals = ScanCost()
+        self.bands_profiled = 0
+        self._outside_bands = ScanCost()
+        self._band: Optional[BandCost] = None
+        self._slowest: List[Tuple[float, int, BandCost]] = []
+        self._sequence = itertools.count()
+        self._token = None
+
+    def __enter__(self) -> 'ScanCostProfile':
+        self._token = _current_profile.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.finish_band()
+        _current_profile.reset(self._token)
+
+    @property
+    def current(self) -> ScanCost:
+        """Cost receiving reported work: the band being scanned, or the scan."""
+        return self._band if self._band is not None else self._outside_bands
+
+    def start_band(self, band_name: str) -> BandCost:
+        """
+        Charge the following work to a band (finishing the previous one).
+
+        Args:
+            band_name: Name of the band being scanned
+
+        Returns:
+            The band's cost, completed by finish_band()
+        """
+        self.finish_band()
+        self._band = BandCost(band_name)
+        return self._band
+
+    def finish_band(self) -> Optional[BandCost]:
+        """
+        Stop charging work to the current band and rank it.
+
+        Returns:
+            The finished band's cost, None if no band was being scanned
+        """
+        band = self._band
+        if band is None:
+            return None
+        self._band = None
+        band.seconds = time.perf_counter() - band._started
+        self.totals.add(band)
+        self.bands_profiled += 1
+        if self.slowest_bands:
+            entry = (band.seconds, next(self._sequence), band)
+            if len(self._slowest) < self.slowest_bands:
+                heapq.heappush(self._slowest, entry)
+            elif band.seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+        return band
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as a scan phase (and a phase of the current band)."""
+        band = self._band
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+            if band is not None:
+                band.phases[name] = band.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the profile.
+
+        Returns:
+            Dict with phases (seconds), totals of the reported work, the
+            number of bands profiled and the slowest bands, slowest first
+        """
+        totals = ScanCost()
+        totals.add(self.totals)
+        totals.add(self._outside_bands)
+        return {
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+            'totals': totals.to_dict(),
+            'bands_profiled': self.bands_profiled,
+            'slowest_bands': [band.to_dict() for _, _, band in sorted(self._slowest, reverse=True)]
+        }
+
+
+def current_scan_costs() -> Optional[ScanCostProfile]:
+    """Get the scan cost profile active on this thread, if any."""
+    return _current_profile.get()
+
+
+def record_scan_io(counter: str, amount: int = 1) -> None:
+    """
+    Report file system or metadata work to the active scan cost profile.
+
+    Args:
+        counter: One of IO_COUNTERS
+        amount: Amount of work (operations or bytes)
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        cost = profile.current
+        setattr(cost, counter, getattr(cost, counter) + amount)
+
+
+def record_scan_time(counter: str, seconds: float) -> None:
+    """
+    Report parse or validation time to the active scan cost profile.
+
+    Args:
+        counter: 'parse_seconds' or 'validate_seconds'
+        seconds: Time spent
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        cost = profile.current
+        setattr(cost, counter, getattr(cost, counter) + seconds)
+
+
+@contextmanager
+def scan_phase(name: str) -> Iterator[None]:
+    """Time a block as a phase of the active scan cost profile (no-op without one)."""
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.phase(name):
+        yield
+
+
+@contextmanager
+def timed_scan_work(counter: str) -> Iterator[None]:
+    """Report the time of a block as parse or validation time (no-op without a profile)."""
+    if _current_profile.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_scan_time(counter, time.perf_counter() - started)
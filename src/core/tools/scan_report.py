@@ -0,0 +1,194 @@
+"""
+Scan Reports for Music Collection MCP Server.
+
+A scan writes one JSON Lines record per band (plus change, error and summary
+records) to a report file below the metadata root instead of keeping every
+band result in memory. The scan response only carries the summary and the
+report path; details are read back page by page with read_scan_report().
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Directory (below the metadata root) that holds scan reports
+SCAN_REPORTS_DIRNAME = ".scan_reports"
+
+# Number of most recent reports kept on disk
+SCAN_REPORT_RETENTION = 5
+
+# Record types written to a report
+SCAN_REPORT_RECORD_TYPES = ('band', 'change', 'error', 'summary')
+
+# Flush buffered records after this many lines so a crash loses little
+_FLUSH_EVERY = 100
+
+
+def scan_reports_dir(metadata_root: Union[str, Path]) -> Path:
+    """
+    Get the scan report directory for a metadata root.
+
+    Args:
+        metadata_root: Directory that contains all metadata files
+
+    Returns:
+        Path to the scan report directory
+    """
+    return Path(metadata_root) / SCAN_REPORTS_DIRNAME
+
+
+class ScanReportWriter:
+    """
+    Append-only JSON Lines writer for a single scan.
+
+    Use as a context manager; the file is opened on enter and closed (and old
+    reports pruned) on exit.
+    """
+
+    def __init__(self, metadata_root: Union[str, Path], retention: int = SCAN_REPORT_RETENTION):
+        """
+        Initialize scan report writer.
+
+        Args:
+            metadata_root: Directory that contains all metadata files
+            retention: Number of most recent reports to keep
+        """
+        self.reports_dir = scan_reports_dir(metadata_root)
+        self.retention = max(1, retention)
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        self.report_path: Optional[Path] = self.reports_dir / f"scan-{timestamp}.jsonl"
+        self.records_written = 0
+        self._file = None
+        self._pending = 0
+
+    def __enter__(self) -> 'ScanReportWriter':
+        try:
+            self.reports_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.report_path, 'w', encoding='utf-8')
+        except OSError as e:
+            # A scan must not fail just because its report cannot be written
+            logger.warning(f"Could not create scan report {self.report_path}: {e}")
+            self.report_path = None
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, record_type: str, data: Dict[str, Any]) -> None:
+        """
+        Append one record to the report.
+
+        Args:
+            record_type: One of SCAN_REPORT_RECORD_TYPES
+            data: JSON-serializable record payload
+        """
+        if self._file is None:
+            return
+        self._file.write(json.dumps({'type': record_type, **data}, ensure_ascii=False, default=str) + '\n')
+        self.records_written += 1
+        self._pending += 1
+        if self._pending >= _FLUSH_EVERY:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Close the report file and prune old reports."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        _prune_reports(self.reports_dir, self.retention)
+
+
+def _prune_reports(reports_dir: Path, retention: int) -> None:
+    """Delete all but the newest retention reports."""
+    reports = sorted(reports_dir.glob('scan-*.jsonl'), reverse=True)
+    for old_report in reports[retention:]:
+        try:
+            old_report.unlink()
+        except OSError as e:
+            logger.warning(f"Could not delete old scan report {old_report}: {e}")
+
+
+def list_scan_reports(metadata_root: Union[str, Path]) -> List[Path]:
+    """
+    List scan reports below a metadata root, newest first.
+
+    Args:
+        metadata_root: Directory that contains all metadata files
+
+    Returns:
+        List of report paths
+    """
+    reports_dir = scan_reports_dir(metadata_root)
+    if not reports_dir.is_dir():
+        return []
+    return sorted(reports_dir.glob('scan-*.jsonl'), reverse=True)
+
+
+def read_scan_report(report_path: Union[str, Path], page: int = 1, page_size: int = 50,
+                     record_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read one page of records from a scan report.
+
+    The file is streamed, so only the requested page is held in memory.
+
+    Args:
+        report_path: Path to the report file
+        page: Page number (starts at 1)
+        page_size: Number of records per page
+        record_type: Only return records of this type (all types if None)
+
+    Returns:
+        Dict with records, pagination info and the summary record (if any)
+
+    Raises:
+        FileNotFoundError: If the report does not exist
+        ValueError: If pagination parameters or the record type are invalid
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be >= 1")
+    if record_type is not None and record_type not in SCAN_REPORT_RECORD_TYPES:
+        raise ValueError(f"Unknown record type: {record_type}")
+
+    report_path = Path(report_path)
+    start = (page - 1) * page_size
+    end = start + page_size
+    records = []
+    total = 0
+    summary = None
+    with open(report_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn trailing line from an interrupted scan
+            if record.get('type') == 'summary':
+                summary = record
+            if record_type is not None and record.get('type') != record_type:
+                continue
+            if start <= total < end:
+                records.append(record)
+            total += 1
+
+    total_pages = (total + page_size - 1) // page_size if total else 0
+    return {
+        'report_path': str(report_path),
+        'record_type': record_type,
+        'records': records,
+        'pagination': {
+            'page': page,
+            'page_size': page_size,
+            'total_records': total,
+            'total_pages': total_pages,
+            'has_next': page < total_pages,
+            'has_previous': page > 1
+        },
+        'summary': summary,
+        'size_bytes': os.path.getsize(report_path)
+    }
@@ -1,12 +1,23 @@
 # Standard library imports
-import json
+import fnmatch
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 # Local imports
 from src.di import get_config
+from src.core.tools.backup_catalog import get_backup_catalog, retention_count_from_config
+from src.core.tools.filesystem import get_filesystem
+from src.core.tools.json_codec import (
+    encode_json,
+    read_json_file,
+    storage_format_for_path,
+    storage_format_from_config,
+)
+from src.core.tools.metadata_store import MetadataStore
 from src.core.tools.performance import (
     BatchFileOperations,
     ProgressReporter,
@@ -14,6 +25,11 @@ from src.core.tools.performance import (
     track_operation,
     get_performance_summary,
 )
+from src.core.tools.scan_checkpoint import ScanCheckpoint, band_fingerprint, checkpoint_interval_from_config
+from src.core.tools.scan_costs import ScanCostProfile, scan_phase, timed_scan_work
+from src.core.tools.scan_report import ScanReportWriter, list_scan_reports, read_scan_report, scan_reports_dir
+from src.core.tools.snapshot import get_snapshot_store
+from src.exceptions import ScanningError
 from src.models import (
     Album,
     AlbumFolderParser,
@@ -28,6 +44,9 @@ from src.models import (
 # Common music file extensions
 MUSIC_EXTENSIONS = {'.mp3', '.flac', '.wav', '.aac', '.m4a', '.ogg', '.wma', '.mp4', '.m4p'}
 
+# Image extensions collected into band and album galleries
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
 # Folders to exclude during scanning
 EXCLUDED_FOLDERS = {
     # Hidden folders
@@ -40,9 +59,20 @@ EXCLUDED_FOLDERS = {
     'artwork', 'covers', 'images', 'scans', 'logs'
 }
 
+# Bands, changes and errors listed in the scan response; the scan report has them all
+MAX_PREVIEW_BANDS = 20
+MAX_LISTED_SCAN_EVENTS = 100
+
+# Serializes index read-modify-write cycles of full scans and watch mode updates
+_collection_index_lock = threading.RLock()
+
+# Band result fields kept in the response preview
+_BAND_PREVIEW_FIELDS = ('band_name', 'folder_path', 'albums_count', 'total_tracks', 'has_metadata')
+
 
 @performance_monitor("music_collection_scan")
-def scan_music_folders() -> Dict:
+def scan_music_folders(band_names: Optional[List[str]] = None, path_glob: Optional[str] = None,
+                       should_cancel: Optional[Callable[[], bool]] = None) -> Dict:
     """
     Scan the music directory structure to discover bands and albums, detecting all changes.
     
@@ -56,10 +86,49 @@ def scan_music_folders() -> Dict:
     - Detects missing albums (in metadata but not in folders)
     - Updates the collection index with current state
     
+    The scan can be limited to specific bands with band_names and/or a
+    path_glob matched against band folder names (e.g. "Pink*" or
+    "Queen/*"; only the band part of the pattern is used). A scoped scan only
+    updates the index entries of bands in scope, and only bands in scope can
+    be detected as removed, so adding a single album does not require a walk
+    of the whole library.
+    
+    Bands are streamed through a generator pipeline (discover -> scan band and
+    sync metadata -> update index) and every band result is written to a JSON
+    Lines scan report instead of being kept in memory, so memory use does not
+    grow with the size of the collection. Use read_scan_report() with the
+    returned report_path to page through the per-band details.
+    
+    Progress is checkpointed to a scan-state file every
+    SCAN_CHECKPOINT_INTERVAL_SECONDS. If a scan is interrupted, the next scan
+    of the same scope resumes from the checkpoint and only scans the bands
+    that were not processed yet or whose folder changed since;
+    results['resume'] reports whether the scan resumed and the time saved.
+    
+    The scan's file writes are published as one collection snapshot
+    generation when it ends. Readers that pinned a snapshot before the scan
+    keep seeing the collection as before it; old file contents are only
+    kept for such readers.
+    
+    results['cost_breakdown'] shows where the scan's time went: seconds per
+    phase (discover, scan, sync, index, save), the directories listed, paths
+    stat'ed, files opened, metadata bytes read and written and the parse and
+    validation time, in total and for the 20 slowest bands. Every band record
+    of the scan report carries the band's cost.
+    
+    Args:
+        band_names: Only scan these band folders (all bands if None)
+        path_glob: Only scan band folders matching this pattern (all bands if None)
+        should_cancel: Checked before each band; when it returns True the scan
+            is checkpointed and stops with an error result
+    
     Returns:
-        Dict containing scan results with bands, albums, and statistics including:
+        Dict containing scan summary and statistics including:
         - status: 'success' or 'error'
-        - results: Dict with scan statistics and detailed change information
+        - results: Dict with scan statistics, a bounded preview of bands,
+          changes and errors, report_path of the full scan report,
+          resume (fresh or resumed scan, bands restored, time saved) and
+          cost_breakdown (phases, totals and slowest bands)
         - collection_path: Path to the scanned music collection
         - changes_made: True if any changes were detected and saved
         - performance_metrics: Performance metrics for the scan operation
@@ -69,23 +138,9 @@ def scan_music_folders() -> Dict:
         OSError: If there are file system access issues
     """
     try:
-        # Validate and prepare for scanning
-        music_root, collection_index = _prepare_scan_environment()
-        
-        # Analyze collection changes
-        current_band_folders, scan_results = _analyze_collection_changes(music_root, collection_index)
-        
-        # Process all band folders with progress reporting
-        _process_band_folders(current_band_folders, music_root, collection_index, scan_results)
-        
-        # Finalize scan results with performance metrics
-        result = _finalize_scan_results(music_root, collection_index, scan_results)
-        
-        # Add performance metrics to result
-        result['performance_metrics'] = get_performance_summary()
-        
-        return result
-        
+        # Readers keep seeing the collection as before the scan until it ends
+        with _collection_index_lock, get_snapshot_store().transaction():
+            return _run_scan(band_names, path_glob, should_cancel)
     except Exception as e:
         error_msg = f"Music collection scan failed: {str(e)}"
         logging.error(error_msg)
@@ -97,6 +152,242 @@ def scan_music_folders() -> Dict:
         }
 
 
+def _run_scan(band_names: Optional[List[str]] = None, path_glob: Optional[str] = None,
+              should_cancel: Optional[Callable[[], bool]] = None) -> Dict:
+    """
+    Run the scan pipeline over the whole collection or a scope of it.
+    
+    Args:
+        band_names: Only scan these band folders (all bands if None)
+        path_glob: Only scan band folders matching this pattern (all bands if None)
+        should_cancel: Checked before each band to stop the scan early
+    
+    Returns:
+        Scan result dictionary (see scan_music_folders)
+    """
+    # Validate and prepare for scanning
+    music_root, collection_index = _prepare_scan_environment()
+    
+    metadata_root = _get_metadata_store(music_root).metadata_root
+    checkpoint = ScanCheckpoint(metadata_root, music_root, band_names=band_names, path_glob=path_glob,
+                                interval_seconds=checkpoint_interval_from_config(get_config()))
+    resumed = checkpoint.load()
+    
+    with ScanReportWriter(metadata_root) as report, ScanCostProfile() as costs:
+        # Analyze collection changes
+        with costs.phase('discover'):
+            current_band_folders, scan_results = _analyze_collection_changes(
+                music_root, collection_index, report, band_names=band_names, path_glob=path_glob)
+        scan_results['report_path'] = str(report.report_path) if report.report_path else None
+        
+        # Take bands that are unchanged since the last checkpoint from it
+        bands_restored = 0
+        if resumed:
+            current_band_folders, bands_restored = _restore_checkpointed_bands(
+                current_band_folders, music_root, collection_index, scan_results, checkpoint, report)
+        
+        # Stream the remaining band folders through the scan pipeline,
+        # checkpointing before an interruption propagates
+        try:
+            _process_band_folders(current_band_folders, music_root, collection_index, scan_results,
+                                  report, checkpoint, should_cancel, costs)
+        except BaseException:
+            checkpoint.save()
+            raise
+        scan_results['resume'] = _resume_summary(checkpoint, resumed, bands_restored,
+                                                 bands_restored + len(current_band_folders))
+        
+        # Finalize scan results and record the summary in the report
+        with costs.phase('save'):
+            result = _finalize_scan_results(music_root, collection_index, scan_results, report)
+        scan_results['cost_breakdown'] = costs.to_dict()
+    
+    # The index is saved, so the scan no longer needs its checkpoint
+    checkpoint.clear()
+    
+    # Add performance metrics to result
+    result['performance_metrics'] = get_performance_summary()
+    
+    return result
+
+
+def _restore_checkpointed_bands(current_band_folders: List[Path], music_root: Path,
+                                collection_index: CollectionIndex, scan_results: Dict,
+                                checkpoint: ScanCheckpoint,
+                                report: Optional[ScanReportWriter] = None) -> Tuple[List[Path], int]:
+    """
+    Apply the bands of a resumed checkpoint whose folder is unchanged.
+    
+    Restored bands update the index and the scan results exactly as if they
+    had been scanned; their report record is built from the checkpoint and
+    marked as restored.
+    
+    Args:
+        current_band_folders: Band folders in scope
+        music_root: Path to music collection root
+        collection_index: Collection index to update
+        scan_results: Scan results dictionary to update
+        checkpoint: Loaded checkpoint of an interrupted scan
+        report: Scan report receiving band and change records
+        
+    Returns:
+        Tuple of (band folders that still need scanning, number of bands restored)
+    """
+    remaining = []
+    current_names = {folder.name for folder in current_band_folders}
+    for band_name in list(checkpoint.processed):
+        if band_name not in current_names:
+            checkpoint.forget(band_name)
+    
+    for band_folder in current_band_folders:
+        state = checkpoint.processed.get(band_folder.name)
+        if state is None or band_fingerprint(band_folder) != state['fingerprint']:
+            # Not processed yet, or changed since it was checkpointed
+            checkpoint.forget(band_folder.name)
+            remaining.append(band_folder)
+            continue
+        
+        band_entry = BandIndexEntry(**state['index_entry'])
+        band_result = {
+            'band_name': band_entry.name,
+            'folder_path': band_entry.folder_path,
+            'albums_count': state['albums_count'],
+            'total_tracks': state['total_tracks'],
+            'has_metadata': band_entry.has_metadata,
+            'restored_from_checkpoint': True
+        }
+        _detect_band_changes(collection_index, band_result, scan_results, report)
+        collection_index.add_band(band_entry)
+        _record_band_result(band_result, scan_results, report)
+    
+    restored = len(current_band_folders) - len(remaining)
+    if restored:
+        logging.info(f"Resumed scan from checkpoint {checkpoint.resumed_from}: "
+                     f"{restored} bands restored, {len(remaining)} left to scan")
+    return remaining, restored
+
+
+def _resume_summary(checkpoint: ScanCheckpoint, resumed: bool, bands_restored: int,
+                    bands_total: int) -> Dict[str, Any]:
+    """
+    Describe whether a scan resumed from a checkpoint and how much time that saved.
+    
+    The time saved is the scan time stored in the checkpoint, scaled by the
+    share of its bands that could be restored instead of re-scanned.
+    
+    Args:
+        checkpoint: Checkpoint of the scan
+        resumed: True if an incomplete state was loaded
+        bands_restored: Bands taken from the checkpoint
+        bands_total: Bands in scope
+        
+    Returns:
+        Resume summary for the scan results
+    """
+    summary = {
+        'mode': 'resumed' if resumed else 'fresh',
+        'bands_restored': bands_restored,
+        'bands_scanned': bands_total - bands_restored,
+        'checkpoints_written': checkpoint.checkpoints_written,
+        'time_saved_seconds': 0.0
+    }
+    if resumed:
+        if checkpoint.loaded_bands:
+            summary['time_saved_seconds'] = round(
+                checkpoint.checkpointed_seconds * bands_restored / checkpoint.loaded_bands, 3)
+        summary['resumed_from'] = checkpoint.resumed_from
+    return summary
+
+
+def rescan_bands(band_names: Iterable[str], music_root: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Re-scan individual bands and update only their collection index entries.
+    
+    Bands whose folder no longer exists are removed from the index. Used by
+    watch mode to keep the index current without full scans.
+    
+    Args:
+        band_names: Names of the band folders to re-scan
+        music_root: Path to music collection root (configured root if None)
+        
+    Returns:
+        Dict with bands_updated, bands_removed, changes_detected, failed_bands and errors
+    """
+    music_root = Path(music_root or get_config().MUSIC_ROOT_PATH)
+    result = {'bands_updated': 0, 'bands_removed': 0, 'changes_detected': [], 'failed_bands': [], 'errors': []}
+    
+    with _collection_index_lock, get_snapshot_store().transaction(), track_operation("rescan_bands") as metrics:
+        collection_index = _load_or_create_collection_index(music_root)
+        changed = False
+        for band_name in band_names:
+            band_folder = music_root / band_name
+            if (band_name.startswith('.') or band_name.lower() in EXCLUDED_FOLDERS
+                    or not get_filesystem().is_dir(band_folder)):
+                if collection_index.remove_band(band_name):
+                    result['bands_removed'] += 1
+                    result['changes_detected'].append(f"Removed band: {band_name}")
+                    changed = True
+                continue
+            
+            band_result = _scan_band_folder(band_folder, music_root)
+            if not band_result:
+                result['failed_bands'].append(band_name)
+                result['errors'].append(f"Error scanning band folder {band_folder}")
+                metrics.errors += 1
+                continue
+            existing_entry = collection_index.get_band(band_name)
+            if existing_entry is None:
+                result['changes_detected'].append(
+                    f"Added new band: {band_name} ({band_result['albums_count']} albums)")
+            collection_index.add_band(_create_band_index_entry(band_result, music_root, existing_entry))
+            result['bands_updated'] += 1
+            metrics.items_processed += 1
+            changed = True
+        
+        if changed:
+            _save_collection_index(collection_index, music_root)
+    
+    return result
+
+
+def get_scan_report(report_path: Optional[str] = None, page: int = 1, page_size: int = 50,
+                    record_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Page through the per-band details of a scan report.
+    
+    Args:
+        report_path: Report returned by scan_music_folders (latest report if None)
+        page: Page number (starts at 1)
+        page_size: Number of records per page
+        record_type: Only return 'band', 'change', 'error' or 'summary' records
+        
+    Returns:
+        Dict with status, records, pagination and the scan summary
+        
+    Raises:
+        ValueError: If the report is not a scan report of this collection or
+            the paging parameters are invalid
+        FileNotFoundError: If no scan report exists
+    """
+    music_root = Path(get_config().MUSIC_ROOT_PATH)
+    metadata_root = _get_metadata_store(music_root).metadata_root
+    
+    if report_path is None:
+        reports = list_scan_reports(metadata_root)
+        if not reports:
+            raise FileNotFoundError("No scan report found. Run scan_music_folders first.")
+        path = reports[0]
+    else:
+        # Only files in the report directory may be read through this accessor
+        path = scan_reports_dir(metadata_root) / Path(report_path).name
+        if not path.is_file():
+            raise ValueError(f"Scan report not found: {report_path}")
+    
+    result = read_scan_report(path, page=page, page_size=page_size, record_type=record_type)
+    result['status'] = 'success'
+    return result
+
+
 def _prepare_scan_environment() -> Tuple[Path, CollectionIndex]:
     """
     Validate music root path and load collection index.
@@ -122,23 +413,36 @@ def _prepare_scan_environment() -> Tuple[Path, CollectionIndex]:
     return music_root, collection_index
 
 
-def _analyze_collection_changes(music_root: Path, collection_index: CollectionIndex) -> Tuple[List[Path], Dict]:
+def _analyze_collection_changes(music_root: Path, collection_index: CollectionIndex,
+                                report: Optional[ScanReportWriter] = None,
+                                band_names: Optional[List[str]] = None,
+                                path_glob: Optional[str] = None) -> Tuple[List[Path], Dict]:
     """
     Analyze changes in the collection by comparing filesystem to existing index.
     
     Args:
         music_root: Path to music collection root
         collection_index: Current collection index
+        report: Scan report receiving change records
+        band_names: Limit the scan to these band folders
+        path_glob: Limit the scan to band folders matching this pattern
         
     Returns:
         Tuple of (current_band_folders, scan_results)
     """
     # Get current filesystem state vs existing index state
-    current_band_folders = _discover_band_folders(music_root)
+    if band_names is None and path_glob is None:
+        current_band_folders = _discover_band_folders(music_root)
+        in_scope = None
+    else:
+        current_band_folders, in_scope = _discover_scoped_band_folders(music_root, band_names, path_glob)
     current_band_names = {folder.name for folder in current_band_folders}
-    existing_band_names = {band.name for band in collection_index.bands}
+    # Bands outside the scope are neither updated nor detected as removed
+    existing_band_names = {band.name for band in collection_index.bands
+                           if in_scope is None or in_scope(band.name)}
     
-    # Initialize scan results tracking structure
+    # Initialize scan results tracking structure; the lists are bounded
+    # previews, the full details go to the scan report
     scan_results = {
         'bands_discovered': len(current_band_folders),
         'bands_added': len(current_band_names - existing_band_names),
@@ -148,19 +452,46 @@ def _analyze_collection_changes(music_root: Path, collection_index: CollectionIn
         'total_tracks': 0,
         'missing_albums': 0,
         'scan_errors': [],
+        'scan_errors_count': 0,
         'scan_timestamp': datetime.now().isoformat(),
         'changes_detected': [],
-        'bands': []
+        'changes_detected_count': 0,
+        'bands': [],
+        'bands_truncated': False,
+        'scope': {
+            'full_scan': in_scope is None,
+            'band_names': list(band_names) if band_names is not None else None,
+            'path_glob': path_glob
+        }
     }
     
     # Process removed bands (exist in index but not in filesystem)
-    _process_removed_bands(collection_index, current_band_names, existing_band_names, scan_results)
+    _process_removed_bands(collection_index, current_band_names, existing_band_names, scan_results, report)
     
     return current_band_folders, scan_results
 
 
+def _record_scan_event(scan_results: Dict, key: str, message: str,
+                       report: Optional[ScanReportWriter] = None) -> None:
+    """
+    Record a change or error: counted always, listed up to a limit, reported in full.
+    
+    Args:
+        scan_results: Scan results dictionary to update
+        key: 'changes_detected' or 'scan_errors'
+        message: Description of the change or error
+        report: Scan report receiving the record
+    """
+    scan_results[f'{key}_count'] += 1
+    if len(scan_results[key]) < MAX_LISTED_SCAN_EVENTS:
+        scan_results[key].append(message)
+    if report is not None:
+        report.write('change' if key == 'changes_detected' else 'error', {'message': message})
+
+
 def _process_removed_bands(collection_index: CollectionIndex, current_band_names: Set[str], 
-                          existing_band_names: Set[str], scan_results: Dict) -> None:
+                          existing_band_names: Set[str], scan_results: Dict,
+                          report: Optional[ScanReportWriter] = None) -> None:
     """
     Process bands that have been removed from the filesystem.
     
@@ -169,24 +500,151 @@ def _process_removed_bands(collection_index: CollectionIndex, current_band_names
         current_band_names: Set of band names currently in filesystem
         existing_band_names: Set of band names in existing index
         scan_results: Scan results dictionary to update
+        report: Scan report receiving change records
     """
     removed_bands = existing_band_names - current_band_names
     for band_name in removed_bands:
         if collection_index.remove_band(band_name):
-            scan_results['changes_detected'].append(f"Removed band: {band_name}")
+            _record_scan_event(scan_results, 'changes_detected', f"Removed band: {band_name}", report)
             logging.info(f"Removed band from index: {band_name}")
 
 
+def _iter_scanned_bands(band_folders: Iterable[Path], music_root: Path, scan_results: Dict,
+                        report: Optional[ScanReportWriter] = None,
+                        progress_reporter: Optional[ProgressReporter] = None,
+                        should_cancel: Optional[Callable[[], bool]] = None,
+                        costs: Optional[ScanCostProfile] = None) -> Iterator[Dict]:
+    """
+    Pipeline stage: scan each band folder and synchronize its metadata file.
+    
+    Args:
+        band_folders: Band folder paths from discovery
+        music_root: Path to music collection root
+        scan_results: Scan results dictionary to update with errors
+        report: Scan report receiving error records
+        progress_reporter: Progress reporter updated once per folder
+        should_cancel: Checked before each folder
+        costs: Scan cost profile; each band's work is charged to it from
+            here until the band is recorded
+        
+    Yields:
+        Band scan result dictionaries (folders that fail to scan are skipped)
+        
+    Raises:
+        ScanningError: If should_cancel returns True
+    """
+    for band_folder in band_folders:
+        if should_cancel is not None and should_cancel():
+            raise ScanningError(
+                "Scan cancelled", scan_path=str(music_root),
+                user_message="Scan cancelled; the next scan with the same scope resumes from its checkpoint"
+            )
+        if costs is not None:
+            costs.start_band(band_folder.name)
+        try:
+            band_result = _scan_band_folder(band_folder, music_root)
+        except Exception as e:
+            band_result = None
+            error_msg = f"Error scanning band folder {band_folder}: {str(e)}"
+            logging.warning(error_msg)
+            _record_scan_event(scan_results, 'scan_errors', error_msg, report)
+        if progress_reporter:
+            progress_reporter.update()
+        if band_result:
+            yield band_result
+        elif costs is not None:
+            costs.finish_band()
+
+
+def _iter_index_updates(band_results: Iterable[Dict], music_root: Path, collection_index: CollectionIndex,
+                        scan_results: Dict, report: Optional[ScanReportWriter] = None) -> Iterator[Dict]:
+    """
+    Pipeline stage: detect changes for each band and update its collection index entry.
+    
+    Args:
+        band_results: Band scan results from the scan stage
+        music_root: Path to music collection root
+        collection_index: Collection index to update
+        scan_results: Scan results dictionary to update
+        report: Scan report receiving change and error records
+        
+    Yields:
+        Band scan results whose index entry was updated
+    """
+    for band_result in band_results:
+        try:
+            with scan_phase('index'):
+                # Detect if this is a new band or an updated existing band
+                _detect_band_changes(collection_index, band_result, scan_results, report)
+                
+                # Update collection index with current band state
+                band_entry = _create_band_index_entry(band_result, music_root, 
+                                                     collection_index.get_band(band_result['band_name']))
+                collection_index.add_band(band_entry)
+        except Exception as e:
+            error_msg = f"Error updating index for band {band_result.get('band_name')}: {str(e)}"
+            logging.warning(error_msg)
+            _record_scan_event(scan_results, 'scan_errors', error_msg, report)
+            continue
+        yield band_result
+
+
+def _band_preview(band_result: Dict) -> Dict:
+    """
+    Reduce a band scan result to the small summary kept in the scan response.
+    
+    Args:
+        band_result: Full band scan result
+        
+    Returns:
+        Dictionary without album, gallery and structure details
+    """
+    return {key: band_result.get(key) for key in _BAND_PREVIEW_FIELDS}
+
+
+def _record_band_result(band_result: Dict, scan_results: Dict,
+                        report: Optional[ScanReportWriter] = None) -> None:
+    """
+    Consume one band result: accumulate totals, report it and keep a bounded preview.
+    
+    Args:
+        band_result: Band scan result
+        scan_results: Scan results dictionary to update
+        report: Scan report receiving the band record
+    """
+    scan_results['albums_discovered'] += band_result['albums_count']
+    scan_results['total_tracks'] += band_result['total_tracks']
+    
+    if report is not None:
+        report.write('band', band_result)
+    if len(scan_results['bands']) < MAX_PREVIEW_BANDS:
+        scan_results['bands'].append(_band_preview(band_result))
+    else:
+        scan_results['bands_truncated'] = True
+
+
 def _process_band_folders(current_band_folders: List[Path], music_root: Path, 
-                         collection_index: CollectionIndex, scan_results: Dict) -> None:
+                         collection_index: CollectionIndex, scan_results: Dict,
+                         report: Optional[ScanReportWriter] = None,
+                         checkpoint: Optional[ScanCheckpoint] = None,
+                         should_cancel: Optional[Callable[[], bool]] = None,
+                         costs: Optional[ScanCostProfile] = None) -> None:
     """
-    Process all current band folders and detect changes with progress reporting.
+    Stream all current band folders through the scan pipeline with progress reporting.
+    
+    Each band result is consumed as soon as it is produced: totals are
+    accumulated, the full result (with the band's cost) is written to the
+    scan report and only a bounded preview is kept in scan_results.
     
     Args:
         current_band_folders: List of band folder paths
         music_root: Path to music collection root
         collection_index: Collection index to update
         scan_results: Scan results dictionary to update
+        report: Scan report receiving one record per band
+        checkpoint: Scan checkpoint recording every processed band
+        should_cancel: Checked before each band to stop the scan early
+        costs: Scan cost profile receiving the cost of every band
     """
     num_bands = len(current_band_folders)
     logging.info(f"Scanning {num_bands} band folders")
@@ -196,46 +654,38 @@ def _process_band_folders(current_band_folders: List[Path], music_root: Path,
     if num_bands > 50:  # Use progress reporting for larger collections
         progress_reporter = ProgressReporter(num_bands, "Band Folder Scanning")
     
+    errors_before = scan_results['scan_errors_count']
     with track_operation("process_band_folders", total_bands=num_bands) as metrics:
-        for i, band_folder in enumerate(current_band_folders):
-            try:
-                # Scan individual band folder for albums and tracks
-                band_result = _scan_band_folder(band_folder, music_root)
-                if not band_result:
-                    continue
-                    
-                # Add band results to overall scan results
-                scan_results['bands'].append(band_result)
-                scan_results['albums_discovered'] += band_result['albums_count']
-                scan_results['total_tracks'] += band_result['total_tracks']
-                
-                # Detect if this is a new band or an updated existing band
-                _detect_band_changes(collection_index, band_result, scan_results)
-                
-                # Update collection index with current band state
-                band_entry = _create_band_index_entry(band_result, music_root, 
-                                                     collection_index.get_band(band_result['band_name']))
-                collection_index.add_band(band_entry)
-                
-                # Update progress tracking
-                metrics.items_processed += 1
-                if progress_reporter:
-                    progress_reporter.update()
-                
-            except Exception as e:
-                error_msg = f"Error scanning band folder {band_folder}: {str(e)}"
-                logging.warning(error_msg)
-                scan_results['scan_errors'].append(error_msg)
-                metrics.errors += 1
-                if progress_reporter:
-                    progress_reporter.update()  # Still update progress on error
+        scanned = _iter_scanned_bands(current_band_folders, music_root, scan_results, report,
+                                      progress_reporter, should_cancel, costs)
+        for band_result in _iter_index_updates(scanned, music_root, collection_index, scan_results, report):
+            band_cost = costs.finish_band() if costs is not None else None
+            if band_cost is not None:
+                band_result['cost'] = band_cost.to_dict()
+            _record_band_result(band_result, scan_results, report)
+            
+            if checkpoint is not None:
+                # Fingerprint after the metadata file was written, so a
+                # resumed scan sees the folder as unchanged
+                band_name = band_result['band_name']
+                checkpoint.record(
+                    band_name, band_fingerprint(music_root / band_result['folder_path']),
+                    band_result['albums_count'], band_result['total_tracks'],
+                    collection_index.get_band(band_name).model_dump()
+                )
+                checkpoint.maybe_save()
+            
+            metrics.items_processed += 1
+        
+        metrics.errors += scan_results['scan_errors_count'] - errors_before
         
         # Finish progress reporting
         if progress_reporter:
             progress_reporter.finish()
 
 
-def _detect_band_changes(collection_index: CollectionIndex, band_result: Dict, scan_results: Dict) -> None:
+def _detect_band_changes(collection_index: CollectionIndex, band_result: Dict, scan_results: Dict,
+                         report: Optional[ScanReportWriter] = None) -> None:
     """
     Detect if a band is new or has been updated.
     
@@ -243,25 +693,28 @@ def _detect_band_changes(collection_index: CollectionIndex, band_result: Dict, s
         collection_index: Collection index to check against
         band_result: Results from band folder scan
         scan_results: Scan results dictionary to update
+        report: Scan report receiving change records
     """
     existing_entry = collection_index.get_band(band_result['band_name'])
     if existing_entry is None:
         # This is a completely new band
-        scan_results['changes_detected'].append(
-            f"Added new band: {band_result['band_name']} ({band_result['albums_count']} albums)"
+        _record_scan_event(
+            scan_results, 'changes_detected',
+            f"Added new band: {band_result['band_name']} ({band_result['albums_count']} albums)", report
         )
     else:
         # Check for changes in existing band (album count differences)
         if existing_entry.albums_count != band_result['albums_count']:
             album_diff = band_result['albums_count'] - existing_entry.albums_count
             scan_results['bands_updated'] += 1
-            scan_results['changes_detected'].append(
-                f"Updated band: {band_result['band_name']} (album change: {album_diff:+d})"
+            _record_scan_event(
+                scan_results, 'changes_detected',
+                f"Updated band: {band_result['band_name']} (album change: {album_diff:+d})", report
             )
 
 
 def _finalize_scan_results(music_root: Path, collection_index: CollectionIndex, 
-                          scan_results: Dict) -> Dict:
+                          scan_results: Dict, report: Optional[ScanReportWriter] = None) -> Dict:
     """
     Finalize scan results and save collection index.
     
@@ -269,6 +722,7 @@ def _finalize_scan_results(music_root: Path, collection_index: CollectionIndex,
         music_root: Path to music collection root
         collection_index: Updated collection index
         scan_results: Scan results dictionary
+        report: Scan report receiving the summary record
         
     Returns:
         Final scan results dictionary
@@ -286,6 +740,12 @@ def _finalize_scan_results(music_root: Path, collection_index: CollectionIndex,
     # Save updated collection index with all changes
     _save_collection_index(collection_index, music_root)
     
+    if report is not None:
+        report.write('summary', {
+            key: value for key, value in scan_results.items()
+            if key not in ('bands', 'changes_detected', 'scan_errors')
+        })
+    
     # Log comprehensive scan summary
     logging.info(
         f"Comprehensive scan completed: {scan_results['bands_discovered']} total bands, "
@@ -323,10 +783,11 @@ def _discover_band_folders(music_root: Path) -> List[Path]:
             
             # Filter for valid band folders
             band_folders = []
+            filesystem = get_filesystem()
             for item in all_items:
-                if (item.is_dir() and 
-                    not item.name.startswith('.') and 
-                    item.name.lower() not in EXCLUDED_FOLDERS):
+                if (not item.name.startswith('.') and 
+                    item.name.lower() not in EXCLUDED_FOLDERS and
+                    filesystem.is_dir(item)):
                     band_folders.append(item)
                     metrics.items_processed += 1
             
@@ -346,6 +807,65 @@ def _discover_band_folders(music_root: Path) -> List[Path]:
             return []
 
 
+def _band_glob_pattern(path_glob: str) -> str:
+    """
+    Reduce a path glob to the pattern for the band folder (its first component).
+    
+    Args:
+        path_glob: Glob relative to the music root, e.g. "Queen/*" or "The *"
+        
+    Returns:
+        Pattern matched against band folder names
+    """
+    return path_glob.replace('\\', '/').strip('/').split('/')[0] or '*'
+
+
+def _discover_scoped_band_folders(music_root: Path, band_names: Optional[List[str]],
+                                  path_glob: Optional[str]) -> Tuple[List[Path], Callable[[str], bool]]:
+    """
+    Find the band folders within a scan scope.
+    
+    Named bands are checked directly, without listing the music root; a
+    glob needs one listing of the music root.
+    
+    Args:
+        music_root: Path to music collection root
+        band_names: Band folder names in scope (may be None)
+        path_glob: Pattern for band folders in scope (may be None)
+        
+    Returns:
+        Tuple of (band folders in scope, predicate telling if a band name is in scope)
+        
+    Raises:
+        ValueError: If a band name is not a plain folder name
+    """
+    names = set()
+    for band_name in band_names or []:
+        if not band_name or band_name in ('.', '..') or '/' in band_name or '\\' in band_name:
+            raise ValueError(f"Invalid band name in scan scope: {band_name!r}")
+        names.add(band_name)
+    pattern = _band_glob_pattern(path_glob) if path_glob is not None else None
+    
+    def in_scope(name: str) -> bool:
+        return name in names or (pattern is not None and fnmatch.fnmatchcase(name, pattern))
+    
+    def is_band_folder(folder: Path) -> bool:
+        return (not folder.name.startswith('.') and folder.name.lower() not in EXCLUDED_FOLDERS
+                and get_filesystem().is_dir(folder))
+    
+    with track_operation("discover_scoped_band_folders", music_root=str(music_root)) as metrics:
+        if pattern is not None:
+            candidates = [folder for folder in _discover_band_folders(music_root) if in_scope(folder.name)]
+            candidates.extend(music_root / name for name in names
+                              if not fnmatch.fnmatchcase(name, pattern))
+        else:
+            candidates = [music_root / name for name in names]
+        band_folders = [folder for folder in candidates if is_band_folder(folder)]
+        metrics.items_processed = len(band_folders)
+    
+    return sorted(band_folders, key=lambda x: x.name.lower()), in_scope
+
+
 def _scan_band_folder(band_folder: Path, music_root: Path) -> Optional[Dict]:
     """
     Scan a single band folder for album information with enhanced metadata detection.
@@ -361,20 +881,24 @@ def _scan_band_folder(band_folder: Path, music_root: Path) -> Optional[Dict]:
         Dictionary with band scan results including structure analysis or None if invalid
     """
     band_name = band_folder.name
-    logging.debug(f"Scanning band folder: {band_name}")
+    logging.debug("Scanning band folder: %s", band_name)
     try:
-        # Find images in the band folder (not in subfolders)
-        band_gallery = [f.name for f in band_folder.iterdir()
-                        if f.is_file() and f.suffix.lower() in {'.jpg', '.jpeg', '.png'}]
-        # Initialize scanning components and discover albums
-        albums, total_tracks = _scan_band_albums(band_folder)
-        # Detect folder structure and load/create metadata
-        folder_structure, metadata = _process_band_metadata(band_folder, band_name, albums, band_gallery)
-        # Check metadata status
-        has_metadata = _check_band_metadata_status(band_folder / '.band_metadata.json', band_name)
-        # Create result with enhanced information
-        return _create_band_scan_result(band_name, band_folder, music_root, albums, 
-                                       total_tracks, has_metadata, folder_structure)
+        with scan_phase('scan'):
+            # Find images in the band folder (not in subfolders)
+            with get_filesystem().scandir(band_folder) as entries:
+                band_gallery = [entry.name for entry in entries
+                                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
+            # Initialize scanning components and discover albums
+            albums, total_tracks = _scan_band_albums(band_folder)
+        with scan_phase('sync'):
+            # Detect folder structure and load/create metadata
+            folder_structure, metadata = _process_band_metadata(band_folder, band_name, albums, band_gallery)
+            # Check metadata status
+            metadata_file = _get_metadata_store(music_root).band_metadata_file(band_name)
+            has_metadata = _check_band_metadata_status(metadata_file, band_name)
+            # Create result with enhanced information
+            return _create_band_scan_result(band_name, band_folder, music_root, albums, 
+                                           total_tracks, has_metadata, folder_structure)
     except Exception as e:
         logging.error(f"Error scanning band folder {band_name}: {e}")
         return None
@@ -449,17 +973,18 @@ def _load_or_create_band_metadata(band_folder: Path, band_name: str):
     Returns:
         BandMetadata instance
     """
-    metadata_file = band_folder / '.band_metadata.json'
+    metadata_file = _get_metadata_store(band_folder.parent).band_metadata_file(band_name)
     metadata = None
     
-    if metadata_file.exists():
+    if get_filesystem().exists(metadata_file):
         try:
             # Load existing metadata
             from src.core.tools.storage import JSONStorage
             metadata_dict = JSONStorage.load_json(metadata_file)
             from src.models.band import BandMetadata
-            metadata = BandMetadata(**metadata_dict)
-            logging.debug(f"Loaded existing metadata for {band_name}")
+            with timed_scan_work('validate_seconds'):
+                metadata = BandMetadata(**metadata_dict)
+            logging.debug("Loaded existing metadata for %s", band_name)
         except Exception as e:
             logging.warning(f"Failed to load existing metadata for {band_name}: {e}")
             # Will create new metadata below
@@ -476,7 +1001,7 @@ def _load_or_create_band_metadata(band_folder: Path, band_name: str):
             description="",
             albums=[]
         )
-        logging.debug(f"Created new metadata structure for {band_name}")
+        logging.debug("Created new metadata structure for %s", band_name)
     
     return metadata
 
@@ -490,12 +1015,12 @@ def _save_band_metadata_file(band_folder: Path, band_name: str, metadata) -> Non
         band_name: Name of the band
         metadata: BandMetadata instance to save
     """
-    metadata_file = band_folder / '.band_metadata.json'
+    metadata_file = _get_metadata_store(band_folder.parent).band_metadata_file(band_name)
     try:
         from src.core.tools.storage import JSONStorage
         metadata_dict = metadata.model_dump()
-        JSONStorage.save_json(metadata_file, metadata_dict, backup=metadata_file.exists())
-        logging.debug(f"Updated metadata with folder structure and local albums for {band_name}")
+        JSONStorage.save_json(metadata_file, metadata_dict, backup=get_filesystem().exists(metadata_file))
+        logging.debug("Updated metadata with folder structure and local albums for %s", band_name)
     except Exception as e:
         logging.warning(f"Failed to save metadata for {band_name}: {e}")
         # Continue with scan even if save fails
@@ -513,7 +1038,7 @@ def _check_band_metadata_status(metadata_file: Path, band_name: str) -> bool:
         True if metadata exists and was properly saved, False otherwise
     """
     has_metadata = False
-    if metadata_file.exists():
+    if get_filesystem().exists(metadata_file):
         try:
             metadata = _load_band_metadata(metadata_file)
             if metadata:
@@ -545,8 +1070,8 @@ def _create_band_scan_result(band_name: str, band_folder: Path, music_root: Path
     """
     # Try to load .band_metadata.json to get the gallery field, else fallback to []
     band_gallery = []
-    metadata_file = band_folder / '.band_metadata.json'
-    if metadata_file.exists():
+    metadata_file = _get_metadata_store(music_root).band_metadata_file(band_name)
+    if get_filesystem().exists(metadata_file):
         try:
             from src.core.tools.storage import JSONStorage
             metadata_dict = JSONStorage.load_json(metadata_file)
@@ -589,7 +1114,7 @@ def _synchronize_metadata_with_local_albums(metadata: 'BandMetadata', local_albu
     """
     from src.models.band import Album, AlbumType
     
-    logging.debug(f"Synchronizing metadata with {len(local_albums)} local albums for {band_name}")
+    logging.debug("Synchronizing metadata with %d local albums for %s", len(local_albums), band_name)
     
     # Prepare data structures for synchronization
     local_albums_lookup, processed_local_albums = _prepare_album_synchronization(local_albums)
@@ -664,12 +1189,12 @@ def _process_existing_albums(metadata: 'BandMetadata', local_albums_lookup: Dict
             )
             updated_local_albums.append(updated_album)
             processed_local_albums.add(album_key)
-            logging.debug(f"Updated existing album in local array: {existing_album.album_name} [{getattr(existing_album, 'edition', '')}]")
+            logging.debug("Updated existing album in local array: %s [%s]", existing_album.album_name, getattr(existing_album, 'edition', ''))
         else:
             # Album not found locally - add to missing albums array
             missing_album = _prepare_missing_album(existing_album)
             updated_missing_albums.append(missing_album)
-            logging.debug(f"Moved album to missing array: {existing_album.album_name} [{getattr(existing_album, 'edition', '')}]")
+            logging.debug("Moved album to missing array: %s [%s]", existing_album.album_name, getattr(existing_album, 'edition', ''))
     
     return updated_local_albums, updated_missing_albums
 
@@ -756,7 +1281,7 @@ def _process_new_local_albums(local_albums: List[Dict], processed_local_albums:
             # This is a new album not in metadata
             new_album = _create_new_album_from_local_data(local_album)
             new_local_albums.append(new_album)
-            logging.debug(f"Added new local album: {new_album.album_name} [{local_album.get('edition', '')}]")
+            logging.debug("Added new local album: %s [%s]", new_album.album_name, local_album.get('edition', ''))
     
     return new_local_albums
 
@@ -811,9 +1336,8 @@ def _update_metadata_with_synchronized_albums(metadata: 'BandMetadata', updated_
     metadata.albums_missing = updated_missing_albums
     metadata.albums_count = len(updated_local_albums) + len(updated_missing_albums)
     
-    logging.debug(f"Synchronized metadata: {len(updated_local_albums)} local albums, "
-                 f"{len(updated_missing_albums)} missing albums, "
-                 f"{metadata.albums_count} total albums")
+    logging.debug("Synchronized metadata: %d local albums, %d missing albums, %d total albums",
+                  len(updated_local_albums), len(updated_missing_albums), metadata.albums_count)
     
     return metadata
 
@@ -831,12 +1355,13 @@ def _discover_album_folders(band_folder: Path) -> List[Path]:
     album_folders = []
     
     try:
-        for item in band_folder.iterdir():
-            if (item.is_dir() and 
-                not item.name.startswith('.') and 
-                item.name.lower() not in EXCLUDED_FOLDERS and
-                item.name != '.band_metadata.json'):  # Skip metadata file
-                album_folders.append(item)
+        with get_filesystem().scandir(band_folder) as entries:
+            for item in entries:
+                if (item.is_dir() and 
+                    not item.name.startswith('.') and 
+                    item.name.lower() not in EXCLUDED_FOLDERS and
+                    item.name != '.band_metadata.json'):  # Skip metadata file
+                    album_folders.append(Path(item.path))
     except (PermissionError, OSError) as e:
         logging.warning(f"Error accessing band folder {band_folder}: {e}")
     
@@ -855,41 +1380,44 @@ def _discover_album_folders_enhanced(band_folder: Path, album_parser: AlbumFolde
         List of dictionaries containing album folder info with metadata
     """
     album_folders = []
+    filesystem = get_filesystem()
     
     try:
-        for item in band_folder.iterdir():
-            if (item.is_dir() and 
-                not item.name.startswith('.') and 
-                item.name.lower() not in EXCLUDED_FOLDERS and
-                item.name != '.band_metadata.json'):
-                
-                # Check if this is a type folder (Album/, Live/, Demo/, etc.)
-                type_folder_info = album_parser._detect_type_folder(item.name)
-                
-                if type_folder_info['is_type_folder']:
-                    # This is a type folder, scan its contents regardless of structure type
-                    # (needed for mixed structures that have both type folders and direct albums)
-                    try:
-                        for album_item in item.iterdir():
+        with filesystem.scandir(band_folder) as entries:
+            items = [Path(entry.path) for entry in entries
+                     if (entry.is_dir() and 
+                         not entry.name.startswith('.') and 
+                         entry.name.lower() not in EXCLUDED_FOLDERS and
+                         entry.name != '.band_metadata.json')]
+        for item in items:
+            # Check if this is a type folder (Album/, Live/, Demo/, etc.)
+            type_folder_info = album_parser._detect_type_folder(item.name)
+            
+            if type_folder_info['is_type_folder']:
+                # This is a type folder, scan its contents regardless of structure type
+                # (needed for mixed structures that have both type folders and direct albums)
+                try:
+                    with filesystem.scandir(item) as album_entries:
+                        for album_item in album_entries:
                             if (album_item.is_dir() and 
                                 not album_item.name.startswith('.') and
                                 album_item.name.lower() not in EXCLUDED_FOLDERS):
                                 album_folders.append({
-                                    'path': album_item,
+                                    'path': Path(album_item.path),
                                     'type_folder': item.name,
                                     'album_type': type_folder_info['album_type'],
                                     'in_type_folder': True
                                 })
-                    except (PermissionError, OSError) as e:
-                        logging.warning(f"Error accessing type folder {item}: {e}")
-                else:
-                    # Regular album folder (default, mixed, or non-type folder)
-                    album_folders.append({
-                        'path': item,
-                        'type_folder': '',
-                        'album_type': None,  # Will be detected from folder name
-                        'in_type_folder': False
-                    })
+                except (PermissionError, OSError) as e:
+                    logging.warning(f"Error accessing type folder {item}: {e}")
+            else:
+                # Regular album folder (default, mixed, or non-type folder)
+                album_folders.append({
+                    'path': item,
+                    'type_folder': '',
+                    'album_type': None,  # Will be detected from folder name
+                    'in_type_folder': False
+                })
                     
     except (PermissionError, OSError) as e:
         logging.warning(f"Error accessing band folder {band_folder}: {e}")
@@ -930,8 +1458,7 @@ def _scan_album_folder_enhanced(album_folder_info: Dict, album_parser: AlbumFold
         else:
             folder_path = album_name
         # Find images in the album folder (recursive, include subfolders)
-        album_gallery = [str(f.relative_to(album_folder)) for f in album_folder.rglob('*')
-                         if f.is_file() and f.suffix.lower() in {'.jpg', '.jpeg', '.png'}]
+        album_gallery = _find_images(album_folder)
         return {
             'album_name': parsed_info.get('album_name', album_name),
             'year': parsed_info.get('year', ''),
@@ -980,6 +1507,30 @@ def _calculate_compliance_summary(albums: List[Dict]) -> Dict[str, Any]:
     return {'average_score': 0, 'compliant_albums': 0, 'total_albums': len(albums), 'compliance_percentage': 0}
 
 
+def _find_images(folder: Path) -> List[str]:
+    """
+    Find the image files in a folder and its subfolders.
+    
+    Args:
+        folder: Folder to search
+        
+    Returns:
+        Image paths relative to folder, with '/' separators; the folder's own
+        files first, then each subfolder's
+    """
+    images = []
+    subfolders = []
+    with get_filesystem().scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subfolders.append(entry)
+            elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                images.append(entry.name)
+    for subfolder in subfolders:
+        images.extend(f"{subfolder.name}/{image}" for image in _find_images(Path(subfolder.path)))
+    return images
+
+
 def _count_music_files(folder: Path) -> int:
     """
     Count music files in a folder (non-recursive) using optimized batch operations.
@@ -994,6 +1545,19 @@ def _count_music_files(folder: Path) -> int:
     return BatchFileOperations.count_files_in_directory(folder, MUSIC_EXTENSIONS)
 
 
+def _get_metadata_store(music_root: Path) -> MetadataStore:
+    """
+    Get the metadata store for a music root using the current configuration.
+    
+    Args:
+        music_root: Path to music collection root
+        
+    Returns:
+        MetadataStore resolving metadata and index file locations
+    """
+    return MetadataStore.from_config(get_config(), music_root=music_root)
+
+
 def _load_or_create_collection_index(music_root: Path) -> CollectionIndex:
     """
     Load existing collection index or create a new one.
@@ -1004,13 +1568,13 @@ def _load_or_create_collection_index(music_root: Path) -> CollectionIndex:
     Returns:
         CollectionIndex instance
     """
-    index_file = music_root / '.collection_index.json'
+    index_file = _get_metadata_store(music_root).collection_index_file()
     
-    if index_file.exists():
+    if get_filesystem().exists(index_file):
         try:
-            with open(index_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return CollectionIndex(**data)
+            data = read_json_file(index_file)
+            with timed_scan_work('validate_seconds'):
+                return CollectionIndex(**data)
         except Exception as e:
             logging.warning(f"Failed to load collection index, creating new one: {e}")
     
@@ -1025,17 +1589,28 @@ def _save_collection_index(collection_index: CollectionIndex, music_root: Path)
         collection_index: CollectionIndex to save
         music_root: Path to music collection root
     """
-    index_file = music_root / '.collection_index.json'
+    index_file = _get_metadata_store(music_root).collection_index_file()
+    storage_format = storage_format_for_path(index_file, storage_format_from_config(get_config()))
     
     try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write the new index next to the old one first, so readers (and
+        # watch mode) never see a missing or partial index. Concurrent scans
+        # each write their own temporary file.
+        temp_file = index_file.with_name(f'{index_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        filesystem = get_filesystem()
+        with filesystem.open(temp_file, 'wb') as f:
+            f.write(encode_json(collection_index.model_dump(), storage_format))
+        
         # Create backup if file exists
-        if index_file.exists():
-            backup_file = music_root / f'.collection_index.json.backup.{int(datetime.now().timestamp())}'
-            index_file.rename(backup_file)
-            
+        if filesystem.exists(index_file):
+            backup_file = index_file.parent / f'{index_file.name}.backup.{int(datetime.now().timestamp())}'
+            _link_or_copy(index_file, backup_file)
+            _record_index_backup(backup_file, index_file)
+        
         # Save new index
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(collection_index.model_dump_json(indent=2))
+        get_snapshot_store().write(index_file, lambda: filesystem.rename(temp_file, index_file))
             
         logging.debug(f"Collection index saved to {index_file}")
         
@@ -1044,6 +1619,38 @@ def _save_collection_index(collection_index: CollectionIndex, music_root: Path)
         raise
 
 
+def _link_or_copy(source: Path, target: Path) -> None:
+    """
+    Hard-link source to target, copying where hard links are not supported.
+    
+    Args:
+        source: Existing file
+        target: Path of the link or copy (replaced if it exists)
+    """
+    filesystem = get_filesystem()
+    if filesystem.exists(target):
+        filesystem.remove(target)
+    try:
+        filesystem.link(source, target)
+    except OSError:
+        filesystem.copy(source, target)
+
+
+def _record_index_backup(backup_file: Path, index_file: Path) -> None:
+    """
+    Record a collection index backup in the backup catalog, applying retention.
+    
+    Args:
+        backup_file: Backup that was created
+        index_file: Collection index file that was backed up
+    """
+    try:
+        catalog = get_backup_catalog(index_file.parent)
+        catalog.record(backup_file, index_file, max_backups=retention_count_from_config(get_config()))
+    except Exception as e:
+        logging.warning(f"Could not record collection index backup in catalog: {e}")
+
+
 def _create_band_index_entry(band_result: Dict, music_root: Path, existing_entry: Optional[BandIndexEntry] = None) -> BandIndexEntry:
     """
     Create a BandIndexEntry from scan results, preserving existing metadata.
@@ -1057,11 +1664,10 @@ def _create_band_index_entry(band_result: Dict, music_root: Path, existing_entry
         BandIndexEntry instance with merged data
     """
     # Load metadata if available to get accurate album counts
-    band_folder = music_root / band_result['folder_path']
-    metadata_file = band_folder / '.band_metadata.json'
+    metadata_file = _get_metadata_store(music_root).band_metadata_file(band_result['band_name'])
     metadata = None
     
-    if metadata_file.exists():
+    if get_filesystem().exists(metadata_file):
         try:
             metadata = _load_band_metadata(metadata_file)
         except Exception as e:
@@ -1116,9 +1722,9 @@ def _load_band_metadata(metadata_file: Path) -> Optional[BandMetadata]:
         BandMetadata instance or None if failed
     """
     try:
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return BandMetadata(**data)
+        data = read_json_file(metadata_file)
+        with timed_scan_work('validate_seconds'):
+            return BandMetadata(**data)
     except Exception as e:
         logging.warning(f"Failed to load band metadata from {metadata_file}: {e}")
         return None
@@ -1138,7 +1744,7 @@ def _detect_missing_albums(collection_index: CollectionIndex) -> int:
         Total number of missing albums detected
     """
     total_missing = 0
-    music_root = Path(get_config().MUSIC_ROOT_PATH)
+    metadata_store = MetadataStore.from_config(get_config())
     
     for band_entry in collection_index.bands:
         if not band_entry.has_metadata:
@@ -1146,10 +1752,9 @@ def _detect_missing_albums(collection_index: CollectionIndex) -> int:
             
         try:
             # Load band metadata
-            band_folder = music_root / band_entry.folder_path
-            metadata_file = band_folder / '.band_metadata.json'
+            metadata_file = metadata_store.band_metadata_file(band_entry.name)
             
-            if metadata_file.exists():
+            if get_filesystem().exists(metadata_file):
                 metadata = _load_band_metadata(metadata_file)
                 if metadata:
                     # With separated albums schema, missing count is already tracked
@@ -1178,8 +1783,9 @@ def _scan_album_folder(album_folder: Path) -> Optional[Dict]:
         if tracks_count == 0:
             return None
         # Find images in the album folder (not recursive)
-        album_gallery = [f.name for f in album_folder.iterdir()
-                         if f.is_file() and f.suffix.lower() in {'.jpg', '.jpeg', '.png'}]
+        with get_filesystem().scandir(album_folder) as entries:
+            album_gallery = [entry.name for entry in entries
+                             if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
         return {
             'album_name': album_name,
             'track_count': tracks_count,
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Snapshot isolation for collection metadata and index reads.
+
+Readers see the collection as a snapshot: an immutable generation of the
+collection index and band metadata files. A reader pins the current
+snapshot (handlers pin one for the whole call), and every file it reads
+comes from that generation, even while a scan rewrites the files.
+
+Snapshots are copy-on-write. Files are loaded into a snapshot lazily and
+shared with the snapshots published after it. Before a writer replaces a
+file, it copies the old contents into every snapshot pinned by another
+reader that has not loaded the file yet; without such readers the old file
+is not read at all. The current snapshot only drops the file, so it never
+holds more than its cache size. The writer publishes a new generation once
+the replacement is done. Writes made inside a transaction (a collection scan)
+are published together when the transaction ends; readers that start
+during it see each file as soon as it is replaced. Readers never wait for
+writers: pinning and publishing only swap references under a short lock. A
+generation is reclaimed when its last reader unpins it.
+
+Files changed outside the server are detected by their stat signature when
+read from the current snapshot. They are picked up by reads that start after
+the change is noticed, but they are not isolated.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from src.core.tools.collection_generation import bump_collection_generation, get_collection_generation
+from src.core.tools.filesystem import get_filesystem
+from src.core.tools.json_codec import decode_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHED_FILES = 4096
+
+# (st_mtime_ns, st_size, st_ino) of a file, None if it does not exist
+Signature = Optional[Tuple[int, int, int]]
+
+
+def _signature(stat_result: os.stat_result) -> Signature:
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
+def _stat_signature(path: str) -> Signature:
+    try:
+        return _signature(get_filesystem().stat(path))
+    except FileNotFoundError:
+        return None
+
+
+class _Entry:
+    """Contents of one file as loaded into a snapshot."""
+
+    __slots__ = ('data', 'signature', 'error')
+
+    def __init__(self, data: Any = None, signature: Signature = None, error: Optional[Exception] = None):
+        self.data = data
+        self.signature = signature
+        self.error = error
+
+    def value(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+def _load_entry(path: str) -> _Entry:
+    """Read and decode a JSON file; a missing file loads as None."""
+    try:
+        with get_filesystem().open(path, 'rb') as f:
+            signature = _signature(os.fstat(f.fileno()))
+            raw = f.read()
+    except FileNotFoundError:
+        return _Entry()
+    except OSError as e:
+        return _Entry(error=e)
+    try:
+        return _Entry(decode_json(raw), signature)
+    except ValueError as e:
+        return _Entry(signature=signature, error=e)
+
+
+class CollectionSnapshot:
+    """One generation of the collection's metadata and index files."""
+
+    def __init__(self, generation: int, entries: Dict[str, _Entry], models: Dict[str, Tuple[_Entry, Any]]):
+        self.generation = generation
+        self.pins = 0
+        self._entries = entries
+        self._models = models
+
+    @property
+    def files_loaded(self) -> int:
+        return len(self._entries)
+
+
+class _Pin:
+    __slots__ = ('snapshot', 'depth')
+
+    def __init__(self, snapshot: CollectionSnapshot):
+        self.snapshot = snapshot
+        self.depth = 1
+
+
+class SnapshotStore:
+    """
+    Copy-on-write generations of collection files for isolated reads.
+
+    File data returned by read() and read_model() is shared between readers
+    and must not be modified.
+    """
+
+    def __init__(self, max_cached_files: int = DEFAULT_MAX_CACHED_FILES):
+        """
+        Initialize snapshot store.
+
+        Args:
+            max_cached_files: Files kept loaded in the current snapshot
+                (older snapshots keep what their readers need)
+        """
+        self.max_cached_files = max(1, max_cached_files)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._current = CollectionSnapshot(get_collection_generation(), {}, {})
+        # Snapshots that are current or pinned by a reader
+        self._live: Dict[int, CollectionSnapshot] = {id(self._current): self._current}
+        # Files being written or written by an open transaction
+        self._dirty: Dict[str, int] = {}
+        self._stats = {'generations_published': 0, 'generations_reclaimed': 0, 'external_changes': 0}
+
+    @property
+    def current_generation(self) -> int:
+        return self._current.generation
+
+    @contextmanager
+    def pin(self) -> Iterator[CollectionSnapshot]:
+        """
+        Pin the current snapshot for the calling thread.
+
+        Reads on this thread use the pinned snapshot until the outermost
+        pin() exits. Nested pins reuse the outer pin. A thread that writes
+        moves its pin to the generation published by its write, so it sees
+        its own writes.
+
+        Yields:
+            The pinned snapshot
+        """
+        pin = getattr(self._local, 'pin', None)
+        if pin is not None:
+            pin.depth += 1
+            try:
+                yield pin.snapshot
+            finally:
+                pin.depth -= 1
+            return
+
+        with self._lock:
+            pin = self._local.pin = _Pin(self._pin_locked(self._current))
+        try:
+            yield pin.snapshot
+        finally:
+            self._local.pin = None
+            with self._lock:
+                self._unpin_locked(pin.snapshot)
+
+    def read(self, path: Union[str, Path]) -> Any:
+        """
+        Read a JSON file as of the calling thread's snapshot.
+
+        Without a pin the current snapshot is used for this read alone. A
+        thread with an open transaction reads the files directly.
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            Decoded JSON data (shared, do not modify), None if the file does not exist
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        return self._read_entry(str(path))[0].value()
+
+    def read_model(self, path: Union[str, Path], factory: Callable[[Any], Any]) -> Any:
+        """
+        Read a JSON file and build a model from it, once per snapshot.
+
+        The model is shared by every reader of the snapshot (and by later
+        snapshots while the file is unchanged), so it must not be modified.
+
+        Args:
+            path: Path of the file
+            factory: Builds the model from the decoded JSON data
+
+        Returns:
+            Model, None if the file does not exist
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        path = str(path)
+        entry, snapshot = self._read_entry(path)
+        data = entry.value()
+        if data is None:
+            return None
+        if snapshot is None:
+            return factory(data)
+        memo = snapshot._models.get(path)
+        if memo is not None and memo[0] is entry:
+            return memo[1]
+        model = factory(data)
+        with self._lock:
+            snapshot._models[path] = (entry, model)
+        return model
+
+    def write(self, path: Union[str, Path], replace: Callable[[], None]) -> None:
+        """
+        Replace a file, keeping its old contents for the readers of older snapshots.
+
+        Args:
+            path: Path of the file
+            replace: Writes the new contents to path (atomically)
+        """
+        path = str(path)
+        own_pin = getattr(self._local, 'pin', None)
+        own = own_pin.snapshot if own_pin is not None else None
+        with self._lock:
+            needs_copy = any(path not in snapshot._entries and self._pinned_by_others_locked(snapshot, own)
+                             for snapshot in self._live.values())
+        old = _load_entry(path) if needs_copy else None
+
+        with self._lock:
+            if self._pinned_by_others_locked(self._current, own):
+                # Its readers keep the old contents; later readers start from a copy without the file
+                self._fork_current_locked(path)
+            else:
+                self._current._entries.pop(path, None)
+                self._current._models.pop(path, None)
+            for snapshot in self._live.values():
+                if path not in snapshot._entries and self._pinned_by_others_locked(snapshot, own):
+                    if old is None:
+                        old = _load_entry(path)
+                    snapshot._entries[path] = old
+            self._dirty[path] = self._dirty.get(path, 0) + 1
+
+        try:
+            replace()
+        except BaseException:
+            # The file was not replaced; the copied old contents are still current
+            with self._lock:
+                self._release_dirty_locked([path])
+            raise
+        transaction = getattr(self._local, 'transaction', None)
+        if transaction is not None:
+            transaction.add(path)
+        else:
+            self._publish([path])
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Publish all writes of the calling thread in one generation.
+
+        Until the transaction ends, readers that pinned a snapshot before a
+        write keep seeing the file as it was; readers that start later see
+        the replaced file. The writes are published when it ends, also if it
+        ends with an exception, since the files have been replaced. Nested
+        transactions join the outer one.
+        """
+        if getattr(self._local, 'transaction', None) is not None:
+            yield
+            return
+
+        paths: Set[str] = set()
+        self._local.transaction = paths
+        try:
+            yield
+        finally:
+            self._local.transaction = None
+            if paths:
+                self._publish(sorted(paths))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get snapshot statistics.
+
+        Returns:
+            Dict with the current generation, live and pinned snapshots,
+            readers, cached files and generation counters
+        """
+        with self._lock:
+            return {
+                'generation': self._current.generation,
+                'live_snapshots': len(self._live),
+                'pinned_snapshots': sum(1 for snapshot in self._live.values() if snapshot.pins),
+                'readers': sum(snapshot.pins for snapshot in self._live.values()),
+                'files_cached': self._current.files_loaded,
+                **self._stats
+            }
+
+    def _read_entry(self, path: str) -> Tuple[_Entry, Optional[CollectionSnapshot]]:
+        """Get the entry of path in the thread's snapshot, loading it if needed."""
+        if getattr(self._local, 'transaction', None) is not None:
+            return _load_entry(path), None
+
+        pin = getattr(self._local, 'pin', None)
+        if pin is None:
+            with self.pin():
+                return self._read_entry(path)
+
+        snapshot = pin.snapshot
+        with self._lock:
+            entry = snapshot._entries.get(path)
+            check = snapshot is self._current and path not in self._dirty
+        if entry is None:
+            loaded = _load_entry(path)
+            with self._lock:
+                # A writer may have copied the old contents in meanwhile; keep those
+                entry = snapshot._entries.setdefault(path, loaded)
+                if snapshot is self._current:
+                    self._evict_locked()
+            return entry, snapshot
+        if not check or entry.signature == _stat_signature(path):
+            return entry, snapshot
+
+        # Changed outside the server: publish the new contents and read them
+        loaded = _load_entry(path)
+        with self._lock:
+            if snapshot is self._current and path not in self._dirty:
+                self._stats['external_changes'] += 1
+                snapshot = self._publish_locked({path: loaded})
+                self._move_pin_locked(pin, snapshot)
+                return loaded, snapshot
+        return entry, pin.snapshot
+
+    def _publish(self, paths: List[str]) -> None:
+        """Publish a generation without the given (just replaced) files."""
+        with self._lock:
+            self._release_dirty_locked(paths)
+            snapshot = self._publish_locked({path: None for path in paths})
+            pin = getattr(self._local, 'pin', None)
+            if pin is not None:
+                self._move_pin_locked(pin, snapshot)
+
+    def _release_dirty_locked(self, paths: List[str]) -> None:
+        for path in paths:
+            remaining = self._dirty.get(path, 0) - 1
+            if remaining > 0:
+                self._dirty[path] = remaining
+            else:
+                self._dirty.pop(path, None)
+
+    def _publish_locked(self, changes: Dict[str, Optional[_Entry]]) -> CollectionSnapshot:
+        """Make a new current snapshot with changed entries replaced or dropped (caller holds the lock)."""
+        previous = self._current
+        entries = dict(previous._entries)
+        models = dict(previous._models)
+        for path, entry in changes.items():
+            models.pop(path, None)
+            if entry is None:
+                entries.pop(path, None)
+            else:
+                entries[path] = entry
+        snapshot = self._current = CollectionSnapshot(bump_collection_generation(), entries, models)
+        self._live[id(snapshot)] = snapshot
+        self._stats['generations_published'] += 1
+        if not previous.pins:
+            self._reclaim_locked(previous)
+        return snapshot
+
+    def _evict_locked(self) -> None:
+        """
+        Drop the oldest loaded files from the current snapshot beyond the cache size.
+
+        The current snapshot holds the same contents as on disk (old contents
+        of replaced files only go to snapshots that are no longer current),
+        so its files can be loaded again at any time.
+        """
+        entries = self._current._entries
+        excess = len(entries) - self.max_cached_files
+        if excess <= 0:
+            return
+        for path in list(entries)[:excess]:
+            del entries[path]
+            self._current._models.pop(path, None)
+
+    def _pinned_by_others_locked(self, snapshot: CollectionSnapshot, own: Optional[CollectionSnapshot]) -> bool:
+        """Whether readers other than the calling thread have the snapshot pinned."""
+        return snapshot.pins > (1 if snapshot is own else 0)
+
+    def _fork_current_locked(self, path: str) -> None:
+        """Leave the current snapshot to its readers and make a copy of it without path current."""
+        previous = self._current
+        entries = dict(previous._entries)
+        models = dict(previous._models)
+        entries.pop(path, None)
+        models.pop(path, None)
+        snapshot = self._current = CollectionSnapshot(previous.generation, entries, models)
+        self._live[id(snapshot)] = snapshot
+
+    def _pin_locked(self, snapshot: CollectionSnapshot) -> CollectionSnapshot:
+        snapshot.pins += 1
+        return snapshot
+
+    def _unpin_locked(self, snapshot: CollectionSnapshot) -> None:
+        snapshot.pins -= 1
+        if not snapshot.pins and snapshot is not self._current:
+            self._reclaim_locked(snapshot)
+
+    def _move_pin_locked(self, pin: _Pin, snapshot: CollectionSnapshot) -> None:
+        if pin.snapshot is not snapshot:
+            self._unpin_locked(pin.snapshot)
+            pin.snapshot = self._pin_locked(snapshot)
+
+    def _reclaim_locked(self, snapshot: CollectionSnapshot) -> None:
+        if self._live.pop(id(snapshot), None) is None:
+            return
+        # A forked generation is reclaimed with its last snapshot
+        if all(live.generation != snapshot.generation for live in self._live.values()):
+            self._stats['generations_reclaimed'] += 1
+
+
+_store = SnapshotStore()
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """
+    Get the process-wide snapshot store.
+
+    Returns:
+        SnapshotStore instance (files of every collection are keyed by path)
+    """
+    return _store
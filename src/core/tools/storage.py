@@ -6,11 +6,7 @@ file locking, backup/recovery, and metadata synchronization.
 """
 
 # Standard library imports
-import json
 import logging
-import os
-import shutil
-import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
@@ -33,89 +29,66 @@ from src.exceptions import (
     create_storage_error,
     wrap_exception,
 )
+from src.core.tools.backup_catalog import (
+    catalog_for_path,
+    get_backup_catalog,
+    retention_count_from_config,
+)
+from src.core.tools.deadline import (
+    Deadline,
+    index_version,
+    make_continuation_token,
+    parse_continuation_token,
+)
+from src.core.tools.filesystem import get_filesystem
+from src.core.tools.json_codec import (
+    decode_json,
+    encode_json,
+    storage_format_for_path,
+    storage_format_from_config,
+)
+from src.core.tools.metadata_store import MetadataStore
 from src.core.tools.performance import (
     performance_monitor,
     track_operation,
     get_performance_summary,
 )
+from src.core.tools.snapshot import get_snapshot_store
+from src.core.tools.tracing import trace_span
 from src.models import (
     AlbumAnalysis,
     BandAnalysis,
     BandIndexEntry,
     BandMetadata,
+    BandMetadataSummary,
     CollectionIndex,
     CollectionInsight,
+    FolderStructure,
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-# Simple in-memory cache for frequently accessed data
-class SimpleCache:
-    """
-    Simple thread-safe in-memory cache for frequently accessed data.
+def _record_backup(backup_path: Path, original_path: Path) -> None:
     """
+    Record a backup in the catalog of the collection it belongs to.
     
-    def __init__(self, max_size: int = 100, ttl_seconds: int = 300):
-        self._cache = {}
-        self._access_times = {}
-        self._max_size = max_size
-        self._ttl_seconds = ttl_seconds
-        self._lock = threading.Lock()
+    Applies the configured retention to the original file's backups. Files
+    outside the configured metadata root are not cataloged. Catalog failures
+    are logged and never fail the write that created the backup.
     
-    def get(self, key: str) -> Optional[Any]:
-        """Get item from cache if it exists and is not expired."""
-        with self._lock:
-            if key not in self._cache:
-                return None
-            
-            # Check if expired
-            access_time = self._access_times.get(key, 0)
-            if time.time() - access_time > self._ttl_seconds:
-                del self._cache[key]
-                del self._access_times[key]
-                return None
-            
-            # Update access time
-            self._access_times[key] = time.time()
-            return self._cache[key]
-    
-    def put(self, key: str, value: Any) -> None:
-        """Put item in cache, evicting old items if necessary."""
-        with self._lock:
-            # Evict expired items
-            self._evict_expired()
-            
-            # Evict oldest items if cache is full
-            if len(self._cache) >= self._max_size and key not in self._cache:
-                oldest_key = min(self._access_times.keys(), key=self._access_times.get)
-                del self._cache[oldest_key]
-                del self._access_times[oldest_key]
-            
-            self._cache[key] = value
-            self._access_times[key] = time.time()
-    
-    def _evict_expired(self) -> None:
-        """Remove expired items from cache."""
-        current_time = time.time()
-        expired_keys = [
-            key for key, access_time in self._access_times.items()
-            if current_time - access_time > self._ttl_seconds
-        ]
-        for key in expired_keys:
-            del self._cache[key]
-            del self._access_times[key]
-    
-    def clear(self) -> None:
-        """Clear all items from cache."""
-        with self._lock:
-            self._cache.clear()
-            self._access_times.clear()
-
-
-# Global cache instances
-_collection_cache = SimpleCache(max_size=50, ttl_seconds=300)  # 5 minute TTL
+    Args:
+        backup_path: Path of the backup that was created
+        original_path: Path of the file that was backed up
+    """
+    try:
+        config = get_config()
+        catalog = catalog_for_path(MetadataStore.from_config(config).metadata_root, backup_path)
+        if catalog is not None:
+            catalog.record(backup_path, original_path, max_backups=retention_count_from_config(config))
+    except Exception as e:
+        logger.warning(f"Could not record backup {backup_path} in backup catalog: {e}")
 
 
 class AtomicFileWriter:
@@ -126,31 +99,38 @@ class AtomicFileWriter:
     corrupting the original file.
     """
     
-    def __init__(self, file_path: Path, backup: bool = True):
+    def __init__(self, file_path: Path, backup: bool = True, binary: bool = False):
         """
         Initialize atomic file writer.
         
         Args:
             file_path: Path to the target file
             backup: Whether to create a backup before writing
+            binary: Open the temporary file in binary mode
         """
         self.file_path = Path(file_path)
         self.temp_path = self.file_path.with_suffix(self.file_path.suffix + '.tmp')
         self.backup_path = self.file_path.with_suffix(self.file_path.suffix + '.backup')
         self.backup = backup
+        self.binary = binary
         self.file_handle = None
         
     def __enter__(self):
         """Enter context manager."""
         # Create backup if requested and file exists
-        if self.backup and self.file_path.exists():
-            shutil.copy2(self.file_path, self.backup_path)
+        filesystem = get_filesystem()
+        if self.backup and filesystem.exists(self.file_path):
+            filesystem.copy(self.file_path, self.backup_path)
+            _record_backup(self.backup_path, self.file_path)
         
         # Create parent directory if it doesn't exist
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Open temporary file for writing
-        self.file_handle = open(self.temp_path, 'w', encoding='utf-8')
+        if self.binary:
+            self.file_handle = filesystem.open(self.temp_path, 'wb')
+        else:
+            self.file_handle = filesystem.open(self.temp_path, 'w', encoding='utf-8')
         return self.file_handle
         
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -160,16 +140,14 @@ class AtomicFileWriter:
             
         if exc_type is None:
             # Success: atomically replace original file
-            if os.name == 'nt':  # Windows
-                if self.file_path.exists():
-                    self.file_path.unlink()
-                self.temp_path.rename(self.file_path)
-            else:  # Unix-like systems
-                self.temp_path.rename(self.file_path)
+            # Atomically replace the original file (also on Windows,
+            # where readers would otherwise see it missing)
+            get_filesystem().rename(self.temp_path, self.file_path)
         else:
             # Error: cleanup temporary file
-            if self.temp_path.exists():
-                self.temp_path.unlink()
+            filesystem = get_filesystem()
+            if filesystem.exists(self.temp_path):
+                filesystem.remove(self.temp_path)
 
 
 @contextmanager
@@ -190,15 +168,16 @@ def file_lock(file_path: Path, timeout: int = 10):
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Create lock file
+    filesystem = get_filesystem()
     try:
-        lock_file = open(lock_path, 'w')
+        lock_file = filesystem.open(lock_path, 'w')
         
         # Try to acquire lock with timeout
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
                 if HAS_FCNTL:  # Unix-like systems
-                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    filesystem.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
                 # On Windows, we just use the lock file existence as a simple lock
                 break
             except (IOError, OSError):
@@ -212,7 +191,7 @@ def file_lock(file_path: Path, timeout: int = 10):
         # Release lock and cleanup
         try:
             if HAS_FCNTL:  # Unix-like systems
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                filesystem.flock(lock_file, fcntl.LOCK_UN)
             lock_file.close()
             if lock_path.exists():
                 lock_path.unlink()
@@ -226,7 +205,8 @@ class JSONStorage:
     """
     
     @staticmethod
-    def save_json(file_path: Path, data: Dict[str, Any], backup: bool = True) -> None:
+    def save_json(file_path: Path, data: Dict[str, Any], backup: bool = True,
+                  storage_format: Optional[str] = None) -> None:
         """
         Save data to JSON file with atomic write operation.
         
@@ -234,14 +214,23 @@ class JSONStorage:
             file_path: Path to save the JSON file
             data: Data to serialize to JSON
             backup: Whether to create backup before writing
+            storage_format: On-disk format (uses METADATA_STORAGE_FORMAT if None);
+                a .gz/.zz file suffix always selects gzip/zlib
             
         Raises:
             StorageError: If save operation fails
         """
         try:
+            if storage_format is None:
+                storage_format = storage_format_from_config(get_config())
+            payload = encode_json(data, storage_format_for_path(file_path, storage_format))
+            
+            def replace() -> None:
+                with AtomicFileWriter(file_path, backup=backup, binary=True) as f:
+                    f.write(payload)
+            
             with file_lock(file_path):
-                with AtomicFileWriter(file_path, backup=backup) as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                get_snapshot_store().write(file_path, replace)
         except Exception as e:
             raise create_storage_error("save", str(file_path), e)
     
@@ -250,6 +239,9 @@ class JSONStorage:
         """
         Load data from JSON file with error handling.
         
+        Pretty, compact and gzip/zlib compressed files are all accepted;
+        compression is detected from the file contents.
+        
         Args:
             file_path: Path to the JSON file
             
@@ -260,7 +252,8 @@ class JSONStorage:
             StorageError: If load operation fails
         """
         try:
-            if not file_path.exists():
+            filesystem = get_filesystem()
+            if not filesystem.exists(file_path):
                 raise StorageError(
                     f"File not found: {file_path}",
                     file_path=str(file_path),
@@ -268,9 +261,9 @@ class JSONStorage:
                     user_message=f"The requested data file does not exist: {file_path.name}"
                 )
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            with filesystem.open(file_path, 'rb') as f:
+                return decode_json(f.read())
+        except ValueError as e:
             raise DataError(
                 f"Invalid JSON in {file_path}: {e}",
                 data_type="JSON",
@@ -294,17 +287,20 @@ class JSONStorage:
         Raises:
             StorageError: If backup creation fails
         """
-        if not file_path.exists():
+        filesystem = get_filesystem()
+        if not filesystem.exists(file_path):
             raise StorageError(f"Cannot backup non-existent file: {file_path}")
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = file_path.with_suffix(f".backup_{timestamp}{file_path.suffix}")
         
         try:
-            shutil.copy2(file_path, backup_path)
-            return backup_path
+            filesystem.copy(file_path, backup_path)
         except Exception as e:
             raise StorageError(f"Failed to create backup: {e}")
+        
+        _record_backup(backup_path, file_path)
+        return backup_path
 
 
 def save_band_metadata(band_name: str, metadata: BandMetadata) -> Dict[str, Any]:
@@ -337,7 +333,8 @@ def save_band_metadata(band_name: str, metadata: BandMetadata) -> Dict[str, Any]
         _update_metadata_timestamps(metadata, band_name)
         
         # Save metadata to file
-        _save_metadata_to_file(metadata, metadata_file)
+        with trace_span("save_band_metadata", band_name=band_name):
+            _save_metadata_to_file(metadata, metadata_file)
         
         return _create_save_metadata_response(band_name, metadata_file, metadata)
         
@@ -381,7 +378,7 @@ def _get_band_metadata_paths(band_name: str) -> Tuple[Path, Path]:
     """
     config = get_config()
     band_folder = Path(config.MUSIC_ROOT_PATH) / band_name
-    metadata_file = band_folder / ".band_metadata.json"
+    metadata_file = MetadataStore.from_config(config).band_metadata_file(band_name)
     return band_folder, metadata_file
 
 
@@ -395,7 +392,7 @@ def _preserve_existing_metadata(metadata: BandMetadata, metadata_file: Path, ban
         metadata_file: Path to existing metadata file
         band_name: Name of the band for logging
     """
-    if not metadata_file.exists():
+    if not get_filesystem().exists(metadata_file):
         return
 
     try:
@@ -557,10 +554,10 @@ def _load_or_create_band_metadata_for_analysis(band_name: str) -> Tuple[Path, Pa
     """
     config = get_config()
     band_folder = Path(config.MUSIC_ROOT_PATH) / band_name
-    metadata_file = band_folder / ".band_metadata.json"
+    metadata_file = MetadataStore.from_config(config).band_metadata_file(band_name)
     
     # Load existing metadata or create new
-    if metadata_file.exists():
+    if get_filesystem().exists(metadata_file):
         try:
             metadata_dict = JSONStorage.load_json(metadata_file)
             metadata = BandMetadata(**metadata_dict)
@@ -738,10 +735,10 @@ def save_collection_insight(insights: CollectionInsight) -> Dict[str, Any]:
     """
     try:
         config = get_config()
-        collection_file = Path(config.MUSIC_ROOT_PATH) / ".collection_index.json"
+        collection_file = MetadataStore.from_config(config).collection_index_file()
         
         # Check if file existed before we modify it
-        file_existed_before = collection_file.exists()
+        file_existed_before = get_filesystem().exists(collection_file)
         
         # Load existing collection index or create new
         if file_existed_before:
@@ -790,11 +787,19 @@ def get_band_list(
     page: int = 1,
     page_size: int = 50,
     include_albums: bool = False,
-    album_details_filter: Optional[str] = None  # 'local', 'missing', or None
+    album_details_filter: Optional[str] = None,  # 'local', 'missing', or None
+    deadline_ms: Optional[int] = None,
+    continuation_token: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get a list of all discovered bands with enhanced filtering, sorting, and pagination.
     
+    Filters that need band metadata (genre, album names) load one file per
+    band. With deadline_ms, filtering stops when the budget is used up and
+    the result covers only the bands examined so far: complete is False and
+    continuation_token continues filtering with the next band (sorting and
+    pagination apply to each part separately).
+    
     Args:
         search_query: Search term to filter bands by name or album name
         filter_genre: Filter bands by genre (if metadata available)
@@ -809,6 +814,8 @@ def get_band_list(
         page_size: Number of results per page (1-100)
         include_albums: Include album details for each band
         album_details_filter: If 'local', only include local albums in album details; if 'missing', only missing albums; None for all
+        deadline_ms: Time budget for filtering in milliseconds (None for no limit)
+        continuation_token: Token of a previous partial result to continue from
         
     Returns:
         Dict containing filtered and paginated band list with enhanced metadata
@@ -817,6 +824,8 @@ def get_band_list(
         StorageError: If operation fails
     """
     try:
+        deadline = Deadline(deadline_ms)
+        
         # Load collection index or return empty result
         index = _load_collection_index_for_band_list()
         if not index:
@@ -825,12 +834,13 @@ def get_band_list(
                                                 filter_album_type, filter_compliance_level, 
                                                 filter_structure_type, sort_by, sort_order)
         
-        # Apply all filters to get filtered band list
-        filtered_bands = _apply_all_band_filters(
-            index.bands, search_query, filter_genre, filter_has_metadata, 
-            filter_missing_albums, filter_album_type, filter_compliance_level, 
-            filter_structure_type, include_albums
-        )
+        # Apply all filters to get filtered band list, within the deadline
+        filter_args = (search_query, filter_genre, filter_has_metadata, filter_missing_albums,
+                       filter_album_type, filter_compliance_level, filter_structure_type, include_albums)
+        token_params = {'filters': filter_args}
+        start = (parse_continuation_token(continuation_token, "get_band_list", token_params, index_version(index))
+                 if continuation_token else 0)
+        filtered_bands, next_offset = _apply_band_filters_within_deadline(index.bands, start, deadline, *filter_args)
         
         # Apply sorting
         sorted_bands = _sort_bands_enhanced(filtered_bands, sort_by, sort_order)
@@ -841,11 +851,13 @@ def get_band_list(
         )
         
         # Build final response with all metadata
-        return _build_final_band_list_response(
+        response = _build_final_band_list_response(
             index, paginated_results, page, page_size, search_query, filter_genre,
             filter_has_metadata, filter_missing_albums, filter_album_type, 
             filter_compliance_level, filter_structure_type, sort_by, sort_order
         )
+        _add_completeness(response, index, start, next_offset, token_params)
+        return response
         
     except Exception as e:
         raise StorageError(f"Failed to get band list: {e}")
@@ -853,51 +865,29 @@ def get_band_list(
 
 def _load_collection_index_for_band_list() -> Optional[CollectionIndex]:
     """
-    Load collection index for band list operations with caching.
+    Load collection index for band list operations.
+    
+    The index model is built once per collection snapshot and shared by
+    all band list calls reading that snapshot.
     
     Returns:
         CollectionIndex if found, None if not found
     """
     config = get_config()
-    collection_file = Path(config.MUSIC_ROOT_PATH) / ".collection_index.json"
-    cache_key = f"collection_index:{collection_file}"
-    
-    # Try to get from cache first
-    cached_index = _collection_cache.get(cache_key)
-    if cached_index:
-        logger.debug("Using cached collection index")
-        return cached_index
+    collection_file = MetadataStore.from_config(config).collection_index_file()
     
-    with track_operation("load_collection_index") as metrics:
-        if not collection_file.exists():
-            return None
-        
-        try:
-            # Check file modification time for cache invalidation
-            file_mtime = collection_file.stat().st_mtime
-            cached_mtime = _collection_cache.get(f"{cache_key}:mtime")
-            
-            if cached_mtime and cached_mtime == file_mtime and cached_index:
-                # File hasn't changed, use cached version
-                return cached_index
-            
-            # Load collection index
-            index_dict = JSONStorage.load_json(collection_file)
+    def build_index(index_dict: Dict[str, Any]) -> CollectionIndex:
+        with track_operation("load_collection_index") as metrics:
             index = CollectionIndex(**index_dict)
-            
-            # Cache the loaded index
-            _collection_cache.put(cache_key, index)
-            _collection_cache.put(f"{cache_key}:mtime", file_mtime)
-            
             metrics.items_processed = len(index.bands) if index.bands else 0
             logger.debug(f"Loaded collection index with {metrics.items_processed} bands")
-            
             return index
-            
-        except Exception as e:
-            logger.error(f"Failed to load collection index: {e}")
-            metrics.errors += 1
-            raise
+    
+    try:
+        return get_snapshot_store().read_model(collection_file, build_index)
+    except Exception as e:
+        logger.error(f"Failed to load collection index: {e}")
+        raise
 
 
 def _create_empty_band_list_result(page: int, page_size: int, search_query: Optional[str], 
@@ -931,7 +921,8 @@ def _create_empty_band_list_result(page: int, page_size: int, search_query: Opti
         "filters_applied": _build_filters_summary(search_query, filter_genre, filter_has_metadata, 
                                                 filter_missing_albums, filter_album_type, 
                                                 filter_compliance_level, filter_structure_type),
-        "sort": {"by": sort_by, "order": sort_order}
+        "sort": {"by": sort_by, "order": sort_order},
+        "complete": True
     }
 
 
@@ -985,6 +976,54 @@ def _apply_all_band_filters(bands: List[BandIndexEntry], search_query: Optional[
     return bands_to_process
 
 
+def _apply_band_filters_within_deadline(bands: List[BandIndexEntry], start: int, deadline: Deadline,
+                                        *filter_args) -> Tuple[List[BandIndexEntry], int]:
+    """
+    Apply the band filters to bands from start on until the deadline expires.
+    
+    Args:
+        bands: All band entries of the index, in index order
+        start: Position of the first band to examine
+        deadline: Time budget (at least one band is always examined)
+        *filter_args: Filter arguments of _apply_all_band_filters
+        
+    Returns:
+        Tuple of the matching bands and the position of the first band not examined
+    """
+    if deadline.budget_ms is None and start == 0:
+        return _apply_all_band_filters(bands, *filter_args), len(bands)
+    
+    matching = []
+    position = start
+    while position < len(bands):
+        matching.extend(_apply_all_band_filters(bands[position:position + 1], *filter_args))
+        position += 1
+        if deadline.expired():
+            break
+    return matching, position
+
+
+def _add_completeness(response: Dict[str, Any], index: CollectionIndex, start: int, next_offset: int,
+                      token_params: Dict[str, Any]) -> None:
+    """
+    Flag a band list response as complete or partial.
+    
+    Args:
+        response: Band list response to update
+        index: Collection index the bands were taken from
+        start: Position of the first band examined
+        next_offset: Position of the first band not examined
+        token_params: Parameters identifying the call for the continuation token
+    """
+    response["complete"] = next_offset >= len(index.bands)
+    response["bands_examined"] = next_offset - start
+    if not response["complete"]:
+        response["continuation_token"] = make_continuation_token(
+            "get_band_list", next_offset, token_params, index_version(index))
+        response["message"] += (f" - partial result: deadline reached after {next_offset} of "
+                                f"{len(index.bands)} bands; pass continuation_token for the rest")
+
+
 def _apply_pagination_and_build_results(bands: List[BandIndexEntry], page: int, page_size: int,
                                        include_albums: bool, album_details_filter: Optional[str]) -> Dict[str, Any]:
     """
@@ -1088,10 +1127,10 @@ def _filter_bands_by_search(bands: List[BandIndexEntry], search_query: str, incl
         # Search in album names if include_albums is True
         if include_albums:
             try:
-                metadata = load_band_metadata(band.name)
-                if metadata:
-                    for album in metadata.albums:
-                        if search_query in album.album_name.lower():
+                summary = load_band_metadata_summary(band.name)
+                if summary:
+                    for album_name in summary.album_names:
+                        if search_query in album_name.lower():
                             filtered_bands.append(band)
                             break
             except:
@@ -1102,15 +1141,15 @@ def _filter_bands_by_search(bands: List[BandIndexEntry], search_query: str, incl
 
 
 def _filter_bands_by_genre(bands: List[BandIndexEntry], genre_filter: str) -> List[BandIndexEntry]:
-    """Filter bands by genre (requires loading metadata)."""
+    """Filter bands by genre (requires loading metadata summaries)."""
     filtered_bands = []
     
     for band in bands:
         try:
-            metadata = load_band_metadata(band.name)
-            if metadata and metadata.genres:
+            summary = load_band_metadata_summary(band.name)
+            if summary and summary.genres:
                 # Check if any of the band's genres match the filter
-                band_genres = [g.lower() for g in metadata.genres]
+                band_genres = [g.lower() for g in summary.genres]
                 if any(genre_filter in genre for genre in band_genres):
                     filtered_bands.append(band)
         except Exception:
@@ -1160,13 +1199,13 @@ def _build_band_info(band_entry: BandIndexEntry, include_albums: bool = False, a
     
     # Load and add enhanced metadata if available
     try:
-        metadata = load_band_metadata(band_entry.name)
-        if metadata:
-            _add_enhanced_metadata_to_band_info(band_info, metadata)
+        summary = load_band_metadata_summary(band_entry.name)
+        if summary:
+            _add_enhanced_metadata_to_band_info(band_info, summary)
             
-            # Include detailed album information if requested
-            if include_albums and (metadata.albums or metadata.albums_missing):
-                _add_album_details_to_band_info(band_info, metadata, album_details_filter)
+            # Include detailed album information if requested (full models built only here)
+            if include_albums and summary.albums_count:
+                _add_album_details_to_band_info(band_info, summary.to_band_metadata(), album_details_filter)
                 
     except Exception as e:
         # If metadata loading fails, continue with basic info
@@ -1204,13 +1243,13 @@ def _build_basic_band_info(band_entry: BandIndexEntry) -> Dict[str, Any]:
     }
 
 
-def _add_enhanced_metadata_to_band_info(band_info: Dict[str, Any], metadata: BandMetadata) -> None:
+def _add_enhanced_metadata_to_band_info(band_info: Dict[str, Any], metadata: BandMetadataSummary) -> None:
     """
     Add enhanced metadata fields to band info dictionary.
     
     Args:
         band_info: Dictionary to update with enhanced metadata
-        metadata: BandMetadata instance with enhanced data
+        metadata: BandMetadataSummary with the band's header fields and counts
     """
     # Add basic metadata fields
     _add_basic_metadata_fields(band_info, metadata)
@@ -1225,13 +1264,13 @@ def _add_enhanced_metadata_to_band_info(band_info: Dict[str, Any], metadata: Ban
     _add_analysis_info(band_info, metadata)
 
 
-def _add_basic_metadata_fields(band_info: Dict[str, Any], metadata: BandMetadata) -> None:
+def _add_basic_metadata_fields(band_info: Dict[str, Any], metadata: BandMetadataSummary) -> None:
     """
     Add basic metadata fields to band info.
     
     Args:
         band_info: Dictionary to update
-        metadata: BandMetadata instance
+        metadata: BandMetadataSummary instance
     """
     if metadata.formed:
         band_info["formed"] = metadata.formed
@@ -1241,61 +1280,58 @@ def _add_basic_metadata_fields(band_info: Dict[str, Any], metadata: BandMetadata
         band_info["origin"] = metadata.origin
 
 
-def _add_folder_structure_info(band_info: Dict[str, Any], metadata: BandMetadata) -> None:
+def _add_folder_structure_info(band_info: Dict[str, Any], metadata: BandMetadataSummary) -> None:
     """
     Add folder structure information to band info.
     
     Args:
         band_info: Dictionary to update
-        metadata: BandMetadata instance
+        metadata: BandMetadataSummary instance
     """
     if metadata.folder_structure:
-        structure_type = metadata.folder_structure.structure_type
-        consistency = metadata.folder_structure.consistency
+        # The summary keeps the raw dict; build the model without validating it
+        folder_structure = FolderStructure.model_construct(**metadata.folder_structure)
+        structure_type = folder_structure.structure_type
+        consistency = folder_structure.consistency
         # Handle both Enum and str cases
         structure_type_value = structure_type.value if hasattr(structure_type, 'value') else str(structure_type)
         consistency_value = consistency.value if hasattr(consistency, 'value') else str(consistency)
         band_info["folder_structure"] = {
             "structure_type": structure_type_value,
             "consistency": consistency_value,
-            "structure_score": metadata.folder_structure.structure_score,
-            "organization_health": metadata.folder_structure.get_organization_health(),
-            "needs_migration": metadata.folder_structure.is_migration_recommended(),
-            "recommendations_count": len(metadata.folder_structure.recommendations)
+            "structure_score": folder_structure.structure_score,
+            "organization_health": folder_structure.get_organization_health(),
+            "needs_migration": folder_structure.is_migration_recommended(),
+            "recommendations_count": len(folder_structure.recommendations)
         }
 
 
-def _add_album_type_distribution(band_info: Dict[str, Any], metadata: BandMetadata) -> None:
+def _add_album_type_distribution(band_info: Dict[str, Any], metadata: BandMetadataSummary) -> None:
     """
     Add album type distribution to band info.
     
     Args:
         band_info: Dictionary to update
-        metadata: BandMetadata instance
+        metadata: BandMetadataSummary instance
     """
-    if metadata.albums:
-        album_types = {}
-        for album in metadata.albums:
-            album_type = album.type.value if hasattr(album.type, 'value') else str(album.type)
-            album_types[album_type] = album_types.get(album_type, 0) + 1
-        
-        band_info["album_types_distribution"] = album_types
+    if metadata.album_types:
+        band_info["album_types_distribution"] = dict(metadata.album_types)
 
 
-def _add_analysis_info(band_info: Dict[str, Any], metadata: BandMetadata) -> None:
+def _add_analysis_info(band_info: Dict[str, Any], metadata: BandMetadataSummary) -> None:
     """
     Add analysis information to band info.
     
     Args:
         band_info: Dictionary to update
-        metadata: BandMetadata instance
+        metadata: BandMetadataSummary instance
     """
-    if metadata.analyze:
+    if metadata.has_analysis:
         band_info["analysis"] = {
-            "band_rating": metadata.analyze.rate,
-            "has_review": bool(metadata.analyze.review),
-            "albums_analyzed": len(metadata.analyze.albums),
-            "similar_bands_count": len(metadata.analyze.similar_bands)
+            "band_rating": metadata.analysis_rate,
+            "has_review": metadata.analysis_has_review,
+            "albums_analyzed": metadata.albums_analyzed,
+            "similar_bands_count": metadata.similar_bands_count
         }
 
 
@@ -1382,34 +1418,103 @@ def load_band_metadata(band_name: str) -> Optional[BandMetadata]:
     """
     Load band metadata from JSON file.
     
+    The file is read from the caller's collection snapshot, so it is never
+    seen half-written while a scan replaces it.
+    
     Args:
         band_name: Name of the band
         
     Returns:
         BandMetadata instance or None if not found
         
+    Raises:
+        StorageError: If load operation fails
+    """
+    try:
+        with trace_span("load_band_metadata", band_name=band_name):
+            config = get_config()
+            metadata_file = MetadataStore.from_config(config).band_metadata_file(band_name)
+            
+            metadata_dict = get_snapshot_store().read(metadata_file)
+            if metadata_dict is None:
+                return None
+            return BandMetadata(**metadata_dict)
+        
+    except Exception as e:
+        raise StorageError(f"Failed to load band metadata for {band_name}: {e}")
+
+
+def load_band_metadata_within_deadline(band_names: List[str], deadline: Optional[Deadline] = None,
+                                       start: int = 0) -> Tuple[Dict[str, BandMetadata], int]:
+    """
+    Load the metadata of bands in order until the deadline expires.
+    
+    Bands without metadata are skipped; bands whose metadata cannot be
+    loaded are logged and skipped.
+    
+    Args:
+        band_names: Names of the bands, in the order to load them
+        deadline: Time budget (None for no limit; at least one band is always loaded)
+        start: Position in band_names of the first band to load
+        
+    Returns:
+        Tuple of metadata by band name and the position of the first band
+        not loaded (len(band_names) when all were loaded)
+    """
+    band_metadata: Dict[str, BandMetadata] = {}
+    position = start
+    while position < len(band_names):
+        band_name = band_names[position]
+        position += 1
+        try:
+            metadata = load_band_metadata(band_name)
+            if metadata:
+                band_metadata[band_name] = metadata
+        except Exception as e:
+            logger.warning(f"Could not load metadata for band {band_name}: {str(e)}")
+        if deadline is not None and deadline.expired():
+            break
+    return band_metadata, position
+
+
+def load_band_metadata_summary(band_name: str) -> Optional[BandMetadataSummary]:
+    """
+    Load the header fields and counts of a band's metadata.
+    
+    Album, analysis and folder structure entries are not validated into
+    models, which makes this much cheaper than load_band_metadata for list
+    and filter views. Use BandMetadataSummary.to_band_metadata() when the
+    full album data is needed. The summary shares the raw data of the
+    caller's collection snapshot and must not be modified.
+    
+    Args:
+        band_name: Name of the band
+        
+    Returns:
+        BandMetadataSummary instance or None if not found
+        
     Raises:
         StorageError: If load operation fails
     """
     try:
         config = get_config()
-        band_folder = Path(config.MUSIC_ROOT_PATH) / band_name
-        metadata_file = band_folder / ".band_metadata.json"
+        metadata_file = MetadataStore.from_config(config).band_metadata_file(band_name)
         
-        if not metadata_file.exists():
+        metadata_dict = get_snapshot_store().read(metadata_file)
+        if metadata_dict is None:
             return None
-        
-        metadata_dict = JSONStorage.load_json(metadata_file)
-        return BandMetadata(**metadata_dict)
+        return BandMetadataSummary.from_dict(metadata_dict)
         
     except Exception as e:
-        raise StorageError(f"Failed to load band metadata for {band_name}: {e}")
+        raise StorageError(f"Failed to load band metadata summary for {band_name}: {e}")
 
 
 def load_collection_index() -> Optional[CollectionIndex]:
     """
     Load collection index from JSON file.
     
+    The index is read from the caller's collection snapshot.
+    
     Returns:
         CollectionIndex instance or None if not found
         
@@ -1418,12 +1523,11 @@ def load_collection_index() -> Optional[CollectionIndex]:
     """
     try:
         config = get_config()
-        collection_file = Path(config.MUSIC_ROOT_PATH) / ".collection_index.json"
+        collection_file = MetadataStore.from_config(config).collection_index_file()
         
-        if not collection_file.exists():
+        index_dict = get_snapshot_store().read(collection_file)
+        if index_dict is None:
             return None
-        
-        index_dict = JSONStorage.load_json(collection_file)
         return CollectionIndex(**index_dict)
         
     except Exception as e:
@@ -1445,7 +1549,7 @@ def update_collection_index(index: CollectionIndex) -> Dict[str, Any]:
     """
     try:
         config = get_config()
-        collection_file = Path(config.MUSIC_ROOT_PATH) / ".collection_index.json"
+        collection_file = MetadataStore.from_config(config).collection_index_file()
         
         # Update timestamp
         index.last_scan = datetime.now().isoformat()
@@ -1470,52 +1574,87 @@ def update_collection_index(index: CollectionIndex) -> Dict[str, Any]:
         raise StorageError(f"Failed to update collection index: {e}")
 
 
-def cleanup_backups(max_backups: int = 5) -> Dict[str, Any]:
+def _get_backup_catalog_for_collection():
+    """
+    Get the backup catalog of the configured collection.
+    
+    Until the catalog records that it did so, backups created before the
+    catalog was introduced are discovered with a recursive walk and imported
+    (also when scans or saves have recorded new backups meanwhile).
+    
+    Returns:
+        Tuple of (BackupCatalog, config)
+    """
+    config = get_config()
+    metadata_root = MetadataStore.from_config(config).metadata_root
+    catalog = get_backup_catalog(metadata_root)
+    
+    if not catalog.legacy_imported() and metadata_root.exists():
+        legacy_backups = [
+            f for f in metadata_root.rglob("*.backup*")
+            if f.is_file() and not f.name.endswith('.tmp')
+        ]
+        imported = catalog.import_untracked(legacy_backups)
+        logger.info(f"Imported {imported} existing backups into the backup catalog in {metadata_root}")
+    
+    return catalog, config
+
+
+def list_backups(original_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    List backup files recorded in the backup catalog, newest first.
+    
+    Args:
+        original_file: Only list backups of this file (absolute or relative to the metadata root)
+        
+    Returns:
+        Dict with the list of backups and totals
+        
+    Raises:
+        StorageError: If the catalog cannot be read
+    """
+    try:
+        catalog, _ = _get_backup_catalog_for_collection()
+        original_path = None
+        if original_file:
+            original_path = Path(original_file)
+            if not original_path.is_absolute():
+                original_path = catalog.root / original_path
+        backups = catalog.list_backups(original_path)
+        
+        return {
+            "status": "success",
+            "catalog_file": str(catalog.catalog_file),
+            "backups": backups,
+            "total_backups": len(backups),
+            "total_size_bytes": sum(b["size"] for b in backups)
+        }
+        
+    except Exception as e:
+        raise StorageError(f"Failed to list backups: {e}")
+
+
+def cleanup_backups(max_backups: Optional[int] = None) -> Dict[str, Any]:
     """
     Cleanup old backup files, keeping only the most recent ones.
     
+    Works from the backup catalog instead of walking the music tree.
+    
     Args:
         max_backups: Maximum number of backup files to keep per original file
+                     (defaults to the configured BACKUP_RETENTION_COUNT)
         
     Returns:
         Dict with cleanup statistics
     """
     try:
-        config = get_config()
-        music_root = Path(config.MUSIC_ROOT_PATH)
+        catalog, config = _get_backup_catalog_for_collection()
+        if max_backups is None:
+            max_backups = retention_count_from_config(config)
         
-        cleaned_count = 0
-        total_freed_size = 0
-        
-        # Find all backup files
-        backup_files = list(music_root.rglob("*.backup*"))
-        
-        # Group by original file
-        backup_groups = {}
-        for backup_file in backup_files:
-            # Extract original file path
-            original_name = backup_file.name.split('.backup')[0]
-            original_path = backup_file.parent / original_name
-            
-            if original_path not in backup_groups:
-                backup_groups[original_path] = []
-            backup_groups[original_path].append(backup_file)
-        
-        # Keep only recent backups
-        for original_path, backups in backup_groups.items():
-            if len(backups) > max_backups:
-                # Sort by modification time (newest first)
-                backups.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-                
-                # Remove old backups
-                for old_backup in backups[max_backups:]:
-                    try:
-                        file_size = old_backup.stat().st_size
-                        old_backup.unlink()
-                        cleaned_count += 1
-                        total_freed_size += file_size
-                    except Exception:
-                        continue  # Skip files that can't be deleted
+        stats = catalog.apply_retention(max_backups)
+        cleaned_count = stats["files_removed"]
+        total_freed_size = stats["space_freed_bytes"]
         
         return {
             "status": "success",
@@ -1531,4 +1670,4 @@ def cleanup_backups(max_backups: int = 5) -> Dict[str, Any]:
             "message": f"Backup cleanup failed: {e}",
             "files_removed": 0,
             "space_freed_bytes": 0
-        } 
\ No newline at end of file
+        } 
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Hierarchical trace spans for Music Collection MCP Server.
+
+Every tool and resource call opens a root span, and the operations it runs
+(track_operation(), band metadata loads and saves, ...) open child spans,
+so a trace shows where a slow call spent its time. The current span lives
+in a context variable: it follows the code into the handler thread pool
+and background jobs, whose work is submitted with a copy of the caller's
+context.
+
+Traces are sampled when their root span starts (TRACE_SAMPLE_RATE). A
+sampled trace records all its spans; an unsampled one records none. Spans
+are written, one JSON object per line, to a rotating local file in the
+shape of OpenTelemetry's OTLP/JSON spans. scripts/trace-summary.py turns
+the file into a flame-style summary per request.
+
+With a sample rate of 0 (the default) spans cost one context variable
+lookup and nothing is written.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "music-collection-mcp"
+
+SPAN_KIND_INTERNAL = "SPAN_KIND_INTERNAL"
+SPAN_KIND_SERVER = "SPAN_KIND_SERVER"
+
+STATUS_CODE_UNSET = "STATUS_CODE_UNSET"
+STATUS_CODE_ERROR = "STATUS_CODE_ERROR"
+
+DEFAULT_TRACE_SAMPLE_RATE = 0.0
+DEFAULT_TRACE_FILE = "logs/traces.jsonl"
+DEFAULT_TRACE_FILE_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_TRACE_FILE_BACKUPS = 5
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('music_mcp_current_span', default=None)
+
+
+def trace_sample_rate_from_config(config: Any) -> float:
+    """
+    Get the trace sampling rate from a configuration object.
+
+    Args:
+        config: Configuration instance (TRACE_SAMPLE_RATE is optional)
+
+    Returns:
+        Fraction of requests traced, between 0 and 1
+    """
+    value = getattr(config, 'TRACE_SAMPLE_RATE', None)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 1:
+        return float(value)
+    return DEFAULT_TRACE_SAMPLE_RATE
+
+
+def trace_file_from_config(config: Any) -> Path:
+    """
+    Get the span file path from a configuration object.
+
+    Args:
+        config: Configuration instance (TRACE_FILE is optional)
+
+    Returns:
+        Path of the JSONL span file (relative paths are relative to the working directory)
+    """
+    value = getattr(config, 'TRACE_FILE', None)
+    if isinstance(value, str) and value.strip():
+        return Path(value).expanduser()
+    return Path(DEFAULT_TRACE_FILE)
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP/JSON AnyValue."""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': value}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ('name', 'kind', 'trace_id', 'span_id', 'parent_span_id', 'start_ns', 'end_ns',
+                 'attributes', 'status_code', 'status_message')
+
+    is_recording = True
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str] = None,
+                 kind: str = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status_code = STATUS_CODE_UNSET
+        self.status_message = ""
+
+    def set_attributes(self, **attributes) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed."""
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = message
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    def to_otel(self) -> Dict[str, Any]:
+        """Encode the span in the shape of an OTLP/JSON span, with its resource."""
+        record = {
+            'resource': {'service.name': SERVICE_NAME},
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_span_id or "",
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns if self.end_ns is not None else time.time_ns(),
+            'attributes': [{'key': key, 'value': _attribute_value(value)}
+                           for key, value in self.attributes.items() if value is not None],
+            'status': {'code': self.status_code}
+        }
+        if self.status_message:
+            record['status']['message'] = self.status_message
+        return record
+
+
+class _NonRecordingSpan:
+    """Span of an unsampled trace; records nothing."""
+
+    __slots__ = ()
+
+    is_recording = False
+    trace_id = None
+
+    def set_attributes(self, **attributes) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+
+
+class JsonlSpanExporter:
+    """Append spans to a JSONL file, rotating it when it grows too large."""
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_TRACE_FILE_MAX_BYTES,
+                 backup_count: int = DEFAULT_TRACE_FILE_BACKUPS):
+        """
+        Initialize span exporter.
+
+        Args:
+            path: Span file; rotated files get the suffixes .1 (newest) to .backup_count
+            max_bytes: Size at which the file is rotated
+            backup_count: Rotated files kept
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = max(0, backup_count)
+        self._lock = threading.Lock()
+        self._file = None
+        self._failed = False
+
+    def export(self, span: Span) -> None:
+        """Write one finished span."""
+        line = json.dumps(span.to_otel(), separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, 'a', encoding='utf-8')
+                elif self.max_bytes > 0 and self._file.tell() + len(line) > self.max_bytes:
+                    self._rotate_locked()
+                self._file.write(line)
+                self._file.flush()
+                self._failed = False
+            except OSError as e:
+                # Report once per failure streak; tracing must not break requests
+                if not self._failed:
+                    logger.warning(f"Could not write trace spans to {self.path}: {e}")
+                    self._failed = True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _rotate_locked(self) -> None:
+        self._file.close()
+        self._file = None
+        if self.backup_count:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+
+class Tracer:
+    """Creates spans and samples traces."""
+
+    def __init__(self, sample_rate: float = DEFAULT_TRACE_SAMPLE_RATE,
+                 exporter: Optional[JsonlSpanExporter] = None):
+        """
+        Initialize tracer.
+
+        Args:
+            sample_rate: Fraction of traces recorded (0 disables tracing)
+            exporter: Destination of finished spans (None disables tracing)
+        """
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, kind: str = SPAN_KIND_INTERNAL, **attributes) -> Iterator[Any]:
+        """
+        Run a block as a span, a child of the current span if there is one.
+
+        Without a current span the block starts a new trace, which is
+        sampled at the tracer's rate. An exception escaping the block marks
+        the span as failed.
+
+        Args:
+            name: Name of the operation
+            kind: SPAN_KIND_SERVER for request roots, SPAN_KIND_INTERNAL otherwise
+            **attributes: Span attributes
+
+        Yields:
+            The span (a non-recording span when the trace is not sampled)
+        """
+        parent = _current_span.get()
+        if parent is None:
+            if self.sample_rate <= 0:
+                yield NON_RECORDING_SPAN
+                return
+            if self.sample_rate < 1 and random.random() >= self.sample_rate:
+                # Children of an unsampled request are not sampled on their own
+                token = _current_span.set(NON_RECORDING_SPAN)
+                try:
+                    yield NON_RECORDING_SPAN
+                finally:
+                    _current_span.reset(token)
+                return
+            span = Span(name, os.urandom(16).hex(), None, kind, attributes)
+        elif not parent.is_recording:
+            yield parent
+            return
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, kind, attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.exporter.export(span)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the shared tracer, creating it from the configuration on first use.
+
+    Returns:
+        Tracer instance
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                from src.di import get_config
+                config = get_config()
+                sample_rate = trace_sample_rate_from_config(config)
+                exporter = JsonlSpanExporter(trace_file_from_config(config)) if sample_rate > 0 else None
+                _tracer = Tracer(sample_rate, exporter)
+    return _tracer
+
+
+def configure_tracing(sample_rate: float, trace_file: Optional[Union[str, Path]] = None,
+                      max_bytes: int = DEFAULT_TRACE_FILE_MAX_BYTES,
+                      backup_count: int = DEFAULT_TRACE_FILE_BACKUPS) -> Tracer:
+    """
+    Replace the shared tracer.
+
+    Args:
+        sample_rate: Fraction of traces recorded (0 disables tracing)
+        trace_file: Span file (defaults to DEFAULT_TRACE_FILE)
+        max_bytes: Size at which the span file is rotated
+        backup_count: Rotated span files kept
+
+    Returns:
+        The new tracer
+    """
+    global _tracer
+    exporter = None
+    if sample_rate > 0:
+        exporter = JsonlSpanExporter(trace_file or DEFAULT_TRACE_FILE, max_bytes, backup_count)
+    with _tracer_lock:
+        previous, _tracer = _tracer, Tracer(sample_rate, exporter)
+    if previous is not None and previous.exporter is not None:
+        previous.exporter.close()
+    return _tracer
+
+
+def trace_span(name: str, kind: str = SPAN_KIND_INTERNAL, **attributes):
+    """
+    Run a block as a span of the shared tracer (see Tracer.span()).
+
+    Args:
+        name: Name of the operation
+        kind: Span kind
+        **attributes: Span attributes
+
+    Returns:
+        Context manager yielding the span
+    """
+    return get_tracer().span(name, kind, **attributes)
+
+
+def current_trace_id() -> Optional[str]:
+    """Get the ID of the trace being recorded, None if there is none."""
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def with_current_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind func to a copy of the calling context, for running it once on another thread.
+
+    Spans opened by func on the other thread become children of the span
+    that was current when func was bound.
+
+    Args:
+        func: Callable to run later
+
+    Returns:
+        Callable running func in the copied context
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def run_in_context(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+    return run_in_context
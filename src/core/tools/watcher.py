@@ -0,0 +1,541 @@
+"""
+Collection Watch Mode for Music Collection MCP Server.
+
+On Linux the music root, band folders and album folders are watched with
+inotify (through ctypes, no extra dependency). Filesystem events are
+debounced into a set of dirty bands, and a background worker re-scans only
+those bands through the regular scanner path and updates the collection
+index incrementally, so the index stays current without full scans.
+
+Enabled with WATCH_MODE_ENABLED; events for a band are collected until it has
+been quiet for WATCH_DEBOUNCE_SECONDS. On network mounts, where inotify does
+not see changes made by other machines, the polling detector in
+poll_watcher.py is used instead (see WATCH_BACKEND).
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+from src.di import get_config
+from src.core.tools.poll_watcher import (
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MAX_STATS_PER_SECOND,
+    DEFAULT_POLL_MIN_INTERVAL,
+    PollingChangeDetector,
+)
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# Root (0), band (1), album or type folder (2), album inside a type folder (3)
+MAX_WATCH_DEPTH = 3
+
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+
+WATCH_BACKEND_AUTO = "auto"
+WATCH_BACKEND_INOTIFY = "inotify"
+WATCH_BACKEND_POLL = "poll"
+WATCH_BACKENDS = (WATCH_BACKEND_AUTO, WATCH_BACKEND_INOTIFY, WATCH_BACKEND_POLL)
+
+# Filesystem types where inotify misses remote changes (/proc/mounts names)
+NETWORK_FILESYSTEMS = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p', 'afs', 'ceph', 'glusterfs'}
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+_POLL_INTERVAL_MS = 500
+
+
+def inotify_available() -> bool:
+    """True if the platform supports inotify."""
+    return sys.platform.startswith('linux') and _load_libc() is not None
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc with the inotify functions, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+def watch_settings_from_config(config: Any) -> Dict[str, Any]:
+    """
+    Get watch mode settings from a configuration object.
+
+    Args:
+        config: Configuration instance (WATCH_* fields are optional)
+
+    Returns:
+        Dict with enabled, backend, debounce_seconds and the poll_* settings
+    """
+    def seconds(name: str, default: float) -> float:
+        value = getattr(config, name, default)
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            return default
+        return float(value)
+
+    backend = getattr(config, 'WATCH_BACKEND', WATCH_BACKEND_AUTO)
+    if not isinstance(backend, str) or backend.lower() not in WATCH_BACKENDS:
+        backend = WATCH_BACKEND_AUTO
+    return {
+        'enabled': getattr(config, 'WATCH_MODE_ENABLED', False) is True,
+        'backend': backend.lower(),
+        'debounce_seconds': seconds('WATCH_DEBOUNCE_SECONDS', DEFAULT_DEBOUNCE_SECONDS),
+        'poll_min_interval': seconds('WATCH_POLL_MIN_INTERVAL', DEFAULT_POLL_MIN_INTERVAL),
+        'poll_max_interval': seconds('WATCH_POLL_MAX_INTERVAL', DEFAULT_POLL_MAX_INTERVAL),
+        'poll_max_stats_per_second': seconds('WATCH_POLL_MAX_STATS_PER_SECOND',
+                                             DEFAULT_POLL_MAX_STATS_PER_SECOND),
+    }
+
+
+def is_network_mount(path: Union[str, Path]) -> bool:
+    """
+    Check whether a path lives on a network filesystem (NFS, SMB/CIFS, ...).
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the filesystem of the longest matching mount point is remote
+    """
+    target = os.path.realpath(path)
+    best_mount, best_type = '', ''
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace('\\040', ' ')
+                inside = target == mount_point or target.startswith(mount_point.rstrip('/') + '/')
+                if inside and len(mount_point) > len(best_mount):
+                    best_mount, best_type = mount_point, fields[2]
+    except OSError:
+        return False
+    return best_type in NETWORK_FILESYSTEMS
+
+
+def select_watch_backend(requested: str, music_root: Union[str, Path]) -> Optional[str]:
+    """
+    Resolve the watch backend to use for a music root.
+
+    Args:
+        requested: 'auto', 'inotify' or 'poll'
+        music_root: Music collection root
+
+    Returns:
+        'inotify' or 'poll', or None if inotify was requested but is unavailable
+    """
+    if requested == WATCH_BACKEND_POLL:
+        return WATCH_BACKEND_POLL
+    if requested == WATCH_BACKEND_INOTIFY:
+        return WATCH_BACKEND_INOTIFY if inotify_available() else None
+    # inotify does not see changes made through other clients of a network share
+    if inotify_available() and not is_network_mount(music_root):
+        return WATCH_BACKEND_INOTIFY
+    return WATCH_BACKEND_POLL
+
+
+def _is_ignored_name(name: str) -> bool:
+    """Metadata, index, backup, lock and report files all start with a dot."""
+    return not name or name.startswith('.')
+
+
+class _Inotify:
+    """Minimal ctypes wrapper around an inotify instance."""
+
+    def __init__(self):
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+
+    def add_watch(self, path: Path, mask: int = WATCH_MASK) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch failed for {path}: {os.strerror(err)}")
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout_ms: int):
+        """Yield (wd, mask, name) tuples, waiting up to timeout_ms for the first."""
+        poller = select.poll()
+        poller.register(self.fd, select.POLLIN)
+        if not poller.poll(timeout_ms):
+            return
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            yield wd, mask, name
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class CollectionWatcher:
+    """
+    Watch a music root and keep the collection index in sync with it.
+
+    A reader thread turns inotify events into per-band dirty marks; a worker
+    thread re-scans bands that have been quiet for the debounce interval and
+    updates the collection index. Metrics are available from get_stats().
+    """
+
+    def __init__(self, music_root: Union[str, Path], debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS):
+        """
+        Initialize collection watcher.
+
+        Args:
+            music_root: Music collection root to watch
+            debounce_seconds: Quiet time required before a dirty band is re-scanned
+        """
+        self.music_root = Path(music_root)
+        self.debounce_seconds = debounce_seconds
+        self._inotify: Optional[_Inotify] = None
+        # watch descriptor -> path relative to the music root (empty for the root)
+        self._watches: Dict[int, Path] = {}
+        # band name -> [first event time, last event time]
+        self._dirty: Dict[str, list] = {}
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._threads = []
+        self._stats = {
+            'events_received': 0,
+            'events_ignored': 0,
+            'queue_overflows': 0,
+            'bands_rescanned': 0,
+            'bands_removed': 0,
+            'rescan_errors': 0,
+            'last_lag_seconds': None,
+            'max_lag_seconds': 0.0,
+            'total_lag_seconds': 0.0,
+            'last_update': None
+        }
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads) and not self._stop.is_set()
+
+    def start(self) -> None:
+        """
+        Add watches and start the reader and worker threads.
+
+        Raises:
+            OSError: If inotify is unavailable or the root cannot be watched
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._inotify = _Inotify()
+        self._add_watch_tree(self.music_root, Path(), 0)
+        self._threads = [
+            threading.Thread(target=self._read_loop, name="collection-watch-reader", daemon=True),
+            threading.Thread(target=self._work_loop, name="collection-watch-worker", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Watching {len(self._watches)} folders below {self.music_root}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop both threads and release the inotify instance."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._watches.clear()
+
+    def _add_watch_tree(self, path: Path, relative: Path, depth: int) -> None:
+        """Watch a folder and its sub-folders down to MAX_WATCH_DEPTH."""
+        try:
+            wd = self._inotify.add_watch(path)
+        except OSError as e:
+            if depth == 0:
+                raise
+            logger.debug(f"Could not watch {path}: {e}")
+            return
+        self._watches[wd] = relative
+        if depth >= MAX_WATCH_DEPTH:
+            return
+        try:
+            with os.scandir(path) as entries:
+                children = [entry.name for entry in entries
+                            if entry.is_dir(follow_symlinks=False) and not _is_ignored_name(entry.name)]
+        except OSError:
+            return
+        for name in children:
+            self._add_watch_tree(path / name, relative / name, depth + 1)
+
+    def _mark_dirty(self, band_name: str) -> None:
+        """Record an event for a band, keeping its first event time for lag metrics."""
+        from src.core.tools.scanner import EXCLUDED_FOLDERS
+        if band_name.lower() in EXCLUDED_FOLDERS:
+            return
+        now = time.monotonic()
+        with self._condition:
+            entry = self._dirty.get(band_name)
+            if entry is None:
+                self._dirty[band_name] = [now, now]
+            else:
+                entry[1] = now
+            self._condition.notify_all()
+
+    def _mark_all_dirty(self) -> None:
+        """Mark every band (and every indexed band) dirty after lost events."""
+        try:
+            names = [entry.name for entry in os.scandir(self.music_root)
+                     if entry.is_dir() and not _is_ignored_name(entry.name)]
+        except OSError:
+            names = []
+        from src.core.tools.scanner import _load_or_create_collection_index
+        # Bands deleted while events were lost are only known to the index
+        names.extend(band.name for band in _load_or_create_collection_index(self.music_root).bands)
+        for name in set(names):
+            self._mark_dirty(name)
+
+    def _handle_event(self, wd: int, mask: int, name: str) -> None:
+        """Translate one inotify event into dirty marks and watch updates."""
+        self._stats['events_received'] += 1
+        if mask & IN_Q_OVERFLOW:
+            self._stats['queue_overflows'] += 1
+            logger.warning("inotify queue overflowed; re-scanning all bands")
+            self._mark_all_dirty()
+            return
+        relative = self._watches.get(wd)
+        if mask & IN_IGNORED:
+            self._watches.pop(wd, None)
+            return
+        if relative is None:
+            return
+
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            if relative.parts:
+                self._mark_dirty(relative.parts[0])
+            return
+        if _is_ignored_name(name):
+            self._stats['events_ignored'] += 1
+            return
+
+        child = relative / name
+        self._mark_dirty(child.parts[0])
+
+        # Start watching folders created or moved into the tree
+        if (self._inotify is not None and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)
+                and len(relative.parts) < MAX_WATCH_DEPTH):
+            self._add_watch_tree(self.music_root / child, child, len(child.parts))
+
+    def _read_loop(self) -> None:
+        """Reader thread: collect inotify events until stopped."""
+        while not self._stop.is_set():
+            try:
+                for wd, mask, name in self._inotify.read_events(_POLL_INTERVAL_MS):
+                    self._handle_event(wd, mask, name)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.error(f"Collection watcher failed to read events: {e}")
+                time.sleep(1.0)
+
+    def _take_ready_bands(self) -> Dict[str, float]:
+        """Wait for bands that have been quiet for the debounce interval and dequeue them."""
+        with self._condition:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                ready = {band: times[0] for band, times in self._dirty.items()
+                         if now - times[1] >= self.debounce_seconds}
+                if ready:
+                    for band in ready:
+                        del self._dirty[band]
+                    return ready
+                if self._dirty:
+                    next_ready = min(times[1] for times in self._dirty.values()) + self.debounce_seconds
+                    self._condition.wait(max(0.01, next_ready - now))
+                else:
+                    self._condition.wait()
+        return {}
+
+    def _work_loop(self) -> None:
+        """Worker thread: re-scan dirty bands and update the index."""
+        from src.core.tools.scanner import rescan_bands
+
+        while not self._stop.is_set():
+            ready = self._take_ready_bands()
+            if not ready:
+                continue
+            try:
+                result = rescan_bands(sorted(ready), self.music_root)
+            except Exception as e:
+                self._stats['rescan_errors'] += 1
+                logger.error(f"Collection watcher could not update bands {sorted(ready)}: {e}")
+                continue
+            now = time.monotonic()
+            for first_event in ready.values():
+                lag = now - first_event
+                self._stats['last_lag_seconds'] = round(lag, 3)
+                self._stats['max_lag_seconds'] = round(max(self._stats['max_lag_seconds'], lag), 3)
+                self._stats['total_lag_seconds'] += lag
+            self._stats['bands_rescanned'] += result['bands_updated']
+            self._stats['bands_removed'] += result['bands_removed']
+            self._stats['rescan_errors'] += len(result['errors'])
+            self._stats['last_update'] = time.time()
+
+    def dirty_bands(self) -> Set[str]:
+        """Bands waiting to be re-scanned."""
+        with self._condition:
+            return set(self._dirty)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get watcher metrics.
+
+        Returns:
+            Dict with running state, watch count, queue depth (dirty bands),
+            oldest pending event age and rescan/lag counters
+        """
+        now = time.monotonic()
+        with self._condition:
+            queue_depth = len(self._dirty)
+            oldest = min((times[0] for times in self._dirty.values()), default=None)
+        processed = self._stats['bands_rescanned'] + self._stats['bands_removed']
+        stats = dict(self._stats)
+        stats.update({
+            'running': self.running,
+            'music_root': str(self.music_root),
+            'debounce_seconds': self.debounce_seconds,
+            'watched_folders': len(self._watches),
+            'queue_depth': queue_depth,
+            'oldest_pending_seconds': round(now - oldest, 3) if oldest is not None else 0.0,
+            'avg_lag_seconds': round(stats.pop('total_lag_seconds') / processed, 3) if processed else None,
+        })
+        return stats
+
+
+_watcher: Optional[Union[CollectionWatcher, PollingChangeDetector]] = None
+_watcher_lock = threading.Lock()
+
+
+def start_collection_watcher(force: bool = False) -> Optional[Union[CollectionWatcher, PollingChangeDetector]]:
+    """
+    Start the shared collection watcher if watch mode is enabled.
+
+    The backend is chosen by WATCH_BACKEND: inotify on local filesystems,
+    polling on network mounts (NFS/SMB) or where inotify is unavailable.
+
+    Args:
+        force: Start even if WATCH_MODE_ENABLED is not set
+
+    Returns:
+        The running watcher, or None if watch mode is disabled or unavailable
+    """
+    global _watcher
+    config = get_config()
+    settings = watch_settings_from_config(config)
+    if not (settings['enabled'] or force):
+        return None
+    backend = select_watch_backend(settings['backend'], config.MUSIC_ROOT_PATH)
+    if backend is None:
+        logger.warning("Watch mode requested but inotify is not available on this platform")
+        return None
+
+    with _watcher_lock:
+        if _watcher is not None and _watcher.running:
+            return _watcher
+        if backend == WATCH_BACKEND_INOTIFY:
+            watcher = CollectionWatcher(config.MUSIC_ROOT_PATH, settings['debounce_seconds'])
+        else:
+            from src.core.tools.metadata_store import MetadataStore
+            watcher = PollingChangeDetector(
+                config.MUSIC_ROOT_PATH,
+                snapshot_dir=MetadataStore.from_config(config).metadata_root,
+                min_interval=settings['poll_min_interval'],
+                max_interval=settings['poll_max_interval'],
+                max_stats_per_second=settings['poll_max_stats_per_second']
+            )
+        try:
+            watcher.start()
+        except OSError as e:
+            logger.error(f"Could not start collection watcher: {e}")
+            watcher.stop()
+            return None
+        _watcher = watcher
+        return watcher
+
+
+def stop_collection_watcher() -> None:
+    """Stop the shared collection watcher, if running."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
+
+
+def get_watch_status() -> Dict[str, Any]:
+    """
+    Get watch mode status and metrics.
+
+    Returns:
+        Dict with enabled flag and, when running, the watcher metrics
+    """
+    watcher = _watcher
+    if watcher is None or not watcher.running:
+        return {'enabled': False, 'running': False}
+    backend = WATCH_BACKEND_INOTIFY if isinstance(watcher, CollectionWatcher) else WATCH_BACKEND_POLL
+    return {'enabled': True, 'backend': backend, **watcher.get_stats()}
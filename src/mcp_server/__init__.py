@@ -15,6 +15,11 @@ from .mcp_instance import mcp
 # Import all tools to ensure they are registered
 from .tools import (
     scan_music_folders,
+    get_scan_report_tool,
+    get_server_metrics,
+    get_job_status,
+    get_job_result,
+    cancel_job,
     get_band_list_tool,
     save_band_metadata_tool,
     save_band_analyze_tool,
@@ -30,7 +35,9 @@ from .tools import (
 from .resources import (
     band_info_resource,
     collection_summary_resource,
-    advanced_analytics_resource
+    advanced_analytics_resource,
+    server_metrics_resource,
+    server_metrics_prometheus_resource
 )
 
 # Import all prompts to ensure they are registered
@@ -46,6 +53,11 @@ __all__ = [
     "mcp",
     # Tools
     "scan_music_folders",
+    "get_scan_report_tool",
+    "get_server_metrics",
+    "get_job_status",
+    "get_job_result",
+    "cancel_job",
     "get_band_list_tool",
     "save_band_metadata_tool",
     "save_band_analyze_tool",
@@ -59,6 +71,8 @@ __all__ = [
     "band_info_resource",
     "collection_summary_resource",
     "advanced_analytics_resource",
+    "server_metrics_resource",
+    "server_metrics_prometheus_resource",
     # Prompts
     "fetch_band_info_prompt",
     "analyze_band_prompt",
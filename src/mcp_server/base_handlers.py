@@ -5,9 +5,14 @@ Music Collection MCP Server - Base Handler Classes
 This module contains abstract base classes for standardizing tool, resource, and prompt handlers.
 """
 
+import asyncio
+import functools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import traceback
 from datetime import datetime, timezone
@@ -24,16 +29,27 @@ if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
 from exceptions import MusicMCPError, ErrorSeverity, ErrorCategory
+from src.core.tools.snapshot import get_snapshot_store
+from src.core.tools.tracing import SPAN_KIND_SERVER, current_trace_id, trace_span, with_current_context
 from .error_handlers import (
     ErrorResponseManager, 
     ToolErrorHandler, 
     ResourceErrorHandler, 
     PromptErrorHandler
 )
+from .coalescing import SingleFlight, request_key
+from .concurrency import ConcurrencyLimiter, get_handler_executor
+from .jobs import JOB_PRIORITY_NORMAL, get_job_manager
+from .mcp_instance import mcp
+from .metrics import get_metrics_registry
+from .profiling import get_profiler, profile_requested, with_profile_parameter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Handler slot held by the current pool thread: (handler, queue_seconds)
+_slot_state = threading.local()
+
 
 @dataclass
 class HandlerResponse:
@@ -66,9 +82,32 @@ class HandlerResponse:
         return result
 
 
+class _MeteredCall:
+    """Outcome of a handler call, filled in by the handler for its metrics."""
+    
+    __slots__ = ('response', 'error')
+    
+    def __init__(self):
+        self.response: Any = None
+        self.error = False
+
+
 class BaseHandler(ABC):
     """Base class for all MCP handlers with common functionality."""
     
+    # Kind of handler in the server metrics
+    handler_kind: str = "handler"
+    
+    # Maximum number of concurrent calls of this handler (None = unlimited)
+    max_concurrency: Optional[int] = None
+    
+    # Share one computation between identical concurrent calls (read-only handlers only)
+    coalesce_requests: bool = False
+    
+    # Read the whole call from one collection snapshot (read-only handlers only;
+    # handlers that read, modify and write files must see the latest files)
+    isolated_reads: bool = False
+    
     def __init__(self, handler_name: str, version: str = "1.0.0"):
         """
         Initialize base handler.
@@ -82,6 +121,192 @@ class BaseHandler(ABC):
         self.logger = logging.getLogger(f"{__name__}.{handler_name}")
         # Initialize error response manager for standardized error handling
         self.error_manager = ErrorResponseManager(handler_name, self.logger)
+        self.limiter = ConcurrencyLimiter(self.max_concurrency)
+        self._queue_stats = {'calls': 0, 'total_queue_seconds': 0.0, 'max_queue_seconds': 0.0}
+        self._queue_stats_lock = threading.Lock()
+        self.singleflight = SingleFlight()
+        get_metrics_registry().register_handler(self)
+    
+    def offloaded(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a synchronous entry point in a coroutine that runs it on the handler thread pool.
+        
+        The wrapper keeps the name, docstring and signature of func, so it
+        can be registered with FastMCP in its place.
+        
+        Args:
+            func: Synchronous MCP entry point calling this handler
+            
+        Returns:
+            Coroutine function with the same signature
+        """
+        @functools.wraps(func)
+        async def run_offloaded(*args, **kwargs):
+            return await self.run_in_pool(func, *args, **kwargs)
+        return run_offloaded
+    
+    async def run_in_pool(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func on the handler thread pool within this handler's concurrency limit.
+        
+        Waiting for a free slot suspends the coroutine instead of occupying a
+        pool thread. The slot is held until func returns, even if the caller
+        is cancelled meanwhile.
+        
+        Args:
+            func: Synchronous callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Return value of func
+        """
+        submitted = time.perf_counter()
+        await self.limiter.acquire_async()
+        try:
+            # The pool thread continues the caller's trace
+            future = get_handler_executor().submit(with_current_context(self._run_holding_slot),
+                                                   submitted, func, args, kwargs)
+        except BaseException:
+            self.limiter.release()
+            raise
+        
+        def release_if_never_run(done_future) -> None:
+            if done_future.cancelled():
+                self.limiter.release()
+        
+        future.add_done_callback(release_if_never_run)
+        return await asyncio.wrap_future(future)
+    
+    def _run_holding_slot(self, submitted: float, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Pool thread: run func with the slot acquired by run_in_pool, then release it."""
+        queue_seconds = time.perf_counter() - submitted
+        self._record_queue_time(queue_seconds)
+        _slot_state.held = (self, queue_seconds)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _slot_state.held = None
+            self.limiter.release()
+    
+    @contextmanager
+    def _execution_slot(self) -> Iterator[float]:
+        """
+        Hold one of this handler's concurrency slots while executing.
+        
+        Reuses the slot when the call came in through run_in_pool, otherwise
+        blocks until a slot is free.
+        
+        Yields:
+            Seconds the call waited before it could run
+        """
+        held = getattr(_slot_state, 'held', None)
+        if held is not None and held[0] is self:
+            yield held[1]
+            return
+        
+        start = time.perf_counter()
+        self.limiter.acquire()
+        queue_seconds = time.perf_counter() - start
+        self._record_queue_time(queue_seconds)
+        try:
+            yield queue_seconds
+        finally:
+            self.limiter.release()
+    
+    def _read_scope(self):
+        """
+        Pin a collection snapshot for the call if the handler reads in isolation.
+        
+        Returns:
+            Context manager holding the pin (a no-op for other handlers)
+        """
+        return get_snapshot_store().pin() if self.isolated_reads else nullcontext()
+    
+    @contextmanager
+    def _metered_call(self, params: Dict[str, Any], queue_seconds: float) -> Iterator[_MeteredCall]:
+        """
+        Record a call in the server metrics (latency, errors and payload bytes).
+        
+        The call is also the root span of a trace (or a child of the
+        caller's span). The caller sets the response it returns, and error if the call
+        failed; an exception escaping the block counts as an error.
+        
+        Args:
+            params: Call parameters
+            queue_seconds: Time the call waited for a concurrency slot
+            
+        Yields:
+            Outcome of the call to fill in
+        """
+        registry = get_metrics_registry()
+        metrics = registry.start_call(self.handler_name, self.handler_kind, params)
+        call = _MeteredCall()
+        started = time.perf_counter()
+        with trace_span(f"{self.handler_kind}/{self.handler_name}", SPAN_KIND_SERVER,
+                        **{'mcp.handler': self.handler_name, 'mcp.queue_seconds': queue_seconds}) as span:
+            try:
+                yield call
+            except BaseException:
+                call.error = True
+                raise
+            finally:
+                registry.finish_call(metrics, time.perf_counter() - started, queue_seconds,
+                                     response=call.response, error=call.error)
+                if call.error:
+                    span.set_error(f"{self.handler_kind} call failed")
+    
+    def _record_queue_time(self, queue_seconds: float) -> None:
+        with self._queue_stats_lock:
+            self._queue_stats['calls'] += 1
+            self._queue_stats['total_queue_seconds'] += queue_seconds
+            self._queue_stats['max_queue_seconds'] = max(self._queue_stats['max_queue_seconds'], queue_seconds)
+    
+    def get_concurrency_stats(self) -> Dict[str, Any]:
+        """
+        Get concurrency limit state and queue time statistics.
+        
+        Returns:
+            Dict with limit, active and waiting calls, and queue times
+        """
+        with self._queue_stats_lock:
+            calls = self._queue_stats['calls']
+            stats = {
+                'handler_name': self.handler_name,
+                **self.limiter.get_stats(),
+                'calls': calls,
+                'avg_queue_seconds': round(self._queue_stats['total_queue_seconds'] / calls, 4) if calls else 0.0,
+                'max_queue_seconds': round(self._queue_stats['max_queue_seconds'], 4)
+            }
+        return stats
+    
+    def _run_coalesced(self, params: Dict[str, Any], func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run func, sharing the computation with identical concurrent calls if enabled.
+        
+        Calls are identical when they have the same parameters and are made
+        at the same collection generation (see src.mcp_server.coalescing).
+        
+        Args:
+            params: Call parameters
+            func: Computation to run
+            
+        Returns:
+            Tuple of the result and whether it was shared from another call
+        """
+        if not self.coalesce_requests:
+            return func(), False
+        return self.singleflight.do(request_key(params), func)
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get request coalescing counters.
+        
+        Returns:
+            Dict with whether coalescing is enabled, calls, computations run and calls coalesced
+        """
+        return {'handler_name': self.handler_name, 'enabled': self.coalesce_requests,
+                **self.singleflight.get_stats()}
     
     def _create_handler_info(self, **kwargs) -> Dict[str, Any]:
         """Create standardized handler info metadata."""
@@ -90,6 +315,9 @@ class BaseHandler(ABC):
             'version': self.version,
             'handler_type': self.__class__.__name__
         }
+        trace_id = current_trace_id()
+        if trace_id is not None:
+            info['trace_id'] = trace_id
         info.update(kwargs)
         return info
     
@@ -153,6 +381,11 @@ class BaseHandler(ABC):
 class BaseToolHandler(BaseHandler):
     """Base class for MCP tool handlers."""
     
+    handler_kind = "tool"
+    
+    # Queue priority of this tool's background jobs (lower runs first)
+    job_priority = JOB_PRIORITY_NORMAL
+    
     def __init__(self, tool_name: str, version: str = "1.0.0"):
         """
         Initialize tool handler.
@@ -178,39 +411,114 @@ class BaseToolHandler(BaseHandler):
         """
         pass
     
-    def execute(self, **kwargs) -> Dict[str, Any]:
+    def execute(self, profile: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Execute tool with standardized error handling and response formatting.
         
         Args:
+            profile: Run the call under the profiler (see src.mcp_server.profiling);
+                also set by the profile parameter of registered tools
             **kwargs: Tool-specific arguments
             
         Returns:
             Standardized tool response dictionary
         """
-        try:
-            # Execute the core tool logic
-            result = self._execute_tool(**kwargs)
-            
-            # Create success response
-            response = HandlerResponse(
-                status='success',
-                data=result,
-                handler_info=self._create_handler_info(
+        profiler = get_profiler()
+        profile_info: Dict[str, Any] = {}
+        profiled = profiler.should_profile(profile or profile_requested())
+        with self._execution_slot() as queue_seconds, self._read_scope(), \
+                self._metered_call(kwargs, queue_seconds) as call:
+            try:
+                # Execute the core tool logic
+                with profiler.profile(self.handler_name, profile_info) if profiled else nullcontext():
+                    result, coalesced = self._run_coalesced(kwargs, lambda: self._execute_tool(**kwargs))
+                
+                # Create success response
+                response = HandlerResponse(
+                    status='success',
+                    data=result,
+                    handler_info=self._create_handler_info(
+                        tool_mode='execution',
+                        parameters_used=kwargs,
+                        queue_seconds=round(queue_seconds, 4),
+                        coalesced=coalesced,
+                        **({'profile': profile_info} if profiled else {})
+                    )
+                )
+                
+                call.response = response.to_dict()
+                
+            except Exception as e:
+                # Use specialized tool error handler
+                call.error = True
+                call.response = self.tool_error_handler.create_tool_error_response(
+                    e, "Tool execution failed", 
                     tool_mode='execution',
-                    parameters_used=kwargs
+                    parameters_used=kwargs,
+                    queue_seconds=round(queue_seconds, 4),
+                    **({'profile': profile_info} if profiled else {})
                 )
-            )
-            
-            return response.to_dict()
+            return call.response
+    
+    def submit_job(self, **kwargs) -> Dict[str, Any]:
+        """
+        Run the tool as a background job and return its job ID immediately.
+        
+        The job result is the response execute() would have returned; it is
+        available from get_job_result once the job has finished.
+        
+        Args:
+            **kwargs: Tool-specific arguments
             
+        Returns:
+            Standardized tool response dictionary with the job ID and state
+        """
+        try:
+            manager = get_job_manager()
+            job = manager.submit(self.handler_name, lambda: self.execute(**kwargs),
+                                 priority=self.job_priority, parameters=kwargs)
         except Exception as e:
-            # Use specialized tool error handler
             return self.tool_error_handler.create_tool_error_response(
-                e, "Tool execution failed", 
-                tool_mode='execution',
+                e, "Could not queue background job",
+                tool_mode='async',
                 parameters_used=kwargs
             )
+        
+        response = HandlerResponse(
+            status='success',
+            data={
+                'job_id': job.job_id,
+                'job_status': job.status,
+                'queue_position': manager.queue_position(job),
+                'message': "Job queued; poll get_job_status and fetch the outcome with get_job_result"
+            },
+            handler_info=self._create_handler_info(
+                tool_mode='async',
+                job_priority=job.priority,
+                parameters_used=kwargs
+            )
+        )
+        return response.to_dict()
+    
+    def register_tool(self, **tool_kwargs) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator registering a synchronous tool function with FastMCP.
+        
+        FastMCP gets a coroutine that runs the function on the handler thread
+        pool (see offloaded()), with an extra profile parameter for profiling
+        the call; the decorated function itself is returned unchanged, so it
+        can still be called directly.
+        
+        Args:
+            **tool_kwargs: Arguments for mcp.tool()
+            
+        Returns:
+            Decorator
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            mcp.tool(**tool_kwargs)(self.offloaded(with_profile_parameter(func)))
+            return func
+        return decorator
     
     def _create_tool_info(self, **kwargs) -> Dict[str, Any]:
         """Create tool-specific metadata."""
@@ -223,6 +531,8 @@ class BaseToolHandler(BaseHandler):
 class BaseResourceHandler(BaseHandler):
     """Base class for MCP resource handlers."""
     
+    handler_kind = "resource"
+    
     def __init__(self, resource_name: str, version: str = "1.0.0"):
         """
         Initialize resource handler.
@@ -258,14 +568,37 @@ class BaseResourceHandler(BaseHandler):
         Returns:
             Resource content or error message
         """
-        try:
-            return self._get_resource_content(**kwargs)
+        with self._execution_slot() as queue_seconds, self._read_scope(), \
+                self._metered_call(kwargs, queue_seconds) as call:
+            try:
+                call.response, _ = self._run_coalesced(kwargs, lambda: self._get_resource_content(**kwargs))
+                
+            except Exception as e:
+                # Use specialized resource error handler
+                call.error = True
+                call.response = self.resource_error_handler.create_resource_error_content(
+                    e, "Resource content generation failed", **kwargs
+                )
+            return call.response
+    
+    def register_resource(self, uri: str, **resource_kwargs) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator registering a synchronous resource function with FastMCP.
+        
+        Like BaseToolHandler.register_tool(), FastMCP gets a coroutine that
+        runs the function on the handler thread pool.
+        
+        Args:
+            uri: Resource URI or URI template
+            **resource_kwargs: Further arguments for mcp.resource()
             
-        except Exception as e:
-            # Use specialized resource error handler
-            return self.resource_error_handler.create_resource_error_content(
-                e, "Resource content generation failed", **kwargs
-            )
+        Returns:
+            Decorator
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            mcp.resource(uri, **resource_kwargs)(self.offloaded(func))
+            return func
+        return decorator
     
     def _format_error_content(self, error_message: str, **kwargs) -> str:
         """
@@ -293,6 +626,8 @@ check the server logs for more detailed error information.
 class BasePromptHandler(BaseHandler):
     """Base class for MCP prompt handlers."""
     
+    handler_kind = "prompt"
+    
     def __init__(self, prompt_name: str, version: str = "1.0.0"):
         """
         Initialize prompt handler.
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Request Coalescing
+
+Expensive read handlers (collection analytics, summary and insights) load
+the metadata of every band and compute the same result for every caller.
+When identical requests arrive while one is already being computed, they
+wait for that computation and share its result instead of repeating it
+("singleflight").
+
+Requests are identical when they have the same parameters and were made at
+the same collection generation, so a request made after a metadata write
+never receives a result computed before it.
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.core.tools.collection_generation import get_collection_generation
+
+
+def request_key(params: Dict[str, Any]) -> Tuple[str, int]:
+    """
+    Build the coalescing key of a request.
+
+    Args:
+        params: Request parameters
+
+    Returns:
+        Tuple of the canonical parameters and the current collection generation
+    """
+    return json.dumps(params, sort_keys=True, default=str), get_collection_generation()
+
+
+class _Call:
+    """A computation in flight and its outcome."""
+
+    __slots__ = ('done', 'result', 'error', 'followers')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Run at most one computation per key at a time and share its outcome.
+
+    The first caller of a key (the leader) runs the computation; callers
+    arriving while it runs wait for it and receive the same result or
+    exception. Results are not kept once the computation has finished.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'executions': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run func, or wait for the run of func already in flight for key.
+
+        Args:
+            key: Key identifying identical computations
+            func: Computation to run
+
+        Returns:
+            Tuple of the result and whether it was shared from another call
+
+        Raises:
+            Exception: Whatever func raised, in the leader and all waiters
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['executions'] += 1
+            else:
+                call.followers += 1
+                self._stats['coalesced'] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dict with calls, computations run, calls coalesced and computations in flight
+        """
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls)}
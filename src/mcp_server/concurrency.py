@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Handler Concurrency
+
+Tool and resource handlers are plain synchronous functions doing file I/O
+and pydantic work. Their MCP entry points are registered as coroutines that
+run the handler on a shared, bounded thread pool, so the event loop keeps
+serving other requests while a handler runs.
+
+Each handler can limit how many of its calls run at the same time (scans
+and migrations run one at a time; read-only handlers are unlimited). Calls
+over the limit wait without occupying a pool thread, and the time a call
+spends waiting is reported as its queue time.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from src.di import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HANDLER_POOL_SIZE = 8
+
+
+def handler_pool_size_from_config(config: Any) -> int:
+    """
+    Get the size of the handler thread pool from a configuration object.
+
+    Args:
+        config: Configuration instance (HANDLER_THREAD_POOL_SIZE is optional)
+
+    Returns:
+        Positive number of pool threads
+    """
+    value = getattr(config, 'HANDLER_THREAD_POOL_SIZE', None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return DEFAULT_HANDLER_POOL_SIZE
+
+
+class _Waiter:
+    """A queued acquire; wake() hands it a slot."""
+
+    __slots__ = ('wake', 'granted')
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.granted = False
+
+
+class ConcurrencyLimiter:
+    """
+    First-come, first-served limit on concurrent calls, for threads and coroutines.
+
+    A released slot is handed directly to the oldest waiter, so waiters are
+    served in arrival order and a newcomer cannot overtake them.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Initialize concurrency limiter.
+
+        Args:
+            limit: Maximum concurrent holders (None for unlimited)
+        """
+        self.limit = limit if limit is None else max(1, limit)
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _try_acquire(self) -> bool:
+        """Take a free slot if nobody is waiting (caller holds the lock)."""
+        if self.limit is None or (self._active < self.limit and not self._waiters):
+            self._active += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Acquire a slot, blocking the calling thread while none is free."""
+        with self._lock:
+            if self._try_acquire():
+                return
+            event = threading.Event()
+            self._waiters.append(_Waiter(event.set))
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        """Acquire a slot, suspending the calling coroutine while none is free."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(grant))
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                # The slot was handed over while we were being cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiter if there is one."""
+        with self._lock:
+            if not self._waiters:
+                self._active -= 1
+                return
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+        waiter.wake()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter state.
+
+        Returns:
+            Dict with the limit, active holders and waiting callers
+        """
+        return {'limit': self.limit, 'active': self._active, 'waiting': len(self._waiters)}
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_handler_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool that runs handlers, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor sized by HANDLER_THREAD_POOL_SIZE
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            size = handler_pool_size_from_config(get_config())
+            _executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="mcp-handler")
+            logger.info(f"Started handler thread pool with {size} threads")
+        return _executor
+
+
+def shutdown_handler_executor(wait: bool = False) -> None:
+    """
+    Shut down the handler thread pool, if one was created.
+
+    Args:
+        wait: Wait for running handlers to finish
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
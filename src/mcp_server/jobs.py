@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Background Jobs
+
+Long-running tools (collection scans, migrations, collection insights) can
+run as background jobs instead of inside the MCP call: the tool returns a job
+ID immediately and the client polls get_job_status/get_job_result, or stops
+the job with cancel_job.
+
+Jobs run on a small pool of worker threads fed by a priority queue; lower
+priority values run first and jobs of equal priority run in submission
+order. Interactive tools never go through the queue, so a background scan
+does not block them.
+
+Cancellation is immediate for queued jobs. A running job is asked to stop:
+jobs that check current_job().cancel_requested (collection scans do, between
+bands) stop early; others finish and their result is discarded.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.tools.tracing import with_current_context
+from src.di import get_config
+
+logger = logging.getLogger(__name__)
+
+# Job priorities: lower values run first
+JOB_PRIORITY_HIGH = 0
+JOB_PRIORITY_NORMAL = 5
+JOB_PRIORITY_LOW = 10
+
+# Job states
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+JOB_FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+DEFAULT_JOB_WORKERS = 2
+
+# Finished jobs (and their results) kept for get_job_result
+MAX_FINISHED_JOBS = 100
+
+_current = threading.local()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def job_workers_from_config(config: Any) -> int:
+    """
+    Get the number of job worker threads from a configuration object.
+
+    Args:
+        config: Configuration instance (JOB_WORKERS is optional)
+
+    Returns:
+        Positive number of worker threads
+    """
+    value = getattr(config, 'JOB_WORKERS', None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return DEFAULT_JOB_WORKERS
+
+
+class Job:
+    """A unit of background work and its outcome."""
+
+    def __init__(self, name: str, func: Callable[[], Any], priority: int = JOB_PRIORITY_NORMAL,
+                 parameters: Optional[Dict[str, Any]] = None):
+        """
+        Initialize job.
+
+        Args:
+            name: Name of the tool or operation the job runs
+            func: Callable doing the work; its return value is the job result
+            priority: Queue priority (lower runs first)
+            parameters: Parameters the job was submitted with, for status reports
+        """
+        self.job_id = uuid.uuid4().hex
+        self.name = name
+        self.priority = priority
+        self.parameters = parameters or {}
+        self.status = JOB_QUEUED
+        self.submitted_at = _now()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self._func = func
+        self._sequence = 0
+        self._cancel = threading.Event()
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._submitted = time.monotonic()
+
+    @property
+    def cancel_requested(self) -> bool:
+        """True once cancel_job was called for this job."""
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JOB_FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the job without its result.
+
+        Returns:
+            Dict with ID, name, state, timestamps, queue wait and run time
+        """
+        now = time.monotonic()
+        queued_until = self._started or self._finished or now
+        info = {
+            'job_id': self.job_id,
+            'name': self.name,
+            'status': self.status,
+            'priority': self.priority,
+            'parameters': self.parameters,
+            'cancel_requested': self.cancel_requested,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'queue_seconds': round(queued_until - self._submitted, 3),
+            'run_seconds': (round((self._finished or now) - self._started, 3)
+                            if self._started is not None else None)
+        }
+        if self.error:
+            info['error'] = self.error
+        return info
+
+
+class JobManager:
+    """
+    Priority queue of jobs served by a pool of worker threads.
+
+    Workers are started on the first submission. Finished jobs are kept up
+    to max_finished_jobs, oldest first out.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_JOB_WORKERS, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        """
+        Initialize job manager.
+
+        Args:
+            max_workers: Number of worker threads
+            max_finished_jobs: Number of finished jobs whose results are kept
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_finished_jobs = max(1, max_finished_jobs)
+        self._queue: 'queue.PriorityQueue' = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._stopping = False
+
+    def submit(self, name: str, func: Callable[[], Any], priority: int = JOB_PRIORITY_NORMAL,
+               parameters: Optional[Dict[str, Any]] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            name: Name of the tool or operation the job runs
+            func: Callable doing the work; its return value is the job result
+            priority: Queue priority (lower runs first)
+            parameters: Parameters the job was submitted with, for status reports
+
+        Returns:
+            The queued job
+
+        Raises:
+            RuntimeError: If the manager has been shut down
+        """
+        # The job continues the submitter's trace, if any
+        job = Job(name, with_current_context(func), priority, parameters)
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError("Job manager is shut down")
+            job._sequence = next(self._sequence)
+            self._jobs[job.job_id] = job
+            self._start_workers()
+        self._queue.put((priority, job._sequence, job))
+        logger.info(f"Queued job {job.job_id} ({name}, priority {priority})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID (None if unknown or expired)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """List known jobs, most recently submitted first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def queue_position(self, job: Job) -> Optional[int]:
+        """
+        Get the 1-based position of a queued job among the queued jobs.
+
+        Args:
+            job: Job to locate
+
+        Returns:
+            Queue position, None if the job is not queued
+        """
+        with self._lock:
+            if job.status != JOB_QUEUED:
+                return None
+            return 1 + sum(1 for other in self._jobs.values()
+                           if other.status == JOB_QUEUED
+                           and (other.priority, other._sequence) < (job.priority, job._sequence))
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job.
+
+        Queued jobs are cancelled at once; running jobs are asked to stop.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            The job, None if unknown
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.finished:
+                return job
+            job._cancel.set()
+            if job.status == JOB_QUEUED:
+                self._finish(job, JOB_CANCELLED)
+        logger.info(f"Cancellation requested for job {job_id} ({job.name})")
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get job counts by state.
+
+        Returns:
+            Dict with worker count and the number of jobs in each state
+        """
+        with self._lock:
+            counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING) + JOB_FINISHED_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {'workers': self.max_workers, 'workers_started': len(self._workers), 'jobs': counts}
+
+    def shutdown(self, wait: bool = False, timeout: float = 5.0) -> None:
+        """
+        Stop accepting jobs, cancel queued ones and stop the workers.
+
+        Args:
+            wait: Wait for running jobs to finish
+            timeout: Maximum time to wait per worker in seconds
+        """
+        with self._lock:
+            self._stopping = True
+            for job in self._jobs.values():
+                if not job.finished:
+                    job._cancel.set()
+                    if job.status == JOB_QUEUED:
+                        self._finish(job, JOB_CANCELLED)
+            workers = list(self._workers)
+        for _ in workers:
+            # Sentinels sort after every real job
+            self._queue.put((float('inf'), next(self._sequence), None))
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+
+    def _start_workers(self) -> None:
+        """Start the worker threads (caller holds the lock)."""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work_loop, name=f"job-worker-{len(self._workers) + 1}",
+                                      daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work_loop(self) -> None:
+        """Worker thread: run queued jobs until shut down."""
+        while True:
+            _, _, job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                if job.status != JOB_QUEUED:
+                    continue  # Cancelled while queued
+                job.status = JOB_RUNNING
+                job.started_at = _now()
+                job._started = time.monotonic()
+            self._run(job)
+
+    def _run(self, job: Job) -> None:
+        """Run one job and record its outcome."""
+        _current.job = job
+        try:
+            result = job._func()
+        except BaseException as e:
+            logger.error(f"Job {job.job_id} ({job.name}) failed: {e}")
+            with self._lock:
+                job.error = str(e)
+                self._finish(job, JOB_CANCELLED if job.cancel_requested else JOB_FAILED)
+            return
+        finally:
+            _current.job = None
+
+        with self._lock:
+            if job.cancel_requested:
+                self._finish(job, JOB_CANCELLED)
+            else:
+                job.result = result
+                failed = isinstance(result, dict) and result.get('status') == 'error'
+                if failed:
+                    job.error = result.get('error')
+                self._finish(job, JOB_FAILED if failed else JOB_SUCCEEDED)
+        logger.info(f"Job {job.job_id} ({job.name}) {job.status}")
+
+    def _finish(self, job: Job, status: str) -> None:
+        """Mark a job finished and expire the oldest finished jobs (caller holds the lock)."""
+        job.status = status
+        job.finished_at = _now()
+        job._finished = time.monotonic()
+        finished = [other for other in self._jobs.values() if other.finished]
+        for expired in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[expired.job_id]
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Get the shared job manager, creating it from the configuration on first use.
+
+    Returns:
+        JobManager instance
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(max_workers=job_workers_from_config(get_config()))
+        return _job_manager
+
+
+def shutdown_job_manager(wait: bool = False) -> None:
+    """
+    Shut down the shared job manager, if one was created.
+
+    Args:
+        wait: Wait for running jobs to finish
+    """
+    global _job_manager
+    with _job_manager_lock:
+        manager, _job_manager = _job_manager, None
+    if manager is not None:
+        manager.shutdown(wait=wait)
+
+
+def current_job() -> Optional[Job]:
+    """
+    Get the job running on the current thread.
+
+    Returns:
+        The running job, None outside a job worker
+    """
+    return getattr(_current, 'job', None)
@@ -18,6 +18,9 @@ from fastmcp import FastMCP
 
 # Local imports - Import MCP instance first to avoid circular imports
 from .mcp_instance import mcp
+from .concurrency import shutdown_handler_executor
+from .jobs import shutdown_job_manager
+from src.core.tools.watcher import start_collection_watcher, stop_collection_watcher
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -38,6 +41,9 @@ def main():
     logger.info("Starting Music Collection MCP Server...")
     
     try:
+        # Keep the collection index live when watch mode is enabled
+        start_collection_watcher()
+        
         # Run server directly - tools are already registered through imports
         logger.info("MCP Server initialized successfully")
         mcp.run()
@@ -47,6 +53,9 @@ def main():
         logger.error(f"Server error: {str(e)}")
         raise
     finally:
+        stop_collection_watcher()
+        shutdown_job_manager()
+        shutdown_handler_executor()
         logger.info("Music Collection MCP Server stopped")
 
 if __name__ == "__main__":
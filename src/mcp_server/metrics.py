@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Handler Metrics
+
+Every tool and resource call is recorded by handler name: calls, errors,
+latency (run time and time queued for a concurrency slot) as streaming
+histograms with p50/p95/p99, request and response payload bytes, and calls
+in flight. Text payloads are counted exactly; JSON data is only encoded for
+one in PAYLOAD_SAMPLE_EVERY calls per handler, and the other calls are
+counted at the average size of the sampled ones, so large responses are not
+serialized twice. Together with the concurrency, coalescing, snapshot and job
+statistics the server already keeps, they are exposed by the
+server://metrics resource and the get_server_metrics tool, as JSON or in
+the Prometheus text exposition format.
+"""
+
+import itertools
+import json
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.tools.performance import LatencyHistogram
+from src.core.tools.snapshot import get_snapshot_store
+
+# Prometheus metric name prefix
+METRIC_PREFIX = "music_mcp"
+
+_QUANTILES = (50, 95, 99)
+
+# One in this many JSON payloads of a handler is encoded to measure its size
+PAYLOAD_SAMPLE_EVERY = 16
+
+
+def payload_bytes(payload: Any) -> int:
+    """
+    Measure a request or response payload.
+
+    Args:
+        payload: Text, or data that is sent as JSON
+
+    Returns:
+        Size in bytes of the UTF-8 text or the compact JSON encoding
+    """
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload.encode('utf-8'))
+    try:
+        return len(json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+class PayloadBytes:
+    """Bytes of a handler's requests or responses, JSON data measured from a sample."""
+
+    __slots__ = ('total', 'sampled_bytes', 'sampled', '_sequence')
+
+    def __init__(self):
+        self.total = 0
+        self.sampled_bytes = 0
+        self.sampled = 0
+        self._sequence = itertools.count()
+
+    def measure(self, payload: Any, sample_every: int) -> Tuple[Optional[str], int]:
+        """
+        Measure a payload if it is text or sampled (call without the registry lock).
+
+        Returns:
+            Tuple of how it was measured ('text', 'sampled', 'estimated' or
+            None without a payload) and its size, to pass to record()
+        """
+        if payload is None:
+            return None, 0
+        if isinstance(payload, str):
+            return 'text', payload_bytes(payload)
+        if next(self._sequence) % sample_every:
+            return 'estimated', 0
+        return 'sampled', payload_bytes(payload)
+
+    def record(self, kind: Optional[str], size: int) -> None:
+        if kind == 'estimated':
+            size = round(self.sampled_bytes / self.sampled) if self.sampled else 0
+        elif kind == 'sampled':
+            self.sampled_bytes += size
+            self.sampled += 1
+        self.total += size
+
+
+class HandlerMetrics:
+    """Counters and latency histograms of one handler."""
+
+    def __init__(self, handler_name: str, handler_kind: str):
+        self.handler_name = handler_name
+        self.handler_kind = handler_kind
+        self.calls = 0
+        self.errors = 0
+        self.request_bytes = PayloadBytes()
+        self.response_bytes = PayloadBytes()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latency = LatencyHistogram()
+        self.queue = LatencyHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'handler_name': self.handler_name,
+            'kind': self.handler_kind,
+            'calls': self.calls,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.calls, 4) if self.calls else 0.0,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'request_bytes': self.request_bytes.total,
+            'response_bytes': self.response_bytes.total,
+            'latency': self.latency.to_dict(),
+            'queue': self.queue.to_dict()
+        }
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of handler metrics.
+
+    Handlers register themselves when created, so their concurrency and
+    coalescing statistics can be collected along with the call metrics.
+    """
+
+    def __init__(self, payload_sample_every: int = PAYLOAD_SAMPLE_EVERY):
+        """
+        Initialize metrics registry.
+
+        Args:
+            payload_sample_every: Encode one in this many JSON payloads of a
+                handler to measure its size (1 measures every payload)
+        """
+        self.payload_sample_every = max(1, payload_sample_every)
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, HandlerMetrics] = {}
+        self._handlers: 'weakref.WeakValueDictionary[str, Any]' = weakref.WeakValueDictionary()
+
+    def register_handler(self, handler: Any) -> None:
+        """
+        Register a handler whose statistics are included in the snapshot.
+
+        Args:
+            handler: BaseHandler instance
+        """
+        with self._lock:
+            self._handlers[handler.handler_name] = handler
+
+    def start_call(self, handler_name: str, handler_kind: str, params: Dict[str, Any]) -> HandlerMetrics:
+        """
+        Record the start of a call.
+
+        Args:
+            handler_name: Name of the handler
+            handler_kind: 'tool' or 'resource'
+            params: Call parameters
+
+        Returns:
+            Metrics of the handler, to pass to finish_call()
+        """
+        with self._lock:
+            metrics = self._metrics.get(handler_name)
+            if metrics is None:
+                metrics = self._metrics[handler_name] = HandlerMetrics(handler_name, handler_kind)
+            metrics.in_flight += 1
+            metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        if params:
+            measured = metrics.request_bytes.measure(params, self.payload_sample_every)
+            with self._lock:
+                metrics.request_bytes.record(*measured)
+        return metrics
+
+    def finish_call(self, metrics: HandlerMetrics, seconds: float, queue_seconds: float = 0.0,
+                    response: Any = None, error: bool = False) -> None:
+        """
+        Record the end of a call.
+
+        Args:
+            metrics: Metrics returned by start_call()
+            seconds: Run time of the call
+            queue_seconds: Time the call waited for a concurrency slot
+            response: Response sent to the client (measured in bytes, or
+                estimated when it is JSON data and not sampled)
+            error: Whether the call failed
+        """
+        measured = metrics.response_bytes.measure(response, self.payload_sample_every)
+        with self._lock:
+            metrics.in_flight -= 1
+            metrics.calls += 1
+            metrics.errors += 1 if error else 0
+            metrics.response_bytes.record(*measured)
+            metrics.latency.record(seconds)
+            metrics.queue.record(queue_seconds)
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Collect all server metrics.
+
+        Returns:
+            Dict with per-handler call metrics, concurrency and coalescing
+            statistics of the registered handlers, snapshot store and job
+            statistics
+        """
+        from .jobs import get_job_manager
+
+        with self._lock:
+            handlers = {name: metrics.to_dict() for name, metrics in sorted(self._metrics.items())}
+            registered = sorted(self._handlers.items())
+        return {
+            'handlers': handlers,
+            'concurrency': {name: handler.get_concurrency_stats() for name, handler in registered},
+            'coalescing': {name: handler.get_coalescing_stats() for name, handler in registered
+                           if handler.coalesce_requests},
+            'snapshots': get_snapshot_store().get_stats(),
+            'jobs': get_job_manager().get_stats()
+        }
+
+    def reset(self) -> None:
+        """Drop the call metrics (registered handlers are kept)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+def format_prometheus(snapshot: Dict[str, Any]) -> str:
+    """
+    Render a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Result of MetricsRegistry.get_snapshot()
+
+    Returns:
+        Exposition text (version 0.0.4)
+    """
+    lines: List[str] = []
+
+    def family(name: str, metric_type: str, help_text: str, samples: List[tuple]) -> None:
+        full_name = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        for suffix, labels, value in samples:
+            if value is None:
+                continue
+            label_text = ','.join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+            lines.append(f"{full_name}{suffix}{{{label_text}}} {_format_value(value)}" if label_text
+                         else f"{full_name}{suffix} {_format_value(value)}")
+
+    handlers = snapshot.get('handlers', {})
+
+    def per_handler(key: str) -> List[tuple]:
+        return [('', {'handler': name, 'kind': m['kind']}, m[key]) for name, m in handlers.items()]
+
+    def summary(key: str) -> List[tuple]:
+        samples = []
+        for name, m in handlers.items():
+            labels = {'handler': name, 'kind': m['kind']}
+            for quantile in _QUANTILES:
+                samples.append(('', {**labels, 'quantile': str(quantile / 100)},
+                                m[key][f'p{quantile}_seconds']))
+            samples.append(('_sum', labels, m[key]['total_seconds']))
+            samples.append(('_count', labels, m[key]['count']))
+        return samples
+
+    family('handler_calls_total', 'counter', "Handler calls completed.", per_handler('calls'))
+    family('handler_errors_total', 'counter', "Handler calls that failed.", per_handler('errors'))
+    family('handler_latency_seconds', 'summary', "Handler run time.", summary('latency'))
+    family('handler_queue_seconds', 'summary', "Time calls waited for a concurrency slot.", summary('queue'))
+    family('handler_request_bytes_total', 'counter', "Request payload bytes.", per_handler('request_bytes'))
+    family('handler_response_bytes_total', 'counter', "Response payload bytes.", per_handler('response_bytes'))
+    family('handler_in_flight', 'gauge', "Handler calls running.", per_handler('in_flight'))
+    family('handler_max_in_flight', 'gauge', "Most handler calls running at once.", per_handler('max_in_flight'))
+
+    concurrency = snapshot.get('concurrency', {})
+    family('handler_waiting', 'gauge', "Calls waiting for a concurrency slot.",
+           [('', {'handler': name}, stats.get('waiting')) for name, stats in concurrency.items()])
+    family('handler_concurrency_limit', 'gauge', "Concurrency limit of the handler.",
+           [('', {'handler': name}, stats.get('limit')) for name, stats in concurrency.items()])
+
+    coalescing = snapshot.get('coalescing', {})
+    family('handler_coalesced_total', 'counter', "Calls that shared another call's computation.",
+           [('', {'handler': name}, stats.get('coalesced')) for name, stats in coalescing.items()])
+
+    snapshots = snapshot.get('snapshots', {})
+    for key in ('live_snapshots', 'pinned_snapshots', 'readers', 'files_cached'):
+        family(f"snapshot_{key}", 'gauge', f"Snapshot store {key.replace('_', ' ')}.",
+               [('', {}, snapshots.get(key))])
+    for key in ('generations_published', 'generations_reclaimed', 'external_changes'):
+        family(f"snapshot_{key}_total", 'counter', f"Snapshot store {key.replace('_', ' ')}.",
+               [('', {}, snapshots.get(key))])
+
+    jobs = snapshot.get('jobs', {})
+    family('jobs', 'gauge', "Background jobs by state.",
+           [('', {'state': state}, count) for state, count in sorted(jobs.get('jobs', {}).items())])
+
+    return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the process-wide handler metrics registry.
+
+    Returns:
+        MetricsRegistry instance
+    """
+    return _registry
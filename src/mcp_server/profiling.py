@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - On-Demand Profiling
+
+A single tool call can be profiled where it is slow instead of being
+reproduced outside the server: every tool accepts profile=true, and
+PROFILE_SAMPLE_RATE profiles a fraction of all tool calls. A profiled call
+runs under cProfile (and tracemalloc with PROFILE_TRACEMALLOC); the .pstats
+file and a text summary of the top functions (and allocation sites) are
+written to PROFILE_DIR, and their paths are returned in handler_info.profile.
+
+Profilers are process-wide, so one call is profiled at a time; a call that
+asks while another is being profiled runs unprofiled and says so. When
+profiling is off, a call costs one parameter lookup and one comparison.
+"""
+
+import contextvars
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Annotated, Any, Callable, Dict, Iterator, Optional, Union
+
+from pydantic import Field
+
+from src.di import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_SAMPLE_RATE = 0.0
+DEFAULT_PROFILE_DIR = "logs/profiles"
+
+# Functions and allocation sites listed in the text summary
+PROFILE_TOP_N = 30
+
+# Frames kept per allocation traceback while tracemalloc is running
+_TRACEMALLOC_FRAMES = 5
+
+_PROFILE_ANNOTATION = Annotated[bool, Field(
+    description="Debug: profile this call and return the profile file paths in handler_info.profile")]
+
+# Set by the profile parameter of registered tools for the call they make
+_profile_requested: contextvars.ContextVar = contextvars.ContextVar('music_mcp_profile_requested', default=False)
+
+
+def profile_sample_rate_from_config(config: Any) -> float:
+    """
+    Get the fraction of tool calls profiled from a configuration object.
+
+    Args:
+        config: Configuration instance (PROFILE_SAMPLE_RATE is optional)
+
+    Returns:
+        Sampling rate between 0 and 1
+    """
+    value = getattr(config, 'PROFILE_SAMPLE_RATE', None)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 1:
+        return float(value)
+    return DEFAULT_PROFILE_SAMPLE_RATE
+
+
+def profile_dir_from_config(config: Any) -> Path:
+    """
+    Get the directory profiles are written to from a configuration object.
+
+    Args:
+        config: Configuration instance (PROFILE_DIR is optional)
+
+    Returns:
+        Profiles directory (relative paths are relative to the working directory)
+    """
+    value = getattr(config, 'PROFILE_DIR', None)
+    if isinstance(value, str) and value.strip():
+        return Path(value).expanduser()
+    return Path(DEFAULT_PROFILE_DIR)
+
+
+def profile_tracemalloc_from_config(config: Any) -> bool:
+    """
+    Get whether profiled calls also trace memory allocations.
+
+    Args:
+        config: Configuration instance (PROFILE_TRACEMALLOC is optional)
+
+    Returns:
+        True to run tracemalloc during profiled calls
+    """
+    return getattr(config, 'PROFILE_TRACEMALLOC', False) is True
+
+
+class InvocationProfiler:
+    """Profiles single handler calls and writes their artifacts."""
+
+    def __init__(self, profile_dir: Union[str, Path] = DEFAULT_PROFILE_DIR,
+                 sample_rate: float = DEFAULT_PROFILE_SAMPLE_RATE, trace_memory: bool = False):
+        """
+        Initialize profiler.
+
+        Args:
+            profile_dir: Directory the artifacts are written to
+            sample_rate: Fraction of calls profiled without being asked
+            trace_memory: Whether to run tracemalloc during profiled calls
+        """
+        self.profile_dir = Path(profile_dir)
+        self.sample_rate = sample_rate
+        self.trace_memory = trace_memory
+        self._busy = threading.Lock()
+
+    def should_profile(self, requested: bool = False) -> bool:
+        """Decide whether a call is profiled: asked for, or sampled."""
+        if requested:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, handler_name: str, info: Dict[str, Any]) -> Iterator[None]:
+        """
+        Profile the block and write its artifacts when it ends.
+
+        Args:
+            handler_name: Name of the profiled handler (part of the file names)
+            info: Filled in with the artifact paths when the block ends
+                (or with the reason it was not profiled)
+        """
+        if not self._busy.acquire(blocking=False):
+            info['skipped'] = "another call is being profiled"
+            yield
+            return
+
+        trace_memory = self.trace_memory and not tracemalloc.is_tracing()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            if trace_memory:
+                tracemalloc.start(_TRACEMALLOC_FRAMES)
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                seconds = time.perf_counter() - started
+                memory = None
+                if trace_memory:
+                    memory = (tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+                    tracemalloc.stop()
+                try:
+                    info.update(self._write(handler_name, profiler, seconds, memory))
+                except OSError as e:
+                    logger.warning(f"Could not write profile of {handler_name}: {e}")
+                    info['error'] = str(e)
+        finally:
+            self._busy.release()
+
+    def _write(self, handler_name: str, profiler: cProfile.Profile, seconds: float,
+               memory: Optional[tuple]) -> Dict[str, Any]:
+        """Write the .pstats file and the text summary."""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+        base = self.profile_dir / f"{stamp}-{re.sub(r'[^A-Za-z0-9_.-]', '_', handler_name)}-{os.getpid()}"
+        pstats_path = base.with_suffix('.pstats')
+        summary_path = base.with_suffix('.txt')
+        profiler.dump_stats(str(pstats_path))
+
+        summary = io.StringIO()
+        summary.write(f"Profile of {handler_name}: {seconds:.3f} s\n\n")
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_N)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_TOP_N)
+        result = {'pstats_path': str(pstats_path), 'summary_path': str(summary_path),
+                  'seconds': round(seconds, 4)}
+        if memory is not None:
+            snapshot, peak = memory
+            summary.write(f"\nPeak traced memory: {peak / 1024 / 1024:.2f} MB\n")
+            summary.write(f"Top {PROFILE_TOP_N} allocation sites:\n")
+            for stat in snapshot.statistics('lineno')[:PROFILE_TOP_N]:
+                summary.write(f"  {stat}\n")
+            result['peak_memory_mb'] = round(peak / 1024 / 1024, 2)
+        summary_path.write_text(summary.getvalue(), encoding='utf-8')
+        logger.info(f"Profiled {handler_name} ({seconds:.3f} s): {summary_path}")
+        return result
+
+
+_profiler: Optional[InvocationProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> InvocationProfiler:
+    """
+    Get the shared profiler, creating it from the configuration on first use.
+
+    Returns:
+        InvocationProfiler instance
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                config = get_config()
+                _profiler = InvocationProfiler(profile_dir_from_config(config),
+                                               profile_sample_rate_from_config(config),
+                                               profile_tracemalloc_from_config(config))
+    return _profiler
+
+
+def configure_profiling(profile_dir: Union[str, Path] = DEFAULT_PROFILE_DIR,
+                        sample_rate: float = DEFAULT_PROFILE_SAMPLE_RATE,
+                        trace_memory: bool = False) -> InvocationProfiler:
+    """
+    Replace the shared profiler.
+
+    Args:
+        profile_dir: Directory the artifacts are written to
+        sample_rate: Fraction of calls profiled without being asked
+        trace_memory: Whether to run tracemalloc during profiled calls
+
+    Returns:
+        The new profiler
+    """
+    global _profiler
+    with _profiler_lock:
+        _profiler = InvocationProfiler(profile_dir, sample_rate, trace_memory)
+    return _profiler
+
+
+def profile_requested() -> bool:
+    """Whether the tool call being made asked to be profiled."""
+    return _profile_requested.get()
+
+
+def with_profile_parameter(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Add a keyword-only profile parameter to a tool function.
+
+    profile=True marks the call as asking to be profiled (see
+    profile_requested()); func itself never receives the parameter.
+
+    Args:
+        func: Synchronous MCP tool function
+
+    Returns:
+        Wrapper with func's signature plus profile: bool = False
+    """
+    signature = inspect.signature(func)
+    if 'profile' in signature.parameters:
+        return func
+
+    @functools.wraps(func)
+    def run_profiled(*args, profile: bool = False, **kwargs):
+        if not profile:
+            return func(*args, **kwargs)
+        token = _profile_requested.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _profile_requested.reset(token)
+
+    parameters = list(signature.parameters.values())
+    position = len(parameters)
+    if parameters and parameters[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        position -= 1
+    parameters.insert(position, inspect.Parameter('profile', inspect.Parameter.KEYWORD_ONLY,
+                                                  default=False, annotation=_PROFILE_ANNOTATION))
+    run_profiled.__signature__ = signature.replace(parameters=parameters)
+    run_profiled.__annotations__ = {**getattr(func, '__annotations__', {}), 'profile': _PROFILE_ANNOTATION}
+    return run_profiled
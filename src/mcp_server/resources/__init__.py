@@ -10,10 +10,13 @@ Each resource is in its own dedicated file for better maintainability.
 from .band_info_resource import band_info_resource
 from .collection_summary_resource import collection_summary_resource
 from .advanced_analytics_resource import advanced_analytics_resource
+from .server_metrics_resource import server_metrics_resource, server_metrics_prometheus_resource
 
 # Export all resources for easy importing
 __all__ = [
     'band_info_resource',
     'collection_summary_resource',
-    'advanced_analytics_resource'
+    'advanced_analytics_resource',
+    'server_metrics_resource',
+    'server_metrics_prometheus_resource'
 ] 
\ No newline at end of file
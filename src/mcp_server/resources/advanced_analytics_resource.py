@@ -5,7 +5,6 @@ Music Collection MCP Server - Advanced Analytics Resource
 This module contains the advanced_analytics_resource implementation.
 """
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseResourceHandler
 
 # Import resource implementation - using absolute imports
@@ -14,6 +13,11 @@ from src.core.resources.advanced_analytics import get_advanced_analytics_markdow
 class AdvancedAnalyticsResourceHandler(BaseResourceHandler):
     """Handler for the advanced_analytics resource."""
     
+    # Concurrent identical calls share one pass over all band metadata,
+    # read from one consistent collection snapshot
+    coalesce_requests = True
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("advanced_analytics", "1.0.0")
     
@@ -24,7 +28,7 @@ class AdvancedAnalyticsResourceHandler(BaseResourceHandler):
 # Create handler instance
 _handler = AdvancedAnalyticsResourceHandler()
 
-@mcp.resource("collection://analytics")
+@_handler.register_resource("collection://analytics")
 def advanced_analytics_resource() -> str:
     """
     Get advanced collection analytics with comprehensive insights in markdown format.
@@ -5,7 +5,6 @@ Music Collection MCP Server - Band Info Resource
 This module contains the band_info_resource implementation.
 """
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseResourceHandler
 
 # Import resource implementation - using absolute imports
@@ -14,6 +13,9 @@ from src.core.resources.band_info import get_band_info_markdown
 class BandInfoResourceHandler(BaseResourceHandler):
     """Handler for the band_info resource."""
     
+    # Read each call from one consistent collection snapshot
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("band_info", "1.0.0")
     
@@ -46,7 +48,7 @@ Please check that the band name is correct and that the band has been scanned in
 # Create handler instance
 _handler = BandInfoResourceHandler()
 
-@mcp.resource("band://info/{band_name}")
+@_handler.register_resource("band://info/{band_name}")
 def band_info_resource(band_name: str) -> str:
     """
     Get detailed band information in markdown format.
@@ -5,7 +5,6 @@ Music Collection MCP Server - Collection Summary Resource
 This module contains the collection_summary_resource implementation.
 """
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseResourceHandler
 
 # Import resource implementation - using absolute imports
@@ -14,6 +13,11 @@ from src.core.resources.collection_summary import get_collection_summary
 class CollectionSummaryResourceHandler(BaseResourceHandler):
     """Handler for the collection_summary resource."""
     
+    # Concurrent identical calls share one pass over all band metadata,
+    # read from one consistent collection snapshot
+    coalesce_requests = True
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("collection_summary", "1.0.0")
     
@@ -25,7 +29,7 @@ class CollectionSummaryResourceHandler(BaseResourceHandler):
 # Create handler instance
 _handler = CollectionSummaryResourceHandler()
 
-@mcp.resource("collection://summary")
+@_handler.register_resource("collection://summary")
 def collection_summary_resource() -> str:
     """
     Get collection summary statistics in markdown format.
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Server Metrics Resource
+
+This module contains the server_metrics_resource implementation.
+"""
+
+import json
+
+from ..base_handlers import BaseResourceHandler
+from ..metrics import format_prometheus, get_metrics_registry
+
+
+class ServerMetricsResourceHandler(BaseResourceHandler):
+    """Handler for the server_metrics resource."""
+    
+    def __init__(self):
+        super().__init__("server_metrics", "1.0.0")
+    
+    def _get_resource_content(self, **kwargs) -> str:
+        """Get server metrics as JSON or Prometheus exposition text."""
+        snapshot = get_metrics_registry().get_snapshot()
+        if kwargs.get('format') == 'prometheus':
+            return format_prometheus(snapshot)
+        return json.dumps(snapshot, indent=2, default=str)
+
+
+# Create handler instance
+_handler = ServerMetricsResourceHandler()
+
+@_handler.register_resource("server://metrics", mime_type="application/json")
+def server_metrics_resource() -> str:
+    """
+    Get latency, error and throughput metrics of every tool and resource as JSON.
+    
+    Per handler: calls, errors, latency and queue time percentiles
+    (p50/p95/p99), request and response payload bytes and calls in flight.
+    Also includes concurrency limits, request coalescing, collection
+    snapshot and background job statistics.
+    
+    URI Format:
+        server://metrics
+    """
+    return _handler.get_content()
+
+
+@_handler.register_resource("server://metrics/prometheus", mime_type="text/plain; version=0.0.4")
+def server_metrics_prometheus_resource() -> str:
+    """
+    Get the server metrics in the Prometheus text exposition format.
+    
+    URI Format:
+        server://metrics/prometheus
+    """
+    return _handler.get_content(format='prometheus')
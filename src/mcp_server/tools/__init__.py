@@ -6,9 +6,14 @@ This package contains all individual MCP tool implementations.
 Each tool is in its own file for better organization and maintainability.
 """
 
-# Import all individual tool modules to register the @mcp.tool() decorators
+# Import all individual tool modules to register the tools (register_tool() decorators)
 from .scan_music_folders_tool import scan_music_folders
 from .get_band_list_tool import get_band_list_tool
+from .get_scan_report_tool import get_scan_report_tool
+from .get_server_metrics_tool import get_server_metrics
+from .get_job_status_tool import get_job_status
+from .get_job_result_tool import get_job_result
+from .cancel_job_tool import cancel_job
 from .save_band_metadata_tool import save_band_metadata_tool
 from .save_band_analyze_tool import save_band_analyze_tool
 from .save_collection_insight_tool import save_collection_insight_tool
@@ -21,6 +26,11 @@ from .generate_collection_theme_css_tool import generate_collection_theme_css_to
 
 __all__ = [
     "scan_music_folders",
+    "get_scan_report_tool",
+    "get_server_metrics",
+    "get_job_status",
+    "get_job_result",
+    "cancel_job",
     "get_band_list_tool",
     "save_band_metadata_tool", 
     "save_band_analyze_tool",
@@ -7,16 +7,24 @@ This module contains the advanced_search_albums_tool implementation.
 
 from typing import Any, Dict, List, Optional
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 # Import required modules and functions
-from src.core.tools.storage import load_collection_index, load_band_metadata
+from src.core.tools.deadline import (
+    Deadline,
+    index_version,
+    make_continuation_token,
+    parse_continuation_token,
+)
+from src.core.tools.storage import load_collection_index, load_band_metadata_within_deadline
 
 
 class AdvancedSearchAlbumsHandler(BaseToolHandler):
     """Handler for the advanced_search_albums tool."""
     
+    # Read each call from one consistent collection snapshot
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("advanced_search_albums", "1.0.0")
     
@@ -36,6 +44,8 @@ class AdvancedSearchAlbumsHandler(BaseToolHandler):
         is_local = kwargs.get('is_local')
         track_count_min = kwargs.get('track_count_min')
         track_count_max = kwargs.get('track_count_max')
+        deadline = Deadline(kwargs.get('deadline_ms'))
+        continuation_token = kwargs.get('continuation_token')
         
         from src.models.analytics import AdvancedSearchEngine, AlbumSearchFilters
         from src.models.band import AlbumType
@@ -113,32 +123,57 @@ class AdvancedSearchAlbumsHandler(BaseToolHandler):
         if not collection_index:
             raise ValueError("Collection index not found. Please run scan_music_folders first.")
         
-        # Initialize search engine and perform search
-        search_engine = AdvancedSearchEngine(collection_index, load_band_metadata)
-        search_results = search_engine.search_albums(search_filters)
+        # Load band metadata from where a previous partial search stopped,
+        # as far as the deadline allows
+        band_names = [band_entry.name for band_entry in collection_index.bands]
+        search_params = search_filters.model_dump(mode='json')
+        version = index_version(collection_index)
+        start = (parse_continuation_token(continuation_token, self.handler_name, search_params, version)
+                 if continuation_token else 0)
+        band_metadata, next_offset = load_band_metadata_within_deadline(band_names, deadline, start)
+        complete = next_offset >= len(band_names)
+        
+        # Perform search
+        search_results = AdvancedSearchEngine.search_albums(band_metadata, search_filters)
+        results = {
+            band_name: [album.model_dump(mode='json') for album in albums]
+            for band_name, albums in search_results.items()
+        }
         
         # Count total matching albums
-        total_matching_albums = sum(len(albums) for albums in search_results.results.values())
+        total_matching_albums = sum(len(albums) for albums in results.values())
+        message = f"Found {total_matching_albums} albums across {len(results)} bands"
         
         # Build comprehensive response
-        return {
+        response = {
             'status': 'success',
-            'message': f"Found {total_matching_albums} albums across {search_results.total_matching_bands} bands",
-            'results': search_results.results,
-            'filters_applied': search_results.filters_applied,
+            'message': message,
+            'complete': complete,
+            'results': results,
+            'filters_applied': {k: v for k, v in search_params.items() if v is not None},
             'total_matching_albums': total_matching_albums,
-            'total_matching_bands': search_results.total_matching_bands,
-            'search_statistics': search_results.search_statistics,
+            'total_matching_bands': len(results),
+            'search_statistics': {
+                'bands_searched': len(band_metadata),
+                'bands_examined': next_offset - start,
+                'total_bands': len(band_names)
+            },
             'tool_info': self._create_tool_info(
                 parameters_used={k: v for k, v in kwargs.items() if v is not None}
             )
         }
+        if not complete:
+            response['continuation_token'] = make_continuation_token(
+                self.handler_name, next_offset, search_params, version)
+            response['message'] = (f"{message} - partial result: deadline reached after {next_offset} of "
+                                   f"{len(band_names)} bands; pass continuation_token for the rest")
+        return response
 
 
 # Create handler instance
 _handler = AdvancedSearchAlbumsHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def advanced_search_albums_tool(
     album_types: Optional[str] = None,
     year_min: Optional[int] = None,
@@ -152,7 +187,9 @@ def advanced_search_albums_tool(
     max_rating: Optional[int] = None,
     is_local: Optional[bool] = None,
     track_count_min: Optional[int] = None,
-    track_count_max: Optional[int] = None
+    track_count_max: Optional[int] = None,
+    deadline_ms: Optional[int] = None,
+    continuation_token: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Perform advanced search across all albums with comprehensive filtering options.
@@ -234,6 +271,15 @@ def advanced_search_albums_tool(
         - track_count_max=6 - Albums with 6 or fewer tracks (EPs/Singles)
         - track_count_min=8, track_count_max=12 - Albums with 8-12 tracks
     
+    deadline_ms (int, optional):
+        Time budget in milliseconds for loading band metadata. When it runs out,
+        the results cover the bands searched so far, complete is false and
+        continuation_token is returned
+        
+    continuation_token (str, optional):
+        Token from a partial result; repeat the search with the same filters and
+        this token to search the remaining bands
+    
     USAGE EXAMPLES:
     
     1. Find all EPs from the 1980s:
@@ -291,7 +337,9 @@ def advanced_search_albums_tool(
         - filters_applied: Summary of filters used in the search
         - total_matching_albums: Total number of albums found across all bands
         - total_matching_bands: Number of bands that had matching albums
-        - search_statistics: Detailed statistics about search performance and results
+        - search_statistics: Bands searched and examined out of the total
+        - complete: False if the deadline cut the search short; continuation_token
+          then searches the remaining bands
         - tool_info: Metadata about the tool execution
     """
     return _handler.execute(
@@ -307,5 +355,7 @@ def advanced_search_albums_tool(
         max_rating=max_rating,
         is_local=is_local,
         track_count_min=track_count_min,
-        track_count_max=track_count_max
+        track_count_max=track_count_max,
+        deadline_ms=deadline_ms,
+        continuation_token=continuation_token
     ) 
\ No newline at end of file
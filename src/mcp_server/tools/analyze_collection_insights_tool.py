@@ -6,13 +6,14 @@ This module contains the analyze_collection_insights_tool implementation.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 # Import required modules and functions
-from src.core.tools.storage import load_collection_index, load_band_metadata
+from src.core.tools.deadline import Deadline
+from src.core.tools.performance import track_operation
+from src.core.tools.storage import load_collection_index, load_band_metadata_within_deadline
 from src.models.analytics import CollectionAnalyzer
 
 # Configure logging
@@ -22,32 +23,35 @@ logger = logging.getLogger(__name__)
 class AnalyzeCollectionInsightsHandler(BaseToolHandler):
     """Handler for the analyze_collection_insights tool."""
     
+    # Concurrent identical calls share one pass over all band metadata,
+    # read from one consistent collection snapshot
+    coalesce_requests = True
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("analyze_collection_insights", "1.0.0")
     
     def _execute_tool(self, **kwargs) -> Dict[str, Any]:
         """Execute the analyze collection insights tool logic."""
+        deadline = Deadline(kwargs.get('deadline_ms'))
+        
         # Load collection index and band metadata
         collection_index = load_collection_index()
         if not collection_index:
             raise ValueError("Collection index not found. Please run scan_music_folders first.")
         
-        band_metadata = {}
-        
-        # Load metadata for all bands
-        for band_entry in collection_index.bands:
-            try:
-                metadata = load_band_metadata(band_entry.name)
-                if metadata:
-                    band_metadata[band_entry.name] = metadata
-            except Exception as e:
-                logger.warning(f"Could not load metadata for band {band_entry.name}: {str(e)}")
+        # Load metadata for all bands, or as many as the deadline allows
+        band_names = [band_entry.name for band_entry in collection_index.bands]
+        band_metadata, bands_loaded = load_band_metadata_within_deadline(band_names, deadline)
+        complete = bands_loaded >= len(band_names)
         
         if not band_metadata:
             raise ValueError('No band metadata available for analysis. Try scanning your collection first.')
         
         # Perform comprehensive analysis
-        insights = CollectionAnalyzer.analyze_collection(collection_index, band_metadata)
+        with track_operation("analyze_collection", bands=len(band_metadata)) as metrics:
+            insights = CollectionAnalyzer.analyze_collection(collection_index, band_metadata)
+            metrics.items_processed = len(band_metadata)
         
         # Create summary sections for easy consumption
         health_summary = {
@@ -82,6 +86,7 @@ class AnalyzeCollectionInsightsHandler(BaseToolHandler):
         
         return {
             'status': 'success',
+            'complete': complete,
             'insights': insights_dict,
             'collection_maturity': insights.collection_maturity,
             'health_summary': health_summary,
@@ -94,7 +99,9 @@ class AnalyzeCollectionInsightsHandler(BaseToolHandler):
                     for metadata in band_metadata.values()
                 ),
                 'analysis_timestamp': insights.generated_at,
-                'collection_scan_date': collection_index.last_scan
+                'collection_scan_date': collection_index.last_scan,
+                'bands_examined': bands_loaded,
+                'total_bands': len(band_names)
             },
             'tool_info': self._create_tool_info(
                 analysis_features=[
@@ -113,13 +120,16 @@ class AnalyzeCollectionInsightsHandler(BaseToolHandler):
 # Create handler instance
 _handler = AnalyzeCollectionInsightsHandler()
 
-@mcp.tool()
-def analyze_collection_insights_tool() -> Dict[str, Any]:
+@_handler.register_tool()
+def analyze_collection_insights_tool(async_mode: bool = False, deadline_ms: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate comprehensive collection analytics and insights.
     
     This tool performs deep analysis of your entire music collection and provides actionable insights.
     No parameters needed - it analyzes your complete collection automatically.
+    On large collections pass async_mode=True to run the analysis as a
+    background job: the tool returns a job_id at once, and the insights are
+    fetched with get_job_result.
     
     WHAT THIS TOOL ANALYZES:
     
@@ -187,6 +197,11 @@ def analyze_collection_insights_tool() -> Dict[str, Any]:
     - To understand your music preferences and patterns
     - Before planning music purchases or acquisitions
     
+    Args:
+        async_mode: Run as a background job and return its job_id immediately
+        deadline_ms: Time budget in milliseconds; when loading band metadata runs out of
+            time, the insights cover only the bands loaded so far (complete=false)
+    
     Returns:
         Dict containing comprehensive collection insights:
         - status: 'success' or 'error' 
@@ -196,5 +211,9 @@ def analyze_collection_insights_tool() -> Dict[str, Any]:
         - type_analysis_summary: Album type distribution vs ideal ratios
         - recommendations_summary: Top recommendations by category with counts
         - analytics_metadata: Analysis details (bands analyzed, timestamp, etc.)
+        - complete: False if the deadline cut loading short (bands_examined of total_bands
+          in analytics_metadata)
     """
-    return _handler.execute() 
\ No newline at end of file
+    if async_mode:
+        return _handler.submit_job(deadline_ms=deadline_ms)
+    return _handler.execute(deadline_ms=deadline_ms) 
\ No newline at end of file
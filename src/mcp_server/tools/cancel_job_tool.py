@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Cancel Job Tool
+
+This module contains the cancel_job tool implementation.
+"""
+
+from typing import Any, Dict
+
+from ..base_handlers import BaseToolHandler
+from ..jobs import get_job_manager
+
+
+class CancelJobHandler(BaseToolHandler):
+    """Handler for the cancel_job tool."""
+
+    def __init__(self):
+        super().__init__("cancel_job", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Dict[str, Any]:
+        """Execute the cancel job tool logic."""
+        job_id = kwargs.get('job_id')
+        if not job_id:
+            raise ValueError("job_id is required")
+
+        job = get_job_manager().cancel(job_id)
+        if job is None:
+            raise ValueError(f"Unknown or expired job: {job_id}")
+
+        return {
+            'job': job.to_dict(),
+            'cancelled': job.cancel_requested,
+            'tool_info': self._create_tool_info(parameters_used={'job_id': job_id})
+        }
+
+
+# Create handler instance
+_handler = CancelJobHandler()
+
+@_handler.register_tool()
+def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a background job started with async_mode=True.
+
+    Queued jobs are cancelled at once. A running scan stops before its next
+    band (the next scan resumes from its checkpoint); other running jobs
+    finish, but their result is discarded. Cancelling a finished job has no
+    effect.
+
+    Args:
+        job_id: job_id returned when the job was started
+
+    Returns:
+        Dict containing:
+        - status: 'success' or 'error'
+        - job: Job state after the request ('cancelled', or 'running' until it stops)
+        - cancelled: True if cancellation was requested
+    """
+    return _handler.execute(job_id=job_id)
@@ -8,16 +8,17 @@ MCP Tool: Generates a CSS file (_index.css) for the web navigator, themed by gen
 - Assigns unique, deterministic colors per genre
 - Writes base styles for backgrounds, text, highlights, badges
 - Overwrites file if force=True, else errors if file exists
+- Writes next to .collection_index.json (the metadata store root when METADATA_STORE_PATH is set)
 - Usage: python -m src.mcp_server.tools.generate_collection_theme_css_tool --output _index.css --force
 
 Auto-generated file: Do not edit _index.css manually. Regenerate using this tool.
 """
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 import os
 from datetime import datetime
 from typing import Dict, Any, Optional
+from src.core.tools.metadata_store import MetadataStore
 from src.core.tools.storage import load_collection_index
 from src.di import get_config
 
@@ -86,14 +87,17 @@ def assign_genre_colors(genres: list) -> Dict[str, str]:
 
 class GenerateCollectionThemeCSSHandler(BaseToolHandler):
     """Handler for the generate_collection_theme_css MCP tool."""
+    
+    # Read each call from one consistent collection snapshot
+    isolated_reads = True
     def __init__(self):
         super().__init__("generate_collection_theme_css", "1.0.0")
 
     def _execute_tool(self, output_path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
         config = get_config()
-        music_root = os.path.abspath(config.MUSIC_ROOT_PATH)
+        metadata_root = os.path.abspath(MetadataStore.from_config(config).metadata_root)
         output_path = output_path or DEFAULT_OUTPUT
-        output_file = os.path.join(music_root, output_path)
+        output_file = os.path.join(metadata_root, output_path)
         response = {
             'status': 'success',
             'message': '',
@@ -135,6 +139,7 @@ class GenerateCollectionThemeCSSHandler(BaseToolHandler):
             genre_vars=genre_vars,
             genre_badges=genre_badges
         )
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(css)
         response['file_operations']['overwritten'] = True
@@ -150,7 +155,7 @@ class GenerateCollectionThemeCSSHandler(BaseToolHandler):
 
 _handler = GenerateCollectionThemeCSSHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def generate_collection_theme_css_tool(
     output_path: str = DEFAULT_OUTPUT,
     force: bool = False
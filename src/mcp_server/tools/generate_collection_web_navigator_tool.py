@@ -6,16 +6,23 @@ MCP Tool: Generates a self-contained _index.html file for web-based navigation o
 - Embeds all JavaScript logic for dynamic data loading, rendering, and navigation
 - Includes minimal inline CSS fallback
 - CLI parameters: output path, CSS path, force overwrite
+- Writes next to .collection_index.json (the metadata store root when METADATA_STORE_PATH is set)
+  and embeds the location of each band's metadata file relative to the page
+- Refuses gzip/zlib METADATA_STORAGE_FORMAT: the browser fetches the metadata files as plain JSON
 - Usage: python -m src.mcp_server.tools.generate_collection_web_navigator_tool --output _index.html --css _index.css --force
 
 Auto-generated file: Do not edit _index.html manually. Regenerate using this tool.
 """
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
+from src.core.tools.json_codec import STORAGE_FORMAT_GZIP, STORAGE_FORMAT_ZLIB, storage_format_from_config
+from src.core.tools.metadata_store import MetadataStore
+from src.core.tools.storage import load_collection_index
 from src.di import get_config
 
+import json
 import os
+from urllib.parse import quote
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -63,7 +70,9 @@ HTML_TEMPLATE = """<!-- AUTO-GENERATED FILE: DO NOT EDIT DIRECTLY -->
   <script>
 // JS logic for dynamic data loading, rendering, navigation
 const COLLECTION_INDEX = '.collection_index.json';
-const BAND_METADATA_SUFFIX = '.band_metadata.json';
+const BAND_METADATA_FILE = '.band_metadata.json';
+// Band metadata locations relative to this page (the metadata store does not mirror folder names)
+const BAND_METADATA_PATHS = {band_metadata_paths};
 const CSS_PATH = '{css_path}';
 
 let state = {{{{
@@ -156,12 +165,16 @@ function renderBandDetails() {{{{
   `;
 }}}}
 
+function bandMetadataPath(bandName) {{
+  return BAND_METADATA_PATHS[bandName] || encodeURIComponent(bandName) + '/' + BAND_METADATA_FILE;
+}}
+
 function selectBand(bandName) {{{{
   state.currentView = 'band';
   state.selectedBand = bandName;
   state.selectedAlbum = null;
   showLoading('Loading band...');
-  fetchJSON(bandName + BAND_METADATA_SUFFIX, data => {{{{
+  fetchJSON(bandMetadataPath(bandName), data => {{{{
     state.bandData = data;
     renderBandDetails();
     window.location.hash = 'band=' + encodeURIComponent(bandName);
@@ -214,6 +227,19 @@ fetchJSON(COLLECTION_INDEX, data => {{{{
 </html>
 """
 
+def _band_metadata_paths(store: MetadataStore) -> Dict[str, str]:
+    """Map band names from the collection index to their metadata file URL relative to the page."""
+    try:
+        index = load_collection_index()
+    except Exception:
+        index = None
+    if not index:
+        return {}
+    return {
+        band.name: quote(store.band_metadata_file(band.name).relative_to(store.metadata_root).as_posix())
+        for band in index.bands
+    }
+
 class GenerateCollectionWebNavigatorHandler(BaseToolHandler):
     """Handler for the generate_collection_web_navigator MCP tool."""
     def __init__(self):
@@ -221,11 +247,12 @@ class GenerateCollectionWebNavigatorHandler(BaseToolHandler):
 
     def _execute_tool(self, output_path: Optional[str] = None, css_path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
         config = get_config()
-        music_root = os.path.abspath(config.MUSIC_ROOT_PATH)
+        store = MetadataStore.from_config(config)
+        metadata_root = os.path.abspath(store.metadata_root)
         output_path = output_path or DEFAULT_OUTPUT
         css_path = css_path or DEFAULT_CSS
-        output_file = os.path.join(music_root, output_path)
-        css_file = os.path.join(music_root, css_path)
+        output_file = os.path.join(metadata_root, output_path)
+        css_file = os.path.join(metadata_root, css_path)
         response = {
             'status': 'success',
             'message': '',
@@ -242,11 +269,25 @@ class GenerateCollectionWebNavigatorHandler(BaseToolHandler):
                 'parameters_used': {'output_path': output_path, 'css_path': css_path, 'force': force}
             }
         }
+        storage_format = storage_format_from_config(config)
+        if storage_format in (STORAGE_FORMAT_GZIP, STORAGE_FORMAT_ZLIB):
+            response['status'] = 'error'
+            response['message'] = (
+                f"METADATA_STORAGE_FORMAT={storage_format} is not supported by the web navigator, "
+                "which reads metadata files as plain JSON. Use 'pretty' or 'compact'."
+            )
+            return response
         if os.path.exists(output_file) and not force:
             response['status'] = 'error'
             response['message'] = f"{output_file} exists. Use force=True to overwrite."
             return response
-        html = HTML_TEMPLATE.format(date=datetime.now().isoformat(timespec='seconds'), css_path=css_path)
+        band_metadata_paths = json.dumps(_band_metadata_paths(store)).replace('</', '<\\/')
+        html = HTML_TEMPLATE.format(
+            date=datetime.now().isoformat(timespec='seconds'),
+            css_path=css_path,
+            band_metadata_paths=band_metadata_paths
+        )
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html)
         response['file_operations']['overwritten'] = True
@@ -267,7 +308,7 @@ class GenerateCollectionWebNavigatorHandler(BaseToolHandler):
 
 _handler = GenerateCollectionWebNavigatorHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def generate_collection_web_navigator_tool(
     output_path: str = DEFAULT_OUTPUT,
     css_path: str = DEFAULT_CSS,
@@ -7,7 +7,6 @@ This module contains the get_band_list_tool implementation.
 
 from typing import Any, Dict, Optional
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler, validate_pagination_params, validate_sort_params
 
 # Import tool implementation - using absolute imports
@@ -17,6 +16,9 @@ from src.core.tools.storage import get_band_list
 class GetBandListHandler(BaseToolHandler):
     """Handler for the get_band_list tool."""
     
+    # Read each call from one consistent collection snapshot
+    isolated_reads = True
+    
     def __init__(self):
         super().__init__("get_band_list", "1.1.0")
     
@@ -33,6 +35,8 @@ class GetBandListHandler(BaseToolHandler):
         page_size = kwargs.get('page_size', 50)
         include_albums = kwargs.get('include_albums', False)
         album_details_filter = kwargs.get('album_details_filter')
+        deadline_ms = kwargs.get('deadline_ms')
+        continuation_token = kwargs.get('continuation_token')
         
         # Validate pagination parameters
         pagination_error = validate_pagination_params(page, page_size)
@@ -56,7 +60,9 @@ class GetBandListHandler(BaseToolHandler):
             page=page,
             page_size=page_size,
             include_albums=include_albums,
-            album_details_filter=album_details_filter
+            album_details_filter=album_details_filter,
+            deadline_ms=deadline_ms,
+            continuation_token=continuation_token
         )
         
         # Add tool-specific metadata
@@ -72,7 +78,9 @@ class GetBandListHandler(BaseToolHandler):
                     'page': page,
                     'page_size': page_size,
                     'include_albums': include_albums,
-                    'album_details_filter': album_details_filter
+                    'album_details_filter': album_details_filter,
+                    'deadline_ms': deadline_ms,
+                    'continuation_token': continuation_token
                 }
             )
             result['album_details_filter'] = album_details_filter
@@ -83,7 +91,7 @@ class GetBandListHandler(BaseToolHandler):
 # Create handler instance
 _handler = GetBandListHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def get_band_list_tool(
     search_query: Optional[str] = None,
     filter_genre: Optional[str] = None,
@@ -94,7 +102,9 @@ def get_band_list_tool(
     page: int = 1,
     page_size: int = 50,
     include_albums: bool = False,
-    album_details_filter: Optional[str] = None  # 'local', 'missing', or None
+    album_details_filter: Optional[str] = None,  # 'local', 'missing', or None
+    deadline_ms: Optional[int] = None,
+    continuation_token: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get a list of all discovered bands with enhanced filtering, sorting, and pagination.
@@ -119,6 +129,9 @@ def get_band_list_tool(
         page_size: Number of results per page (1-100)
         include_albums: If True, include detailed album information for each band
         album_details_filter: If 'local', only include local albums in album details; if 'missing', only missing albums; None for all
+        deadline_ms: Time budget in milliseconds; when filters that read band metadata
+            (genre, album names) run out of time, a partial result is returned
+        continuation_token: Token from a partial result, to continue filtering where it stopped
     
     Returns:
         Dict containing filtered and paginated band list with metadata including:
@@ -129,6 +142,8 @@ def get_band_list_tool(
         - filters_applied: Summary of filters that were applied
         - sort: Information about the applied sorting
         - album_details_filter: Album details filter applied
+        - complete: False if the deadline cut filtering short; continuation_token then
+          continues with the bands not examined yet
     """
     return _handler.execute(
         search_query=search_query,
@@ -140,5 +155,7 @@ def get_band_list_tool(
         page=page,
         page_size=page_size,
         include_albums=include_albums,
-        album_details_filter=album_details_filter
+        album_details_filter=album_details_filter,
+        deadline_ms=deadline_ms,
+        continuation_token=continuation_token
     ) 
\ No newline at end of file
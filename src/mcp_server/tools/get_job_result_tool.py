@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Get Job Result Tool
+
+This module contains the get_job_result tool implementation.
+"""
+
+from typing import Any, Dict
+
+from ..base_handlers import BaseToolHandler
+from ..jobs import JOB_SUCCEEDED, get_job_manager
+
+
+class GetJobResultHandler(BaseToolHandler):
+    """Handler for the get_job_result tool."""
+
+    def __init__(self):
+        super().__init__("get_job_result", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Dict[str, Any]:
+        """Execute the get job result tool logic."""
+        job_id = kwargs.get('job_id')
+        if not job_id:
+            raise ValueError("job_id is required")
+
+        job = get_job_manager().get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown or expired job: {job_id}")
+
+        return {
+            'job': job.to_dict(),
+            'completed': job.finished,
+            # The response the tool would have returned if run synchronously
+            'result': job.result if job.finished else None,
+            'message': (None if job.status == JOB_SUCCEEDED
+                        else f"Job is {job.status}" + ("" if job.finished else "; try again later")),
+            'tool_info': self._create_tool_info(parameters_used={'job_id': job_id})
+        }
+
+
+# Create handler instance
+_handler = GetJobResultHandler()
+
+@_handler.register_tool()
+def get_job_result(job_id: str) -> Dict[str, Any]:
+    """
+    Get the outcome of a background job started with async_mode=True.
+
+    Args:
+        job_id: job_id returned when the job was started
+
+    Returns:
+        Dict containing:
+        - status: 'success' or 'error' (of this call, not of the job)
+        - completed: True if the job has finished
+        - result: The response of the tool that ran as the job, once finished
+        - job: Job state, timestamps and error (if the job failed)
+    """
+    return _handler.execute(job_id=job_id)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Get Job Status Tool
+
+This module contains the get_job_status tool implementation.
+"""
+
+from typing import Any, Dict, Optional
+
+from ..base_handlers import BaseToolHandler
+from ..jobs import get_job_manager
+
+
+class GetJobStatusHandler(BaseToolHandler):
+    """Handler for the get_job_status tool."""
+
+    def __init__(self):
+        super().__init__("get_job_status", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Dict[str, Any]:
+        """Execute the get job status tool logic."""
+        job_id = kwargs.get('job_id')
+        manager = get_job_manager()
+
+        if job_id is None:
+            # No job given: list the known jobs, newest first
+            return {
+                'jobs': [job.to_dict() for job in manager.list_jobs()],
+                'job_stats': manager.get_stats(),
+                'tool_info': self._create_tool_info(parameters_used={'job_id': None})
+            }
+
+        job = manager.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown or expired job: {job_id}")
+
+        job_info = job.to_dict()
+        job_info['queue_position'] = manager.queue_position(job)
+        return {
+            'job': job_info,
+            'result_available': job.finished,
+            'tool_info': self._create_tool_info(parameters_used={'job_id': job_id})
+        }
+
+
+# Create handler instance
+_handler = GetJobStatusHandler()
+
+@_handler.register_tool()
+def get_job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Check the state of a background job started with async_mode=True.
+
+    Args:
+        job_id: job_id returned when the job was started (omit to list all recent jobs)
+
+    Returns:
+        Dict containing:
+        - status: 'success' or 'error'
+        - job: Job state ('queued', 'running', 'succeeded', 'failed' or
+          'cancelled'), queue position, timestamps, queue wait and run time
+        - result_available: True once get_job_result can return the outcome
+        - jobs/job_stats: All recent jobs and counts per state (without job_id)
+    """
+    return _handler.execute(job_id=job_id)
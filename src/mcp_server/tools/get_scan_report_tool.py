@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Get Scan Report Tool
+
+This module contains the get_scan_report_tool implementation.
+"""
+
+from typing import Any, Dict, Optional
+
+from ..base_handlers import BaseToolHandler, validate_pagination_params
+
+# Import tool implementation - using absolute imports
+from src.core.tools.scanner import get_scan_report
+
+
+class GetScanReportHandler(BaseToolHandler):
+    """Handler for the get_scan_report tool."""
+
+    def __init__(self):
+        super().__init__("get_scan_report", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Dict[str, Any]:
+        """Execute the get scan report tool logic."""
+        report_path = kwargs.get('report_path')
+        page = kwargs.get('page', 1)
+        page_size = kwargs.get('page_size', 50)
+        record_type = kwargs.get('record_type')
+
+        # Validate pagination parameters
+        pagination_error = validate_pagination_params(page, page_size)
+        if pagination_error:
+            raise ValueError(pagination_error)
+
+        result = get_scan_report(
+            report_path=report_path,
+            page=page,
+            page_size=page_size,
+            record_type=record_type
+        )
+
+        # Add tool-specific metadata
+        result['tool_info'] = self._create_tool_info(
+            parameters_used={
+                'report_path': report_path,
+                'page': page,
+                'page_size': page_size,
+                'record_type': record_type
+            }
+        )
+
+        return result
+
+
+# Create handler instance
+_handler = GetScanReportHandler()
+
+@_handler.register_tool()
+def get_scan_report_tool(
+    report_path: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 50,
+    record_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Page through the detailed results of a collection scan.
+
+    scan_music_folders only returns a summary; the full per-band results
+    (albums, folder structure, compliance), every detected change and every
+    error are written to a scan report that this tool reads page by page.
+
+    Args:
+        report_path: report_path returned by scan_music_folders (latest scan if omitted)
+        page: Page number for pagination (starts at 1)
+        page_size: Number of records per page (1-100)
+        record_type: Only return 'band', 'change', 'error' or 'summary' records
+
+    Returns:
+        Dict containing:
+        - status: 'success' or 'error'
+        - records: Report records of the requested page
+        - pagination: Page information with total counts and navigation info
+        - summary: Scan summary statistics
+        - report_path: Path of the report that was read
+    """
+    return _handler.execute(
+        report_path=report_path,
+        page=page,
+        page_size=page_size,
+        record_type=record_type
+    )
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Music Collection MCP Server - Get Server Metrics Tool
+
+This module contains the get_server_metrics tool implementation.
+"""
+
+from typing import Any, Dict
+
+from ..base_handlers import BaseToolHandler
+from ..metrics import format_prometheus, get_metrics_registry
+
+METRICS_FORMATS = ('json', 'prometheus')
+
+
+class GetServerMetricsHandler(BaseToolHandler):
+    """Handler for the get_server_metrics tool."""
+
+    def __init__(self):
+        super().__init__("get_server_metrics", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Dict[str, Any]:
+        """Execute the get server metrics tool logic."""
+        metrics_format = kwargs.get('format', 'json')
+        if metrics_format not in METRICS_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(METRICS_FORMATS)}")
+
+        snapshot = get_metrics_registry().get_snapshot()
+        result = {'metrics': snapshot}
+        if metrics_format == 'prometheus':
+            result['prometheus'] = format_prometheus(snapshot)
+        result['tool_info'] = self._create_tool_info(parameters_used={'format': metrics_format})
+        return result
+
+
+# Create handler instance
+_handler = GetServerMetricsHandler()
+
+@_handler.register_tool()
+def get_server_metrics(format: str = "json") -> Dict[str, Any]:
+    """
+    Get latency, error and throughput metrics of every tool and resource.
+
+    Args:
+        format: 'json' for the metrics only, 'prometheus' to also get them in
+            the Prometheus text exposition format
+
+    Returns:
+        Dict containing:
+        - status: 'success' or 'error'
+        - metrics: Per-handler calls, errors, latency and queue time
+          percentiles (p50/p95/p99), payload bytes and calls in flight, plus
+          concurrency, coalescing, snapshot and background job statistics
+        - prometheus: Exposition text (format='prometheus' only)
+    """
+    return _handler.execute(format=format)
@@ -8,8 +8,8 @@ band folder organization patterns between different structure types.
 
 from typing import Any, Dict, List, Optional
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
+from ..jobs import JOB_PRIORITY_LOW
 
 # Import migration functionality
 from src.models.migration import (
@@ -26,6 +26,10 @@ logger = logging.getLogger(__name__)
 class MigrateBandStructureHandler(BaseToolHandler):
     """Handler for the migrate_band_structure tool."""
     
+    job_priority = JOB_PRIORITY_LOW
+    # Migrations move folders around; never run two at once
+    max_concurrency = 1
+    
     def __init__(self):
         super().__init__("migrate_band_structure", "1.0.0")
     
@@ -209,7 +213,7 @@ class MigrateBandStructureHandler(BaseToolHandler):
 # Create handler instance
 _handler = MigrateBandStructureHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def migrate_band_structure(
     band_name: str,
     migration_type: str,
@@ -217,7 +221,8 @@ def migrate_band_structure(
     album_type_overrides: Optional[Dict[str, str]] = None,
     backup_original: bool = True,
     force: bool = False,
-    exclude_albums: Optional[List[str]] = None
+    exclude_albums: Optional[List[str]] = None,
+    async_mode: bool = False
 ) -> Dict[str, Any]:
     """
     Migrate a band's folder structure between different organization patterns.
@@ -244,6 +249,8 @@ def migrate_band_structure(
         backup_original: Whether to create backup before migration (recommended: True)
         force: Override safety checks and validation warnings
         exclude_albums: List of album names to skip during migration
+        async_mode: Run as a background job and return its job_id immediately
+            (see get_job_status, get_job_result and cancel_job)
     
     Returns:
         Dict containing migration results including:
@@ -274,7 +281,8 @@ def migrate_band_structure(
             exclude_albums=["Work in Progress Demo"]
         )
     """
-    return _handler.execute(
+    run = _handler.submit_job if async_mode else _handler.execute
+    return run(
         band_name=band_name,
         migration_type=migration_type,
         dry_run=dry_run,
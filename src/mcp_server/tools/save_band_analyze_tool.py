@@ -8,7 +8,6 @@ This module contains the save_band_analyze_tool implementation.
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 # Import tool implementation - using absolute imports
@@ -305,7 +304,7 @@ class SaveBandAnalyzeHandler(BaseToolHandler):
 # Create handler instance
 _handler = SaveBandAnalyzeHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def save_band_analyze_tool(
     band_name: str,    
     analysis: Dict[str, Any]
@@ -8,7 +8,6 @@ This module contains the save_band_metadata_tool implementation.
 from typing import Any, Dict
 from datetime import datetime, timezone
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 # Import tool implementation - using absolute imports
@@ -321,7 +320,7 @@ class SaveBandMetadataHandler(BaseToolHandler):
 # Create handler instance
 _handler = SaveBandMetadataHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def save_band_metadata_tool(
     band_name: str,
     metadata: Dict[str, Any]
@@ -8,7 +8,6 @@ This module contains the save_collection_insight_tool implementation.
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 # Import tool implementation - using absolute imports
@@ -272,7 +271,7 @@ class SaveCollectionInsightHandler(BaseToolHandler):
 # Create handler instance
 _handler = SaveCollectionInsightHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def save_collection_insight_tool(
     insights: Dict[str, Any]
 ) -> Dict[str, Any]:
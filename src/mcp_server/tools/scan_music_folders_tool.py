@@ -5,32 +5,52 @@ Music Collection MCP Server - Scan Music Folders Tool
 This module contains the scan_music_folders tool implementation.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
+from ..jobs import JOB_PRIORITY_LOW, current_job
 
 # Import tool implementation - using absolute imports
 from src.core.tools.scanner import scan_music_folders as scanner_scan_music_folders
+from src.core.tools.watcher import get_watch_status
 
 
 class ScanMusicFoldersHandler(BaseToolHandler):
     """Handler for the scan_music_folders tool."""
     
+    job_priority = JOB_PRIORITY_LOW
+    # Scans hold the collection index lock; a second one would only wait for it
+    max_concurrency = 1
+    
     def __init__(self):
-        super().__init__("scan_music_folders", "3.0.0")
+        super().__init__("scan_music_folders", "3.4.0")
     
     def _execute_tool(self, **kwargs) -> Dict[str, Any]:
         """Execute the scan music folders tool logic."""
-        # Call the scanner to perform comprehensive change detection
-        # Reason: Always perform full scan to detect all types of changes
-        result = scanner_scan_music_folders()
+        band_names = kwargs.get('band_names')
+        path_glob = kwargs.get('path_glob')
+        scoped = band_names is not None or path_glob is not None
+        
+        # A background scan stops between bands when its job is cancelled
+        job = current_job()
+        should_cancel = (lambda: job.cancel_requested) if job is not None else None
+        
+        # Call the scanner to perform change detection over the whole
+        # collection, or only over the requested bands
+        result = scanner_scan_music_folders(band_names=band_names, path_glob=path_glob,
+                                            should_cancel=should_cancel)
         
         # Add tool-specific metadata
         if result.get('status') == 'success':
             result['tool_info'] = self._create_tool_info(
-                scan_mode='comprehensive_change_detection',
-                change_detection='enabled'
+                scan_mode='scoped_change_detection' if scoped else 'comprehensive_change_detection',
+                change_detection='enabled',
+                parameters_used={
+                    'band_names': band_names,
+                    'path_glob': path_glob
+                },
+                resume_mode=result['results']['resume']['mode'],
+                watch_mode=get_watch_status()
             )
         
         return result
@@ -39,8 +59,12 @@ class ScanMusicFoldersHandler(BaseToolHandler):
 # Create handler instance
 _handler = ScanMusicFoldersHandler()
 
-@mcp.tool()
-def scan_music_folders() -> Dict[str, Any]:
+@_handler.register_tool()
+def scan_music_folders(
+    band_names: Optional[List[str]] = None,
+    path_glob: Optional[str] = None,
+    async_mode: bool = False
+) -> Dict[str, Any]:
     """
     Scan the music directory structure to discover bands and albums, detecting all changes.
     
@@ -52,14 +76,41 @@ def scan_music_folders() -> Dict[str, Any]:
     - Preserves existing metadata and analysis data during scanning
     - Optimized for performance while ensuring complete change detection
     
+    Pass band_names and/or path_glob to rescan only part of the collection,
+    e.g. after adding an album: only those bands' index entries are updated
+    and only they can be detected as removed.
+    
+    Per-band details are not returned inline: they are written to a scan
+    report that can be paged through with get_scan_report_tool.
+    
+    Long scans are checkpointed. If a scan was interrupted (restart, client
+    timeout), calling the tool again with the same parameters resumes it;
+    results.resume shows 'resumed' or 'fresh' and time_saved_seconds.
+    
+    On large collections use async_mode=True: the scan runs as a background
+    job and the tool returns a job_id at once. Poll get_job_status, fetch the
+    scan result with get_job_result, or stop it with cancel_job (a cancelled
+    scan resumes from its checkpoint next time).
+    
+    Args:
+        band_names: Only scan these band folders (names as in the music root)
+        path_glob: Only scan band folders matching this pattern, e.g. "Pink*" or "Queen/*"
+        async_mode: Run as a background job and return its job_id immediately
+    
     Returns:
         Dict containing scan results including:
         - status: 'success' or 'error'
-        - results: Dict with scan statistics and detailed change information
+        - results: Dict with scan statistics, a bounded preview of bands,
+          changes and errors, report_path of the full scan report,
+          resume (mode, bands_restored, time_saved_seconds) and
+          cost_breakdown (seconds per phase, file system and metadata work,
+          and the 20 slowest bands)
         - collection_path: Path to the scanned music collection
         - changes_made: True if any changes were detected and saved
         - bands_added: Number of new bands discovered
         - bands_removed: Number of bands no longer found
         - albums_changed: Number of bands with album structure changes
     """
-    return _handler.execute() 
\ No newline at end of file
+    if async_mode:
+        return _handler.submit_job(band_names=band_names, path_glob=path_glob)
+    return _handler.execute(band_names=band_names, path_glob=path_glob) 
\ No newline at end of file
@@ -7,7 +7,6 @@ This module contains the validate_band_metadata_tool implementation.
 
 from typing import Any, Dict
 
-from ..mcp_instance import mcp
 from ..base_handlers import BaseToolHandler
 
 class ValidateBandMetadataHandler(BaseToolHandler):
@@ -158,7 +157,7 @@ class ValidateBandMetadataHandler(BaseToolHandler):
 # Create handler instance
 _handler = ValidateBandMetadataHandler()
 
-@mcp.tool()
+@_handler.register_tool()
 def validate_band_metadata_tool(
     band_name: str,
     metadata: Dict[str, Any]
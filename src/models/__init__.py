@@ -15,6 +15,7 @@ from .band import (
     AlbumType,
     BandAnalysis, 
     BandMetadata,
+    BandMetadataSummary,
 )
 
 from .album_parser import (
@@ -42,10 +43,12 @@ from .band_structure import (
     StructureType,
 )
 from .collection import (
+    BandEntryList,
     BandIndexEntry,
     CollectionIndex,
     CollectionInsight,
     CollectionStats,
+    CompactBandEntry,
 )
 from .validation import (
     AlbumDataMigrator,
@@ -79,6 +82,7 @@ from .migration_analytics import (
 
 # Rebuild models to resolve forward references
 BandMetadata.model_rebuild()
+BandMetadataSummary.model_rebuild()
 
 __all__ = [
     # Band models
@@ -87,12 +91,15 @@ __all__ = [
     'AlbumType',
     'BandAnalysis',
     'BandMetadata',
+    'BandMetadataSummary',
     
     # Collection models
+    'BandEntryList',
     'BandIndexEntry',
     'CollectionIndex',
     'CollectionInsight',
     'CollectionStats',
+    'CompactBandEntry',
     
     # Validation utilities
     'AlbumDataMigrator',
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, field_serializer, PrivateAttr
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
@@ -571,4 +571,121 @@ class BandMetadata(BaseModel):
                 self.albums_missing.append(moved_album)
                 self.update_timestamp()
                 return True
-        return False 
\ No newline at end of file
+        return False 
+
+class BandMetadataSummary(BaseModel):
+    """
+    Lightweight view of band metadata for list and filter operations.
+    
+    Only top-level scalar fields and counts are validated; album, analysis
+    and album-level data stay raw. The full BandMetadata is built from the
+    raw data the first time album data is accessed.
+    
+    Attributes:
+        band_name: Name of the band
+        formed: Year band was formed (YYYY format)
+        genres: List of band genres
+        origin: Country/location of origin
+        albums_count: Total number of albums (local + missing)
+        local_albums_count: Number of local albums
+        missing_albums_count: Number of missing albums
+        album_types: Count of local albums per album type
+        last_updated: ISO datetime of last metadata update
+        last_metadata_saved: ISO datetime when metadata was last saved
+        has_analysis: Whether analysis data is present
+        analysis_rate: Overall band rating from the analysis
+        analysis_has_review: Whether the analysis contains a band review
+        albums_analyzed: Number of albums with analysis
+        similar_bands_count: Number of similar bands in the local collection
+        folder_structure: Raw folder structure data (not validated)
+    """
+    band_name: str = Field(..., description="Band name")
+    formed: str = Field(default="", description="Formation year (YYYY)")
+    genres: List[str] = Field(default_factory=list, description="Band genres")
+    origin: str = Field(default="", description="Country/location of origin")
+    albums_count: int = Field(default=0, ge=0, description="Total number of albums (local + missing)")
+    local_albums_count: int = Field(default=0, ge=0, description="Number of local albums")
+    missing_albums_count: int = Field(default=0, ge=0, description="Number of missing albums")
+    album_types: Dict[str, int] = Field(default_factory=dict, description="Local album count per type")
+    last_updated: str = Field(default="", description="Last update timestamp")
+    last_metadata_saved: Optional[str] = Field(default=None, description="Last metadata save timestamp")
+    has_analysis: bool = Field(default=False, description="Whether analysis data is present")
+    analysis_rate: int = Field(default=0, description="Overall band rating")
+    analysis_has_review: bool = Field(default=False, description="Whether the analysis has a band review")
+    albums_analyzed: int = Field(default=0, ge=0, description="Number of analyzed albums")
+    similar_bands_count: int = Field(default=0, ge=0, description="Number of similar bands in the collection")
+    folder_structure: Optional[Dict[str, Any]] = Field(default=None, description="Raw folder structure data")
+
+    _raw: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _metadata: Optional[BandMetadata] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BandMetadataSummary':
+        """
+        Build a summary from raw band metadata as stored on disk.
+        
+        Args:
+            data: Raw metadata dictionary (as loaded from .band_metadata.json)
+            
+        Returns:
+            BandMetadataSummary instance keeping a reference to the raw data
+        """
+        albums = data.get('albums') or []
+        albums_missing = data.get('albums_missing') or []
+        has_analysis = data.get('analyze') is not None
+        analyze = data.get('analyze') or {}
+
+        album_types: Dict[str, int] = {}
+        for album in albums:
+            album_type = (album.get('type') if isinstance(album, dict) else None) or AlbumType.ALBUM.value
+            album_types[album_type] = album_types.get(album_type, 0) + 1
+
+        summary = cls(
+            band_name=data.get('band_name', ''),
+            formed=data.get('formed') or '',
+            genres=data.get('genres') or [],
+            origin=data.get('origin') or '',
+            albums_count=len(albums) + len(albums_missing),
+            local_albums_count=len(albums),
+            missing_albums_count=len(albums_missing),
+            album_types=album_types,
+            last_updated=data.get('last_updated') or '',
+            last_metadata_saved=data.get('last_metadata_saved'),
+            has_analysis=has_analysis,
+            analysis_rate=analyze.get('rate') or 0,
+            analysis_has_review=bool(analyze.get('review')),
+            albums_analyzed=len(analyze.get('albums') or []),
+            similar_bands_count=len(analyze.get('similar_bands') or []),
+            folder_structure=data.get('folder_structure')
+        )
+        summary._raw = data
+        return summary
+
+    def to_band_metadata(self) -> BandMetadata:
+        """
+        Materialize (once) and return the full, validated band metadata.
+        
+        Returns:
+            BandMetadata built from the raw data
+            
+        Raises:
+            ValueError: If the raw data fails full validation
+        """
+        if self._metadata is None:
+            self._metadata = BandMetadata(**self._raw)
+        return self._metadata
+
+    @property
+    def album_names(self) -> List[str]:
+        """Names of local albums, read without building album models."""
+        return [album.get('album_name', '') for album in self._raw.get('albums') or [] if isinstance(album, dict)]
+
+    @property
+    def albums(self) -> List[Album]:
+        """Local albums; materializes the full metadata on first access."""
+        return self.to_band_metadata().albums
+
+    @property
+    def albums_missing(self) -> List[Album]:
+        """Missing albums; materializes the full metadata on first access."""
+        return self.to_band_metadata().albums_missing
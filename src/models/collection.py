@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, field_validator, model_validator
+from pydantic_core import core_schema
+from collections.abc import MutableSequence
+from typing import Iterable, List, Dict, Optional, Any, Union
 from datetime import datetime
 import json
+import sys
 
 
 class BandIndexEntry(BaseModel):
@@ -46,6 +49,148 @@ class BandIndexEntry(BaseModel):
         return self
 
 
+# Attribute layout shared by BandIndexEntry and its compact in-memory form
+_BAND_ENTRY_FIELDS = (
+    'name', 'albums_count', 'local_albums_count', 'folder_path',
+    'missing_albums_count', 'has_metadata', 'has_analysis', 'last_updated'
+)
+
+
+class CompactBandEntry:
+    """
+    Memory-compact in-memory form of a BandIndexEntry.
+    
+    Exposes the same attributes as BandIndexEntry but keeps them in
+    ``__slots__`` with interned band names and folder paths, which makes it
+    several times smaller than the equivalent pydantic model. Values are
+    validated once through BandIndexEntry before a record is created;
+    ``to_entry()`` materializes the pydantic model again when needed.
+    """
+    __slots__ = _BAND_ENTRY_FIELDS
+
+    def __init__(self, name: str, albums_count: int, local_albums_count: int, folder_path: str,
+                 missing_albums_count: int, has_metadata: bool, has_analysis: bool, last_updated: str):
+        self.name = sys.intern(name)
+        self.albums_count = albums_count
+        self.local_albums_count = local_albums_count
+        # Folder paths usually equal the band name, so interning shares the string
+        self.folder_path = sys.intern(folder_path)
+        self.missing_albums_count = missing_albums_count
+        self.has_metadata = has_metadata
+        self.has_analysis = has_analysis
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_entry(cls, entry: Union[BandIndexEntry, 'CompactBandEntry', Dict[str, Any]]) -> 'CompactBandEntry':
+        """
+        Create a compact record from a validated entry or raw dictionary.
+        
+        Args:
+            entry: BandIndexEntry, CompactBandEntry or dict (validated as BandIndexEntry)
+            
+        Returns:
+            CompactBandEntry (the same object if it already is one)
+        """
+        if isinstance(entry, CompactBandEntry):
+            return entry
+        if not isinstance(entry, BandIndexEntry):
+            entry = BandIndexEntry.model_validate(entry)
+        return cls(*(getattr(entry, field) for field in _BAND_ENTRY_FIELDS))
+
+    def to_entry(self) -> BandIndexEntry:
+        """
+        Materialize the pydantic model for this record.
+        
+        Returns:
+            Validated BandIndexEntry with the record's values
+        """
+        return BandIndexEntry(**self.model_dump())
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        """Return the record as a dictionary, matching BandIndexEntry.model_dump()."""
+        return {field: getattr(self, field) for field in _BAND_ENTRY_FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CompactBandEntry, BandIndexEntry)):
+            return all(getattr(self, f) == getattr(other, f) for f in _BAND_ENTRY_FIELDS)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CompactBandEntry({', '.join(f'{f}={getattr(self, f)!r}' for f in _BAND_ENTRY_FIELDS)})"
+
+
+class BandEntryList(MutableSequence):
+    """
+    List of band index entries stored as CompactBandEntry records.
+    
+    Behaves like a list: entries can be appended, replaced and removed as
+    BandIndexEntry models, dictionaries or records, and are converted to
+    records on the way in. Items are returned as records, which can be
+    updated in place just like the models they replace.
+    """
+
+    def __init__(self, entries: Optional[Iterable[Any]] = None):
+        self._records: List[CompactBandEntry] = [CompactBandEntry.from_entry(e) for e in entries or ()]
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        """Validate as a list of BandIndexEntry and serialize back to plain dictionaries."""
+        return core_schema.no_info_wrap_validator_function(
+            cls._validate,
+            handler.generate_schema(List[BandIndexEntry]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: [record.model_dump() for record in value]
+            )
+        )
+
+    @classmethod
+    def _validate(cls, value: Any, handler: Any) -> 'BandEntryList':
+        if isinstance(value, BandEntryList):
+            return cls(value)
+        if isinstance(value, (list, tuple)):
+            # Validate one entry at a time so only one pydantic model is alive at once
+            return cls(CompactBandEntry.from_entry(item) for item in value)
+        return cls(handler(value))
+
+    def __getitem__(self, index):
+        # Slices return plain lists of records, like list.copy()
+        return self._records[index]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            self._records[index] = [CompactBandEntry.from_entry(v) for v in value]
+        else:
+            self._records[index] = CompactBandEntry.from_entry(value)
+
+    def __delitem__(self, index) -> None:
+        del self._records[index]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def insert(self, index: int, value: Any) -> None:
+        self._records.insert(index, CompactBandEntry.from_entry(value))
+
+    def copy(self) -> List[CompactBandEntry]:
+        """Return a shallow copy of the records as a plain list."""
+        return list(self._records)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BandEntryList):
+            return self._records == other._records
+        if isinstance(other, list):
+            return self._records == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BandEntryList({self._records!r})"
+
+
 class CollectionStats(BaseModel):
     """
     Collection statistics and analytics with enhanced album type distribution.
@@ -118,13 +263,13 @@ class CollectionIndex(BaseModel):
     
     Attributes:
         stats: Collection statistics
-        bands: List of band index entries
+        bands: Band index entries (held as compact records, see BandEntryList)
         last_scan: ISO datetime of last collection scan
         insights: Collection insights and recommendations
         metadata_version: Schema version for migration support
     """
     stats: CollectionStats = Field(default_factory=CollectionStats, description="Collection statistics")
-    bands: List[BandIndexEntry] = Field(default_factory=list, description="Band index entries")
+    bands: BandEntryList = Field(default_factory=BandEntryList, description="Band index entries")
     last_scan: str = Field(default_factory=lambda: datetime.now().isoformat(), description="Last scan timestamp")
     insights: Optional[CollectionInsight] = Field(default=None, description="Collection insights")
     metadata_version: str = Field(default="1.0", description="Schema version")
@@ -175,7 +320,7 @@ class CollectionIndex(BaseModel):
             band_entry: BandIndexEntry to add
         """
         # Remove existing entry if present
-        self.bands = [b for b in self.bands if b.name != band_entry.name]
+        self.bands[:] = [b for b in self.bands if b.name != band_entry.name]
         
         # Add new entry
         self.bands.append(band_entry)
@@ -195,7 +340,7 @@ class CollectionIndex(BaseModel):
             True if band was found and removed, False otherwise
         """
         initial_count = len(self.bands)
-        self.bands = [b for b in self.bands if b.name != band_name]
+        self.bands[:] = [b for b in self.bands if b.name != band_name]
         
         if len(self.bands) < initial_count:
             self._update_stats()
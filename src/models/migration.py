@@ -9,7 +9,6 @@ and progress tracking.
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from enum import Enum
-import json
 import shutil
 import time
 import os
@@ -40,6 +39,14 @@ logger = logging.getLogger(__name__)
 ERROR_HANDLING_AVAILABLE = False
 
 
+def _band_metadata_file(band_folder_path: Path) -> Path:
+    """Resolve the metadata file of a band folder, honouring an out-of-tree metadata store."""
+    from src.di import get_config
+    from src.core.tools.metadata_store import MetadataStore
+    store = MetadataStore.from_config(get_config(), music_root=band_folder_path.parent)
+    return store.band_metadata_file(band_folder_path.name)
+
+
 class MigrationType(str, Enum):
     """
     Enumeration of supported migration types.
@@ -1130,12 +1137,12 @@ class MigrationIntegrityChecker:
     def _verify_metadata_consistency(self, band_folder_path: Path, check: MigrationIntegrityCheck):
         """Verify metadata consistency after migration."""
         try:
-            metadata_file = band_folder_path / ".band_metadata.json"
+            metadata_file = _band_metadata_file(band_folder_path)
             
             if metadata_file.exists():
                 # Load and verify metadata can be parsed
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                from src.core.tools.json_codec import read_json_file
+                metadata = read_json_file(metadata_file)
                 
                 # Check if metadata structure is valid
                 if not isinstance(metadata, dict):
@@ -1739,7 +1746,7 @@ class BandStructureMigrator:
         )
         
         # Backup metadata file if it exists
-        metadata_file = band_folder_path / ".band_metadata.json"
+        metadata_file = _band_metadata_file(band_folder_path)
         metadata_backup_path = None
         if metadata_file.exists():
             metadata_backup_path = str(backup_folder / ".band_metadata.json")
@@ -0,0 +1,206 @@
+"""
+Tests for the synthetic collection generator and benchmark suite.
+
+Tests cover reproducible generation, the variety of generated libraries,
+baseline comparison, a short benchmark run and a short load test against
+a tiny library.
+"""
+
+import importlib.util
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import BandMetadata
+
+BENCH_DIR = Path(__file__).resolve().parent.parent.parent / "scripts" / "bench"
+
+
+def _load_script(name):
+    spec = importlib.util.spec_from_file_location(name, BENCH_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+gen_collection = _load_script("gen_collection")
+run_benchmarks = _load_script("run_benchmarks")
+load_test = _load_script("load_test")
+
+
+def _tree(root):
+    return {str(path.relative_to(root)): path.read_bytes() if path.is_file() else None
+            for path in sorted(root.rglob('*')) if path.name != gen_collection.MANIFEST_FILE}
+
+
+class TestCollectionGenerator(unittest.TestCase):
+    """Test the synthetic collection generator."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_same_seed_generates_same_library(self):
+        first = gen_collection.generate_collection(self.temp_dir / "a", 30, seed=3)
+        second = gen_collection.generate_collection(self.temp_dir / "b", 30, seed=3)
+        other = gen_collection.generate_collection(self.temp_dir / "c", 30, seed=4)
+
+        self.assertEqual(first['counts'], second['counts'])
+        self.assertEqual(_tree(self.temp_dir / "a"), _tree(self.temp_dir / "b"))
+        self.assertNotEqual(_tree(self.temp_dir / "a"), _tree(self.temp_dir / "c"))
+        self.assertEqual(other['seed'], 4)
+
+    def test_library_varies_structure_and_metadata(self):
+        root = self.temp_dir / "library"
+        manifest = gen_collection.generate_collection(root, 80, seed=1)
+
+        bands = [path for path in root.iterdir() if path.is_dir()]
+        self.assertEqual(len(bands), 80)
+        self.assertEqual(manifest, gen_collection.load_manifest(root))
+        album_folders = [path.name for path in root.glob('*/*') if path.is_dir()]
+        self.assertTrue(any(name in ('Live', 'EP', 'Demo', 'Compilation', 'Single', 'Album')
+                            for name in album_folders))
+        self.assertTrue(any(name[:4].isdigit() for name in album_folders))
+        self.assertTrue(any('Edition' in path.name or 'Remastered' in path.name for path in root.rglob('*')))
+
+        metadata = [json.loads(path.read_text()) for path in root.glob('*/.band_metadata.json')]
+        self.assertEqual(len(metadata), manifest['counts']['metadata_files'])
+        for data in metadata:
+            BandMetadata(**data)
+        self.assertTrue(any(m['analyze'] and m['analyze']['similar_bands'] for m in metadata))
+        self.assertTrue(any(m['albums_missing'] for m in metadata))
+        for names in manifest['samples'].values():
+            self.assertTrue(all((root / name).is_dir() for name in names))
+
+    def test_refuses_non_empty_root(self):
+        (self.temp_dir / "file").touch()
+        with self.assertRaises(ValueError):
+            gen_collection.generate_collection(self.temp_dir, 5)
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Test comparison of results with a baseline."""
+
+    @staticmethod
+    def _results(**medians):
+        return {'collection': {'seed': 1},
+                'benchmarks': {name: {'median': median} for name, median in medians.items()}}
+
+    def test_regression_needs_ratio_and_delta(self):
+        baseline = self._results(slow=0.100, noisy=0.001, fast=0.100, same=0.100)
+        results = self._results(slow=0.200, noisy=0.003, fast=0.050, same=0.110, added=0.5)
+
+        comparison = run_benchmarks.compare_results(results, baseline, threshold=0.25, min_delta_ms=5)
+
+        self.assertTrue(comparison['collection_matches'])
+        self.assertEqual(comparison['regressions'], ['slow'])
+        statuses = {name: row['status'] for name, row in comparison['benchmarks'].items()}
+        self.assertEqual(statuses, {'slow': 'regressed', 'noisy': 'ok', 'fast': 'improved',
+                                    'same': 'ok', 'added': 'new'})
+
+    def test_baseline_thresholds_and_failures(self):
+        baseline = {**self._results(scan=0.100, search=0.100), 'thresholds': {'scan': 1.5}}
+        results = self._results(scan=0.200)
+        results['benchmarks']['search'] = {'error': "boom"}
+        results['collection'] = {'seed': 2}
+
+        comparison = run_benchmarks.compare_results(results, baseline)
+
+        self.assertFalse(comparison['collection_matches'])
+        self.assertEqual(comparison['benchmarks']['scan']['status'], 'ok')
+        self.assertEqual(comparison['regressions'], ['search'])
+
+
+class TestBenchmarkRun(unittest.TestCase):
+    """Test a short benchmark run."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_run_selected_benchmarks(self):
+        source = self.temp_dir / "library"
+        gen_collection.generate_collection(source, 12, seed=5)
+        before = _tree(source)
+
+        results = run_benchmarks.run_benchmarks(source, repeat=2, warmup=0,
+                                                only=['band_list_default', 'resource_band_info'])
+
+        self.assertEqual(set(results['benchmarks']), {'band_list_default', 'resource_band_info'})
+        for stats in results['benchmarks'].values():
+            self.assertEqual(stats['runs'], 2)
+            self.assertLessEqual(stats['min'], stats['median'])
+            self.assertLessEqual(stats['median'], stats['max'])
+        self.assertEqual(results['collection']['counts']['bands'], 12)
+        self.assertEqual(before, _tree(source))
+
+    def test_run_on_simulated_network_storage(self):
+        source = self.temp_dir / "library"
+        gen_collection.generate_collection(source, 5, seed=5)
+
+        results = run_benchmarks.run_benchmarks(source, repeat=1, warmup=0, only=['scan_scoped'],
+                                                fs_latency_ms=1, fs_seed=3)
+
+        stats = results['benchmarks']['scan_scoped']
+        self.assertGreater(stats['filesystem_calls']['scandir'], 0)
+        self.assertGreater(stats['median'], stats['filesystem_calls']['scandir'] * 0.001)
+        self.assertEqual(results['settings']['filesystem']['latency_ms'], 1)
+        local = {**results, 'settings': {**results['settings'], 'filesystem': {'latency_ms': 0.0}}}
+        self.assertFalse(run_benchmarks.compare_results(results, local)['settings_match'])
+        self.assertTrue(run_benchmarks.compare_results(results, results)['settings_match'])
+
+
+class TestLoadTest(unittest.TestCase):
+    """Test a short load test."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_concurrent_clients(self):
+        source = self.temp_dir / "library"
+        gen_collection.generate_collection(source, 8, seed=5)
+        before = _tree(source)
+
+        results = load_test.run_load_test(source, clients=3, duration=0, max_requests=6, seed=2,
+                                          mix={'band_list': 1, 'band_info': 1, 'save_metadata': 1, 'scan_band': 1})
+
+        self.assertEqual(results['totals']['requests'], 18)
+        self.assertEqual(results['totals']['errors'], 0)
+        self.assertLessEqual(set(results['operations']), {'band_list', 'band_info', 'save_metadata', 'scan_band'})
+        for stats in results['operations'].values():
+            self.assertGreater(stats['throughput_rps'], 0)
+            self.assertLessEqual(stats['latency']['p50'], stats['latency']['p99'])
+        self.assertEqual(before, _tree(source))
+        self.assertEqual(load_test.compare_load_results(results, results)['regressions'], [])
+
+    def test_regressed_operations(self):
+        def results(p95, throughput, error_rate):
+            return {'operations': {'band_list': {'latency': {'p95': p95}, 'throughput_rps': throughput,
+                                                 'error_rate': error_rate}}}
+
+        baseline = results(0.100, 50.0, 0.0)
+        compare = load_test.compare_load_results
+        self.assertEqual(compare(results(0.110, 45.0, 0.005), baseline)['regressions'], [])
+        self.assertEqual(compare(results(0.200, 50.0, 0.0), baseline)['operations']['band_list']['reasons'],
+                         ['p95 latency'])
+        self.assertEqual(compare(results(0.100, 30.0, 0.05), baseline)['operations']['band_list']['reasons'],
+                         ['throughput', 'error rate'])
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            load_test.Workload(self.temp_dir, {'unknown': 1})
+        with self.assertRaises(ValueError):
+            load_test.run_load_test(self.temp_dir, transport='stdio', fs_latency_ms=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
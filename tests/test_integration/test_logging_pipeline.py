@@ -0,0 +1,135 @@
+"""
+Tests for the monitoring logging pipeline.
+
+Tests cover writing records through the queue listeners, rate limiting and
+sampling per call site, and batching of performance and request records.
+"""
+
+import importlib.util
+import json
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent.parent / "scripts" / "monitoring" / "logging-config.py"
+
+_spec = importlib.util.spec_from_file_location("logging_config", SCRIPT)
+logging_config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(logging_config)
+
+
+def _record(lineno, level=logging.DEBUG, msg="Scanning band folder: %s", args=("Band",)):
+    return logging.LogRecord("music_mcp.scanner", level, "scanner.py", lineno, msg, args, None)
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    """Test rate limiting and sampling per call site."""
+
+    def test_records_over_burst_are_sampled(self):
+        limiter = logging_config.RateLimitFilter(per_second=0, burst=3, sample_every=5)
+        kept = [limiter.filter(_record(10)) for _ in range(23)]
+
+        # 3 within the burst, then every 5th of the remaining 20
+        self.assertEqual(sum(kept), 7)
+        self.assertEqual(limiter.suppressed_total, 16)
+        last = _record(10)
+        for _ in range(5):
+            passed = limiter.filter(last)
+        self.assertTrue(passed)
+        self.assertEqual(last.getMessage(), "Scanning band folder: Band [4 similar records suppressed]")
+
+    def test_sites_and_errors_are_limited_separately(self):
+        limiter = logging_config.RateLimitFilter(per_second=0, burst=1, sample_every=0)
+        self.assertTrue(limiter.filter(_record(10)))
+        self.assertFalse(limiter.filter(_record(10)))
+        self.assertTrue(limiter.filter(_record(20)))
+        self.assertTrue(all(limiter.filter(_record(10, logging.ERROR)) for _ in range(10)))
+
+
+class TestLoggingPipeline(unittest.TestCase):
+    """Test the queue listeners and batched structured records."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in ('music_mcp', 'music_mcp.requests', 'music_mcp.performance', 'music_mcp.errors'):
+            logging.getLogger(name).handlers.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_records_are_written_by_listener(self):
+        config = logging_config.MCPLoggingConfig(log_dir=self.temp_dir, environment="production")
+        config.rate_limit_filter.per_second = 0
+        config.rate_limit_filter.burst = 10
+        logger = config.setup_logging()
+        logger.setLevel(logging.DEBUG)
+        self.assertTrue(all(isinstance(h, logging_config.NonBlockingQueueHandler) for h in logger.handlers))
+
+        for i in range(500):
+            logger.info("Scanned band %d", i)
+        logger.error("Scan failed")
+        config.shutdown()
+
+        lines = (Path(self.temp_dir) / "music_mcp.log").read_text().splitlines()
+        # The burst of 10, every 100th of the other 490, and the error
+        self.assertEqual(len(lines), 15)
+        self.assertIn("Scanned band 0", lines[0])
+        self.assertIn("Scanned band 109 [99 similar records suppressed]", lines[10])
+        self.assertIn("Scan failed", lines[-1])
+        self.assertEqual(config.get_stats(), {'queued': 0, 'dropped': 0, 'suppressed': 486})
+
+    def test_capture_root_keeps_foreign_handlers(self):
+        class RecordingHandler(logging.Handler):
+            closed = False
+
+            def emit(self, record):
+                records.append(record.getMessage())
+
+            def close(self):
+                self.closed = True
+                super().close()
+
+        records = []
+        root = logging.getLogger()
+        foreign = RecordingHandler()
+        root.addHandler(foreign)
+        level = root.level
+        try:
+            config = logging_config.MCPLoggingConfig(log_dir=self.temp_dir, capture_root=True)
+            config.setup_logging()
+            config.setup_logging()
+            ours = [h for h in root.handlers if isinstance(h, logging_config.NonBlockingQueueHandler)]
+            self.assertEqual(len(ours), 1)
+            self.assertIn(foreign, root.handlers)
+
+            logging.error("Scan failed")
+            config.shutdown()
+            self.assertIn("Scan failed", (Path(self.temp_dir) / "music_mcp.log").read_text())
+            self.assertFalse(any(isinstance(h, logging_config.NonBlockingQueueHandler) for h in root.handlers))
+            self.assertIn(foreign, root.handlers)
+            self.assertFalse(foreign.closed)
+            self.assertEqual(records, ["Scan failed"])
+        finally:
+            root.removeHandler(foreign)
+            root.setLevel(level)
+
+    def test_structured_records_are_batched(self):
+        monitoring = logging_config.setup_monitoring(environment="development", log_dir=self.temp_dir)
+        monitoring['main_logger'].handlers.clear()
+        perf_logger = monitoring['performance_logger']
+        for i in range(perf_logger.batch_size + 3):
+            perf_logger.log_operation("scan_band", 0.01, {'band': i})
+        monitoring['request_logger'].log_request("get_band_list", {}, "req-1")
+        monitoring['shutdown']()
+
+        perf_lines = [json.loads(line) for line in (Path(self.temp_dir) / "performance.log").read_text().splitlines()]
+        self.assertEqual([line.get('batch_size') for line in perf_lines], [perf_logger.batch_size, 3])
+        self.assertEqual(perf_lines[1]['records'][-1]['band'], perf_logger.batch_size + 2)
+        request_lines = [json.loads(line) for line in (Path(self.temp_dir) / "mcp_requests.log").read_text().splitlines()]
+        self.assertEqual(request_lines[0]['method'], "get_band_list")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,19 +6,25 @@ for critical operations like scanning, loading, and searching.
 """
 
 import time
+import tracemalloc
 import tempfile
 import unittest
 import shutil
 from pathlib import Path
 from unittest.mock import patch
 
+import psutil
+
 from src.core.tools.scanner import scan_music_folders
 from src.core.tools.storage import (
     save_band_metadata,
     get_band_list,
     load_collection_index
 )
-from src.models import BandMetadata, Album, CollectionIndex, BandIndexEntry
+from src.config import Config
+from src.core.tools.json_codec import read_json_file
+from src.di import override_dependency
+from src.models import BandMetadata, Album, AlbumAnalysis, BandAnalysis, CollectionIndex, BandIndexEntry
 
 
 class TestPerformanceBenchmarks(unittest.TestCase):
@@ -345,5 +351,146 @@ class TestPerformanceBenchmarks(unittest.TestCase):
         self.assertTrue(True)
 
 
+class TestMetadataStorageFormatBenchmark(unittest.TestCase):
+    """Compare bytes written, load latency and scan I/O per METADATA_STORAGE_FORMAT."""
+
+    NUM_BANDS = 100
+    ALBUMS_PER_BAND = 6
+
+    def _run_format(self, storage_format):
+        """Build a collection, save rich metadata and scan it using one storage format."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            class MockConfig:
+                MUSIC_ROOT_PATH = temp_dir
+                CACHE_DURATION_DAYS = 30
+                LOG_LEVEL = "INFO"
+                METADATA_STORAGE_FORMAT = storage_format
+
+            root = Path(temp_dir)
+            with override_dependency(Config, MockConfig()):
+                for i in range(self.NUM_BANDS):
+                    band_name = f"Format Band {i:03d}"
+                    albums = []
+                    for j in range(self.ALBUMS_PER_BAND):
+                        album_path = root / band_name / f"{2000 + j} - Album {j:02d}"
+                        album_path.mkdir(parents=True)
+                        (album_path / "01 - Track.mp3").touch()
+                        albums.append(Album(album_name=f"Album {j:02d}", year=str(2000 + j), track_count=10))
+                    metadata = BandMetadata(
+                        band_name=band_name,
+                        formed="1990",
+                        genres=["Progressive Metal", "Art Rock"],
+                        origin="Somewhere",
+                        members=[f"Member {k}" for k in range(5)],
+                        description=f"{band_name} is a band with a long and winding history. " * 30,
+                        albums=albums,
+                        analyze=BandAnalysis(
+                            review="An extensive review of the band's career and influence. " * 40,
+                            rate=8,
+                            albums=[AlbumAnalysis(album_name=a.album_name,
+                                                  review="Detailed album review text. " * 30, rate=7)
+                                    for a in albums]
+                        )
+                    )
+                    save_band_metadata(band_name, metadata)
+
+                metadata_files = list(root.glob("*/.band_metadata.json"))
+                bytes_written = sum(f.stat().st_size for f in metadata_files)
+
+                start_time = time.perf_counter()
+                for metadata_file in metadata_files:
+                    read_json_file(metadata_file)
+                load_time = time.perf_counter() - start_time
+
+                io_counters = getattr(psutil.Process(), 'io_counters', None)
+                io_before = io_counters() if io_counters else None
+                start_time = time.perf_counter()
+                result = scan_music_folders()
+                scan_time = time.perf_counter() - start_time
+                io_after = io_counters() if io_counters else None
+
+            self.assertEqual(result['status'], 'success')
+            scan_io = None
+            if io_before is not None and hasattr(io_before, 'read_chars'):
+                scan_io = (io_after.read_chars - io_before.read_chars,
+                           io_after.write_chars - io_before.write_chars)
+            return {
+                'bytes_written': bytes_written,
+                'load_time': load_time,
+                'scan_time': scan_time,
+                'scan_io': scan_io
+            }
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_storage_format_benchmark(self):
+        """Report on-disk size, load latency and scan I/O with compression off and on."""
+        results = {fmt: self._run_format(fmt) for fmt in ("pretty", "compact", "gzip")}
+
+        print(f"\n=== Metadata Storage Format Benchmark ({self.NUM_BANDS} bands) ===")
+        for fmt, stats in results.items():
+            line = (f"{fmt:>8}: {stats['bytes_written'] / 1024:8.1f} KB written, "
+                    f"load {stats['load_time'] * 1000:7.1f} ms, scan {stats['scan_time']:.2f} s")
+            if stats['scan_io'] is not None:
+                line += (f", scan I/O read {stats['scan_io'][0] / 1024:.0f} KB"
+                         f" / write {stats['scan_io'][1] / 1024:.0f} KB")
+            print(line)
+        ratio = results['pretty']['bytes_written'] / results['gzip']['bytes_written']
+        print(f"Compression ratio (pretty / gzip): {ratio:.1f}x")
+
+        self.assertLess(results['compact']['bytes_written'], results['pretty']['bytes_written'])
+        self.assertLess(results['gzip']['bytes_written'], results['compact']['bytes_written'] / 2)
+
+
+class TestStreamingScanMemoryBenchmark(unittest.TestCase):
+    """Check that scan memory no longer grows with the per-band scan results."""
+
+    # Remaining per-band cost is the compact index entry, the index dump written
+    # at the end of the scan and performance tracker records; the band results
+    # themselves (album dicts, galleries, structure) are streamed to the report
+    MAX_GROWTH_PER_BAND = 6 * 1024
+
+    def _peak_scan_memory(self, num_bands):
+        """Scan a fresh collection of num_bands bands and return (peak bytes, result)."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            class MockConfig:
+                MUSIC_ROOT_PATH = temp_dir
+                CACHE_DURATION_DAYS = 30
+                LOG_LEVEL = "INFO"
+
+            root = Path(temp_dir)
+            for i in range(num_bands):
+                for j in range(3):
+                    album_path = root / f"Memory Band {i:04d}" / f"{2000 + j} - Album {j}"
+                    album_path.mkdir(parents=True)
+                    (album_path / "01 - Track.mp3").touch()
+
+            with override_dependency(Config, MockConfig()):
+                tracemalloc.start()
+                try:
+                    result = scan_music_folders()
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+            return peak, result
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_peak_memory_growth_per_band_is_bounded(self):
+        small_peak, small_result = self._peak_scan_memory(50)
+        large_peak, large_result = self._peak_scan_memory(200)
+        growth_per_band = (large_peak - small_peak) / 150
+
+        print(f"\nScan peak memory: 50 bands {small_peak / 1024:.0f} KB, "
+              f"200 bands {large_peak / 1024:.0f} KB ({growth_per_band / 1024:.1f} KB per band)")
+        self.assertEqual(large_result['status'], 'success')
+        self.assertEqual(large_result['results']['bands_discovered'], 200)
+        # The response does not grow with the collection
+        self.assertEqual(len(large_result['results']['bands']), len(small_result['results']['bands']))
+        self.assertLess(growth_per_band, self.MAX_GROWTH_PER_BAND)
+
+
 if __name__ == '__main__':
-    unittest.main() 
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for request coalescing.
+
+Tests cover the singleflight primitive, keys that include the collection
+generation, and coalescing in the expensive read handlers.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from src.core.tools.collection_generation import bump_collection_generation, get_collection_generation
+from src.mcp_server.base_handlers import BaseToolHandler
+from src.mcp_server.coalescing import SingleFlight, request_key
+
+
+class CountingTool(BaseToolHandler):
+    """Read-only tool that counts its computations."""
+
+    coalesce_requests = True
+
+    def __init__(self, delay: float = 0.2):
+        super().__init__("counting_tool", "1.0.0")
+        self.delay = delay
+        self.computations = 0
+
+    def _execute_tool(self, **kwargs) -> Any:
+        self.computations += 1
+        time.sleep(self.delay)
+        return {'answer': kwargs.get('question', 42)}
+
+
+def _run_concurrently(func, count: int):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(func) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """Test the singleflight primitive."""
+
+    def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight()
+        runs = []
+
+        def compute():
+            runs.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = _run_concurrently(lambda: flight.do("key", compute), 5)
+
+        assert len(runs) == 1
+        assert len({id(result) for result, _ in results}) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert flight.get_stats() == {'calls': 5, 'executions': 1, 'coalesced': 4, 'in_flight': 0}
+
+    def test_errors_are_shared_and_not_kept(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("no index")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", fail)
+            assert started.wait(5)
+            follower = pool.submit(flight.do, "key", fail)
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="no index"):
+                    future.result()
+
+        # A later call computes again
+        assert flight.do("key", lambda: "ok") == ("ok", False)
+
+    def test_key_changes_with_generation(self):
+        before = request_key({'b': 1, 'a': None})
+        assert before == request_key({'a': None, 'b': 1})
+        assert bump_collection_generation() == get_collection_generation()
+        assert request_key({'a': None, 'b': 1}) != before
+
+
+class TestCoalescedHandlers:
+    """Test coalescing in handlers."""
+
+    def test_identical_calls_are_coalesced(self):
+        tool = CountingTool()
+
+        responses = _run_concurrently(lambda: tool.execute(question=1), 4)
+
+        assert tool.computations == 1
+        assert all(response['answer'] == 1 for response in responses)
+        assert sum(response['handler_info']['coalesced'] for response in responses) == 3
+        stats = tool.get_coalescing_stats()
+        assert stats['enabled'] is True
+        assert stats['coalesced'] == 3
+
+    def test_different_parameters_are_not_coalesced(self):
+        tool = CountingTool(delay=0.1)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(tool.execute, question=1)
+            second = pool.submit(tool.execute, question=2)
+            assert first.result()['answer'] == 1
+            assert second.result()['answer'] == 2
+        assert tool.computations == 2
+
+    def test_write_during_computation_starts_a_new_one(self):
+        tool = CountingTool()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(tool.execute)
+            time.sleep(0.05)
+            bump_collection_generation()
+            second = pool.submit(tool.execute)
+            assert first.result()['handler_info']['coalesced'] is False
+            assert second.result()['handler_info']['coalesced'] is False
+        assert tool.computations == 2
+
+    def test_expensive_reads_opt_in(self):
+        from src.mcp_server.resources.advanced_analytics_resource import _handler as analytics
+        from src.mcp_server.resources.band_info_resource import _handler as band_info
+        from src.mcp_server.resources.collection_summary_resource import _handler as summary
+        from src.mcp_server.tools.analyze_collection_insights_tool import _handler as insights
+
+        assert analytics.coalesce_requests and summary.coalesce_requests and insights.coalesce_requests
+        assert not band_info.coalesce_requests
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for running handlers off the event loop.
+
+Tests cover the concurrency limiter, per-handler limits and queue time
+reporting on the handler thread pool, and calling registered tools through
+a FastMCP client.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from src.mcp_server.base_handlers import BaseToolHandler
+from src.mcp_server.concurrency import ConcurrencyLimiter
+
+
+class SlowTool(BaseToolHandler):
+    """Tool handler that sleeps, with a configurable concurrency limit."""
+
+    def __init__(self, name: str, delay: float, limit: Any = None):
+        self.max_concurrency = limit
+        super().__init__(name, "1.0.0")
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _execute_tool(self, **kwargs) -> Any:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return {'done': True}
+
+
+class TestConcurrencyLimiter:
+    """Test the thread/coroutine concurrency limiter."""
+
+    def test_slot_is_handed_to_waiters_in_order(self):
+        limiter = ConcurrencyLimiter(1)
+        limiter.acquire()
+        order = []
+
+        async def waiter(name):
+            await limiter.acquire_async()
+            order.append(name)
+            limiter.release()
+
+        async def scenario():
+            tasks = [asyncio.create_task(waiter(name)) for name in ("first", "second")]
+            await asyncio.sleep(0.01)
+            assert limiter.waiting == 2
+            limiter.release()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+        assert order == ["first", "second"]
+        assert limiter.get_stats() == {'limit': 1, 'active': 0, 'waiting': 0}
+
+    def test_cancelled_waiter_gives_up_its_place(self):
+        limiter = ConcurrencyLimiter(1)
+        limiter.acquire()
+
+        async def scenario():
+            task = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+        assert limiter.waiting == 0
+        limiter.release()
+        assert limiter.active == 0
+
+    def test_unlimited(self):
+        limiter = ConcurrencyLimiter()
+        for _ in range(100):
+            limiter.acquire()
+        assert limiter.active == 100
+
+
+class TestHandlerThreadPool:
+    """Test handlers running on the handler thread pool."""
+
+    def test_limited_handler_queues_while_reads_run_in_parallel(self):
+        scan = SlowTool("slow_scan", delay=0.2, limit=1)
+        read = SlowTool("slow_read", delay=0.2)
+        run_scan = scan.offloaded(scan.execute)
+        run_read = read.offloaded(read.execute)
+
+        async def scenario():
+            start = time.perf_counter()
+            results = await asyncio.gather(run_scan(), run_scan(), run_read(), run_read(), run_read())
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(scenario())
+
+        assert scan.max_running == 1
+        assert read.max_running == 3
+        # Two scans back to back; the reads overlap with them
+        assert 0.35 < elapsed < 0.6
+        scan_queue_times = sorted(r['handler_info']['queue_seconds'] for r in results[:2])
+        assert scan_queue_times[0] < 0.1
+        assert scan_queue_times[1] >= 0.15
+        stats = scan.get_concurrency_stats()
+        assert stats['calls'] == 2
+        assert stats['limit'] == 1
+        assert stats['max_queue_seconds'] >= 0.15
+
+    def test_sync_calls_share_the_limit(self):
+        scan = SlowTool("slow_scan", delay=0.1, limit=1)
+        threads = [threading.Thread(target=scan.execute) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert scan.max_running == 1
+        assert scan.limiter.active == 0
+
+    def test_registered_tools_are_served_through_the_pool(self):
+        from fastmcp import Client
+        from src.mcp_server import mcp
+
+        async def scenario():
+            async with Client(mcp) as client:
+                tools = {tool.name: tool for tool in await client.list_tools()}
+                result = await client.call_tool("get_job_status", {})
+                return tools, result
+
+        tools, result = asyncio.run(scenario())
+
+        assert 'async_mode' in tools['scan_music_folders'].input_schema['properties']
+        assert result.data['status'] == 'success'
+        assert 'queue_seconds' in result.data['handler_info']
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for background jobs.
+
+Tests cover the priority job queue (ordering, cancellation, failures and
+retention) and running long tools with async_mode=True through the job tools.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools import scanner
+from src.core.tools.scan_checkpoint import SCAN_STATE_FILENAME
+from src.di import override_dependency
+from src.mcp_server.jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_PRIORITY_HIGH,
+    JOB_PRIORITY_LOW,
+    JOB_SUCCEEDED,
+    JobManager,
+    current_job,
+    shutdown_job_manager,
+)
+from src.mcp_server.tools.cancel_job_tool import cancel_job
+from src.mcp_server.tools.get_job_result_tool import get_job_result
+from src.mcp_server.tools.get_job_status_tool import get_job_status
+from src.mcp_server.tools.scan_music_folders_tool import scan_music_folders
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+class TestJobManager:
+    """Test the job queue and worker pool."""
+
+    def test_jobs_run_in_priority_order(self, manager):
+        release = threading.Event()
+        order = []
+        blocker = manager.submit("blocker", release.wait)
+        assert _wait_for(lambda: blocker.status == 'running')
+        low = manager.submit("scan", lambda: order.append("scan"), priority=JOB_PRIORITY_LOW)
+        high = manager.submit("insights", lambda: order.append("insights"), priority=JOB_PRIORITY_HIGH)
+
+        assert manager.queue_position(high) == 1
+        assert manager.queue_position(low) == 2
+        time.sleep(0.02)
+        release.set()
+
+        assert _wait_for(lambda: low.finished)
+        assert order == ["insights", "scan"]
+        assert low.status == JOB_SUCCEEDED
+        assert low.to_dict()['queue_seconds'] >= 0.02
+
+    def test_cancel_queued_job_never_runs(self, manager):
+        release = threading.Event()
+        ran = []
+        blocker = manager.submit("blocker", release.wait)
+        assert _wait_for(lambda: blocker.status == 'running')
+        queued = manager.submit("scan", lambda: ran.append(True))
+
+        manager.cancel(queued.job_id)
+        release.set()
+
+        assert queued.status == JOB_CANCELLED
+        assert _wait_for(lambda: manager.get_stats()['jobs']['running'] == 0)
+        assert ran == []
+
+    def test_failures_and_error_results(self, manager):
+        def boom():
+            raise RuntimeError("disk on fire")
+
+        raised = manager.submit("boom", boom)
+        error_result = manager.submit("error", lambda: {'status': 'error', 'error': "no index"})
+
+        assert _wait_for(lambda: error_result.finished)
+        assert raised.status == JOB_FAILED
+        assert raised.error == "disk on fire"
+        assert error_result.status == JOB_FAILED
+        assert error_result.result['error'] == "no index"
+
+    def test_current_job_and_retention(self):
+        manager = JobManager(max_workers=1, max_finished_jobs=2)
+        jobs = [manager.submit(f"job {i}", current_job) for i in range(4)]
+        assert _wait_for(lambda: jobs[-1].finished)
+
+        assert jobs[-1].result is jobs[-1]
+        assert manager.get(jobs[0].job_id) is None
+        assert [job.job_id for job in manager.list_jobs()] == [jobs[3].job_id, jobs[2].job_id]
+        assert current_job() is None
+        manager.shutdown(wait=True)
+
+
+class TestAsyncTools:
+    """Test long tools started with async_mode=True."""
+
+    @pytest.fixture
+    def music_root(self):
+        temp_dir = tempfile.mkdtemp()
+        for band in ("Queen", "Rush", "Yes"):
+            album = Path(temp_dir) / band / "2000 - Album"
+            album.mkdir(parents=True)
+            (album / "01 - Track.mp3").touch()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = temp_dir
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+            SCAN_CHECKPOINT_INTERVAL_SECONDS = 1e-6
+
+        with override_dependency(Config, MockConfig()):
+            yield Path(temp_dir)
+            shutdown_job_manager(wait=True)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_async_scan_returns_job_and_result(self, music_root):
+        response = scan_music_folders(async_mode=True)
+
+        assert response['status'] == 'success'
+        assert response['handler_info']['tool_mode'] == 'async'
+        job_id = response['job_id']
+        assert _wait_for(lambda: get_job_status(job_id=job_id)['result_available'])
+
+        status = get_job_status(job_id=job_id)
+        assert status['job']['status'] == JOB_SUCCEEDED
+        assert status['job']['name'] == 'scan_music_folders'
+        result = get_job_result(job_id=job_id)
+        assert result['completed'] is True
+        assert result['result']['status'] == 'success'
+        assert result['result']['results']['bands_discovered'] == 3
+        assert get_job_status()['job_stats']['jobs']['succeeded'] == 1
+
+    def test_cancel_running_scan_checkpoints_it(self, music_root):
+        real_scan = scanner._scan_band_folder
+        first_band_done = threading.Event()
+        cancelled = threading.Event()
+
+        def scan_and_wait(band_folder, root):
+            result = real_scan(band_folder, root)
+            first_band_done.set()
+            cancelled.wait(5)
+            return result
+
+        with patch("src.core.tools.scanner._scan_band_folder", side_effect=scan_and_wait):
+            job_id = scan_music_folders(async_mode=True)['job_id']
+            assert first_band_done.wait(5)
+            response = cancel_job(job_id=job_id)
+            cancelled.set()
+            assert response['cancelled'] is True
+            assert _wait_for(lambda: get_job_status(job_id=job_id)['result_available'])
+
+        assert get_job_status(job_id=job_id)['job']['status'] == JOB_CANCELLED
+        assert (music_root / SCAN_STATE_FILENAME).exists()
+        # The next scan picks up where the cancelled one stopped
+        assert scan_music_folders()['results']['resume']['bands_restored'] == 1
+
+    def test_unknown_job(self, music_root):
+        assert get_job_status(job_id="nope")['status'] == 'error'
+        assert get_job_result(job_id="nope")['status'] == 'error'
+        assert cancel_job(job_id="nope")['status'] == 'error'
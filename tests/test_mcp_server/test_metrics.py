@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for handler metrics.
+
+Tests cover recording tool and resource calls, the metrics snapshot with
+the statistics of registered handlers, the Prometheus exposition and the
+get_server_metrics tool.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from src.mcp_server.base_handlers import BaseResourceHandler, BaseToolHandler
+from src.mcp_server.metrics import MetricsRegistry, format_prometheus, get_metrics_registry, payload_bytes
+
+
+class EchoTool(BaseToolHandler):
+    """Tool echoing its parameters, failing on request."""
+
+    def __init__(self):
+        super().__init__("echo_metrics_tool", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Any:
+        if kwargs.get('fail'):
+            raise ValueError("asked to fail")
+        return {'echo': kwargs.get('text')}
+
+
+class TextResource(BaseResourceHandler):
+    """Resource returning fixed text."""
+
+    def __init__(self):
+        super().__init__("text_metrics_resource", "1.0.0")
+
+    def _get_resource_content(self, **kwargs) -> str:
+        return "# Héllo"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    # Measure every payload so byte counts are exact
+    monkeypatch.setattr(get_metrics_registry(), 'payload_sample_every', 1)
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+class TestHandlerMetrics:
+    """Test recording of handler calls."""
+
+    def test_tool_calls_and_errors(self):
+        tool = EchoTool()
+        tool.execute(text="hi")
+        tool.execute(text="hi")
+        assert tool.execute(fail=True)['status'] == 'error'
+
+        metrics = get_metrics_registry().get_snapshot()['handlers']['echo_metrics_tool']
+        assert metrics['kind'] == 'tool'
+        assert metrics['calls'] == 3
+        assert metrics['errors'] == 1
+        assert metrics['in_flight'] == 0
+        assert metrics['max_in_flight'] == 1
+        assert metrics['request_bytes'] == 2 * payload_bytes({'text': 'hi'}) + payload_bytes({'fail': True})
+        assert metrics['response_bytes'] > 0
+        assert metrics['latency']['count'] == 3
+        assert metrics['latency']['p99_seconds'] is not None
+
+    def test_resource_calls(self):
+        resource = TextResource()
+        assert resource.get_content() == "# Héllo"
+
+        metrics = get_metrics_registry().get_snapshot()['handlers']['text_metrics_resource']
+        assert metrics['kind'] == 'resource'
+        assert metrics['calls'] == 1
+        assert metrics['request_bytes'] == 0
+        assert metrics['response_bytes'] == len("# Héllo".encode('utf-8'))
+
+    def test_json_payloads_are_sampled(self, monkeypatch):
+        from src.mcp_server import metrics as metrics_module
+
+        measured = []
+        monkeypatch.setattr(metrics_module, 'payload_bytes', lambda payload: measured.append(payload) or 100)
+        registry = MetricsRegistry(payload_sample_every=4)
+        for i in range(8):
+            metrics = registry.start_call('echo', 'tool', {'i': i})
+            registry.finish_call(metrics, 0.01, response={'echo': i})
+        metrics = registry.start_call('text', 'resource', {})
+        registry.finish_call(metrics, 0.01, response="# Text")
+
+        # Two in eight JSON requests and responses were encoded; the others count at their average size
+        assert measured == [{'i': 0}, {'echo': 0}, {'i': 4}, {'echo': 4}, "# Text"]
+        handlers = registry.get_snapshot()['handlers']
+        assert handlers['echo']['request_bytes'] == handlers['echo']['response_bytes'] == 800
+        assert handlers['text']['response_bytes'] == 100
+
+    def test_snapshot_includes_handler_statistics(self):
+        from src.mcp_server.resources.collection_summary_resource import _handler as summary
+
+        snapshot = get_metrics_registry().get_snapshot()
+        assert snapshot['concurrency']['collection_summary']['handler_name'] == 'collection_summary'
+        assert snapshot['coalescing']['collection_summary']['enabled'] is summary.coalesce_requests
+        assert 'generation' in snapshot['snapshots']
+        assert 'jobs' in snapshot['jobs']
+
+
+class TestExposition:
+    """Test the exposed formats."""
+
+    def test_prometheus_format(self):
+        registry = MetricsRegistry()
+        metrics = registry.start_call('band "info"', 'resource', {})
+        registry.finish_call(metrics, 0.25, response="x", error=True)
+
+        text = format_prometheus(registry.get_snapshot())
+        labels = '{handler="band \\"info\\"",kind="resource"}'
+        assert f'music_mcp_handler_calls_total{labels} 1' in text
+        assert f'music_mcp_handler_errors_total{labels} 1' in text
+        assert '# TYPE music_mcp_handler_latency_seconds summary' in text
+        assert 'music_mcp_handler_latency_seconds{handler="band \\"info\\"",kind="resource",quantile="0.5"} 0.25' in text
+        assert f'music_mcp_handler_latency_seconds_count{labels} 1' in text
+        assert text.endswith('\n')
+
+    def test_get_server_metrics_tool(self):
+        from src.mcp_server.resources.server_metrics_resource import server_metrics_resource
+        from src.mcp_server.tools.get_server_metrics_tool import get_server_metrics
+
+        EchoTool().execute(text="hi")
+        result = get_server_metrics(format='prometheus')
+        assert result['status'] == 'success'
+        assert result['metrics']['handlers']['echo_metrics_tool']['calls'] == 1
+        assert 'music_mcp_handler_calls_total{handler="echo_metrics_tool",kind="tool"} 1' in result['prometheus']
+        assert get_server_metrics(format='xml')['status'] == 'error'
+
+        content = json.loads(server_metrics_resource())
+        assert content['handlers']['get_server_metrics']['calls'] == 2
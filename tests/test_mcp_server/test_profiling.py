@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for on-demand profiling of tool calls.
+
+Tests cover profiling on request and by sampling, the written artifacts,
+memory tracing, calls that are not profiled, and the profile parameter
+added to registered tools.
+"""
+
+import inspect
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.mcp_server.base_handlers import BaseToolHandler
+from src.mcp_server.profiling import configure_profiling, profile_requested, with_profile_parameter
+
+
+class BusyTool(BaseToolHandler):
+    """Tool doing a little work."""
+
+    def __init__(self):
+        super().__init__("busy_profiled_tool", "1.0.0")
+
+    def _execute_tool(self, **kwargs) -> Any:
+        if kwargs.get('fail'):
+            raise ValueError("asked to fail")
+        return {'total': sum(len(str(i)) for i in range(kwargs.get('n', 1000)))}
+
+
+@pytest.fixture
+def profile_dir():
+    directory = Path(tempfile.mkdtemp())
+    configure_profiling(directory)
+    yield directory
+    configure_profiling()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestProfiling:
+    """Test profiled tool calls."""
+
+    def test_requested_profile_writes_artifacts(self, profile_dir):
+        response = BusyTool().execute(profile=True, n=5000)
+
+        assert response['status'] == 'success'
+        assert 'profile' not in response['handler_info']['parameters_used']
+        profile = response['handler_info']['profile']
+        assert Path(profile['pstats_path']).parent == profile_dir
+        assert Path(profile['pstats_path']).stat().st_size > 0
+        summary = Path(profile['summary_path']).read_text(encoding='utf-8')
+        assert summary.startswith("Profile of busy_profiled_tool")
+        assert "_execute_tool" in summary
+        assert 'peak_memory_mb' not in profile
+
+    def test_unprofiled_calls_have_no_profile(self, profile_dir):
+        response = BusyTool().execute(n=10)
+
+        assert 'profile' not in response['handler_info']
+        assert list(profile_dir.iterdir()) == []
+
+    def test_sampling_and_memory_tracing(self, profile_dir):
+        configure_profiling(profile_dir, sample_rate=1.0, trace_memory=True)
+
+        response = BusyTool().execute(fail=True)
+
+        assert response['status'] == 'error'
+        profile = response['tool_info']['profile']
+        assert profile['peak_memory_mb'] >= 0
+        assert "allocation sites" in Path(profile['summary_path']).read_text(encoding='utf-8')
+
+    def test_profile_parameter_of_registered_tools(self):
+        def tool(band_name: str, page: int = 1) -> dict:
+            return {'profiled': profile_requested()}
+
+        wrapped = with_profile_parameter(tool)
+
+        assert list(inspect.signature(wrapped).parameters) == ['band_name', 'page', 'profile']
+        assert wrapped("Queen") == {'profiled': False}
+        assert wrapped("Queen", profile=True) == {'profiled': True}
+        assert profile_requested() is False
@@ -8,7 +8,7 @@ import json
 from datetime import datetime
 from pydantic import ValidationError
 
-from src.models.band import Album, AlbumAnalysis, BandAnalysis, BandMetadata
+from src.models.band import Album, AlbumAnalysis, AlbumType, BandAnalysis, BandMetadata, BandMetadataSummary
 
 
 class TestAlbum:
@@ -403,3 +403,61 @@ class TestBandMetadata:
         metadata.last_metadata_saved = datetime.now().isoformat()
         
         assert metadata.has_metadata_saved() is True 
+
+
+class TestBandMetadataSummary:
+    """Test cases for the lightweight BandMetadataSummary view."""
+
+    def _raw_metadata(self):
+        return BandMetadata(
+            band_name="Opeth",
+            formed="1990",
+            genres=["Progressive Metal"],
+            origin="Stockholm",
+            albums=[
+                Album(album_name="Blackwater Park", year="2001"),
+                Album(album_name="Lamentations", year="2003", type=AlbumType.LIVE),
+            ],
+            albums_missing=[Album(album_name="Orchid", year="1995")],
+            analyze=BandAnalysis(review="Great", rate=9, albums=[AlbumAnalysis(album_name="Blackwater Park", rate=10)],
+                                 similar_bands=["Katatonia"]),
+        ).model_dump()
+
+    def test_summary_fields_and_counts(self):
+        summary = BandMetadataSummary.from_dict(self._raw_metadata())
+
+        assert summary.band_name == "Opeth"
+        assert summary.genres == ["Progressive Metal"]
+        assert summary.albums_count == 3
+        assert summary.local_albums_count == 2
+        assert summary.missing_albums_count == 1
+        assert summary.album_types == {"Album": 1, "Live": 1}
+        assert summary.has_analysis and summary.analysis_rate == 9 and summary.analysis_has_review
+        assert summary.albums_analyzed == 1
+        assert summary.similar_bands_count == 1
+        assert summary.album_names == ["Blackwater Park", "Lamentations"]
+
+    def test_albums_are_not_validated_until_accessed(self):
+        raw = self._raw_metadata()
+        raw["albums"][0]["year"] = "not a year"
+
+        summary = BandMetadataSummary.from_dict(raw)
+        assert summary.local_albums_count == 2
+        with pytest.raises(ValidationError):
+            summary.albums
+
+    def test_folder_structure_stays_raw(self):
+        raw = self._raw_metadata()
+        raw["folder_structure"] = {"structure_type": "mixed", "structure_score": 150}
+
+        summary = BandMetadataSummary.from_dict(raw)
+        assert summary.folder_structure == {"structure_type": "mixed", "structure_score": 150}
+
+    def test_full_metadata_is_materialized_once(self):
+        summary = BandMetadataSummary.from_dict(self._raw_metadata())
+
+        metadata = summary.to_band_metadata()
+        assert isinstance(metadata, BandMetadata)
+        assert summary.to_band_metadata() is metadata
+        assert [a.album_name for a in summary.albums_missing] == ["Orchid"]
+
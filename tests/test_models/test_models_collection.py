@@ -5,6 +5,7 @@ Tests the BandIndexEntry, CollectionStats, CollectionInsight, and CollectionInde
 
 import pytest
 import json
+import tracemalloc
 from datetime import datetime
 from pydantic import ValidationError
 
@@ -12,7 +13,8 @@ from src.models.collection import (
     BandIndexEntry, 
     CollectionStats, 
     CollectionInsight, 
-    CollectionIndex
+    CollectionIndex,
+    CompactBandEntry
 )
 
 
@@ -389,3 +391,57 @@ class TestCollectionIndex:
         assert index.stats.total_bands == 1
         assert index.stats.total_albums == 3
         assert index.stats.avg_albums_per_band == 3.0 
+
+
+class TestCompactBandEntries:
+    """Test the compact in-memory band entry representation."""
+
+    @staticmethod
+    def _raw_bands(count):
+        return [
+            {"name": f"Band {i:05d}", "folder_path": f"Band {i:05d}", "albums_count": 5,
+             "local_albums_count": 4, "missing_albums_count": 1, "has_metadata": True,
+             "last_updated": "2024-01-01T00:00:00"}
+            for i in range(count)
+        ]
+
+    def test_entries_are_stored_compactly_and_update_in_place(self):
+        index = CollectionIndex(bands=[BandIndexEntry(name="Band", folder_path="Band", albums_count=2,
+                                                      local_albums_count=2)])
+        entry = index.get_band("Band")
+        assert isinstance(entry, CompactBandEntry)
+        assert entry.folder_path is entry.name
+
+        entry.has_analysis = True
+        assert index.model_dump()["bands"][0]["has_analysis"] is True
+        assert entry.to_entry() == BandIndexEntry(**index.model_dump()["bands"][0])
+
+    def test_appended_models_are_converted(self):
+        index = CollectionIndex()
+        index.bands.append(BandIndexEntry(name="New", folder_path="New", albums_count=1, local_albums_count=1))
+        index.bands.append({"name": "Raw", "folder_path": "Raw"})
+
+        assert all(isinstance(b, CompactBandEntry) for b in index.bands)
+        assert [b["name"] for b in json.loads(index.to_json())["bands"]] == ["New", "Raw"]
+        with pytest.raises(ValidationError):
+            index.bands.append({"name": "No folder"})
+
+    def test_compact_index_uses_much_less_memory(self):
+        raw_bands = self._raw_bands(5000)
+
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            models = [BandIndexEntry(**band) for band in raw_bands]
+            model_bytes = tracemalloc.get_traced_memory()[0] - baseline
+            del models
+
+            baseline = tracemalloc.get_traced_memory()[0]
+            index = CollectionIndex(bands=raw_bands)
+            compact_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+
+        assert len(index.bands) == 5000
+        assert compact_bytes < model_bytes / 2
+
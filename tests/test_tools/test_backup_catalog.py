@@ -0,0 +1,166 @@
+"""
+Unit tests for the backup catalog.
+
+Tests cover recording, automatic retention, compaction, legacy import and
+that listing/cleanup work from the catalog without walking the music tree.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools.backup_catalog import (
+    BACKUP_CATALOG_FILENAME,
+    BackupCatalog,
+    get_backup_catalog,
+)
+from src.core.tools.scanner import _save_collection_index
+from src.core.tools.storage import JSONStorage, cleanup_backups, list_backups
+from src.di import override_dependency
+from src.models import CollectionIndex
+
+
+def _make_backup(root: Path, name: str, content: str = "{}") -> Path:
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+class TestBackupCatalog:
+    """Test the catalog itself."""
+
+    def test_record_applies_retention(self, tmp_path):
+        catalog = BackupCatalog(tmp_path)
+        original = tmp_path / "Band" / ".band_metadata.json"
+        for i in range(4):
+            catalog.record(_make_backup(tmp_path, f"Band/.band_metadata.backup_{i}.json"), original,
+                           max_backups=2)
+
+        backups = catalog.list_backups(original)
+        assert [b["backup"] for b in backups] == [
+            "Band/.band_metadata.backup_3.json",
+            "Band/.band_metadata.backup_2.json",
+        ]
+        assert not (tmp_path / "Band/.band_metadata.backup_0.json").exists()
+        assert not (tmp_path / "Band/.band_metadata.backup_1.json").exists()
+
+    def test_catalog_survives_reload(self, tmp_path):
+        catalog = BackupCatalog(tmp_path)
+        catalog.record(_make_backup(tmp_path, "a.json.backup"), tmp_path / "a.json")
+
+        reloaded = BackupCatalog(tmp_path)
+        assert [b["original"] for b in reloaded.list_backups()] == ["a.json"]
+
+    def test_re_recording_same_backup_is_deduplicated_and_compacted(self, tmp_path):
+        catalog = BackupCatalog(tmp_path)
+        catalog.import_untracked([])
+        backup = _make_backup(tmp_path, "a.json.backup")
+        for _ in range(300):
+            catalog.record(backup, tmp_path / "a.json")
+
+        assert len(catalog.list_backups()) == 1
+        lines = (tmp_path / BACKUP_CATALOG_FILENAME).read_text().splitlines()
+        assert len(lines) < 150
+        # Compaction keeps the legacy import marker
+        assert BackupCatalog(tmp_path).legacy_imported()
+
+    def test_torn_line_is_ignored(self, tmp_path):
+        catalog = BackupCatalog(tmp_path)
+        catalog.record(_make_backup(tmp_path, "a.json.backup"), tmp_path / "a.json")
+        with open(tmp_path / BACKUP_CATALOG_FILENAME, "a") as f:
+            f.write('{"op": "add", "backu')
+
+        assert len(BackupCatalog(tmp_path).list_backups()) == 1
+
+
+class TestCatalogIntegration:
+    """Test backup-creating paths and catalog-based cleanup."""
+
+    @pytest.fixture
+    def music_root(self):
+        temp_dir = tempfile.mkdtemp()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = temp_dir
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+            BACKUP_RETENTION_COUNT = 3
+
+        with override_dependency(Config, MockConfig()):
+            yield Path(temp_dir)
+
+    def test_save_json_and_create_backup_are_cataloged(self, music_root):
+        metadata_file = music_root / "Queen" / ".band_metadata.json"
+        JSONStorage.save_json(metadata_file, {"v": 1})
+        JSONStorage.save_json(metadata_file, {"v": 2})
+        JSONStorage.create_backup(metadata_file)
+
+        result = list_backups("Queen/.band_metadata.json")
+        assert result["status"] == "success"
+        assert result["total_backups"] == 2
+        assert {Path(b["backup"]).name for b in result["backups"]} >= {".band_metadata.json.backup"}
+
+    def test_index_backups_are_bounded(self, music_root):
+        index_file = music_root / ".collection_index.json"
+        index_file.write_text("{}")
+        for i in range(6):
+            with patch("src.core.tools.scanner.datetime") as mock_datetime:
+                mock_datetime.now.return_value.timestamp.return_value = 1_700_000_000 + i
+                _save_collection_index(CollectionIndex(), music_root)
+
+        assert len(list(music_root.glob(".collection_index.json.backup.*"))) == 3
+        assert len(list_backups(".collection_index.json")["backups"]) == 3
+
+    def test_cleanup_does_not_walk_tree_after_legacy_import(self, music_root):
+        catalog = get_backup_catalog(music_root)
+        catalog.import_untracked([])
+        catalog.record(_make_backup(music_root, "x.json.backup"), music_root / "x.json")
+
+        with patch.object(Path, "rglob", side_effect=AssertionError("tree walk")):
+            result = cleanup_backups()
+
+        assert result["status"] == "success"
+        assert result["files_removed"] == 0
+
+    def test_legacy_backups_are_imported_once(self, music_root):
+        for i in range(5):
+            _make_backup(music_root, f"Band/old.backup_{i}.json")
+
+        result = cleanup_backups(max_backups=2)
+
+        assert result["files_removed"] == 3
+        assert (music_root / BACKUP_CATALOG_FILENAME).exists()
+        assert len(list(music_root.glob("Band/*.backup*"))) == 2
+
+    def test_collection_without_backups_is_walked_once(self, music_root):
+        (music_root / "Queen").mkdir()
+
+        assert list_backups()["total_backups"] == 0
+        assert (music_root / BACKUP_CATALOG_FILENAME).exists()
+        with patch.object(Path, "rglob", side_effect=AssertionError("tree walk")):
+            assert list_backups()["total_backups"] == 0
+
+    def test_legacy_backups_are_imported_after_new_backups_were_recorded(self, music_root):
+        index_file = music_root / ".collection_index.json"
+        index_file.write_text("{}")
+        for i in range(12):
+            legacy = _make_backup(music_root, f".collection_index.json.backup.{1_600_000_000 + i}")
+            os.utime(legacy, (1_600_000_000 + i, 1_600_000_000 + i))
+        # Scans record their backups (creating the catalog) before any cleanup
+        for i in range(2):
+            with patch("src.core.tools.scanner.datetime") as mock_datetime:
+                mock_datetime.now.return_value.timestamp.return_value = 1_700_000_000 + i
+                _save_collection_index(CollectionIndex(), music_root)
+
+        result = cleanup_backups()
+
+        assert result["files_removed"] == 11
+        assert len(list(music_root.glob(".collection_index.json.backup.*"))) == 3
+        assert len(list_backups(".collection_index.json")["backups"]) == 3
+        with patch.object(Path, "rglob", side_effect=AssertionError("tree walk")):
+            assert cleanup_backups()["files_removed"] == 0
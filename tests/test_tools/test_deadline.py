@@ -0,0 +1,131 @@
+"""
+Unit tests for deadline-aware collection operations.
+
+Tests cover deadlines, continuation tokens, and partial results of
+get_band_list, advanced_search_albums and analyze_collection_insights.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools.deadline import Deadline, make_continuation_token, parse_continuation_token
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.storage import get_band_list, load_band_metadata, save_band_metadata
+from src.di import override_dependency
+from src.mcp_server.tools.advanced_search_albums_tool import advanced_search_albums_tool
+from src.mcp_server.tools.analyze_collection_insights_tool import analyze_collection_insights_tool
+
+BANDS = {"Anthrax": "Thrash Metal", "Genesis": "Progressive Rock", "Slayer": "Thrash Metal", "Yes": "Progressive Rock"}
+
+
+@pytest.fixture
+def collection():
+    temp_dir = tempfile.mkdtemp()
+    root = Path(temp_dir)
+    for band in BANDS:
+        album = root / band / "1985 - Album"
+        album.mkdir(parents=True)
+        (album / "01 - Track.mp3").touch()
+
+    class MockConfig:
+        MUSIC_ROOT_PATH = temp_dir
+        CACHE_DURATION_DAYS = 30
+        LOG_LEVEL = "INFO"
+
+    with override_dependency(Config, MockConfig()):
+        assert scan_music_folders()['status'] == 'success'
+        for band, genre in BANDS.items():
+            metadata = load_band_metadata(band)
+            metadata.genres = [genre]
+            save_band_metadata(band, metadata)
+        yield root
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _out_of_time():
+    """Make every deadline expire as soon as it is checked."""
+    return patch.object(Deadline, 'expired', return_value=True)
+
+
+class TestDeadline:
+    """Test deadlines and continuation tokens."""
+
+    def test_deadline(self):
+        assert not Deadline().expired()
+        assert Deadline().remaining_seconds() is None
+        assert 0 < Deadline(60000).remaining_seconds() <= 60
+        for invalid in (0, -5, 1.5, True, "100"):
+            with pytest.raises(ValueError):
+                Deadline(invalid)
+
+    def test_continuation_token_round_trip(self):
+        token = make_continuation_token("op", 3, {'genre': 'rock'}, "v1")
+
+        assert parse_continuation_token(token, "op", {'genre': 'rock'}, "v1") == 3
+        with pytest.raises(ValueError, match="does not belong"):
+            parse_continuation_token(token, "op", {'genre': 'jazz'}, "v1")
+        with pytest.raises(ValueError, match="changed"):
+            parse_continuation_token(token, "op", {'genre': 'rock'}, "v2")
+        with pytest.raises(ValueError, match="Invalid"):
+            parse_continuation_token("not-a-token", "op", {'genre': 'rock'}, "v1")
+
+
+class TestPartialResults:
+    """Test operations that run out of time."""
+
+    def test_band_list_continues_where_it_stopped(self, collection):
+        full = get_band_list(filter_genre="thrash metal")
+        assert full['complete'] is True
+        assert [band['name'] for band in full['bands']] == ["Anthrax", "Slayer"]
+
+        found = []
+        token = None
+        with _out_of_time():
+            for _ in range(len(BANDS)):
+                part = get_band_list(filter_genre="thrash metal", deadline_ms=1, continuation_token=token)
+                assert part['bands_examined'] == 1
+                found.extend(band['name'] for band in part['bands'])
+                token = part.get('continuation_token')
+                if part['complete']:
+                    break
+        assert token is None
+        assert found == ["Anthrax", "Slayer"]
+
+    def test_band_list_rejects_token_of_other_filters(self, collection):
+        with _out_of_time():
+            token = get_band_list(filter_genre="thrash metal", deadline_ms=1)['continuation_token']
+
+        with pytest.raises(Exception, match="does not belong"):
+            get_band_list(filter_genre="progressive rock", continuation_token=token)
+
+    def test_search_albums_partial_and_continued(self, collection):
+        full = advanced_search_albums_tool(genres="Progressive Rock")
+        assert full['status'] == 'success'
+        assert full['complete'] is True
+        assert sorted(full['results']) == ["Genesis", "Yes"]
+
+        with _out_of_time():
+            first = advanced_search_albums_tool(genres="Progressive Rock", deadline_ms=1)
+        assert first['complete'] is False
+        assert first['search_statistics']['bands_examined'] == 1
+
+        rest = advanced_search_albums_tool(genres="Progressive Rock",
+                                           continuation_token=first['continuation_token'])
+        assert rest['complete'] is True
+        assert sorted(first['results']) + sorted(rest['results']) == ["Genesis", "Yes"]
+        assert rest['search_statistics']['bands_examined'] == len(BANDS) - 1
+
+    def test_insights_cover_loaded_bands(self, collection):
+        with _out_of_time():
+            partial = analyze_collection_insights_tool(deadline_ms=1)
+
+        assert partial['status'] == 'success'
+        assert partial['complete'] is False
+        assert partial['analytics_metadata']['total_bands_analyzed'] == 1
+        assert partial['analytics_metadata']['total_bands'] == len(BANDS)
+        assert analyze_collection_insights_tool()['complete'] is True
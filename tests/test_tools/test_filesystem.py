@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable file system layer.
+
+Tests cover the local file system, latency, jitter and failure injection,
+and the scanner, storage and batch operations going through the configured
+file system.
+"""
+
+import errno
+import fcntl
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.filesystem import (
+    LatencyFileSystem,
+    LocalFileSystem,
+    configure_filesystem,
+    get_filesystem,
+)
+from src.core.tools.performance import BatchFileOperations
+from src.core.tools.scanner import _save_collection_index, scan_music_folders
+from src.models import CollectionIndex
+from src.core.tools.storage import AtomicFileWriter, JSONStorage, StorageError
+from src.di import override_dependency
+
+
+@pytest.fixture(autouse=True)
+def local_filesystem():
+    yield
+    configure_filesystem()
+
+
+@pytest.fixture
+def library(tmp_path):
+    for band, albums in {"Band A": ["1990 - First", "Live/1992 - Alive"], "Band B": ["Only"]}.items():
+        for album in albums:
+            folder = tmp_path / band / album
+            folder.mkdir(parents=True)
+            (folder / "01 - Track.mp3").touch()
+            (folder / "cover.jpg").touch()
+    return tmp_path
+
+
+class MockConfig:
+    def __init__(self, root: Path):
+        self.MUSIC_ROOT_PATH = str(root)
+        self.CACHE_DURATION_DAYS = 30
+
+
+class TestLocalFileSystem:
+    """Test the local file system."""
+
+    def test_operations(self, tmp_path):
+        fs = LocalFileSystem()
+        (tmp_path / "dir").mkdir()
+        with fs.open(tmp_path / "a.txt", 'w', encoding='utf-8') as f:
+            f.write("data")
+            fs.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fs.flock(f, fcntl.LOCK_UN)
+        fs.rename(tmp_path / "a.txt", tmp_path / "b.txt")
+
+        with fs.scandir(tmp_path) as entries:
+            assert sorted(entry.name for entry in entries) == ["b.txt", "dir"]
+        assert fs.stat(tmp_path / "b.txt").st_size == 4
+        assert fs.is_file(tmp_path / "b.txt") and not fs.is_dir(tmp_path / "b.txt")
+        assert fs.is_dir(tmp_path / "dir") and not fs.is_file(tmp_path / "dir")
+        assert not fs.exists(tmp_path / "a.txt")
+
+    def test_default_filesystem_is_local(self):
+        assert type(get_filesystem()) is LocalFileSystem
+
+
+class TestLatencyFileSystem:
+    """Test latency, jitter and failure injection."""
+
+    def test_operations_are_delayed(self, tmp_path):
+        fs = LatencyFileSystem(latency_ms={'stat': 30}, seed=1)
+
+        started = time.perf_counter()
+        fs.exists(tmp_path)
+        fs.scandir(tmp_path).close()
+        elapsed = time.perf_counter() - started
+
+        assert 0.03 <= elapsed < 0.1
+        stats = fs.get_stats()
+        assert stats['calls']['stat'] == 1
+        assert stats['calls']['scandir'] == 1
+        assert stats['delay_seconds'] == {'scandir': 0.0, 'stat': 0.03, 'open': 0.0, 'rename': 0.0, 'flock': 0.0,
+                                          'link': 0.0, 'copy': 0.0, 'remove': 0.0}
+
+    def test_jitter_is_bounded_and_seeded(self, tmp_path):
+        def delays(seed):
+            fs = LatencyFileSystem(latency_ms=2, jitter_ms=2, seed=seed)
+            for _ in range(5):
+                fs.stat(tmp_path)
+            return fs.get_stats()['delay_seconds']['stat']
+
+        assert delays(7) == delays(7)
+        assert 0 <= delays(7) <= 0.02
+
+    def test_entry_stat_costs_a_round_trip(self, tmp_path):
+        (tmp_path / "dir").mkdir()
+        fs = LatencyFileSystem()
+
+        with fs.scandir(tmp_path) as entries:
+            (entry,) = list(entries)
+            assert entry.is_dir() and entry.name == "dir" and entry.path == str(tmp_path / "dir")
+            assert fs.get_stats()['calls']['stat'] == 0
+            entry.stat()
+
+        assert fs.get_stats()['calls'] == {'scandir': 1, 'stat': 1, 'open': 0, 'rename': 0, 'flock': 0,
+                                           'link': 0, 'copy': 0, 'remove': 0}
+
+    def test_failures_are_injected(self, tmp_path):
+        fs = LatencyFileSystem(failure_rate={'open': 1.0})
+
+        with pytest.raises(OSError) as error:
+            fs.open(tmp_path / "file", 'w')
+
+        assert error.value.errno == errno.EIO
+        assert not (tmp_path / "file").exists()
+        assert fs.exists(tmp_path)
+        assert fs.get_stats()['failures']['open'] == 1
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            LatencyFileSystem(latency_ms={'unlink': 1})
+        with pytest.raises(ValueError):
+            LatencyFileSystem(jitter_ms=-1)
+
+
+class TestConfiguredFileSystem:
+    """Test the scanner, storage and batch operations using the configured file system."""
+
+    def test_scan_goes_through_filesystem(self, library):
+        fs = configure_filesystem(LatencyFileSystem())
+
+        with override_dependency(Config, MockConfig(library)):
+            result = scan_music_folders()
+
+        assert result['status'] == 'success'
+        assert result['results']['bands_discovered'] == 2
+        assert result['results']['albums_discovered'] == 3
+        calls = fs.get_stats()['calls']
+        # Root, two band folders, a type folder, three album folders
+        assert calls['scandir'] >= 7
+        assert calls['stat'] > 0 and calls['open'] > 0 and calls['rename'] > 0 and calls['flock'] > 0
+
+    def test_batch_operations_go_through_filesystem(self, library):
+        fs = configure_filesystem(LatencyFileSystem())
+
+        items = BatchFileOperations.scan_directory_batch(library)
+        count = BatchFileOperations.count_files_in_directory(library / "Band B" / "Only", {'.mp3'})
+
+        assert sorted(item.name for item in items) == ["Band A", "Band B"]
+        assert count == 1
+        assert fs.get_stats()['calls']['scandir'] == 2
+
+    def test_failed_rename_keeps_original(self, tmp_path):
+        target = tmp_path / "data.json"
+        JSONStorage.save_json(target, {'version': 1}, backup=False, storage_format='compact')
+        configure_filesystem(LatencyFileSystem(failure_rate={'rename': 1.0}))
+
+        with pytest.raises(StorageError):
+            JSONStorage.save_json(target, {'version': 2}, backup=False, storage_format='compact')
+
+        configure_filesystem()
+        assert JSONStorage.load_json(target) == {'version': 1}
+
+    def test_atomic_writer_opens_through_filesystem(self, tmp_path):
+        fs = configure_filesystem(LatencyFileSystem())
+
+        with AtomicFileWriter(tmp_path / "file.txt", backup=False) as f:
+            f.write("text")
+
+        assert (tmp_path / "file.txt").read_text() == "text"
+        assert fs.get_stats()['calls']['open'] == 1
+        assert fs.get_stats()['calls']['rename'] == 1
+
+    def test_backups_go_through_filesystem(self, tmp_path):
+        target = tmp_path / "data.json"
+        JSONStorage.save_json(target, {'version': 1}, backup=False)
+        fs = configure_filesystem(LatencyFileSystem())
+
+        with override_dependency(Config, MockConfig(tmp_path)):
+            JSONStorage.save_json(target, {'version': 2})
+            JSONStorage.create_backup(target)
+            _save_collection_index(CollectionIndex(), tmp_path)
+            _save_collection_index(CollectionIndex(), tmp_path)
+
+        calls = fs.get_stats()['calls']
+        assert calls['copy'] == 2
+        # The index backup is a hard link where the file system supports it
+        assert calls['link'] + calls['copy'] == 3
+
+    def test_failed_backup_copy_is_reported(self, tmp_path):
+        target = tmp_path / "data.json"
+        JSONStorage.save_json(target, {'version': 1}, backup=False)
+        configure_filesystem(LatencyFileSystem(failure_rate={'copy': 1.0}))
+
+        with pytest.raises(StorageError):
+            JSONStorage.create_backup(target)
+        with pytest.raises(StorageError):
+            JSONStorage.save_json(target, {'version': 2})
+
+        configure_filesystem()
+        assert JSONStorage.load_json(target) == {'version': 1}
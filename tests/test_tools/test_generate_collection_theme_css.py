@@ -16,6 +16,8 @@ def temp_collection_dir(monkeypatch):
     yield Path(temp_dir)
     os.chdir(orig_cwd)
     shutil.rmtree(temp_dir)
+    # Drop the config cached for the patched environment
+    clear_dependencies()
 
 def write_json(path, data):
     with open(path, 'w', encoding='utf-8') as f:
@@ -90,4 +92,21 @@ def test_generate_theme_css_empty_collection(temp_collection_dir, monkeypatch):
     assert result["status"] == "error"
     assert "No genre data found" in result["message"]
     css_path = temp_collection_dir / "_index.css"
-    assert not css_path.exists() 
\ No newline at end of file
+    assert not css_path.exists() 
+def test_generate_theme_css_in_metadata_store(temp_collection_dir, monkeypatch):
+    music_root = temp_collection_dir / "music"
+    store_root = temp_collection_dir / "store"
+    music_root.mkdir()
+    store_root.mkdir()
+    write_json(store_root / ".collection_index.json", {
+        "stats": {"top_genres": {"Rock": 1}},
+        "bands": [],
+        "metadata_version": "1.0"
+    })
+    monkeypatch.setenv("MUSIC_ROOT_PATH", str(music_root))
+    monkeypatch.setenv("METADATA_STORE_PATH", str(store_root))
+    clear_dependencies()
+    result = generate_collection_theme_css_tool(output_path="_index.css", force=True)
+    assert result["status"] == "success"
+    assert (store_root / "_index.css").exists()
+    assert not (music_root / "_index.css").exists()
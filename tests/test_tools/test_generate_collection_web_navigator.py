@@ -4,12 +4,15 @@ import tempfile
 import shutil
 import pytest
 from pathlib import Path
+from src.core.tools.metadata_store import MetadataStore
 from src.mcp_server.tools.generate_collection_web_navigator_tool import generate_collection_web_navigator_tool
 from src.di import clear_dependencies
 
 @pytest.fixture(autouse=True)
 def clear_di_cache():
     clear_dependencies()
+    yield
+    clear_dependencies()
 
 @pytest.fixture
 def temp_collection_dir(monkeypatch):
@@ -138,4 +141,40 @@ def test_generate_index_html_corrupt_json(temp_collection_dir, monkeypatch):
     assert html_path.exists()
     html = html_path.read_text(encoding="utf-8")
     # The HTML is generated regardless of JSON validity
-    assert "AUTO-GENERATED FILE" in html 
\ No newline at end of file
+    assert "AUTO-GENERATED FILE" in html 
+
+def test_generate_index_html_in_metadata_store(temp_collection_dir, monkeypatch):
+    music_root = temp_collection_dir / "music"
+    store_root = temp_collection_dir / "store"
+    (music_root / "Test Band").mkdir(parents=True)
+    store_root.mkdir()
+    monkeypatch.setenv("MUSIC_ROOT_PATH", str(music_root))
+    monkeypatch.setenv("METADATA_STORE_PATH", str(store_root))
+    (store_root / "_index.css").write_text("body { background: #000; }", encoding="utf-8")
+    write_json(store_root / ".collection_index.json", {
+        "bands": [{"name": "Test Band", "folder_path": "Test Band"}],
+        "metadata_version": "1.0"
+    })
+    result = generate_collection_web_navigator_tool(
+        output_path="_index.html", css_path="_index.css", force=True
+    )
+    assert result["status"] == "success"
+    # Nothing is written into the music tree
+    assert not (music_root / "_index.html").exists()
+    html = (store_root / "_index.html").read_text(encoding="utf-8")
+    band_file = MetadataStore(music_root, store_root).band_metadata_file("Test Band")
+    relative = band_file.relative_to(store_root).as_posix().replace(" ", "%20")
+    assert f'"Test Band": "{relative}"' in html
+
+
+@pytest.mark.parametrize("storage_format", ["gzip", "zlib"])
+def test_generate_index_html_refuses_compressed_storage(temp_collection_dir, monkeypatch, storage_format):
+    monkeypatch.setenv("MUSIC_ROOT_PATH", str(temp_collection_dir))
+    monkeypatch.setenv("METADATA_STORAGE_FORMAT", storage_format)
+    music_root = get_music_root()
+    result = generate_collection_web_navigator_tool(
+        output_path="_index.html", css_path="_index.css", force=True
+    )
+    assert result["status"] == "error"
+    assert storage_format in result["message"]
+    assert not (music_root / "_index.html").exists()
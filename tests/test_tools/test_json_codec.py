@@ -0,0 +1,144 @@
+"""
+Unit tests for the on-disk JSON encoding of metadata files.
+
+Tests cover every storage format, magic-byte detection, suffix overrides and
+that JSONStorage, the scanner and the cache manager read files written in any
+format.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.cache import CacheManager, CacheStatus
+from src.core.tools.json_codec import (
+    STORAGE_FORMATS,
+    decode_json,
+    detect_encoding,
+    encode_json,
+    storage_format_for_path,
+    storage_format_from_config,
+)
+from src.core.tools.metadata_store import COLLECTION_INDEX_FILENAME
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.storage import (
+    JSONStorage,
+    load_band_metadata,
+    load_collection_index,
+    save_band_metadata,
+)
+from src.di import override_dependency
+from src.exceptions import DataError
+from src.models import BandMetadata
+
+SAMPLE = {"band_name": "Björk", "albums": [{"album_name": "Homogenic", "year": "1997"}] * 20}
+
+
+class TestEncoding:
+    """Test encoding and decoding in every format."""
+
+    @pytest.mark.parametrize("storage_format", STORAGE_FORMATS)
+    def test_round_trip(self, storage_format):
+        raw = encode_json(SAMPLE, storage_format)
+        assert decode_json(raw) == SAMPLE
+
+    def test_detection(self):
+        assert detect_encoding(encode_json(SAMPLE, "gzip")) == "gzip"
+        assert detect_encoding(encode_json(SAMPLE, "zlib")) == "zlib"
+        assert detect_encoding(encode_json(SAMPLE, "compact")) == "json"
+        assert detect_encoding(b"") == "json"
+
+    def test_sizes_shrink(self):
+        pretty = len(encode_json(SAMPLE, "pretty"))
+        compact = len(encode_json(SAMPLE, "compact"))
+        assert compact < pretty
+        assert len(encode_json(SAMPLE, "gzip")) < compact
+        assert len(encode_json(SAMPLE, "zlib")) < compact
+
+    def test_gzip_output_is_deterministic(self):
+        assert encode_json(SAMPLE, "gzip") == encode_json(SAMPLE, "gzip")
+
+    def test_corrupted_compressed_data_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_json(encode_json(SAMPLE, "gzip")[:20])
+
+    def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError):
+            encode_json(SAMPLE, "bzip2")
+
+    def test_suffix_overrides_configured_format(self):
+        assert storage_format_for_path("index.json.gz", "pretty") == "gzip"
+        assert storage_format_for_path("index.json", "zlib") == "zlib"
+
+    def test_format_from_config_falls_back_to_default(self):
+        class MockConfig:
+            METADATA_STORAGE_FORMAT = "GZIP"
+
+        assert storage_format_from_config(MockConfig()) == "gzip"
+        assert storage_format_from_config(object()) == "pretty"
+        MockConfig.METADATA_STORAGE_FORMAT = "lz4"
+        assert storage_format_from_config(MockConfig()) == "pretty"
+
+
+class TestJSONStorageFormats:
+    """Test JSONStorage with explicit formats."""
+
+    @pytest.mark.parametrize("storage_format", STORAGE_FORMATS)
+    def test_save_and_load(self, tmp_path, storage_format):
+        file_path = tmp_path / "data.json"
+        JSONStorage.save_json(file_path, SAMPLE, backup=False, storage_format=storage_format)
+        assert JSONStorage.load_json(file_path) == SAMPLE
+
+    def test_gz_suffix_writes_gzip(self, tmp_path):
+        file_path = tmp_path / "data.json.gz"
+        JSONStorage.save_json(file_path, SAMPLE, backup=False, storage_format="pretty")
+        assert detect_encoding(file_path.read_bytes()) == "gzip"
+
+    def test_corrupted_gzip_raises_data_error(self, tmp_path):
+        file_path = tmp_path / "data.json"
+        file_path.write_bytes(encode_json(SAMPLE, "gzip")[:20])
+        with pytest.raises(DataError):
+            JSONStorage.load_json(file_path)
+
+
+class TestConfiguredFormat:
+    """Test that the configured format is used end to end."""
+
+    @pytest.fixture
+    def music_root(self):
+        temp_dir = tempfile.mkdtemp()
+        album = Path(temp_dir) / "Queen" / "1975 - A Night at the Opera"
+        album.mkdir(parents=True)
+        (album / "01 - Death on Two Legs.mp3").touch()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = temp_dir
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+            METADATA_STORAGE_FORMAT = "gzip"
+
+        with override_dependency(Config, MockConfig()):
+            yield Path(temp_dir)
+
+    def test_scan_save_and_load_compressed(self, music_root):
+        result = scan_music_folders()
+        assert result['status'] == 'success'
+        save_band_metadata("Queen", BandMetadata(band_name="Queen", formed="1970"))
+
+        metadata_file = music_root / "Queen" / ".band_metadata.json"
+        assert detect_encoding(metadata_file.read_bytes()) == "gzip"
+        assert detect_encoding((music_root / COLLECTION_INDEX_FILENAME).read_bytes()) == "gzip"
+        assert load_band_metadata("Queen").formed == "1970"
+        assert load_collection_index().get_band("Queen") is not None
+        assert CacheManager().get_cache_status(metadata_file) == CacheStatus.VALID
+
+    def test_pretty_files_still_readable_after_switch(self, music_root):
+        metadata_file = music_root / "Queen" / ".band_metadata.json"
+        JSONStorage.save_json(metadata_file, BandMetadata(band_name="Queen").model_dump(),
+                              storage_format="pretty")
+
+        assert load_band_metadata("Queen").band_name == "Queen"
+        save_band_metadata("Queen", BandMetadata(band_name="Queen", formed="1970"))
+        assert detect_encoding(metadata_file.read_bytes()) == "gzip"
@@ -0,0 +1,159 @@
+"""
+Unit tests for the out-of-tree metadata store.
+
+Tests cover path resolution, the one-shot importer, and that scanning and
+saving with METADATA_STORE_PATH configured never write into the music root.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.metadata_store import (
+    BAND_METADATA_FILENAME,
+    COLLECTION_INDEX_FILENAME,
+    MetadataStore,
+    store_dirname_for_band,
+)
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.storage import load_band_metadata, load_collection_index, save_band_metadata
+from src.di import override_dependency
+from src.models import BandMetadata
+
+
+def _snapshot_tree(root: Path):
+    """Return the set of relative paths below root."""
+    return {str(p.relative_to(root)) for p in root.rglob('*')}
+
+
+class TestMetadataStorePaths:
+    """Test path resolution with and without an external store."""
+
+    def test_in_tree_paths_by_default(self, tmp_path):
+        store = MetadataStore(tmp_path)
+        assert not store.is_external
+        assert store.band_metadata_file("Metallica") == tmp_path / "Metallica" / BAND_METADATA_FILENAME
+        assert store.collection_index_file() == tmp_path / COLLECTION_INDEX_FILENAME
+
+    def test_external_paths_are_mirrored_and_hashed(self, tmp_path):
+        store = MetadataStore(tmp_path / "music", tmp_path / "store")
+        metadata_file = store.band_metadata_file("AC/DC")
+        assert store.is_external
+        assert metadata_file.name == BAND_METADATA_FILENAME
+        assert metadata_file.parent.parent == tmp_path / "store" / "bands"
+        assert metadata_file.parent.name.startswith("AC_DC-")
+        assert store.collection_index_file() == tmp_path / "store" / COLLECTION_INDEX_FILENAME
+
+    def test_dirname_distinguishes_similar_names(self):
+        assert store_dirname_for_band("AC/DC") != store_dirname_for_band("AC_DC")
+        assert store_dirname_for_band("Queen") != store_dirname_for_band("queen")
+        assert store_dirname_for_band("..") not in ("..", ".")
+
+    def test_from_config_ignores_unset_values(self, tmp_path):
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(tmp_path)
+
+        assert not MetadataStore.from_config(MockConfig()).is_external
+        MockConfig.METADATA_STORE_PATH = ""
+        assert not MetadataStore.from_config(MockConfig()).is_external
+
+
+class TestMetadataStoreImport:
+    """Test the one-shot importer."""
+
+    def test_import_copies_metadata_and_index(self, tmp_path):
+        music = tmp_path / "music"
+        (music / "Queen").mkdir(parents=True)
+        (music / "Queen" / BAND_METADATA_FILENAME).write_text('{"band_name": "Queen"}')
+        (music / "Nirvana").mkdir()
+        (music / COLLECTION_INDEX_FILENAME).write_text('{"bands": []}')
+        before = _snapshot_tree(music)
+
+        store = MetadataStore(music, tmp_path / "store")
+        result = store.import_in_tree_metadata()
+
+        assert result["status"] == "success"
+        assert result["bands_imported"] == 1
+        assert result["collection_index_imported"] is True
+        assert json.loads(store.band_metadata_file("Queen").read_text()) == {"band_name": "Queen"}
+        assert store.collection_index_file().exists()
+        assert _snapshot_tree(music) == before
+
+        # Second run keeps existing store files
+        again = store.import_in_tree_metadata()
+        assert again["bands_imported"] == 0
+        assert again["bands_skipped"] == 1
+
+    def test_import_requires_store(self, tmp_path):
+        with pytest.raises(ValueError):
+            MetadataStore(tmp_path).import_in_tree_metadata()
+
+
+class TestReadOnlyMusicRoot:
+    """Scanning and saving with an external store leave the music root untouched."""
+
+    @pytest.fixture
+    def collection(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        music = temp_dir / "music"
+        album = music / "Pink Floyd" / "1973 - The Dark Side of the Moon"
+        album.mkdir(parents=True)
+        (album / "Money.mp3").touch()
+        (music / "Pink Floyd" / "Cover.jpg").touch()
+        yield music, temp_dir / "store"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_scan_and_save_write_only_to_store(self, collection):
+        music, store_path = collection
+        before = _snapshot_tree(music)
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(music)
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+            METADATA_STORE_PATH = str(store_path)
+
+        with override_dependency(Config, MockConfig()):
+            result = scan_music_folders()
+            assert result['status'] == 'success'
+            assert result['results']['bands_discovered'] == 1
+
+            save_band_metadata("Pink Floyd", BandMetadata(band_name="Pink Floyd", formed="1965"))
+            metadata = load_band_metadata("Pink Floyd")
+            index = load_collection_index()
+
+        assert _snapshot_tree(music) == before
+        assert metadata.formed == "1965"
+        assert index.get_band("Pink Floyd") is not None
+        store = MetadataStore(music, store_path)
+        assert store.band_metadata_file("Pink Floyd").exists()
+        assert store.collection_index_file().exists()
+
+    @pytest.mark.skipif(os.name == 'nt' or os.geteuid() == 0,
+                        reason="Permission bits are not enforced")
+    def test_scan_succeeds_on_read_only_root(self, collection):
+        music, store_path = collection
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(music)
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+            METADATA_STORE_PATH = str(store_path)
+
+        folders = [music] + [p for p in music.rglob('*') if p.is_dir()]
+        for folder in folders:
+            os.chmod(folder, 0o555)
+        try:
+            with override_dependency(Config, MockConfig()):
+                result = scan_music_folders()
+        finally:
+            for folder in folders:
+                os.chmod(folder, 0o755)
+
+        assert result['status'] == 'success'
+        assert MetadataStore(music, store_path).collection_index_file().exists()
@@ -0,0 +1,162 @@
+"""
+Unit tests for the performance tracker.
+
+Tests cover the bounded history, per-operation aggregates and latency
+percentiles, per-thread operation stacks, the optional memory sampling and
+allocation tracing.
+"""
+
+import threading
+import tracemalloc
+
+import pytest
+
+from src.config import Config
+from src.core.tools.performance import LatencyHistogram, PerformanceTracker
+from src.di import override_dependency
+
+
+class TestLatencyHistogram:
+    """Test latency percentiles."""
+
+    def test_percentiles_are_close(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.min == pytest.approx(0.001)
+        assert histogram.max == pytest.approx(1.0)
+        for percent in (50, 95, 99):
+            assert histogram.percentile(percent) == pytest.approx(percent / 100, rel=0.1)
+
+    def test_empty_and_single_values(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+
+        histogram.record(0.25)
+        summary = histogram.to_dict()
+        assert summary['p50_seconds'] == summary['p99_seconds'] == 0.25
+        assert summary['avg_seconds'] == 0.25
+
+
+class TestPerformanceTracker:
+    """Test the bounded tracker."""
+
+    def test_history_is_bounded_and_aggregates_keep_counting(self):
+        tracker = PerformanceTracker(max_recent_operations=10, track_memory=False)
+        for i in range(100):
+            metrics = tracker.start_operation("count_files" if i % 2 else "scan")
+            metrics.items_processed = 1
+            metrics.errors = 1 if i == 0 else 0
+            tracker.finish_operation(metrics)
+
+        assert len(tracker.get_recent_operations()) == 10
+        summary = tracker.get_metrics_summary()
+        assert summary['total_operations'] == 100
+        assert summary['total_items_processed'] == 100
+        assert summary['total_errors'] == 1
+        assert summary['recent_operations'] == 10
+        assert summary['operations']['scan']['count'] == 50
+        assert summary['operations']['scan']['errors'] == 1
+        assert summary['operations']['count_files']['p95_seconds'] is not None
+        assert 'max_memory_increase_mb' not in summary
+
+        tracker.clear_metrics()
+        assert tracker.get_metrics_summary() == {'total_operations': 0}
+
+    def test_nested_operations_per_thread(self):
+        tracker = PerformanceTracker(track_memory=False)
+        outer = tracker.start_operation("scan")
+        inner = tracker.start_operation("count_files")
+        seen_by_other_thread = []
+        thread = threading.Thread(target=lambda: seen_by_other_thread.append(tracker.get_current_operation()))
+        thread.start()
+        thread.join(5)
+
+        assert seen_by_other_thread == [None]
+        assert tracker.get_current_operation() is inner
+        assert inner.parent_operation == "scan"
+        tracker.finish_operation(inner)
+        assert tracker.get_current_operation() is outer
+        tracker.finish_operation(outer)
+        assert tracker.get_current_operation() is None
+
+    def test_memory_sampling_is_optional(self):
+        tracker = PerformanceTracker(track_memory=False)
+        unsampled = tracker.start_operation("cheap")
+        sampled = tracker.start_operation("scan", track_memory=True)
+        tracker.finish_operation(sampled)
+        tracker.finish_operation(unsampled)
+
+        assert unsampled.memory_start is None and unsampled.memory_delta is None
+        if sampled.memory_start is not None:
+            assert sampled.memory_delta is not None
+            assert 'max_memory_increase_mb' in tracker.get_metrics_summary()
+
+
+def _allocate(count):
+    return [{'name': f"Album {i}", 'tracks': list(range(20))} for i in range(count)]
+
+
+class TestAllocationTracing:
+    """Test the tracemalloc mode."""
+
+    def test_peak_and_sites_per_operation(self):
+        tracker = PerformanceTracker(track_memory=False, trace_allocations=True, allocation_top_n=3)
+        kept = []
+        for _ in range(2):
+            metrics = tracker.start_operation("analyze_collection")
+            kept.append(_allocate(2000))
+            del _allocate(20000)[:]
+            tracker.finish_operation(metrics)
+
+        assert not tracemalloc.is_tracing()
+        assert metrics.traced_memory_peak > 1
+        assert 0 < len(metrics.allocation_sites) <= 3
+        assert metrics.allocation_sites[0]['site'].endswith(".py:" + str(_allocate.__code__.co_firstlineno + 1))
+        assert metrics.allocation_sites[0]['site'].startswith("tests/")
+        summary = tracker.get_metrics_summary()
+        stats = summary['operations']['analyze_collection']
+        assert stats['traced_operations'] == 2
+        # Transient allocations count for the peak, not for the sites
+        assert stats['max_traced_peak_mb'] > sum(site['size_kb'] for site in stats['top_allocation_sites']) / 1024
+        assert len(stats['top_allocation_sites']) <= 3
+        assert summary['max_traced_peak_mb'] == stats['max_traced_peak_mb']
+
+    def test_nested_operations_keep_their_peak(self):
+        tracker = PerformanceTracker(track_memory=False, trace_allocations=True)
+        outer = tracker.start_operation("scan")
+        data = _allocate(5000)
+        del data
+        inner = tracker.start_operation("load_collection_index")
+        tracker.finish_operation(inner)
+        tracker.finish_operation(outer)
+
+        assert outer.traced_memory_peak > inner.traced_memory_peak
+        assert outer.traced_memory_peak > 1
+
+    def test_off_by_default_and_per_operation(self):
+        with override_dependency(Config, Config(MUSIC_ROOT_PATH="/tmp")):
+            tracker = PerformanceTracker(track_memory=False)
+            untraced = tracker.start_operation("scan")
+            tracker.finish_operation(untraced)
+            traced = tracker.start_operation("scan", trace_allocations=True)
+            tracker.finish_operation(traced)
+        with override_dependency(Config, Config(MUSIC_ROOT_PATH="/tmp", PERFORMANCE_TRACEMALLOC=True)):
+            configured = PerformanceTracker(track_memory=False)
+            configured.finish_operation(configured.start_operation("scan"))
+
+        assert untraced.traced_memory_peak is None and untraced.allocation_sites == []
+        assert traced.traced_memory_peak is not None
+        assert configured.trace_allocations is True
+        assert configured.get_metrics_summary()['operations']['scan']['traced_operations'] == 1
+
+    def test_tracemalloc_started_elsewhere_keeps_running(self):
+        tracker = PerformanceTracker(track_memory=False, trace_allocations=True)
+        tracemalloc.start()
+        try:
+            tracker.finish_operation(tracker.start_operation("scan"))
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
@@ -0,0 +1,195 @@
+"""
+Unit tests for the polling change detector.
+
+Tests cover mtime-based change detection, snapshot persistence, the adaptive
+interval (change rate, I/O budget, latency) and backend selection.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import mock_open, patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools.poll_watcher import POLL_SNAPSHOT_FILENAME, PollingChangeDetector
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.storage import load_collection_index, save_band_metadata
+from src.core.tools.watcher import (
+    get_watch_status,
+    is_network_mount,
+    select_watch_backend,
+    start_collection_watcher,
+    stop_collection_watcher,
+)
+from src.di import override_dependency
+from src.models import BandMetadata
+
+
+def _add_album(root: Path, band: str, album: str) -> None:
+    album_path = root / band / album
+    album_path.mkdir(parents=True)
+    (album_path / "01 - Track.mp3").touch()
+
+
+@pytest.fixture
+def music_root():
+    temp_dir = tempfile.mkdtemp()
+    root = Path(temp_dir)
+    _add_album(root, "Queen", "1975 - A Night at the Opera")
+    _add_album(root, "Rush", "1976 - 2112")
+
+    class MockConfig:
+        MUSIC_ROOT_PATH = temp_dir
+        CACHE_DURATION_DAYS = 30
+        LOG_LEVEL = "INFO"
+        WATCH_MODE_ENABLED = True
+        WATCH_BACKEND = "poll"
+        WATCH_POLL_MIN_INTERVAL = 0.05
+        WATCH_POLL_MAX_INTERVAL = 0.2
+
+    with override_dependency(Config, MockConfig()):
+        scan_music_folders()
+        yield root
+        stop_collection_watcher()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _started_detector(root: Path, **kwargs) -> PollingChangeDetector:
+    """Take the initial snapshot without starting the polling thread."""
+    detector = PollingChangeDetector(root, **kwargs)
+    detector._take_snapshot()
+    # Coarse filesystem timestamps: make sure later changes get a new mtime
+    time.sleep(0.02)
+    return detector
+
+
+class TestPollCycle:
+    """Test change detection in a single poll cycle."""
+
+    def test_idle_cycle_only_stats_root_and_bands(self, music_root):
+        detector = _started_detector(music_root)
+        with patch("src.core.tools.scanner.rescan_bands") as rescan:
+            result = detector.poll_once()
+
+        assert result['changed_bands'] == []
+        assert result['stat_calls'] == 3  # root + 2 band folders
+        rescan.assert_not_called()
+
+    def test_new_album_new_band_and_removed_band_are_rescanned(self, music_root):
+        detector = _started_detector(music_root)
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        _add_album(music_root, "Yes", "1971 - Fragile")
+        shutil.rmtree(music_root / "Rush")
+
+        result = detector.poll_once()
+
+        assert result['changed_bands'] == ["Queen", "Rush", "Yes"]
+        index = load_collection_index()
+        assert index.get_band("Queen").albums_count == 2
+        assert index.get_band("Yes") is not None
+        assert index.get_band("Rush") is None
+        stats = detector.get_stats()
+        assert stats['bands_rescanned'] == 2
+        assert stats['bands_removed'] == 1
+
+    def test_own_metadata_writes_do_not_retrigger(self, music_root):
+        detector = _started_detector(music_root)
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        detector.poll_once()
+        time.sleep(0.02)
+
+        assert detector.poll_once()['changed_bands'] == []
+
+    def test_metadata_save_is_picked_up_once(self, music_root):
+        detector = _started_detector(music_root)
+        save_band_metadata("Rush", BandMetadata(band_name="Rush", formed="1968"))
+
+        assert detector.poll_once()['changed_bands'] == ["Rush"]
+        time.sleep(0.02)
+        assert detector.poll_once()['changed_bands'] == []
+
+    def test_failed_band_is_retried(self, music_root):
+        detector = _started_detector(music_root)
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        failure = {'bands_updated': 0, 'bands_removed': 0, 'changes_detected': [],
+                   'failed_bands': ["Queen"], 'errors': ["Error scanning band folder Queen"]}
+        with patch("src.core.tools.scanner.rescan_bands", return_value=failure):
+            detector.poll_once()
+
+        assert detector.poll_once()['changed_bands'] == ["Queen"]
+
+
+class TestAdaptiveInterval:
+    """Test interval adaptation."""
+
+    def test_backs_off_while_idle_and_resets_on_change(self, music_root):
+        detector = _started_detector(music_root, min_interval=1, max_interval=4)
+        intervals = []
+        for _ in range(5):
+            detector.poll_once()
+            intervals.append(detector.interval)
+        assert intervals == [1.5, 2.25, 3.375, 4, 4]
+
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        detector.poll_once()
+        assert detector.interval == 1
+        assert detector.get_stats()['interval_reason'] == 'changes'
+
+    def test_io_budget_sets_interval_floor(self, music_root):
+        detector = _started_detector(music_root, min_interval=0, max_interval=0.1,
+                                     max_stats_per_second=1)
+        detector.poll_once()
+
+        assert detector.interval == 3  # 3 stat calls at 1 per second
+        assert detector.get_stats()['interval_reason'] == 'io_budget'
+        assert detector.get_stats()['stats_per_second'] <= 1
+
+    def test_slow_storage_sets_latency_floor(self, music_root):
+        detector = _started_detector(music_root, min_interval=0, max_interval=0.1,
+                                     max_stats_per_second=0)
+        real_stat = __import__('os').stat
+
+        def slow_stat(path, *args, **kwargs):
+            time.sleep(0.02)
+            return real_stat(path, *args, **kwargs)
+
+        with patch("src.core.tools.poll_watcher.os.stat", side_effect=slow_stat):
+            detector.poll_once()
+
+        stats = detector.get_stats()
+        assert stats['interval_reason'] == 'io_latency'
+        assert detector.interval >= 10 * 0.06
+        assert stats['last_cycle_seconds'] >= 0.06
+
+
+class TestPollingBackend:
+    """Test the polling thread, snapshot persistence and backend selection."""
+
+    def test_changes_while_stopped_are_detected_on_start(self, music_root):
+        watcher = start_collection_watcher()
+        assert isinstance(watcher, PollingChangeDetector)
+        assert (music_root / POLL_SNAPSHOT_FILENAME).exists()
+        stop_collection_watcher()
+
+        time.sleep(0.02)
+        _add_album(music_root, "Yes", "1971 - Fragile")
+        start_collection_watcher()
+
+        deadline = time.monotonic() + 10
+        while load_collection_index().get_band("Yes") is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert load_collection_index().get_band("Yes") is not None
+        status = get_watch_status()
+        assert status['backend'] == 'poll'
+        assert status['cycles'] >= 1
+        assert status['last_cycle_stats'] >= 3
+
+    def test_auto_backend_polls_network_mounts(self, tmp_path):
+        mounts = f"server:/music {tmp_path} nfs4 rw 0 0\n"
+        with patch("builtins.open", mock_open(read_data=mounts)):
+            assert is_network_mount(tmp_path / "Queen") is True
+            assert select_watch_backend("auto", tmp_path) == "poll"
+        assert select_watch_backend("poll", tmp_path) == "poll"
@@ -0,0 +1,191 @@
+"""
+Unit tests for resumable scans.
+
+Tests cover checkpointing an interrupted scan, resuming it (skipping bands
+that are unchanged since the checkpoint), scope matching and disabling
+checkpoints.
+"""
+
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools import scanner
+from src.core.tools.scan_checkpoint import SCAN_STATE_FILENAME, ScanCheckpoint
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.storage import load_collection_index
+from src.di import override_dependency
+
+BANDS = ["Band A", "Band B", "Band C", "Band D", "Band E"]
+
+
+class _Interrupted(BaseException):
+    """Stands in for a restart or cancellation in the middle of a scan."""
+
+
+def _add_album(root: Path, band: str, album: str) -> None:
+    album_path = root / band / album
+    album_path.mkdir(parents=True)
+    (album_path / "01 - Track.mp3").touch()
+
+
+def _make_config(root: Path, interval: float):
+    class MockConfig:
+        MUSIC_ROOT_PATH = str(root)
+        CACHE_DURATION_DAYS = 30
+        LOG_LEVEL = "INFO"
+        SCAN_CHECKPOINT_INTERVAL_SECONDS = interval
+    return MockConfig()
+
+
+@pytest.fixture
+def music_root():
+    temp_dir = tempfile.mkdtemp()
+    root = Path(temp_dir)
+    for band in BANDS:
+        _add_album(root, band, "2000 - Album")
+    with override_dependency(Config, _make_config(root, 1e-6)):
+        yield root
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _interrupted_scan(after_bands: int, **kwargs) -> None:
+    """Run a scan that is interrupted while scanning band number after_bands + 1."""
+    real_scan = scanner._scan_band_folder
+    calls = []
+
+    def scan_then_interrupt(band_folder, music_root):
+        if len(calls) == after_bands:
+            raise _Interrupted()
+        calls.append(band_folder.name)
+        return real_scan(band_folder, music_root)
+
+    with patch("src.core.tools.scanner._scan_band_folder", side_effect=scan_then_interrupt):
+        with pytest.raises(_Interrupted):
+            scan_music_folders(**kwargs)
+
+
+def _counting_scan(**kwargs):
+    """Run a scan, returning its result and the band folders it scanned."""
+    real_scan = scanner._scan_band_folder
+    scanned = []
+
+    def count(band_folder, music_root):
+        scanned.append(band_folder.name)
+        return real_scan(band_folder, music_root)
+
+    with patch("src.core.tools.scanner._scan_band_folder", side_effect=count):
+        return scan_music_folders(**kwargs), scanned
+
+
+class TestResumableScan:
+    """Test checkpointing and resuming scans."""
+
+    def test_interrupted_scan_leaves_checkpoint_and_no_index(self, music_root):
+        _interrupted_scan(after_bands=3)
+
+        state = json.loads((music_root / SCAN_STATE_FILENAME).read_text())
+        assert state['status'] == 'in_progress'
+        assert len(state['processed_bands']) == 3
+        assert state['scope'] == {'band_names': None, 'path_glob': None}
+        assert load_collection_index() is None
+
+    def test_resume_scans_only_remaining_bands(self, music_root):
+        _interrupted_scan(after_bands=3)
+
+        result, scanned = _counting_scan()
+
+        assert result['status'] == 'success'
+        assert len(scanned) == 2
+        resume = result['results']['resume']
+        assert resume['mode'] == 'resumed'
+        assert resume['bands_restored'] == 3
+        assert resume['bands_scanned'] == 2
+        assert resume['time_saved_seconds'] >= 0
+        # Totals match an uninterrupted scan
+        assert result['results']['bands_added'] == 5
+        assert result['results']['albums_discovered'] == 5
+        assert result['results']['changes_detected_count'] == 5
+        assert len(load_collection_index().bands) == 5
+        assert not (music_root / SCAN_STATE_FILENAME).exists()
+
+        # The checkpoint is gone, so the next scan starts fresh
+        result, scanned = _counting_scan()
+        assert result['results']['resume']['mode'] == 'fresh'
+        assert len(scanned) == 5
+
+    def test_band_changed_since_checkpoint_is_rescanned(self, music_root):
+        _interrupted_scan(after_bands=3)
+        state = json.loads((music_root / SCAN_STATE_FILENAME).read_text())
+        changed_band = sorted(state['processed_bands'])[0]
+        time.sleep(0.02)
+        _add_album(music_root, changed_band, "2001 - Second Album")
+
+        result, scanned = _counting_scan()
+
+        assert changed_band in scanned
+        assert result['results']['resume']['bands_restored'] == 2
+        assert result['results']['albums_discovered'] == 6
+        assert load_collection_index().get_band(changed_band).albums_count == 2
+
+    def test_band_removed_since_checkpoint(self, music_root):
+        scan_music_folders()
+        _add_album(music_root, "Band F", "2000 - Album")
+        _interrupted_scan(after_bands=4)
+        state = json.loads((music_root / SCAN_STATE_FILENAME).read_text())
+        removed_band = sorted(state['processed_bands'])[0]
+        shutil.rmtree(music_root / removed_band)
+
+        result, _ = _counting_scan()
+
+        assert result['results']['resume']['mode'] == 'resumed'
+        assert result['results']['bands_removed'] == 1
+        assert result['results']['bands_added'] == 1
+        assert load_collection_index().get_band(removed_band) is None
+        assert len(load_collection_index().bands) == 5
+
+    def test_other_scope_does_not_resume(self, music_root):
+        _interrupted_scan(after_bands=3)
+
+        result, scanned = _counting_scan(band_names=["Band E"])
+
+        assert result['results']['resume']['mode'] == 'fresh'
+        assert scanned == ["Band E"]
+        # The full scan's checkpoint is kept for a later full scan
+        assert (music_root / SCAN_STATE_FILENAME).exists()
+        assert _counting_scan()[0]['results']['resume']['mode'] == 'resumed'
+
+    def test_checkpoints_disabled(self, music_root):
+        with override_dependency(Config, _make_config(music_root, 0)):
+            _interrupted_scan(after_bands=3)
+            assert not (music_root / SCAN_STATE_FILENAME).exists()
+            result, scanned = _counting_scan()
+
+        assert result['results']['resume']['mode'] == 'fresh'
+        assert len(scanned) == 5
+
+
+class TestScanCheckpoint:
+    """Test the scan-state file."""
+
+    def test_unreadable_or_foreign_state_is_ignored(self, tmp_path):
+        (tmp_path / SCAN_STATE_FILENAME).write_text('{"version": 1, "processed_')
+        assert ScanCheckpoint(tmp_path, tmp_path / "music").load() is False
+
+        checkpoint = ScanCheckpoint(tmp_path, tmp_path / "music", interval_seconds=1)
+        checkpoint.record("Band A", 1, 1, 1, {})
+        assert checkpoint.save() is True
+        assert ScanCheckpoint(tmp_path, tmp_path / "other").load() is False
+        assert ScanCheckpoint(tmp_path, tmp_path / "music", path_glob="Band*").load() is False
+
+        resumed = ScanCheckpoint(tmp_path, tmp_path / "music")
+        assert resumed.load() is True
+        assert resumed.loaded_bands == 1
+        resumed.clear()
+        assert not (tmp_path / SCAN_STATE_FILENAME).exists()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for scan cost profiles.
+
+Tests cover charging work to bands and to the scan, ranking of the slowest
+bands, reporting from the file system layer and the JSON codec, and the
+cost breakdown of a scan result and its report.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.filesystem import LocalFileSystem
+from src.core.tools.json_codec import decode_json, encode_json
+from src.core.tools.scan_costs import (
+    SCAN_PHASES,
+    ScanCostProfile,
+    current_scan_costs,
+    record_scan_io,
+    scan_phase,
+)
+from src.core.tools.scanner import scan_music_folders
+from src.di import override_dependency
+
+
+@pytest.fixture
+def library(tmp_path):
+    albums = {"Band A": ["1990 - First", "Live/1992 - Alive"], "Band B": ["Only"]}
+    for band, band_albums in albums.items():
+        for album in band_albums:
+            folder = tmp_path / band / album
+            folder.mkdir(parents=True)
+            (folder / "01 - Track.mp3").touch()
+    scans = tmp_path / "Band A" / "1990 - First" / "Scans"
+    for i in range(30):
+        (scans / f"page{i}").mkdir(parents=True)
+        (scans / f"page{i}" / "front.jpg").touch()
+    return tmp_path
+
+
+class MockConfig:
+    def __init__(self, root: Path):
+        self.MUSIC_ROOT_PATH = str(root)
+        self.CACHE_DURATION_DAYS = 30
+
+
+class TestScanCostProfile:
+    """Test charging work and ranking bands."""
+
+    def test_work_is_charged_to_current_band(self, tmp_path):
+        fs = LocalFileSystem()
+        with ScanCostProfile() as costs:
+            assert current_scan_costs() is costs
+            fs.scandir(tmp_path).close()
+            costs.start_band("Band A")
+            with scan_phase('scan'):
+                fs.scandir(tmp_path).close()
+                fs.stat(tmp_path)
+            decode_json(encode_json({'band_name': "Band A"}))
+            band = costs.finish_band()
+
+        assert current_scan_costs() is None
+        assert band.dirs_listed == 1 and band.paths_stated == 1
+        assert band.metadata_bytes_read == band.metadata_bytes_written > 0
+        assert band.parse_seconds > 0
+        assert set(band.phases) == {'scan'}
+        summary = costs.to_dict()
+        assert summary['totals']['dirs_listed'] == 2
+        assert summary['bands_profiled'] == 1
+        assert list(summary['phases']) == list(SCAN_PHASES)
+
+    def test_only_slowest_bands_are_kept(self):
+        with ScanCostProfile(slowest_bands=3) as costs:
+            for i, seconds in enumerate([0.0, 0.02, 0.0, 0.01, 0.03, 0.0]):
+                costs.start_band(f"Band {i}")
+                time.sleep(seconds)
+            # The last band is finished when the profile ends
+
+        summary = costs.to_dict()
+        assert [band['band_name'] for band in summary['slowest_bands']] == ["Band 4", "Band 1", "Band 3"]
+        assert summary['bands_profiled'] == 6
+
+    def test_reporting_without_profile_is_ignored(self, tmp_path):
+        record_scan_io('dirs_listed')
+        with scan_phase('scan'):
+            LocalFileSystem().scandir(tmp_path).close()
+        assert current_scan_costs() is None
+
+
+class TestScanCostBreakdown:
+    """Test the cost breakdown of scans."""
+
+    def test_scan_result_lists_costs(self, library):
+        with override_dependency(Config, MockConfig(library)):
+            result = scan_music_folders()
+
+        breakdown = result['results']['cost_breakdown']
+        assert breakdown['bands_profiled'] == 2
+        assert all(breakdown['phases'][phase] > 0 for phase in SCAN_PHASES)
+        bands = {band['band_name']: band for band in breakdown['slowest_bands']}
+        assert set(bands) == {"Band A", "Band B"}
+        seconds = [band['seconds'] for band in breakdown['slowest_bands']]
+        assert seconds == sorted(seconds, reverse=True)
+        # The scans/ folders are listed when looking for album images
+        assert bands["Band A"]['dirs_listed'] > 30 > bands["Band B"]['dirs_listed']
+        assert bands["Band A"]['metadata_bytes_written'] > 0
+        assert breakdown['totals']['dirs_listed'] > sum(band['dirs_listed'] for band in bands.values())
+
+        with open(result['results']['report_path'], encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        costs = {record['band_name']: record['cost'] for record in records if record['type'] == 'band'}
+        assert set(costs) == {"Band A", "Band B"}
+        assert costs["Band B"]['phases'].keys() == {'scan', 'sync', 'index'}
@@ -0,0 +1,134 @@
+"""
+Unit tests for streamed scan reports.
+
+Tests cover the JSON Lines report writer and paged reader, retention, and
+that scan_music_folders keeps only a bounded summary in its response while
+every band result is written to the report.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.core.tools.scan_report import (
+    SCAN_REPORTS_DIRNAME,
+    ScanReportWriter,
+    list_scan_reports,
+    read_scan_report,
+)
+from src.core.tools.scanner import MAX_PREVIEW_BANDS, get_scan_report, scan_music_folders
+from src.di import override_dependency
+
+
+class TestScanReportFile:
+    """Test the report writer and reader."""
+
+    def test_write_and_page(self, tmp_path):
+        with ScanReportWriter(tmp_path) as report:
+            for i in range(7):
+                report.write('band', {'band_name': f"Band {i}"})
+            report.write('change', {'message': "Added new band: Band 0"})
+            report.write('summary', {'bands_discovered': 7})
+
+        page = read_scan_report(report.report_path, page=2, page_size=3, record_type='band')
+        assert [r['band_name'] for r in page['records']] == ["Band 3", "Band 4", "Band 5"]
+        assert page['pagination']['total_records'] == 7
+        assert page['pagination']['total_pages'] == 3
+        assert page['pagination']['has_next'] is True
+        assert page['summary']['bands_discovered'] == 7
+
+    def test_retention_keeps_newest_reports(self, tmp_path):
+        paths = []
+        for _ in range(4):
+            with ScanReportWriter(tmp_path, retention=2) as report:
+                report.write('summary', {})
+            paths.append(report.report_path)
+
+        assert list_scan_reports(tmp_path) == [paths[3], paths[2]]
+
+    def test_torn_line_is_ignored(self, tmp_path):
+        with ScanReportWriter(tmp_path) as report:
+            report.write('band', {'band_name': "A"})
+        with open(report.report_path, 'a') as f:
+            f.write('{"type": "band", "band_')
+
+        assert read_scan_report(report.report_path)['pagination']['total_records'] == 1
+
+    def test_invalid_record_type_rejected(self, tmp_path):
+        with ScanReportWriter(tmp_path) as report:
+            pass
+        with pytest.raises(ValueError):
+            read_scan_report(report.report_path, record_type='albums')
+
+
+class TestStreamingScan:
+    """Test that scans stream band results to the report."""
+
+    @pytest.fixture
+    def music_root(self):
+        temp_dir = tempfile.mkdtemp()
+        for i in range(MAX_PREVIEW_BANDS + 5):
+            album = Path(temp_dir) / f"Band {i:02d}" / "2000 - Album"
+            album.mkdir(parents=True)
+            (album / "01 - Track.mp3").touch()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = temp_dir
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+
+        with override_dependency(Config, MockConfig()):
+            yield Path(temp_dir)
+
+    def test_response_is_bounded_and_report_is_complete(self, music_root):
+        with patch("src.core.tools.scanner.MAX_LISTED_SCAN_EVENTS", 10):
+            result = scan_music_folders()
+
+        assert result['status'] == 'success'
+        scan_results = result['results']
+        assert scan_results['bands_discovered'] == MAX_PREVIEW_BANDS + 5
+        assert len(scan_results['bands']) == MAX_PREVIEW_BANDS
+        assert scan_results['bands_truncated'] is True
+        assert 'albums' not in scan_results['bands'][0]
+        assert len(scan_results['changes_detected']) == 10
+        assert scan_results['changes_detected_count'] == MAX_PREVIEW_BANDS + 5
+
+        report_path = Path(scan_results['report_path'])
+        assert report_path.parent == music_root / SCAN_REPORTS_DIRNAME
+        records = [json.loads(line) for line in report_path.read_text().splitlines()]
+        bands = [r for r in records if r['type'] == 'band']
+        assert len(bands) == MAX_PREVIEW_BANDS + 5
+        assert bands[0]['albums'][0]['album_name'] == "Album"
+        assert records[-1]['type'] == 'summary'
+        assert records[-1]['changes_detected_count'] == MAX_PREVIEW_BANDS + 5
+
+    def test_get_scan_report_defaults_to_latest(self, music_root):
+        scan_music_folders()
+        latest = scan_music_folders()['results']['report_path']
+
+        page = get_scan_report(page=1, page_size=5, record_type='band')
+        assert page['status'] == 'success'
+        assert page['report_path'] == latest
+        assert len(page['records']) == 5
+        assert page['pagination']['total_records'] == MAX_PREVIEW_BANDS + 5
+
+    def test_get_scan_report_only_reads_report_directory(self, music_root):
+        scan_music_folders()
+        (music_root / "secret.jsonl").write_text('{"type": "band"}\n')
+
+        with pytest.raises(ValueError):
+            get_scan_report(report_path=str(music_root / "secret.jsonl"))
+
+    def test_scan_tool_and_report_tool(self, music_root):
+        from src.mcp_server.tools.get_scan_report_tool import get_scan_report_tool
+        from src.mcp_server.tools.scan_music_folders_tool import scan_music_folders as scan_tool
+
+        scan = scan_tool()
+        assert scan['status'] == 'success'
+        result = get_scan_report_tool(report_path=scan['results']['report_path'], record_type='summary')
+        assert result['status'] == 'success'
+        assert result['records'][0]['bands_discovered'] == MAX_PREVIEW_BANDS + 5
@@ -749,3 +749,90 @@ class TestMusicDirectoryScanner:
         # Now scan should detect has_metadata as True
         result = _scan_band_folder(beatles_folder, temp_music_dir)
         assert result['has_metadata'] is True  # Now has last_metadata_saved timestamp 
+
+
+class TestScopedScans:
+    """Test scans limited to specific bands or a path glob."""
+
+    @pytest.fixture
+    def scanned_root(self):
+        """Create and fully scan a collection, yielding its root under a DI config override."""
+        from src.di import override_dependency
+        from src.config import Config
+
+        temp_dir = Path(tempfile.mkdtemp())
+        for band, album in [("Queen", "A Night at the Opera"), ("Pink Floyd", "Animals"),
+                            ("Pink Martini", "Sympathique"), ("Rush", "2112")]:
+            (temp_dir / band / album).mkdir(parents=True)
+            (temp_dir / band / album / "01.mp3").touch()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(temp_dir)
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+
+        with override_dependency(Config, MockConfig()):
+            scan_music_folders()
+            yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_band_names_scope_updates_only_named_bands(self, scanned_root):
+        from src.core.tools.storage import load_collection_index
+
+        (scanned_root / "Queen" / "News of the World").mkdir()
+        (scanned_root / "Queen" / "News of the World" / "01.mp3").touch()
+        (scanned_root / "Rush" / "Moving Pictures").mkdir()
+        (scanned_root / "Rush" / "Moving Pictures" / "01.mp3").touch()
+
+        with patch("src.core.tools.scanner._discover_band_folders",
+                   side_effect=AssertionError("full walk")):
+            result = scan_music_folders(band_names=["Queen"])
+
+        assert result['status'] == 'success'
+        assert result['results']['bands_discovered'] == 1
+        assert result['results']['bands_updated'] == 1
+        assert result['results']['scope']['full_scan'] is False
+        index = load_collection_index()
+        assert index.get_band("Queen").albums_count == 2
+        assert index.get_band("Rush").albums_count == 1
+        assert len(index.bands) == 4
+
+    def test_removal_detection_is_confined_to_scope(self, scanned_root):
+        from src.core.tools.storage import load_collection_index
+
+        shutil.rmtree(scanned_root / "Rush")
+        shutil.rmtree(scanned_root / "Pink Floyd")
+
+        result = scan_music_folders(band_names=["Pink Floyd", "Queen"])
+
+        assert result['results']['bands_removed'] == 1
+        assert "Removed band: Pink Floyd" in result['results']['changes_detected']
+        index = load_collection_index()
+        assert index.get_band("Pink Floyd") is None
+        assert index.get_band("Rush") is not None
+
+    def test_path_glob_scope(self, scanned_root):
+        (scanned_root / "Pink Panther" / "Theme").mkdir(parents=True)
+
+        result = scan_music_folders(path_glob="Pink*/*")
+
+        assert result['status'] == 'success'
+        assert result['results']['bands_discovered'] == 3
+        assert result['results']['bands_added'] == 1
+        assert {b['band_name'] for b in result['results']['bands']} == {
+            "Pink Floyd", "Pink Martini", "Pink Panther"}
+
+    def test_invalid_band_name_is_rejected(self, scanned_root):
+        result = scan_music_folders(band_names=["../etc"])
+
+        assert result['status'] == 'error'
+        assert "Invalid band name" in result['error']
+
+    def test_tool_passes_scope(self, scanned_root):
+        from src.mcp_server.tools.scan_music_folders_tool import scan_music_folders as scan_tool
+
+        result = scan_tool(band_names=["Rush"])
+
+        assert result['status'] == 'success'
+        assert result['results']['bands_discovered'] == 1
+        assert result['tool_info']['scan_mode'] == 'scoped_change_detection'
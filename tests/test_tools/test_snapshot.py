@@ -0,0 +1,242 @@
+"""
+Unit tests for snapshot isolation.
+
+Tests cover pinned readers keeping their generation while files are
+replaced, transactions publishing all their writes at once, reclaiming old
+generations, detecting files changed outside the server and readers that
+stay isolated from a running collection scan.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.scanner import scan_music_folders
+from src.core.tools.snapshot import SnapshotStore
+from src.core.tools.storage import get_band_list, load_band_metadata, load_collection_index
+from src.di import override_dependency
+
+
+def _replace(path: Path, data) -> None:
+    temp = path.with_suffix('.tmp')
+    temp.write_text(json.dumps(data), encoding='utf-8')
+    os.replace(temp, path)
+
+
+def _in_thread(func):
+    """Run func on another thread (which has no pin or transaction) and return its result."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join(10)
+    return result[0]
+
+
+@pytest.fixture
+def temp_dir():
+    directory = Path(tempfile.mkdtemp())
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestSnapshotStore:
+    """Test generations, pins and transactions."""
+
+    def test_pinned_reader_keeps_its_generation(self, temp_dir):
+        store = SnapshotStore()
+        path = temp_dir / "a.json"
+        _replace(path, {'v': 1})
+
+        with store.pin() as snapshot:
+            generation = snapshot.generation
+            # Another thread replaces a file this reader has not read yet
+            _in_thread(lambda: store.write(path, lambda: _replace(path, {'v': 2})))
+            assert store.read(path) == {'v': 1}
+            assert _in_thread(lambda: store.read(path)) == {'v': 2}
+            assert store.current_generation > generation
+            assert store.get_stats()['live_snapshots'] == 2
+
+        assert store.read(path) == {'v': 2}
+        stats = store.get_stats()
+        assert stats['live_snapshots'] == 1
+        assert stats['generations_reclaimed'] == 1
+        assert stats['readers'] == 0
+
+    def test_writer_sees_its_own_writes(self, temp_dir):
+        store = SnapshotStore()
+        path = temp_dir / "a.json"
+
+        with store.pin():
+            assert store.read(path) is None
+            store.write(path, lambda: _replace(path, {'v': 1}))
+            assert store.read(path) == {'v': 1}
+
+    def test_transaction_publishes_writes_together(self, temp_dir):
+        store = SnapshotStore()
+        paths = [temp_dir / "a.json", temp_dir / "b.json"]
+        for path in paths:
+            _replace(path, {'v': 1})
+        published = store.get_stats()['generations_published']
+
+        pinned = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def reader():
+            with store.pin():
+                pinned.set()
+                release.wait(10)
+                seen.extend(store.read(path) for path in paths)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        pinned.wait(10)
+        with store.transaction():
+            for path in paths:
+                store.write(path, lambda path=path: _replace(path, {'v': 2}))
+                # The writer reads the files directly, as do readers starting now
+                assert store.read(path) == {'v': 2}
+                assert _in_thread(lambda path=path: store.read(path)) == {'v': 2}
+            assert store.get_stats()['generations_published'] == published
+        release.set()
+        thread.join(10)
+
+        # The reader pinned before the writes keeps the old files
+        assert seen == [{'v': 1}, {'v': 1}]
+        assert [_in_thread(lambda path=path: store.read(path)) for path in paths] == [{'v': 2}, {'v': 2}]
+        assert store.get_stats()['generations_published'] == published + 1
+        assert store.get_stats()['live_snapshots'] == 1
+
+    def test_failed_write_keeps_generation(self, temp_dir):
+        store = SnapshotStore()
+        path = temp_dir / "a.json"
+        _replace(path, {'v': 1})
+        generation = store.current_generation
+
+        def fail():
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            store.write(path, fail)
+        assert store.current_generation == generation
+        assert store.read(path) == {'v': 1}
+
+    def test_external_changes_and_models(self, temp_dir):
+        store = SnapshotStore()
+        path = temp_dir / "a.json"
+        _replace(path, {'v': 1})
+        builds = []
+
+        def build(data):
+            builds.append(data)
+            return dict(data)
+
+        first = store.read_model(path, build)
+        assert store.read_model(path, build) is first
+        _replace(path, {'v': 2, 'edited': True})
+
+        assert store.read_model(path, build) == {'v': 2, 'edited': True}
+        assert len(builds) == 2
+        assert store.get_stats()['external_changes'] == 1
+
+    def test_cache_is_bounded(self, temp_dir):
+        store = SnapshotStore(max_cached_files=3)
+        for i in range(10):
+            path = temp_dir / f"{i}.json"
+            _replace(path, {'v': i})
+            assert store.read(path) == {'v': i}
+        assert store.get_stats()['files_cached'] == 3
+
+    def test_writes_without_readers_do_not_read_old_files(self, temp_dir, monkeypatch):
+        from src.core.tools import snapshot as snapshot_module
+
+        store = SnapshotStore(max_cached_files=3)
+        paths = [temp_dir / f"{i}.json" for i in range(10)]
+        for path in paths:
+            _replace(path, {'v': 1})
+            store.read(path)
+        loads = []
+        load_entry = snapshot_module._load_entry
+        monkeypatch.setattr(snapshot_module, '_load_entry', lambda path: loads.append(path) or load_entry(path))
+
+        with store.transaction():
+            for path in paths:
+                store.write(path, lambda path=path: _replace(path, {'v': 2}))
+                assert _in_thread(lambda path=path: store.read(path)) == {'v': 2}
+                assert store.get_stats()['files_cached'] <= 3
+        # Only the readers loaded files
+        assert len(loads) == len(paths)
+
+
+class TestScanIsolation:
+    """Test readers running while a collection scan rewrites the collection."""
+
+    @pytest.fixture
+    def music_root(self, temp_dir):
+        for band in ("Queen", "Rush"):
+            album = temp_dir / band / "2000 - Album"
+            album.mkdir(parents=True)
+            (album / "01 - Track.mp3").touch()
+
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(temp_dir)
+            CACHE_DURATION_DAYS = 30
+            LOG_LEVEL = "INFO"
+
+        with override_dependency(Config, MockConfig()):
+            yield temp_dir
+
+    def test_reader_sees_collection_before_scan(self, music_root):
+        from src.core.tools.snapshot import get_snapshot_store
+
+        assert scan_music_folders()['status'] == 'success'
+        album = music_root / "Yes" / "1971 - Fragile"
+        album.mkdir(parents=True)
+        (album / "01 - Roundabout.mp3").touch()
+
+        with get_snapshot_store().pin():
+            assert get_band_list()['total_bands'] == 2
+            assert load_band_metadata("Yes") is None
+            assert _in_thread(scan_music_folders)['results']['bands_discovered'] == 3
+            assert get_band_list()['total_bands'] == 2
+            assert load_band_metadata("Yes") is None
+            assert len(load_collection_index().bands) == 2
+
+        assert get_band_list()['total_bands'] == 3
+        assert load_band_metadata("Yes").band_name == "Yes"
+
+    def test_scan_keeps_cache_bounded(self, music_root, monkeypatch):
+        from src.core.tools import snapshot as snapshot_module
+
+        for i in range(20):
+            album = music_root / f"Band {i:02d}" / "2000 - Album"
+            album.mkdir(parents=True)
+            (album / "01 - Track.mp3").touch()
+        store = SnapshotStore(max_cached_files=5)
+        monkeypatch.setattr(snapshot_module, '_store', store)
+        assert scan_music_folders()['status'] == 'success'
+        for band in ("Queen", "Rush", "Band 07"):
+            load_band_metadata(band)
+
+        cached = []
+        original_write = snapshot_module.SnapshotStore.write
+
+        def write(self, path, replace):
+            original_write(self, path, replace)
+            cached.append(self.get_stats()['files_cached'])
+            # A reader during the scan loads another band into the current snapshot
+            _in_thread(lambda: load_band_metadata("Queen"))
+
+        monkeypatch.setattr(snapshot_module.SnapshotStore, 'write', write)
+        # Handlers pin a snapshot for the whole call; the scan's own pin keeps nothing alive
+        with store.pin():
+            assert scan_music_folders()['status'] == 'success'
+            assert store.get_stats()['live_snapshots'] == 1
+        assert len(cached) > 22
+        assert max(cached) <= 5
@@ -981,6 +981,21 @@ class TestEnhancedBandListOperations(unittest.TestCase):
         self.assertEqual(result['bands'][0]['name'], "Alice in Chains")
         self.assertEqual(result['filters_applied']['genre'], "grunge")
     
+    def test_list_and_genre_filter_use_metadata_summaries(self):
+        """Test that list and genre filter paths never build full band metadata."""
+        from src.models import BandMetadataSummary
+        
+        with patch.object(storage, 'load_band_metadata', side_effect=AssertionError("full load")), \
+             patch.object(BandMetadataSummary, 'to_band_metadata', side_effect=AssertionError("materialized")):
+            result = storage.get_band_list(filter_genre="metal")
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual({band['name'] for band in result['bands']}, {"Alice in Chains", "Black Sabbath", "Iron Maiden"})
+        sabbath = next(band for band in result['bands'] if band['name'] == "Black Sabbath")
+        self.assertEqual(sabbath['formed'], "1968")
+        self.assertEqual(sabbath['album_types_distribution'], {"Album": 8})
+        self.assertNotIn('metadata_error', sabbath)
+    
     def test_filter_has_metadata(self):
         """Test filtering by metadata availability."""
         # Test bands with metadata
@@ -0,0 +1,150 @@
+"""
+Unit tests for trace spans.
+
+Tests cover span hierarchy, propagation to other threads, sampling, the
+rotating JSONL export, tracked operations and handler calls as spans, and
+the offline trace summary script.
+"""
+
+import importlib.util
+import json
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.core.tools.performance import track_operation
+from src.core.tools.tracing import (
+    NON_RECORDING_SPAN,
+    configure_tracing,
+    current_trace_id,
+    trace_span,
+    with_current_context,
+)
+from src.mcp_server.base_handlers import BaseToolHandler
+
+
+def _read_spans(path: Path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+@pytest.fixture
+def trace_file():
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "traces.jsonl"
+    configure_tracing(1.0, path)
+    yield path
+    configure_tracing(0.0)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestSpans:
+    """Test span hierarchy and export."""
+
+    def test_nested_spans_share_the_trace(self, trace_file):
+        with trace_span("request", answer=42) as root:
+            with trace_span("child"):
+                pass
+            assert current_trace_id() == root.trace_id
+        assert current_trace_id() is None
+
+        child, request = _read_spans(trace_file)
+        assert child['traceId'] == request['traceId'] == root.trace_id
+        assert child['parentSpanId'] == request['spanId']
+        assert request['parentSpanId'] == ""
+        assert request['attributes'] == [{'key': 'answer', 'value': {'intValue': 42}}]
+        assert int(request['endTimeUnixNano']) >= int(request['startTimeUnixNano'])
+        assert request['resource']['service.name'] == "music-collection-mcp"
+
+    def test_context_follows_work_to_other_threads(self, trace_file):
+        def work():
+            with trace_span("worker"):
+                pass
+
+        with trace_span("request") as root:
+            thread = threading.Thread(target=with_current_context(work))
+            thread.start()
+            thread.join(5)
+
+        worker = next(span for span in _read_spans(trace_file) if span['name'] == "worker")
+        assert worker['traceId'] == root.trace_id
+        assert worker['parentSpanId'] == root.span_id
+
+    def test_errors_mark_the_span(self, trace_file):
+        with pytest.raises(ValueError):
+            with trace_span("request"):
+                raise ValueError("broken")
+
+        status = _read_spans(trace_file)[0]['status']
+        assert status == {'code': "STATUS_CODE_ERROR", 'message': "ValueError: broken"}
+
+    def test_unsampled_traces_record_nothing(self, trace_file):
+        configure_tracing(0.0)
+        with trace_span("request") as span:
+            assert span is NON_RECORDING_SPAN
+            assert current_trace_id() is None
+
+        configure_tracing(1e-9, trace_file)
+        with trace_span("request") as span, trace_span("child") as child:
+            assert span is child is NON_RECORDING_SPAN
+        assert not trace_file.exists()
+
+    def test_file_is_rotated(self, trace_file):
+        configure_tracing(1.0, trace_file, max_bytes=2000, backup_count=2)
+        for i in range(50):
+            with trace_span("request", i=i):
+                pass
+
+        assert trace_file.exists()
+        assert trace_file.with_name("traces.jsonl.1").exists()
+        assert trace_file.with_name("traces.jsonl.2").exists()
+        assert not trace_file.with_name("traces.jsonl.3").exists()
+        assert trace_file.stat().st_size <= 2000
+
+
+class TestTracedOperations:
+    """Test operations and handler calls recorded as spans."""
+
+    def test_handler_call_is_the_root_of_its_operations(self, trace_file):
+        class ListTool(BaseToolHandler):
+            def __init__(self):
+                super().__init__("traced_list_tool", "1.0.0")
+
+            def _execute_tool(self, **kwargs):
+                for _ in range(3):
+                    with track_operation("load", track_memory=False) as metrics:
+                        metrics.items_processed = 1
+                return {'done': True}
+
+        response = ListTool().execute()
+
+        spans = _read_spans(trace_file)
+        root = spans[-1]
+        assert root['name'] == "tool/traced_list_tool"
+        assert root['kind'] == "SPAN_KIND_SERVER"
+        assert response['handler_info']['trace_id'] == root['traceId']
+        loads = [span for span in spans if span['name'] == "load"]
+        assert len(loads) == 3
+        assert all(span['parentSpanId'] == root['spanId'] for span in loads)
+        assert {'key': 'items_processed', 'value': {'intValue': 1}} in loads[0]['attributes']
+
+    def test_trace_summary_script(self, trace_file, capsys):
+        script = Path(__file__).resolve().parents[2] / "scripts" / "trace-summary.py"
+        spec = importlib.util.spec_from_file_location("trace_summary", script)
+        trace_summary = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(trace_summary)
+
+        with trace_span("tool/get_band_list"):
+            for _ in range(4):
+                with trace_span("load_band_metadata"):
+                    pass
+
+        (trace,) = trace_summary.build_trees(trace_summary.load_spans([trace_file]))
+        tree = trace['tree']
+        assert tree.name == "tool/get_band_list"
+        assert tree.children['load_band_metadata'].count == 4
+        assert trace_summary.main([str(trace_file), '--min-percent', '0']) == 0
+        output = capsys.readouterr().out
+        assert "tool/get_band_list" in output and "load_band_metadata x4" in output
@@ -0,0 +1,179 @@
+"""
+Unit tests for collection watch mode.
+
+Tests cover incremental band re-scans, event handling and debouncing, and an
+end-to-end run against real inotify events on Linux.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.core.tools.scanner import rescan_bands, scan_music_folders
+from src.core.tools.storage import load_collection_index
+from src.core.tools.watcher import (
+    IN_CREATE,
+    IN_ISDIR,
+    IN_Q_OVERFLOW,
+    CollectionWatcher,
+    get_watch_status,
+    inotify_available,
+    start_collection_watcher,
+    stop_collection_watcher,
+    watch_settings_from_config,
+)
+from src.di import override_dependency
+
+
+def _add_album(root: Path, band: str, album: str) -> None:
+    album_path = root / band / album
+    album_path.mkdir(parents=True)
+    (album_path / "01 - Track.mp3").touch()
+
+
+def _wait_for(predicate, timeout: float = 20.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def music_root():
+    temp_dir = tempfile.mkdtemp()
+    root = Path(temp_dir)
+    _add_album(root, "Queen", "1975 - A Night at the Opera")
+    _add_album(root, "Rush", "1976 - 2112")
+
+    class MockConfig:
+        MUSIC_ROOT_PATH = temp_dir
+        CACHE_DURATION_DAYS = 30
+        LOG_LEVEL = "INFO"
+        WATCH_MODE_ENABLED = True
+        WATCH_DEBOUNCE_SECONDS = 0.1
+
+    with override_dependency(Config, MockConfig()):
+        scan_music_folders()
+        yield root
+        stop_collection_watcher()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestRescanBands:
+    """Test incremental index updates."""
+
+    def test_updates_only_requested_bands(self, music_root):
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        _add_album(music_root, "Rush", "1981 - Moving Pictures")
+
+        result = rescan_bands(["Queen"], music_root)
+
+        assert result['bands_updated'] == 1
+        index = load_collection_index()
+        assert index.get_band("Queen").albums_count == 2
+        assert index.get_band("Rush").albums_count == 1
+
+    def test_missing_folder_is_removed_and_new_folder_added(self, music_root):
+        shutil.rmtree(music_root / "Rush")
+        _add_album(music_root, "Yes", "1971 - Fragile")
+
+        result = rescan_bands(["Rush", "Yes"], music_root)
+
+        assert result['bands_removed'] == 1
+        assert "Removed band: Rush" in result['changes_detected']
+        index = load_collection_index()
+        assert index.get_band("Rush") is None
+        assert index.get_band("Yes").albums_count == 1
+
+
+class TestEventHandling:
+    """Test event translation and debouncing without a real inotify instance."""
+
+    def test_events_mark_band_dirty_and_ignore_metadata_files(self, music_root):
+        watcher = CollectionWatcher(music_root, debounce_seconds=60)
+        watcher._watches = {1: Path(), 2: Path("Queen"), 3: Path("Queen/1975 - A Night at the Opera")}
+
+        watcher._handle_event(3, IN_CREATE, "02 - Lazing on a Sunday Afternoon.mp3")
+        watcher._handle_event(2, IN_CREATE, ".band_metadata.json")
+        watcher._handle_event(1, IN_CREATE, ".collection_index.json")
+
+        assert watcher.dirty_bands() == {"Queen"}
+        stats = watcher.get_stats()
+        assert stats['queue_depth'] == 1
+        assert stats['events_ignored'] == 2
+
+    def test_debounce_waits_for_quiet_band(self, music_root):
+        watcher = CollectionWatcher(music_root, debounce_seconds=0.2)
+        watcher._watches = {1: Path()}
+        watcher._handle_event(1, IN_CREATE | IN_ISDIR, "Queen")
+
+        start = time.monotonic()
+        ready = watcher._take_ready_bands()
+
+        assert list(ready) == ["Queen"]
+        assert time.monotonic() - start >= 0.15
+        assert watcher.get_stats()['queue_depth'] == 0
+
+    def test_overflow_marks_every_band_dirty(self, music_root):
+        watcher = CollectionWatcher(music_root, debounce_seconds=60)
+        watcher._handle_event(-1, IN_Q_OVERFLOW, "")
+
+        assert watcher.dirty_bands() == {"Queen", "Rush"}
+        assert watcher.get_stats()['queue_overflows'] == 1
+
+    def test_settings_from_config(self):
+        class MockConfig:
+            WATCH_MODE_ENABLED = True
+            WATCH_DEBOUNCE_SECONDS = -1
+
+        settings = watch_settings_from_config(MockConfig())
+        assert settings['enabled'] is True
+        assert settings['debounce_seconds'] == 2.0
+        assert settings['backend'] == 'auto'
+        assert watch_settings_from_config(object())['enabled'] is False
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify is only available on Linux")
+class TestInotifyWatch:
+    """Test the watcher against real filesystem events."""
+
+    def test_new_album_and_new_band_update_index(self, music_root):
+        watcher = start_collection_watcher()
+        assert watcher is not None and watcher.running
+
+        _add_album(music_root, "Queen", "1977 - News of the World")
+        _add_album(music_root, "Yes", "1971 - Fragile")
+
+        def index_updated():
+            index = load_collection_index()
+            return (index.get_band("Queen").albums_count == 2
+                    and index.get_band("Yes") is not None)
+
+        assert _wait_for(index_updated), get_watch_status()
+        status = get_watch_status()
+        assert status['running'] is True
+        assert status['bands_rescanned'] >= 2
+        assert status['last_lag_seconds'] is not None
+        # The band folder created after start is watched as well
+        assert status['watched_folders'] >= 6
+
+    def test_removed_band_is_dropped(self, music_root):
+        start_collection_watcher()
+        shutil.rmtree(music_root / "Rush")
+
+        assert _wait_for(lambda: load_collection_index().get_band("Rush") is None), get_watch_status()
+        assert get_watch_status()['bands_removed'] == 1
+
+    def test_disabled_by_default(self, music_root):
+        class MockConfig:
+            MUSIC_ROOT_PATH = str(music_root)
+
+        with override_dependency(Config, MockConfig()):
+            assert start_collection_watcher() is None
+        assert get_watch_status() == {'enabled': False, 'running': False}